@@ -149,6 +149,9 @@ class Agent(BaseAgent):
             embedder: Embedder configuration for the agent.
             apps: List of applications that the agent can access through Morshed Squad Platform.
             mcps: List of MCP server references for tool integration.
+            parallel_tool_calls: Run every native tool call of a turn concurrently instead of only the first.
+            max_parallel_tool_calls: Maximum number of tool calls run at the same time in parallel mode.
+            tool_call_timeout: Seconds a tool call may run in parallel mode before it is reported as timed out.
     """
 
     model_config = ConfigDict()
@@ -160,6 +163,20 @@ class Agent(BaseAgent):
         default=None,
         description="Maximum execution time for an agent to execute a task",
     )
+    parallel_tool_calls: bool = Field(
+        default=False,
+        description="Run all native tool calls returned in one LLM turn concurrently instead of only the first.",
+    )
+    max_parallel_tool_calls: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of tool calls run at the same time when parallel_tool_calls is enabled.",
+    )
+    tool_call_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds a tool call may run when parallel_tool_calls is enabled before it is reported as timed out.",
+    )
     step_callback: Any | None = Field(
         default=None,
         description="Callback to be executed after each step of the agent execution.",
@@ -304,6 +321,10 @@ class Agent(BaseAgent):
                         sources=self.knowledge_sources,
                         embedder=self.embedder,
                         collection_name=self.role,
+                        hybrid_search=bool(
+                            self.knowledge_config
+                            and self.knowledge_config.hybrid_search
+                        ),
                     )
                     self.knowledge.add_sources()
         except (TypeError, ValueError) as e:
@@ -489,7 +510,7 @@ class Agent(BaseAgent):
                 raise e
             result = self.execute_task(task, context, tools)
 
-        if self.max_rpm and self._rpm_controller:
+        if self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         result = process_tool_results(self, result)
@@ -722,7 +743,7 @@ class Agent(BaseAgent):
                 raise e
             result = await self.aexecute_task(task, context, tools)
 
-        if self.max_rpm and self._rpm_controller:
+        if self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         result = process_tool_results(self, result)
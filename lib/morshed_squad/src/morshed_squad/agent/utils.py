@@ -104,7 +104,10 @@ def get_knowledge_config(agent: Agent) -> dict[str, Any]:
     Returns:
         Dictionary of knowledge configuration.
     """
-    return agent.knowledge_config.model_dump() if agent.knowledge_config else {}
+    if not agent.knowledge_config:
+        return {}
+    # hybrid_search is applied when the knowledge storage is built.
+    return agent.knowledge_config.model_dump(exclude={"hybrid_search"})
 
 
 def handle_knowledge_retrieval(
@@ -70,6 +70,8 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         config (dict[str, Any] | None): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (int | None): Maximum number of requests per minute for the agent execution.
+        max_tpm (int | None): Maximum number of tokens per minute for the agent execution.
+        rpm_controller (RPMController | None): Rate limiter to use instead of one built from max_rpm and max_tpm.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (list[Any] | None): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
@@ -111,6 +113,7 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
     __hash__ = object.__hash__
     _logger: Logger = PrivateAttr(default_factory=lambda: Logger(verbose=False))
     _rpm_controller: RPMController | None = PrivateAttr(default=None)
+    _has_own_cache_handler: bool | None = PrivateAttr(default=None)
     _request_within_rpm_limit: Any = PrivateAttr(default=None)
     _original_role: str | None = PrivateAttr(default=None)
     _original_goal: str | None = PrivateAttr(default=None)
@@ -133,6 +136,17 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description="Maximum number of tokens per minute for the agent execution to be respected.",
+    )
+    rpm_controller: RPMController | None = Field(
+        default=None,
+        description=(
+            "Rate limiter to use instead of one built from max_rpm and max_tpm. "
+            "Pass RPMController.shared(name, ...) to share one budget between agents and crews."
+        ),
+    )
     allow_delegation: bool = Field(
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
@@ -304,10 +318,12 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+        # A handler passed by the user is kept when the agent joins a crew. Only
+        # the first run sees the user's input; re-validation must not flip it.
+        if self._has_own_cache_handler is None:
+            self._has_own_cache_handler = self.cache_handler is not None
+        if not self._rpm_controller:
+            self._rpm_controller = self._build_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
 
@@ -329,10 +345,8 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
     def set_private_attrs(self) -> Self:
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
-            self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
-            )
+        if not self._rpm_controller:
+            self._rpm_controller = self._build_rpm_controller()
         if not self._token_process:
             self._token_process = TokenProcess()
         return self
@@ -398,6 +412,7 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
             "_logger",
             "_rpm_controller",
             "_request_within_rpm_limit",
+            "rpm_controller",
             "_token_process",
             "agent_executor",
             "tools",
@@ -444,6 +459,8 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
             knowledge_sources=existing_knowledge_sources,
             knowledge=copied_knowledge,
             knowledge_storage=copied_knowledge_storage,
+            rpm_controller=self.rpm_controller,
+            cache_handler=self.cache_handler if self._has_own_cache_handler else None,
         )
 
     def interpolate_inputs(self, inputs: dict[str, Any]) -> None:
@@ -477,6 +494,16 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
             self.cache_handler = cache_handler
             self.tools_handler.cache = cache_handler
 
+    def _build_rpm_controller(self) -> RPMController | None:
+        """Return the configured rate limiter, or build one from max_rpm/max_tpm."""
+        if self.rpm_controller is not None:
+            return self.rpm_controller
+        if self.max_rpm or self.max_tpm:
+            return RPMController(
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+            )
+        return None
+
     def set_rpm_controller(self, rpm_controller: RPMController) -> None:
         """Set the rpm controller for the agent.
 
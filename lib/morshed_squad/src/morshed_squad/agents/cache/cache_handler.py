@@ -1,38 +1,136 @@
 """Cache handler for tool usage results."""
 
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
 from typing import Any
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
 
-from morshed_squad.utilities.rw_lock import RWLock
+from morshed_squad.agents.cache.disk_cache import SQLiteCacheStorage
+
+
+def canonicalize_tool_input(tool_input: Any) -> str:
+    """Render tool arguments in a stable, order-independent form.
+
+    Dicts and JSON strings are re-serialized with sorted keys so that
+    ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}`` produce the same string.
+    Anything that is not JSON is returned as its stripped string form.
+
+    Args:
+        tool_input: Tool arguments as a dict or string.
+
+    Returns:
+        Canonical string representation of the arguments.
+    """
+    if not tool_input:
+        return ""
+    value = tool_input
+    if isinstance(tool_input, str):
+        try:
+            value = json.loads(tool_input)
+        except ValueError:
+            return tool_input.strip()
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        return str(tool_input).strip()
 
 
 class CacheHandler(BaseModel):
     """Handles caching of tool execution results.
 
-    Provides thread-safe in-memory caching for tool outputs based on tool name and input.
-    Uses a read-write lock to allow concurrent reads while ensuring exclusive write access.
+    Provides a thread-safe, bounded LRU cache for tool outputs keyed by a hash of
+    the tool name and its canonicalized input. Entries may expire per tool, and an
+    optional SQLite tier persists results across restarts and processes.
+
+    Attributes:
+        max_entries: Maximum entries kept in memory before LRU eviction.
+            ``None`` disables the bound.
+        default_ttl: Seconds an entry stays valid when the tool has no
+            specific TTL. ``None`` means entries never expire.
+        tool_ttls: Per-tool TTLs in seconds, keyed by tool name.
+        persist_path: Path of the SQLite file backing the on-disk tier.
+            ``None`` keeps the cache purely in memory.
 
     Notes:
         - TODO: Rename 'input' parameter to avoid shadowing builtin.
     """
 
-    _cache: dict[str, Any] = PrivateAttr(default_factory=dict)
-    _lock: RWLock = PrivateAttr(default_factory=RWLock)
+    max_entries: int | None = Field(
+        default=1024,
+        description="Maximum number of in-memory entries before LRU eviction.",
+    )
+    default_ttl: float | None = Field(
+        default=None,
+        description="Default time-to-live in seconds for cached entries.",
+    )
+    tool_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-tool time-to-live overrides in seconds.",
+    )
+    persist_path: str | None = Field(
+        default=None,
+        description="SQLite file used as a persistent, shared cache tier.",
+    )
+
+    _cache: OrderedDict[str, tuple[Any, float | None]] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _disk: SQLiteCacheStorage | None = PrivateAttr(default=None)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _evictions: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Open the persistent tier when a path is configured."""
+        if self.persist_path:
+            self._disk = SQLiteCacheStorage(
+                db_path=self.persist_path, max_entries=self.max_entries
+            )
+
+    @staticmethod
+    def _make_key(tool: str, input: str) -> str:
+        """Build the hashed cache key for a tool call."""
+        raw = f"{tool}\x00{canonicalize_tool_input(input)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _expires_at(self, tool: str, ttl: float | None) -> float | None:
+        """Resolve the absolute expiry for a new entry."""
+        if ttl is None:
+            ttl = self.tool_ttls.get(tool, self.default_ttl)
+        return None if ttl is None else time.time() + ttl
 
-    def add(self, tool: str, input: str, output: Any) -> None:
+    def _store(self, key: str, output: Any, expires_at: float | None) -> None:
+        """Insert into the in-memory tier, evicting LRU entries. Caller holds the lock."""
+        self._cache[key] = (output, expires_at)
+        self._cache.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def add(self, tool: str, input: str, output: Any, ttl: float | None = None) -> None:
         """Add a tool result to the cache.
 
         Args:
             tool: Name of the tool.
             input: Input string used for the tool.
             output: Output result from tool execution.
+            ttl: Optional time-to-live in seconds overriding the configured TTLs.
 
         Notes:
             - TODO: Rename 'input' parameter to avoid shadowing builtin.
         """
-        with self._lock.w_locked():
-            self._cache[f"{tool}-{input}"] = output
+        key = self._make_key(tool, input)
+        expires_at = self._expires_at(tool, ttl)
+        with self._lock:
+            self._store(key, output, expires_at)
+        if self._disk is not None:
+            self._disk.set(key, tool, output, expires_at)
 
     def read(self, tool: str, input: str) -> Any | None:
         """Retrieve a cached tool result.
@@ -47,5 +145,51 @@ class CacheHandler(BaseModel):
         Notes:
             - TODO: Rename 'input' parameter to avoid shadowing builtin.
         """
-        with self._lock.r_locked():
-            return self._cache.get(f"{tool}-{input}")
+        key = self._make_key(tool, input)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                output, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return output
+                del self._cache[key]
+
+        if self._disk is not None:
+            found, output, expires_at = self._disk.get(key)
+            if found:
+                with self._lock:
+                    self._store(key, output, expires_at)
+                    self._hits += 1
+                return output
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def clear(self, tool: str | None = None) -> None:
+        """Drop cached entries.
+
+        Args:
+            tool: When given, only the persistent entries for this tool are
+                removed from disk; the in-memory tier is always cleared.
+        """
+        with self._lock:
+            self._cache.clear()
+        if self._disk is not None:
+            self._disk.clear(tool)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and eviction counters plus the current size.
+
+        Returns:
+            Dictionary with ``hits``, ``misses``, ``evictions`` and ``size`` keys.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._cache),
+            }
@@ -0,0 +1,178 @@
+"""SQLite-backed persistent tier for the tool result cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from morshed_squad.utilities.paths import db_storage_path
+
+
+logger = logging.getLogger(__name__)
+
+_PRUNE_EVERY_N_WRITES = 64
+
+
+class SQLiteCacheStorage:
+    """Persistent key/value store for cached tool results.
+
+    Entries are stored as JSON in a single SQLite table opened in WAL mode, so
+    several processes (or crews) pointing at the same file share results and
+    survive restarts. Only JSON-serializable outputs are persisted.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+        max_entries: Upper bound on stored rows; least recently used rows are
+            pruned once it is exceeded. ``None`` disables size-based pruning.
+    """
+
+    def __init__(self, db_path: str | None = None, max_entries: int | None = None) -> None:
+        """Initialize the storage and create the table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file. Defaults to
+                ``tool_cache.db`` under ``db_storage_path()``.
+            max_entries: Optional upper bound on stored rows.
+        """
+        self.db_path = db_path or str(Path(db_storage_path()) / "tool_cache.db")
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        self._initialize_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _initialize_db(self) -> None:
+        """Create the cache table and its expiry index."""
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tool_cache (
+                key TEXT PRIMARY KEY,
+                tool TEXT NOT NULL,
+                output_json TEXT NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_tool_cache_accessed
+            ON tool_cache(accessed_at)
+            """
+        )
+
+    def get(self, key: str) -> tuple[bool, Any, float | None]:
+        """Look up a cached output.
+
+        Args:
+            key: Hashed cache key.
+
+        Returns:
+            ``(True, output, expires_at)`` on a live hit and
+            ``(False, None, None)`` otherwise.
+        """
+        now = time.time()
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT output_json, expires_at FROM tool_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return False, None, None
+            if row[1] is not None and row[1] <= now:
+                conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                return False, None, None
+            conn.execute(
+                "UPDATE tool_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return True, json.loads(row[0]), row[1]
+        except sqlite3.Error as e:
+            logger.warning(f"Tool cache read failed: {e}")
+            return False, None, None
+
+    def set(self, key: str, tool: str, output: Any, expires_at: float | None) -> bool:
+        """Store an output.
+
+        Args:
+            key: Hashed cache key.
+            tool: Tool name, kept for inspection and targeted clears.
+            output: Tool output; skipped if it is not JSON-serializable.
+            expires_at: Absolute expiry timestamp, or ``None`` for no expiry.
+
+        Returns:
+            Whether the output was persisted.
+        """
+        try:
+            output_json = json.dumps(output)
+        except (TypeError, ValueError):
+            return False
+        try:
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO tool_cache
+                (key, tool, output_json, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, tool, output_json, expires_at, time.time()),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY_N_WRITES == 0:
+                self.prune()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Tool cache write failed: {e}")
+            return False
+
+    def prune(self) -> int:
+        """Drop expired rows and trim the table down to ``max_entries``.
+
+        Returns:
+            Number of rows removed.
+        """
+        conn = self._connection()
+        removed = conn.execute(
+            "DELETE FROM tool_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        ).rowcount
+        if self.max_entries is not None:
+            (count,) = conn.execute("SELECT COUNT(*) FROM tool_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                removed += conn.execute(
+                    """
+                    DELETE FROM tool_cache WHERE key IN (
+                        SELECT key FROM tool_cache ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,),
+                ).rowcount
+        return removed
+
+    def clear(self, tool: str | None = None) -> None:
+        """Remove all rows, or only those belonging to ``tool``.
+
+        Args:
+            tool: Optional tool name to restrict the clear to.
+        """
+        conn = self._connection()
+        if tool is None:
+            conn.execute("DELETE FROM tool_cache")
+        else:
+            conn.execute("DELETE FROM tool_cache WHERE tool = ?", (tool,))
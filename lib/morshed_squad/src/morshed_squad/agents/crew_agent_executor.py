@@ -6,8 +6,17 @@ and memory management.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass
+from datetime import datetime
+import inspect
+import json
 import logging
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from pydantic import BaseModel, GetCoreSchemaHandler, ValidationError
@@ -35,6 +44,7 @@ from morshed_squad.hooks.tool_hooks import (
     get_before_tool_call_hooks,
 )
 from morshed_squad.utilities.agent_utils import (
+    aenforce_rpm_limit,
     aget_llm_response,
     convert_tools_to_openai_schema,
     enforce_rpm_limit,
@@ -77,6 +87,37 @@ if TYPE_CHECKING:
     from morshed_squad.utilities.types import LLMMessage
 
 
+@dataclass
+class _NativeToolCall:
+    """State of one native tool call between preparation, execution and completion."""
+
+    call_id: str
+    func_name: str
+    args_dict: dict[str, Any]
+    input_str: str
+    agent_key: str
+    original_tool: BaseTool | None = None
+    structured_tool: CrewStructuredTool | None = None
+    started_at: datetime | None = None
+    should_execute: bool = False
+    from_cache: bool = False
+    timed_out: bool = False
+    result: str = ""
+    error: Exception | None = None
+
+
+def _has_native_async(tool: BaseTool | None) -> bool:
+    """Whether a tool implements ``_arun`` itself rather than only ``_run``."""
+    if tool is None:
+        return False
+    func = getattr(tool, "func", None)
+    if func is not None:
+        return inspect.iscoroutinefunction(func)
+    from morshed_squad.tools.base_tool import BaseTool
+
+    return type(tool)._arun is not BaseTool._arun
+
+
 class CrewAgentExecutor(CrewAgentExecutorMixin):
     """Executor for crew agents.
 
@@ -150,6 +191,8 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.response_model = response_model
         self.ask_for_human_input = False
         self.messages: list[LLMMessage] = []
+        # Serializes cache writes from parallel tool calls
+        self._tool_state_lock = threading.Lock()
         self.iterations = 0
         self.log_error_after = 3
         self.before_llm_call_hooks: list[Callable[..., Any]] = []
@@ -210,6 +253,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         Returns:
             Dictionary with agent output.
         """
+        # Reset state for fresh execution; agents reuse their executor per task
+        self.messages.clear()
+        self.iterations = 0
         self._setup_messages(inputs)
 
         self._inject_multimodal_files(inputs)
@@ -667,41 +713,19 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             return True
         return False
 
-    def _handle_native_tool_calls(
-        self,
-        tool_calls: list[Any],
-        available_functions: dict[str, Callable[..., Any]],
-    ) -> AgentFinish | None:
-        """Handle a single native tool call from the LLM.
+    def _parse_native_tool_call(
+        self, tool_call: Any
+    ) -> tuple[str, str, str | dict[str, Any]] | None:
+        """Extract the id, sanitized name and arguments of a native tool call.
 
-        Executes only the FIRST tool call and appends the result to message history.
-        This enables sequential tool execution with reflection after each tool,
-        allowing the LLM to reason about results before deciding on next steps.
+        Handles OpenAI-, Gemini-, Anthropic- and Bedrock-style tool calls.
 
         Args:
-            tool_calls: List of tool calls from the LLM (only first is processed).
-            available_functions: Dict mapping function names to callables.
+            tool_call: Tool call object or dict returned by the LLM.
 
         Returns:
-            AgentFinish if tool has result_as_answer=True, None otherwise.
+            ``(call_id, func_name, func_args)``, or None if the format is unknown.
         """
-        from datetime import datetime
-        import json
-
-        from morshed_squad.events import crewai_event_bus
-        from morshed_squad.events.types.tool_usage_events import (
-            ToolUsageErrorEvent,
-            ToolUsageFinishedEvent,
-            ToolUsageStartedEvent,
-        )
-
-        if not tool_calls:
-            return None
-
-        # Only process the FIRST tool call for sequential execution with reflection
-        tool_call = tool_calls[0]
-
-        # Extract tool call info - handle OpenAI-style, Anthropic-style, and Gemini-style
         if hasattr(tool_call, "function"):
             # OpenAI-style: has .function.name and .function.arguments
             call_id = getattr(tool_call, "id", f"call_{id(tool_call)}")
@@ -735,237 +759,491 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             func_args = func_info.get("arguments", "{}") or tool_call.get("input", {})
         else:
             return None
+        return call_id, func_name, func_args
 
-        # Append assistant message with single tool call
-        assistant_message: LLMMessage = {
-            "role": "assistant",
-            "content": None,
-            "tool_calls": [
-                {
-                    "id": call_id,
-                    "type": "function",
-                    "function": {
-                        "name": func_name,
-                        "arguments": func_args
-                        if isinstance(func_args, str)
-                        else json.dumps(func_args),
-                    },
-                }
-            ],
-        }
+    def _parse_native_tool_calls(
+        self, tool_calls: list[Any]
+    ) -> list[tuple[str, str, str | dict[str, Any]]]:
+        """Parse the tool calls to run this turn and record them in the message history.
 
-        self.messages.append(assistant_message)
+        Only the first call is kept unless the agent enables
+        ``parallel_tool_calls``; calls in an unknown format are skipped.
+        """
+        if not getattr(self.agent, "parallel_tool_calls", False):
+            tool_calls = tool_calls[:1]
+        parsed = [
+            call
+            for call in (self._parse_native_tool_call(tc) for tc in tool_calls)
+            if call is not None
+        ]
+        if parsed:
+            assistant_message: LLMMessage = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {
+                            "name": func_name,
+                            "arguments": func_args
+                            if isinstance(func_args, str)
+                            else json.dumps(func_args),
+                        },
+                    }
+                    for call_id, func_name, func_args in parsed
+                ],
+            }
+            self.messages.append(assistant_message)
+        return parsed
 
-        # Parse arguments for the single tool call
-        if isinstance(func_args, str):
-            try:
-                args_dict = json.loads(func_args)
-            except json.JSONDecodeError:
-                args_dict = {}
+    def _handle_native_tool_calls(
+        self,
+        tool_calls: list[Any],
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> AgentFinish | None:
+        """Handle native tool calls from the LLM.
+
+        By default executes only the FIRST tool call and appends the result to
+        message history. This enables sequential tool execution with reflection
+        after each tool, allowing the LLM to reason about results before
+        deciding on next steps.
+
+        When the agent enables ``parallel_tool_calls``, every call of the turn
+        runs concurrently on a thread pool of at most
+        ``max_parallel_tool_calls`` workers, each bounded by
+        ``tool_call_timeout``. Cache lookups, hooks, events and tool messages
+        are still handled one call at a time in the order the LLM returned
+        them, so only the tool bodies overlap.
+
+        Args:
+            tool_calls: List of tool calls from the LLM.
+            available_functions: Dict mapping function names to callables.
+
+        Returns:
+            AgentFinish if a tool has result_as_answer=True, None otherwise.
+        """
+        parsed = self._parse_native_tool_calls(tool_calls)
+        if not parsed:
+            return None
+
+        calls = self._prepare_native_tool_calls(parsed)
+        if getattr(self.agent, "parallel_tool_calls", False):
+            self._run_native_tool_calls_parallel(calls, available_functions)
         else:
-            args_dict = func_args
+            for call in calls:
+                if call.should_execute:
+                    call.result, call.error = self._run_native_tool(
+                        call, available_functions
+                    )
+        return self._complete_native_tool_calls(calls)
 
-        agent_key = getattr(self.agent, "key", "unknown") if self.agent else "unknown"
+    async def _ahandle_native_tool_calls(
+        self,
+        tool_calls: list[Any],
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> AgentFinish | None:
+        """Async variant of ``_handle_native_tool_calls``.
 
-        # Find original tool by matching sanitized name (needed for cache_function and result_as_answer)
+        In parallel mode, tools with a native async implementation are awaited
+        and the others run in worker threads, all gathered concurrently.
 
-        original_tool = None
-        for tool in self.original_tools or []:
-            if sanitize_tool_name(tool.name) == func_name:
-                original_tool = tool
-                break
+        Args:
+            tool_calls: List of tool calls from the LLM.
+            available_functions: Dict mapping function names to callables.
 
-        # Check if tool has reached max usage count
-        max_usage_reached = False
-        if original_tool:
-            if (
-                hasattr(original_tool, "max_usage_count")
-                and original_tool.max_usage_count is not None
-                and original_tool.current_usage_count >= original_tool.max_usage_count
-            ):
-                max_usage_reached = True
+        Returns:
+            AgentFinish if a tool has result_as_answer=True, None otherwise.
+        """
+        if not getattr(self.agent, "parallel_tool_calls", False):
+            return self._handle_native_tool_calls(tool_calls, available_functions)
 
-        # Check cache before executing
-        from_cache = False
-        input_str = json.dumps(args_dict) if args_dict else ""
-        if self.tools_handler and self.tools_handler.cache:
-            cached_result = self.tools_handler.cache.read(
-                tool=func_name, input=input_str
-            )
-            if cached_result is not None:
-                result = (
-                    str(cached_result)
-                    if not isinstance(cached_result, str)
-                    else cached_result
-                )
-                from_cache = True
+        parsed = self._parse_native_tool_calls(tool_calls)
+        if not parsed:
+            return None
 
-        # Emit tool usage started event
-        started_at = datetime.now()
-        crewai_event_bus.emit(
-            self,
-            event=ToolUsageStartedEvent(
-                tool_name=func_name,
-                tool_args=args_dict,
-                from_agent=self.agent,
-                from_task=self.task,
-                agent_key=agent_key,
-            ),
-        )
-        error_event_emitted = False
+        calls = self._prepare_native_tool_calls(parsed)
+        await self._arun_native_tool_calls_parallel(calls, available_functions)
+        return self._complete_native_tool_calls(calls)
 
-        track_delegation_if_needed(func_name, args_dict, self.task)
+    def _prepare_native_tool_calls(
+        self, parsed: list[tuple[str, str, str | dict[str, Any]]]
+    ) -> list[_NativeToolCall]:
+        """Check limits and cache, emit started events and run before hooks, in order."""
+        from morshed_squad.events.types.tool_usage_events import ToolUsageStartedEvent
 
-        # Find the structured tool for hook context
-        structured_tool: CrewStructuredTool | None = None
-        for structured in self.tools or []:
-            if sanitize_tool_name(structured.name) == func_name:
-                structured_tool = structured
-                break
+        agent_key = getattr(self.agent, "key", "unknown") if self.agent else "unknown"
+        scheduled: dict[str, int] = {}
+        calls: list[_NativeToolCall] = []
+        for call_id, func_name, func_args in parsed:
+            if isinstance(func_args, str):
+                try:
+                    args_dict = json.loads(func_args)
+                except json.JSONDecodeError:
+                    args_dict = {}
+            else:
+                args_dict = func_args
 
-        # Execute before_tool_call hooks
-        hook_blocked = False
-        before_hook_context = ToolCallHookContext(
-            tool_name=func_name,
-            tool_input=args_dict,
-            tool=structured_tool,  # type: ignore[arg-type]
-            agent=self.agent,
-            task=self.task,
-            crew=self.crew,
-        )
-        before_hooks = get_before_tool_call_hooks()
-        try:
-            for hook in before_hooks:
-                hook_result = hook(before_hook_context)
-                if hook_result is False:
-                    hook_blocked = True
+            # Find original tool by matching sanitized name (needed for cache_function and result_as_answer)
+            original_tool = None
+            for tool in self.original_tools or []:
+                if sanitize_tool_name(tool.name) == func_name:
+                    original_tool = tool
                     break
-        except Exception as hook_error:
-            if self.agent.verbose:
-                self._printer.print(
-                    content=f"Error in before_tool_call hook: {hook_error}",
-                    color="red",
-                )
 
-        # If hook blocked execution, set result and skip tool execution
-        if hook_blocked:
-            result = f"Tool execution blocked by hook. Tool: {func_name}"
-        # Execute the tool (only if not cached, not at max usage, and not blocked by hook)
-        elif not from_cache and not max_usage_reached:
-            result = "Tool not found"
-            if func_name in available_functions:
-                try:
-                    tool_func = available_functions[func_name]
-                    raw_result = tool_func(**args_dict)
-
-                    # Add to cache after successful execution (before string conversion)
-                    if self.tools_handler and self.tools_handler.cache:
-                        should_cache = True
-                        if (
-                            original_tool
-                            and hasattr(original_tool, "cache_function")
-                            and callable(original_tool.cache_function)
-                        ):
-                            should_cache = original_tool.cache_function(
-                                args_dict, raw_result
-                            )
-                        if should_cache:
-                            self.tools_handler.cache.add(
-                                tool=func_name, input=input_str, output=raw_result
-                            )
+            # Check if tool has reached max usage count, counting calls
+            # already scheduled earlier in this turn
+            max_usage_reached = False
+            if original_tool:
+                if (
+                    hasattr(original_tool, "max_usage_count")
+                    and original_tool.max_usage_count is not None
+                    and original_tool.current_usage_count + scheduled.get(func_name, 0)
+                    >= original_tool.max_usage_count
+                ):
+                    max_usage_reached = True
 
-                    # Convert to string for message
-                    result = (
-                        str(raw_result)
-                        if not isinstance(raw_result, str)
-                        else raw_result
-                    )
-                except Exception as e:
-                    result = f"Error executing tool: {e}"
-                    if self.task:
-                        self.task.increment_tools_errors()
-                    crewai_event_bus.emit(
-                        self,
-                        event=ToolUsageErrorEvent(
-                            tool_name=func_name,
-                            tool_args=args_dict,
-                            from_agent=self.agent,
-                            from_task=self.task,
-                            agent_key=agent_key,
-                            error=e,
-                        ),
-                    )
-                    error_event_emitted = True
-        elif max_usage_reached and original_tool:
-            # Return error message when max usage limit is reached
-            result = f"Tool '{func_name}' has reached its usage limit of {original_tool.max_usage_count} times and cannot be used anymore."
-
-        after_hook_context = ToolCallHookContext(
-            tool_name=func_name,
-            tool_input=args_dict,
-            tool=structured_tool,  # type: ignore[arg-type]
-            agent=self.agent,
-            task=self.task,
-            crew=self.crew,
-            tool_result=result,
-        )
-        after_hooks = get_after_tool_call_hooks()
-        try:
-            for after_hook in after_hooks:
-                after_hook_result = after_hook(after_hook_context)
-                if after_hook_result is not None:
-                    result = after_hook_result
-                    after_hook_context.tool_result = result
-        except Exception as hook_error:
-            if self.agent.verbose:
-                self._printer.print(
-                    content=f"Error in after_tool_call hook: {hook_error}",
-                    color="red",
+            call = _NativeToolCall(
+                call_id=call_id,
+                func_name=func_name,
+                args_dict=args_dict,
+                input_str=json.dumps(args_dict) if args_dict else "",
+                agent_key=agent_key,
+                original_tool=original_tool,
+            )
+
+            # Check cache before executing
+            if self.tools_handler and self.tools_handler.cache:
+                cached_result = self.tools_handler.cache.read(
+                    tool=func_name, input=call.input_str
                 )
+                if cached_result is not None:
+                    call.result = (
+                        str(cached_result)
+                        if not isinstance(cached_result, str)
+                        else cached_result
+                    )
+                    call.from_cache = True
 
-        if not error_event_emitted:
+            # Emit tool usage started event
+            call.started_at = datetime.now()
             crewai_event_bus.emit(
                 self,
-                event=ToolUsageFinishedEvent(
-                    output=result,
+                event=ToolUsageStartedEvent(
                     tool_name=func_name,
                     tool_args=args_dict,
                     from_agent=self.agent,
                     from_task=self.task,
                     agent_key=agent_key,
-                    started_at=started_at,
-                    finished_at=datetime.now(),
                 ),
             )
 
-        # Append tool result message
-        tool_message: LLMMessage = {
-            "role": "tool",
-            "tool_call_id": call_id,
-            "name": func_name,
-            "content": result,
-        }
-        self.messages.append(tool_message)
-
-        # Log the tool execution
-        if self.agent and self.agent.verbose:
-            cache_info = " (from cache)" if from_cache else ""
-            self._printer.print(
-                content=f"Tool {func_name} executed with result{cache_info}: {result[:200]}...",
-                color="green",
+            track_delegation_if_needed(func_name, args_dict, self.task)
+
+            # Find the structured tool for hook context
+            for structured in self.tools or []:
+                if sanitize_tool_name(structured.name) == func_name:
+                    call.structured_tool = structured
+                    break
+
+            # Execute before_tool_call hooks
+            hook_blocked = False
+            before_hook_context = ToolCallHookContext(
+                tool_name=func_name,
+                tool_input=args_dict,
+                tool=call.structured_tool,  # type: ignore[arg-type]
+                agent=self.agent,
+                task=self.task,
+                crew=self.crew,
             )
+            before_hooks = get_before_tool_call_hooks()
+            try:
+                for hook in before_hooks:
+                    hook_result = hook(before_hook_context)
+                    if hook_result is False:
+                        hook_blocked = True
+                        break
+            except Exception as hook_error:
+                if self.agent.verbose:
+                    self._printer.print(
+                        content=f"Error in before_tool_call hook: {hook_error}",
+                        color="red",
+                    )
 
-        if (
-            original_tool
-            and hasattr(original_tool, "result_as_answer")
-            and original_tool.result_as_answer
+            # If hook blocked execution, set result and skip tool execution
+            if hook_blocked:
+                call.result = f"Tool execution blocked by hook. Tool: {func_name}"
+            # Execute the tool only if not cached, not at max usage, and not blocked by hook
+            elif not call.from_cache and not max_usage_reached:
+                call.should_execute = True
+                scheduled[func_name] = scheduled.get(func_name, 0) + 1
+            elif max_usage_reached and original_tool:
+                # Return error message when max usage limit is reached
+                call.result = f"Tool '{func_name}' has reached its usage limit of {original_tool.max_usage_count} times and cannot be used anymore."
+            calls.append(call)
+        return calls
+
+    def _run_native_tool(
+        self,
+        call: _NativeToolCall,
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> tuple[str, Exception | None]:
+        """Execute one tool call. Safe to run on a worker thread.
+
+        Returns:
+            The result message and the exception raised by the tool, if any.
+        """
+        if call.func_name not in available_functions:
+            return "Tool not found", None
+        try:
+            raw_result = available_functions[call.func_name](**call.args_dict)
+        except Exception as e:
+            return f"Error executing tool: {e}", e
+        return self._native_tool_result(call, raw_result), None
+
+    async def _arun_native_tool(
+        self,
+        call: _NativeToolCall,
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> tuple[str, Exception | None]:
+        """Await a tool's native async implementation, or run it in a worker thread."""
+        if call.func_name in available_functions and _has_native_async(
+            call.original_tool
         ):
-            # Return immediately with tool result as final answer
-            return AgentFinish(
-                thought="Tool result is the final answer",
-                output=result,
-                text=result,
+            try:
+                raw_result = await call.original_tool.arun(**call.args_dict)  # type: ignore[union-attr]
+            except Exception as e:
+                return f"Error executing tool: {e}", e
+            return self._native_tool_result(call, raw_result), None
+        ctx = contextvars.copy_context()
+        return await asyncio.to_thread(
+            ctx.run, self._run_native_tool, call, available_functions
+        )
+
+    def _native_tool_result(self, call: _NativeToolCall, raw_result: Any) -> str:
+        """Cache a successful tool result and convert it to a message string.
+
+        Parallel calls finish on worker threads, so the cache check and write
+        are done under ``_tool_state_lock``. The late result of a call already
+        reported as timed out is not cached.
+        """
+        if self.tools_handler and self.tools_handler.cache:
+            with self._tool_state_lock:
+                should_cache = not call.timed_out
+                if (
+                    should_cache
+                    and call.original_tool
+                    and hasattr(call.original_tool, "cache_function")
+                    and callable(call.original_tool.cache_function)
+                ):
+                    should_cache = call.original_tool.cache_function(
+                        call.args_dict, raw_result
+                    )
+                if should_cache:
+                    self.tools_handler.cache.add(
+                        tool=call.func_name, input=call.input_str, output=raw_result
+                    )
+        return str(raw_result) if not isinstance(raw_result, str) else raw_result
+
+    def _run_native_tool_calls_parallel(
+        self,
+        calls: list[_NativeToolCall],
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> None:
+        """Run the executable calls on a thread pool, bounded by the agent's limits.
+
+        A call that exceeds ``tool_call_timeout`` is reported as timed out
+        and its thread is left to finish in the background; its late result
+        is discarded.
+        """
+        runnable = [call for call in calls if call.should_execute]
+        if not runnable:
+            return
+        timeout: float | None = getattr(self.agent, "tool_call_timeout", None)
+        max_workers = min(
+            len(runnable), getattr(self.agent, "max_parallel_tool_calls", 8)
+        )
+        # Calls still queued behind others get the time of every wave before them.
+        queued_deadline = (
+            time.monotonic() + timeout * -(-len(runnable) // max_workers)
+            if timeout is not None
+            else None
+        )
+        started: dict[int, float] = {}
+
+        def run(index: int) -> tuple[str, Exception | None]:
+            started[index] = time.monotonic()
+            return self._run_native_tool(runnable[index], available_functions)
+
+        pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tool-call"
+        )
+        futures = {
+            pool.submit(contextvars.copy_context().run, run, index): index
+            for index in range(len(runnable))
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                wait_for = None
+                if timeout is not None and queued_deadline is not None:
+                    now = time.monotonic()
+                    deadlines = {
+                        future: started[futures[future]] + timeout
+                        if futures[future] in started
+                        else queued_deadline
+                        for future in pending
+                    }
+                    for future, deadline in deadlines.items():
+                        if deadline <= now:
+                            pending.discard(future)
+                            future.cancel()
+                            self._time_out_native_tool_call(
+                                runnable[futures[future]], timeout
+                            )
+                    if not pending:
+                        break
+                    wait_for = min(deadlines[future] for future in pending) - now
+                done, pending = wait(
+                    pending, timeout=wait_for, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    call = runnable[futures[future]]
+                    call.result, call.error = future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _arun_native_tool_calls_parallel(
+        self,
+        calls: list[_NativeToolCall],
+        available_functions: dict[str, Callable[..., Any]],
+    ) -> None:
+        """Gather the executable calls, bounded by the agent's limits."""
+        runnable = [call for call in calls if call.should_execute]
+        if not runnable:
+            return
+        timeout: float | None = getattr(self.agent, "tool_call_timeout", None)
+        semaphore = asyncio.Semaphore(getattr(self.agent, "max_parallel_tool_calls", 8))
+
+        async def run(call: _NativeToolCall) -> None:
+            async with semaphore:
+                try:
+                    call.result, call.error = await asyncio.wait_for(
+                        self._arun_native_tool(call, available_functions), timeout
+                    )
+                except asyncio.TimeoutError:
+                    if timeout is None:
+                        raise
+                    self._time_out_native_tool_call(call, timeout)
+
+        await asyncio.gather(*(run(call) for call in runnable))
+
+    def _time_out_native_tool_call(
+        self, call: _NativeToolCall, timeout: float
+    ) -> None:
+        """Report a call as timed out; its worker may still finish later."""
+        with self._tool_state_lock:
+            call.timed_out = True
+        call.result = f"Tool '{call.func_name}' timed out after {timeout} seconds."
+        call.error = TimeoutError(call.result)
+
+    def _complete_native_tool_calls(
+        self, calls: list[_NativeToolCall]
+    ) -> AgentFinish | None:
+        """Run after hooks, emit events and append tool results, in call order.
+
+        Returns:
+            AgentFinish with the result of the first call whose tool has
+            result_as_answer=True, None otherwise.
+        """
+        from morshed_squad.events.types.tool_usage_events import (
+            ToolUsageErrorEvent,
+            ToolUsageFinishedEvent,
+        )
+
+        for call in calls:
+            if call.error is not None:
+                if self.task:
+                    self.task.increment_tools_errors()
+                crewai_event_bus.emit(
+                    self,
+                    event=ToolUsageErrorEvent(
+                        tool_name=call.func_name,
+                        tool_args=call.args_dict,
+                        from_agent=self.agent,
+                        from_task=self.task,
+                        agent_key=call.agent_key,
+                        error=call.error,
+                    ),
+                )
+
+            after_hook_context = ToolCallHookContext(
+                tool_name=call.func_name,
+                tool_input=call.args_dict,
+                tool=call.structured_tool,  # type: ignore[arg-type]
+                agent=self.agent,
+                task=self.task,
+                crew=self.crew,
+                tool_result=call.result,
             )
+            after_hooks = get_after_tool_call_hooks()
+            try:
+                for after_hook in after_hooks:
+                    after_hook_result = after_hook(after_hook_context)
+                    if after_hook_result is not None:
+                        call.result = after_hook_result
+                        after_hook_context.tool_result = call.result
+            except Exception as hook_error:
+                if self.agent.verbose:
+                    self._printer.print(
+                        content=f"Error in after_tool_call hook: {hook_error}",
+                        color="red",
+                    )
+
+            if call.error is None:
+                crewai_event_bus.emit(
+                    self,
+                    event=ToolUsageFinishedEvent(
+                        output=call.result,
+                        tool_name=call.func_name,
+                        tool_args=call.args_dict,
+                        from_agent=self.agent,
+                        from_task=self.task,
+                        agent_key=call.agent_key,
+                        started_at=call.started_at,
+                        finished_at=datetime.now(),
+                    ),
+                )
+
+            # Append tool result message
+            tool_message: LLMMessage = {
+                "role": "tool",
+                "tool_call_id": call.call_id,
+                "name": call.func_name,
+                "content": call.result,
+            }
+            self.messages.append(tool_message)
+
+            # Log the tool execution
+            if self.agent and self.agent.verbose:
+                cache_info = " (from cache)" if call.from_cache else ""
+                self._printer.print(
+                    content=f"Tool {call.func_name} executed with result{cache_info}: {call.result[:200]}...",
+                    color="green",
+                )
+
+        for call in calls:
+            if (
+                call.original_tool
+                and hasattr(call.original_tool, "result_as_answer")
+                and call.original_tool.result_as_answer
+            ):
+                # Return immediately with tool result as final answer
+                return AgentFinish(
+                    thought="Tool result is the final answer",
+                    output=call.result,
+                    text=call.result,
+                )
 
         # Inject post-tool reasoning prompt to enforce analysis
         reasoning_prompt = self._i18n.slice("post_tool_reasoning")
@@ -985,6 +1263,9 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         Returns:
             Dictionary with agent output.
         """
+        # Reset state for fresh execution; agents reuse their executor per task
+        self.messages.clear()
+        self.iterations = 0
         self._setup_messages(inputs)
 
         await self._ainject_multimodal_files(inputs)
@@ -1056,7 +1337,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     )
                     break
 
-                enforce_rpm_limit(self.request_within_rpm_limit)
+                await aenforce_rpm_limit(self.request_within_rpm_limit)
 
                 answer = await aget_llm_response(
                     llm=self.llm,
@@ -1205,7 +1486,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     self._show_logs(formatted_answer)
                     return formatted_answer
 
-                enforce_rpm_limit(self.request_within_rpm_limit)
+                await aenforce_rpm_limit(self.request_within_rpm_limit)
 
                 # Call LLM with native tools
                 # Pass available_functions=None so the LLM returns tool_calls
@@ -1231,7 +1512,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                     and self._is_tool_call_list(answer)
                 ):
                     # Handle tool calls - execute tools and add results to messages
-                    tool_finish = self._handle_native_tool_calls(
+                    tool_finish = await self._ahandle_native_tool_calls(
                         answer, available_functions
                     )
                     # If tool has result_as_answer=True, return immediately
@@ -1301,7 +1582,7 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         Returns:
             Final answer from the agent.
         """
-        enforce_rpm_limit(self.request_within_rpm_limit)
+        await aenforce_rpm_limit(self.request_within_rpm_limit)
 
         answer = await aget_llm_response(
             llm=self.llm,
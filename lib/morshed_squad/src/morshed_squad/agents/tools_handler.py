@@ -9,6 +9,7 @@ from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 from morshed_squad.tools.cache_tools.cache_tools import CacheTools
+from morshed_squad.utilities.string_utils import sanitize_tool_name
 
 
 if TYPE_CHECKING:
@@ -57,7 +58,7 @@ class ToolsHandler:
                     input_str = str(calling.arguments)
 
             self.cache.add(
-                tool=calling.tool_name,
+                tool=sanitize_tool_name(calling.tool_name),
                 input=input_str,
                 output=output,
             )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from concurrent.futures import Future
 from copy import copy as shallow_copy
 from hashlib import md5
@@ -50,6 +50,11 @@ except ImportError:
 from morshed_squad.agent import Agent
 from morshed_squad.agents.agent_builder.base_agent import BaseAgent
 from morshed_squad.agents.cache.cache_handler import CacheHandler
+from morshed_squad.crews.batch import (
+    BatchResult,
+    CrewBatchRunner,
+    ProcessBatchRunner,
+)
 from morshed_squad.crews.crew_output import CrewOutput
 from morshed_squad.crews.utils import (
     StreamingContext,
@@ -100,7 +105,7 @@ from morshed_squad.utilities.constants import NOT_SPECIFIED, TRAINING_DATA_FILE
 from morshed_squad.utilities.crew.models import CrewContext
 from morshed_squad.utilities.evaluators.crew_evaluator_handler import CrewEvaluator
 from morshed_squad.utilities.evaluators.task_evaluator import TaskEvaluator
-from morshed_squad.utilities.file_handler import FileHandler
+from morshed_squad.utilities.file_handler import FileHandler, LogRotation
 from morshed_squad.utilities.file_store import clear_files, get_all_files
 from morshed_squad.utilities.formatter import (
     aggregate_raw_outputs_from_task_outputs,
@@ -140,6 +145,9 @@ class Crew(FlowTrackable, BaseModel):
             execution.
         cache: Whether the crew should use a cache to store the results of the
             tools execution.
+        cache_handler: Tool result cache shared by the crew's agents. Pass a
+            CacheHandler (or its config as a dict) to set ``max_entries``, the
+            TTLs or ``persist_path``; a default in-memory cache is used otherwise.
         function_calling_llm: The language model that will run the tool calling
             for all the agents.
         process: The process flow that the crew will follow (e.g., sequential,
@@ -148,6 +156,10 @@ class Crew(FlowTrackable, BaseModel):
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to
             be respected.
+        max_tpm: Maximum number of tokens per minute for the crew execution to
+            be respected.
+        rpm_controller: Rate limiter to use instead of one built from max_rpm
+            and max_tpm, e.g. ``RPMController.shared(name, ...)``.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         task_callback: Callback to be executed after each task for every agents
@@ -184,6 +196,13 @@ class Crew(FlowTrackable, BaseModel):
 
     name: str | None = Field(default="crew")
     cache: bool = Field(default=True)
+    cache_handler: CacheHandler | None = Field(
+        default=None,
+        description=(
+            "Tool result cache shared by the crew's agents. "
+            "Defaults to an in-memory CacheHandler."
+        ),
+    )
     tasks: list[Task] = Field(default_factory=list)
     agents: list[BaseAgent] = Field(default_factory=list)
     process: Process = Field(default=Process.sequential)
@@ -250,13 +269,31 @@ class Crew(FlowTrackable, BaseModel):
             "to be respected."
         ),
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of tokens per minute for the crew execution "
+            "to be respected."
+        ),
+    )
+    rpm_controller: RPMController | None = Field(
+        default=None,
+        description=(
+            "Rate limiter to use instead of one built from max_rpm and max_tpm. "
+            "Pass RPMController.shared(name, ...) to share one budget between crews."
+        ),
+    )
     prompt_file: str | None = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
     )
     output_log_file: bool | str | None = Field(
         default=None,
-        description="Path to the log file to be saved",
+        description="Path to the log file to be saved. A .jsonl path appends one JSON object per line from a background writer.",
+    )
+    output_log_rotation: LogRotation | None = Field(
+        default=None,
+        description="Size/time rotation and gzip settings for a .jsonl output_log_file.",
     )
     planning: bool | None = Field(
         default=False,
@@ -331,7 +368,7 @@ class Crew(FlowTrackable, BaseModel):
     @model_validator(mode="after")
     def set_private_attrs(self) -> Crew:
         """set private attributes."""
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         event_listener = EventListener()
 
         # Determine and set tracing state once for this execution
@@ -345,8 +382,12 @@ class Crew(FlowTrackable, BaseModel):
         event_listener.formatter.verbose = self.verbose
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
-            self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+            self._file_handler = FileHandler(
+                self.output_log_file, rotation=self.output_log_rotation
+            )
+        self._rpm_controller = self.rpm_controller or RPMController(
+            max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+        )
         if self.function_calling_llm and not isinstance(self.function_calling_llm, LLM):
             self.function_calling_llm = create_llm(self.function_calling_llm)
 
@@ -432,9 +473,9 @@ class Crew(FlowTrackable, BaseModel):
 
         if self.agents:
             for agent in self.agents:
-                if self.cache:
+                if self.cache and not agent._has_own_cache_handler:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self._is_rate_limited():
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
@@ -753,12 +794,21 @@ class Crew(FlowTrackable, BaseModel):
         self,
         inputs: list[dict[str, Any]],
         input_files: dict[str, FileInput] | None = None,
+        max_concurrency: int = 1,
+        crew_factory: Callable[[], Any] | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput]:
         """Executes the Crew's workflow for each input and aggregates results.
 
         Args:
             inputs: List of input dictionaries, one per execution.
             input_files: Optional dict of named file inputs shared across all executions.
+            max_concurrency: Number of inputs run at the same time. Above 1,
+                inputs run through ``kickoff_batch``, each on a fresh copy of
+                the crew as in the sequential case; the first failure is
+                raised once running inputs finish. Ignored when streaming.
+            crew_factory: Picklable callable, or ``@CrewBase`` class, that
+                builds this crew. When given, inputs run in ``max_concurrency``
+                worker processes instead of threads; see ``kickoff_batch``.
 
         Returns:
             List of CrewOutput or CrewStreamingOutput objects.
@@ -766,6 +816,20 @@ class Crew(FlowTrackable, BaseModel):
         If stream=True, returns a list of CrewStreamingOutput objects that must
         each be iterated to get stream chunks and access results.
         """
+        if (max_concurrency > 1 or crew_factory is not None) and not self.stream:
+            outputs: dict[int, CrewOutput | CrewStreamingOutput] = {}
+            for batch_result in self.kickoff_batch(
+                inputs,
+                max_concurrency=max_concurrency,
+                input_files=input_files,
+                crew_factory=crew_factory,
+            ):
+                if batch_result.error is not None:
+                    raise batch_result.error
+                if batch_result.output is not None:
+                    outputs[batch_result.index] = batch_result.output
+            return [outputs[i] for i in range(len(inputs))]
+
         results: list[CrewOutput | CrewStreamingOutput] = []
 
         total_usage_metrics = UsageMetrics()
@@ -785,6 +849,97 @@ class Crew(FlowTrackable, BaseModel):
         self._task_output_handler.reset()
         return results
 
+    def kickoff_batch(
+        self,
+        inputs: Iterable[dict[str, Any]],
+        max_concurrency: int = 4,
+        input_files: dict[str, FileInput] | None = None,
+        reuse_crews: bool = False,
+        crew_factory: Callable[[], Any] | None = None,
+    ) -> Iterator[BatchResult]:
+        """Execute the Crew's workflow for many inputs with bounded concurrency.
+
+        This crew serves as a template: each input runs on its own copy, and at
+        most ``max_concurrency`` copies run at once. With ``reuse_crews`` a
+        copy is kept for its slot's later inputs instead, which avoids copying
+        per input but carries task, tool and memory state from one input into
+        the next. Results stream back as each input finishes,
+        and a failure only affects its own ``BatchResult``. ``usage_metrics``
+        is set to the merged usage once the iterator is exhausted or closed.
+
+        With ``crew_factory``, inputs run in ``max_concurrency`` worker
+        processes instead, each building its own crew once from the factory,
+        so CPU-bound work is not serialized by the GIL. Inputs, input files
+        and outputs must then be picklable, and errors raised in a worker are
+        reported as ``BatchWorkerError``.
+
+        Args:
+            inputs: Input dictionaries, read lazily, so large batches can be
+                streamed from a file or generator.
+            max_concurrency: Maximum number of inputs run at the same time.
+            input_files: Optional dict of named file inputs shared across all executions.
+            reuse_crews: Whether a slot runs later inputs on the same crew
+                copy. Only enable it for crews that keep no state between
+                kickoffs.
+            crew_factory: Picklable callable returning this crew, or the
+                ``@CrewBase`` class defining it, used to build the crew in
+                each worker process.
+
+        Returns:
+            Iterator of BatchResult in completion order; ``index`` gives each
+            result's position in ``inputs``.
+        """
+        if crew_factory is not None:
+            return self._kickoff_batch_in_processes(
+                ProcessBatchRunner(
+                    crew_factory,
+                    max_workers=max_concurrency,
+                    input_files=input_files,
+                ),
+                inputs,
+            )
+        return CrewBatchRunner(
+            self,
+            max_concurrency=max_concurrency,
+            input_files=input_files,
+            reuse_crews=reuse_crews,
+        ).run(inputs)
+
+    def _kickoff_batch_in_processes(
+        self, runner: ProcessBatchRunner, inputs: Iterable[dict[str, Any]]
+    ) -> Iterator[BatchResult]:
+        try:
+            yield from runner.run(inputs)
+        finally:
+            self.usage_metrics = runner.usage_metrics
+
+    def akickoff_batch(
+        self,
+        inputs: Iterable[dict[str, Any]],
+        max_concurrency: int = 4,
+        input_files: dict[str, FileInput] | None = None,
+        reuse_crews: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Native async variant of ``kickoff_batch`` using ``akickoff``.
+
+        Args:
+            inputs: Input dictionaries, read lazily.
+            max_concurrency: Maximum number of inputs run at the same time.
+            input_files: Optional dict of named file inputs shared across all executions.
+            reuse_crews: Whether a slot runs later inputs on the same crew
+                copy. Only enable it for crews that keep no state between
+                kickoffs.
+
+        Returns:
+            Async iterator of BatchResult in completion order.
+        """
+        return CrewBatchRunner(
+            self,
+            max_concurrency=max_concurrency,
+            input_files=input_files,
+            reuse_crews=reuse_crews,
+        ).arun(inputs)
+
     async def kickoff_async(
         self,
         inputs: dict[str, Any] | None = None,
@@ -836,12 +991,15 @@ class Crew(FlowTrackable, BaseModel):
         self,
         inputs: list[dict[str, Any]],
         input_files: dict[str, FileInput] | None = None,
+        max_concurrency: int | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
         """Executes the Crew's workflow for each input asynchronously.
 
         Args:
             inputs: List of input dictionaries, one per execution.
             input_files: Optional dict of named file inputs shared across all executions.
+            max_concurrency: Maximum number of crews running at once; None runs
+                all inputs at once. Ignored when streaming.
 
         Returns:
             List of CrewOutput or CrewStreamingOutput objects.
@@ -856,7 +1014,7 @@ class Crew(FlowTrackable, BaseModel):
         ) -> CrewOutput | CrewStreamingOutput:
             return await crew.kickoff_async(inputs=input_data, input_files=input_files)
 
-        return await run_for_each_async(self, inputs, kickoff_fn)
+        return await run_for_each_async(self, inputs, kickoff_fn, max_concurrency)
 
     async def akickoff(
         self,
@@ -944,6 +1102,7 @@ class Crew(FlowTrackable, BaseModel):
         self,
         inputs: list[dict[str, Any]],
         input_files: dict[str, FileInput] | None = None,
+        max_concurrency: int | None = None,
     ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
         """Native async execution of the Crew's workflow for each input.
 
@@ -952,6 +1111,8 @@ class Crew(FlowTrackable, BaseModel):
         Args:
             inputs: List of input dictionaries, one per execution.
             input_files: Optional dict of named file inputs shared across all executions.
+            max_concurrency: Maximum number of crews running at once; None runs
+                all inputs at once. Ignored when streaming.
 
         Returns:
             List of CrewOutput or CrewStreamingOutput objects.
@@ -965,7 +1126,7 @@ class Crew(FlowTrackable, BaseModel):
         ) -> CrewOutput | CrewStreamingOutput:
             return await crew.akickoff(inputs=input_data, input_files=input_files)
 
-        return await run_for_each_async(self, inputs, kickoff_fn)
+        return await run_for_each_async(self, inputs, kickoff_fn, max_concurrency)
 
     async def _arun_sequential_process(self) -> CrewOutput:
         """Executes tasks sequentially using native async and returns the final output."""
@@ -1666,10 +1827,12 @@ class Crew(FlowTrackable, BaseModel):
         exclude = {
             "id",
             "_rpm_controller",
+            "rpm_controller",
             "_logger",
             "_execution_span",
             "_file_handler",
             "_cache_handler",
+            "cache_handler",
             "_memory",
             "agents",
             "tasks",
@@ -1718,6 +1881,8 @@ class Crew(FlowTrackable, BaseModel):
             knowledge=existing_knowledge,
             manager_agent=manager_agent,
             manager_llm=manager_llm,
+            rpm_controller=self.rpm_controller,
+            cache_handler=self.cache_handler,
         )
 
     def _set_tasks_callbacks(self) -> None:
@@ -1738,9 +1903,14 @@ class Crew(FlowTrackable, BaseModel):
         for agent in self.agents:
             agent.interpolate_inputs(inputs)
 
+    def _is_rate_limited(self) -> bool:
+        return bool(self.rpm_controller or self.max_rpm or self.max_tpm)
+
     def _finish_execution(self, final_string_output: str) -> None:
-        if self.max_rpm:
+        if self._is_rate_limited():
             self._rpm_controller.stop_rpm_counter()
+        if self.output_log_file:
+            self._file_handler.flush()
 
     def calculate_usage_metrics(self) -> UsageMetrics:
         """Calculates and returns the usage metrics."""
@@ -1,5 +1,17 @@
+from morshed_squad.crews.batch import (
+    BatchResult,
+    BatchWorkerError,
+    CrewBatchRunner,
+    ProcessBatchRunner,
+)
 from morshed_squad.crews.crew_output import CrewOutput
 
 
 
-__all__ = ["CrewOutput"]
+__all__ = [
+    "BatchResult",
+    "BatchWorkerError",
+    "CrewBatchRunner",
+    "CrewOutput",
+    "ProcessBatchRunner",
+]
@@ -0,0 +1,401 @@
+"""Bounded-concurrency execution of one crew over many inputs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+import multiprocessing
+from multiprocessing.context import BaseContext
+import os
+import threading
+import traceback
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from morshed_squad.crews.crew_output import CrewOutput
+from morshed_squad.types.usage_metrics import UsageMetrics
+
+
+if TYPE_CHECKING:
+    from morshed_squad_files import FileInput
+
+    from morshed_squad.crew import Crew
+
+
+class BatchResult(BaseModel):
+    """Outcome of running the crew on one input of a batch.
+
+    Attributes:
+        index: Position of the input in the batch.
+        inputs: The input dictionary.
+        output: The crew output, or None if the run failed.
+        error: The exception raised by the run, if any.
+        usage_metrics: Token usage of this run alone.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description="Position of the input in the batch")
+    inputs: dict[str, Any] = Field(description="Inputs of this run")
+    output: CrewOutput | None = Field(default=None, description="Output of the run")
+    error: Exception | None = Field(default=None, description="Error raised by the run")
+    usage_metrics: UsageMetrics = Field(
+        default_factory=UsageMetrics, description="Token usage of this run"
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the run completed without raising."""
+        return self.error is None
+
+
+def _usage_delta(after: UsageMetrics, before: UsageMetrics) -> UsageMetrics:
+    """Usage accrued between two cumulative snapshots."""
+    return UsageMetrics(
+        **{
+            name: getattr(after, name) - getattr(before, name)
+            for name in UsageMetrics.model_fields
+        }
+    )
+
+
+class CrewBatchRunner:
+    """Runs a crew over many inputs with at most ``max_concurrency`` at a time.
+
+    The crew passed in is a warm template: it is never executed itself, and
+    each input runs on a copy of it, so at most ``max_concurrency`` copies
+    are alive however long the input. With ``reuse_crews`` a slot keeps its
+    copy for the following inputs instead of copying again; only use it for
+    crews that keep no state between kickoffs. Each copy counts its own
+    token usage. Inputs are consumed lazily, results are yielded as each
+    run completes, and a failing input is reported in its ``BatchResult``
+    without stopping the others. Token usage is merged into
+    ``usage_metrics`` as runs finish.
+
+    Attributes:
+        max_concurrency: Maximum number of inputs run at the same time.
+        reuse_crews: Whether a slot runs later inputs on the same crew copy.
+        usage_metrics: Token usage of the runs completed so far.
+    """
+
+    def __init__(
+        self,
+        crew: Crew,
+        max_concurrency: int = 4,
+        input_files: dict[str, FileInput] | None = None,
+        reuse_crews: bool = False,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            crew: Template crew that is copied for each concurrency slot.
+            max_concurrency: Maximum number of inputs run at the same time.
+            input_files: Optional named file inputs shared by every run.
+            reuse_crews: Whether a slot runs later inputs on the same crew copy.
+                Only enable it if tasks, tools and memory keep no state
+                between kickoffs.
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.reuse_crews = reuse_crews
+        self.usage_metrics = UsageMetrics()
+        self._template = crew
+        self._input_files = input_files
+        self._idle: list[Crew] = []
+        self._lock = threading.Lock()
+
+    def _checkout(self) -> Crew:
+        """Take an idle crew copy, or copy the template."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            crew = self._template.copy()
+        crew.stream = False
+        return crew
+
+    def _checkin(self, crew: Crew) -> None:
+        if self.reuse_crews:
+            with self._lock:
+                self._idle.append(crew)
+
+    def _record(
+        self, index: int, inputs: dict[str, Any], crew: Crew, before: UsageMetrics
+    ) -> BatchResult:
+        usage = _usage_delta(crew.calculate_usage_metrics(), before)
+        with self._lock:
+            self.usage_metrics.add_usage_metrics(usage)
+        return BatchResult(index=index, inputs=inputs, usage_metrics=usage)
+
+    def _run_one(self, index: int, inputs: dict[str, Any]) -> BatchResult:
+        crew = self._checkout()
+        before = crew.calculate_usage_metrics()
+        try:
+            output = crew.kickoff(inputs=inputs, input_files=self._input_files)
+        except Exception as e:
+            result = self._record(index, inputs, crew, before)
+            result.error = e
+        else:
+            result = self._record(index, inputs, crew, before)
+            result.output = output  # type: ignore[assignment]
+        self._checkin(crew)
+        return result
+
+    async def _arun_one(self, index: int, inputs: dict[str, Any]) -> BatchResult:
+        crew = self._checkout()
+        before = crew.calculate_usage_metrics()
+        try:
+            output = await crew.akickoff(inputs=inputs, input_files=self._input_files)
+        except Exception as e:
+            result = self._record(index, inputs, crew, before)
+            result.error = e
+        else:
+            result = self._record(index, inputs, crew, before)
+            result.output = output  # type: ignore[assignment]
+        self._checkin(crew)
+        return result
+
+    def _finish(self) -> None:
+        self._template.usage_metrics = self.usage_metrics
+        self._template._task_output_handler.reset()
+        with self._lock:
+            self._idle.clear()
+
+    def run(self, inputs: Iterable[dict[str, Any]]) -> Iterator[BatchResult]:
+        """Run every input on worker threads, yielding results as they complete.
+
+        Closing the iterator early cancels inputs that have not started and
+        waits for the running ones.
+
+        Args:
+            inputs: Input dictionaries, read lazily.
+
+        Yields:
+            One ``BatchResult`` per input, in completion order.
+        """
+        pending = enumerate(inputs)
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="crew-batch"
+        )
+        in_flight: set[Future[BatchResult]] = set()
+        try:
+            while True:
+                for index, input_data in islice(
+                    pending, self.max_concurrency - len(in_flight)
+                ):
+                    in_flight.add(executor.submit(self._run_one, index, input_data))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._finish()
+
+    async def arun(self, inputs: Iterable[dict[str, Any]]) -> AsyncIterator[BatchResult]:
+        """Run every input with native async kickoff, yielding results as they complete.
+
+        Args:
+            inputs: Input dictionaries, read lazily.
+
+        Yields:
+            One ``BatchResult`` per input, in completion order.
+        """
+        pending = enumerate(inputs)
+        in_flight: set[asyncio.Task[BatchResult]] = set()
+        try:
+            while True:
+                for index, input_data in islice(
+                    pending, self.max_concurrency - len(in_flight)
+                ):
+                    in_flight.add(asyncio.create_task(self._arun_one(index, input_data)))
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            self._finish()
+
+
+class BatchWorkerError(Exception):
+    """An exception raised inside a batch worker process.
+
+    The original exception may not be picklable, so its type name, message
+    and formatted traceback are sent back instead.
+
+    Attributes:
+        error_type: Qualified name of the original exception type.
+        worker_traceback: Traceback formatted in the worker process.
+    """
+
+    def __init__(self, error_type: str, message: str, worker_traceback: str) -> None:
+        super().__init__(error_type, message, worker_traceback)
+        self.error_type = error_type
+        self.message = message
+        self.worker_traceback = worker_traceback
+
+    def __str__(self) -> str:
+        return f"{self.error_type}: {self.message}"
+
+
+_worker_factory: Callable[[], Any] | None = None
+_worker_input_files: dict[str, FileInput] | None = None
+_worker_crew: Crew | None = None
+
+
+def _build_crew(factory: Callable[[], Any]) -> Crew:
+    """Call a crew factory; ``@CrewBase`` classes are instantiated and their crew built."""
+    built = factory()
+    if getattr(built, "is_crew_class", False):
+        built = built.crew()
+    return built  # type: ignore[no-any-return]
+
+
+def _init_worker(
+    factory: Callable[[], Any], input_files: dict[str, FileInput] | None
+) -> None:
+    global _worker_factory, _worker_input_files
+    _worker_factory = factory
+    _worker_input_files = input_files
+
+
+def _run_in_worker(
+    index: int, inputs: dict[str, Any]
+) -> tuple[int, CrewOutput | None, BatchWorkerError | None, dict[str, int]]:
+    """Run one input on this process's crew, building it on first use.
+
+    Returns a plain tuple rather than a ``BatchResult`` to keep the pickled
+    reply small; the inputs are not sent back.
+    """
+    global _worker_crew
+    try:
+        if _worker_crew is None:
+            if _worker_factory is None:
+                raise RuntimeError("batch worker was not initialized")
+            _worker_crew = _build_crew(_worker_factory)
+            _worker_crew.stream = False
+        before = _worker_crew.calculate_usage_metrics()
+    except Exception as e:
+        return index, None, _worker_error(e), {}
+    output: CrewOutput | None = None
+    error: BatchWorkerError | None = None
+    try:
+        output = _worker_crew.kickoff(inputs=inputs, input_files=_worker_input_files)  # type: ignore[assignment]
+    except Exception as e:
+        error = _worker_error(e)
+    usage = _usage_delta(_worker_crew.calculate_usage_metrics(), before)
+    return index, output, error, usage.model_dump()
+
+
+def _worker_error(error: Exception) -> BatchWorkerError:
+    return BatchWorkerError(
+        f"{type(error).__module__}.{type(error).__qualname__}",
+        str(error),
+        traceback.format_exc(),
+    )
+
+
+class ProcessBatchRunner:
+    """Runs a crew over many inputs in a pool of worker processes.
+
+    CPU-bound work in a kickoff (prompt rendering, validation, output
+    parsing, local embedders) shares one interpreter lock when run on
+    threads; separate processes scale it across cores. Each worker builds
+    its own crew once, from ``crew_factory``, and then runs input after
+    input on it. Inputs are consumed lazily with at most two per worker
+    queued, results stream back as they complete, and failures are isolated
+    per input.
+
+    ``crew_factory`` must be picklable: a module-level function returning a
+    ``Crew``, or a ``@CrewBase`` project class, which is instantiated and its
+    ``crew()`` method called. Workers use the ``spawn`` start method by
+    default, so scripts must guard their entry point with
+    ``if __name__ == "__main__":``. Events emitted inside workers are not
+    delivered to listeners in the parent process.
+
+    Attributes:
+        max_workers: Number of worker processes.
+        usage_metrics: Token usage of the runs completed so far.
+    """
+
+    def __init__(
+        self,
+        crew_factory: Callable[[], Any],
+        max_workers: int | None = None,
+        input_files: dict[str, FileInput] | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            crew_factory: Picklable callable building the crew in each worker.
+            max_workers: Number of worker processes; defaults to the CPU count.
+            input_files: Optional named file inputs shared by every run; must
+                be picklable.
+            mp_context: Multiprocessing context; defaults to ``spawn``.
+        """
+        self.max_workers = max(max_workers or os.cpu_count() or 1, 1)
+        self.usage_metrics = UsageMetrics()
+        self._crew_factory = crew_factory
+        self._input_files = input_files
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(self, inputs: Iterable[dict[str, Any]]) -> Iterator[BatchResult]:
+        """Run every input in the worker pool, yielding results as they complete.
+
+        Closing the iterator early cancels inputs that have not started and
+        waits for the running ones.
+
+        Args:
+            inputs: Input dictionaries, read lazily; each must be picklable.
+
+        Yields:
+            One ``BatchResult`` per input, in completion order.
+        """
+        pending = enumerate(inputs)
+        submitted: dict[int, dict[str, Any]] = {}
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._crew_factory, self._input_files),
+        )
+        in_flight: set[Future[Any]] = set()
+        try:
+            while True:
+                for index, input_data in islice(
+                    pending, 2 * self.max_workers - len(in_flight)
+                ):
+                    submitted[index] = input_data
+                    in_flight.add(executor.submit(_run_in_worker, index, input_data))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, output, error, usage_data = future.result()
+                    usage = UsageMetrics(**usage_data)
+                    self.usage_metrics.add_usage_metrics(usage)
+                    yield BatchResult(
+                        index=index,
+                        inputs=submitted.pop(index),
+                        output=output,
+                        error=error,
+                        usage_metrics=usage,
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping
+import contextlib
 from typing import TYPE_CHECKING, Any
 
 from opentelemetry import baggage
@@ -362,13 +363,20 @@ async def run_for_each_async(
     kickoff_fn: Callable[
         [Crew, dict[str, Any]], Coroutine[Any, Any, CrewOutput | CrewStreamingOutput]
     ],
+    max_concurrency: int | None = None,
 ) -> list[CrewOutput | CrewStreamingOutput] | CrewStreamingOutput:
     """Execute crew workflow for each input asynchronously.
 
+    Without streaming, each crew copy is made when its run starts and its
+    usage is merged as soon as it finishes, so with ``max_concurrency`` only
+    that many copies are alive at once.
+
     Args:
         crew: The crew instance to execute.
         inputs: List of input dictionaries for each execution.
         kickoff_fn: Async function to call for each crew copy (kickoff_async or akickoff).
+        max_concurrency: Maximum number of crews running at once; None runs all
+            inputs at once. Only applies without streaming.
 
     Returns:
         If streaming, a single CrewStreamingOutput that yields chunks from all crews.
@@ -381,9 +389,8 @@ async def run_for_each_async(
         signal_error,
     )
 
-    crew_copies = [crew.copy() for _ in inputs]
-
     if crew.stream:
+        crew_copies = [crew.copy() for _ in inputs]
         ctx = ForEachStreamingContext()
 
         async def run_all_crews() -> None:
@@ -430,17 +437,20 @@ async def run_for_each_async(
 
         return streaming_output
 
-    async_tasks: list[asyncio.Task[CrewOutput | CrewStreamingOutput]] = [
-        asyncio.create_task(kickoff_fn(crew_copy, input_data))
-        for crew_copy, input_data in zip(crew_copies, inputs, strict=True)
-    ]
+    total_usage_metrics = UsageMetrics()
+    limit: asyncio.Semaphore | contextlib.nullcontext[None] = (
+        asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+    )
 
-    results = await asyncio.gather(*async_tasks)
+    async def run_one(input_data: dict[str, Any]) -> CrewOutput | CrewStreamingOutput:
+        async with limit:
+            crew_copy = crew.copy()
+            result = await kickoff_fn(crew_copy, input_data)
+            if crew_copy.usage_metrics:
+                total_usage_metrics.add_usage_metrics(crew_copy.usage_metrics)
+            return result
 
-    total_usage_metrics = UsageMetrics()
-    for crew_copy in crew_copies:
-        if crew_copy.usage_metrics:
-            total_usage_metrics.add_usage_metrics(crew_copy.usage_metrics)
+    results = await asyncio.gather(*(run_one(input_data) for input_data in inputs))
     crew.usage_metrics = total_usage_metrics
 
     crew._task_output_handler.reset()
@@ -1,20 +1,80 @@
 import sqlite3
 import os
 import hashlib
+import threading
 from datetime import datetime
+from typing import ClassVar
 
 class DatabaseManager:
+    # Connections are pooled per thread and per database file, so the many
+    # short-lived DatabaseManager instances created by tools and the UI reuse
+    # one connection (and its prepared statement cache) instead of reopening.
+    # The schema is created whenever a connection is opened, so every
+    # ":memory:" connection and every re-created database file gets its tables.
+    _local: ClassVar[threading.local] = threading.local()
+    _init_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, db_path="morshed.db", user_id=None):
         self.db_path = db_path
         self.user_id = user_id
         self._initialize_db()
 
     def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get(self.db_path)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, cached_statements=256)
+            # WAL lets the UI read while crews write; NORMAL is durable in WAL mode.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                self._create_schema(conn)
+            conns[self.db_path] = conn
+        return conn
 
-    def _initialize_db(self):
+    def close(self):
+        """Close this thread's pooled connection to the database."""
+        conns = getattr(self._local, "conns", None)
+        if conns and self.db_path in conns:
+            conns.pop(self.db_path).close()
+
+    def _paginate(self, query, params, limit=None, offset=0):
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = (*params, limit, offset)
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def _iter_query(self, query, params, batch_size=1000):
+        # Streams rows with fetchmany on a dedicated cursor instead of
+        # materializing the whole result set.
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = sqlite3.Row
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows: break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    def _initialize_db(self):
+        # A pooled connection to a file that was deleted keeps using the unlinked
+        # file; reopen so the database is re-created with its schema.
+        if self.db_path != ":memory:" and not os.path.exists(self.db_path):
+            self.close()
+        self._get_connection()
+
+    def _create_schema(self, conn):
+        with conn:
+            cursor = conn.cursor()
             
             # 1. Migration checks: Rename old tables that clash with new unique constraints
             cursor.execute("PRAGMA table_info(custom_agents)")
@@ -159,7 +219,16 @@ class DatabaseManager:
             if columns and 'transcript' not in columns:
                 cursor.execute("ALTER TABLE telephony_logs ADD COLUMN transcript TEXT")
 
-            # 6. Default Admin User setup for backward compatibility (Adopts old rows with user_id=1)
+            # 6. Indexes for tenant-scoped lookups, status filters and newest-first listings
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_user_status ON leads(user_id, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_user_created ON leads(user_id, created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_telephony_user_ts ON telephony_logs(user_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_telephony_lead ON telephony_logs(lead_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_outputs_user_ts ON agent_outputs(user_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_social_user_status ON social_posts(user_id, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_pending_user_status ON pending_actions(user_id, status)")
+
+            # 7. Default Admin User setup for backward compatibility (Adopts old rows with user_id=1)
             cursor.execute("SELECT COUNT(*) FROM users")
             if cursor.fetchone()[0] == 0:
                 default_hash = hashlib.sha256(b"admin123").hexdigest()
@@ -185,8 +254,8 @@ class DatabaseManager:
     def verify_user(self, username, password):
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM users WHERE username = ? AND password_hash = ?", (username, password_hash))
             row = cursor.fetchone()
             return dict(row) if row else None
@@ -224,6 +293,58 @@ class DatabaseManager:
         except sqlite3.IntegrityError:
             return None
 
+    def add_leads_bulk(self, leads):
+        """Insert many leads in one transaction.
+
+        `leads` is an iterable of (name, phone) or (name, phone, email) tuples.
+        Returns the number of rows inserted, or 0 when a constraint rejected
+        the batch.
+        """
+        if not self.user_id: return 0
+        rows = [
+            (self.user_id, lead[0], lead[1], lead[2] if len(lead) > 2 else None)
+            for lead in leads
+        ]
+        if not rows: return 0
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "INSERT INTO leads (user_id, name, phone, email) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                return cursor.rowcount
+        except sqlite3.IntegrityError:
+            # The transaction is rolled back, so no lead of the batch is stored.
+            return 0
+
+    def iter_leads(self, batch_size=1000):
+        """Yield this user's leads one dict at a time, oldest first."""
+        if not self.user_id: return iter(())
+        return self._iter_query(
+            "SELECT * FROM leads WHERE user_id = ? ORDER BY id",
+            (self.user_id,), batch_size
+        )
+
+    def get_lead_contacts(self):
+        """Return the sets of phones and emails already stored for this user."""
+        phones, emails = set(), set()
+        if not self.user_id: return phones, emails
+        for row in self._iter_query("SELECT phone, email FROM leads WHERE user_id = ?", (self.user_id,)):
+            if row["phone"]: phones.add(row["phone"])
+            if row["email"]: emails.add(row["email"].lower())
+        return phones, emails
+
+    def count_leads(self, status=None):
+        if not self.user_id: return 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if status is None:
+                cursor.execute("SELECT COUNT(*) FROM leads WHERE user_id = ?", (self.user_id,))
+            else:
+                cursor.execute("SELECT COUNT(*) FROM leads WHERE user_id = ? AND status = ?", (self.user_id, status))
+            return cursor.fetchone()[0]
+
     def save_agent_memory(self, key, value):
         if not self.user_id: return
         with self._get_connection() as conn:
@@ -248,8 +369,8 @@ class DatabaseManager:
     def get_pending_social_posts(self):
         if not self.user_id: return []
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM social_posts WHERE status = 'Pending' AND user_id = ? ORDER BY timestamp DESC", (self.user_id,))
             return [dict(row) for row in cursor.fetchall()]
 
@@ -263,13 +384,40 @@ class DatabaseManager:
             )
             conn.commit()
 
-    def get_all_agent_outputs(self):
-        if not self.user_id: return []
+    def log_agent_outputs_bulk(self, outputs):
+        """Insert many agent outputs in one transaction.
+
+        `outputs` is an iterable of dicts with the keyword arguments of
+        `log_agent_output`. Returns the number of rows inserted.
+        """
+        if not self.user_id: return 0
+        rows = [
+            (
+                self.user_id,
+                o.get("crew_name"),
+                o.get("output"),
+                o.get("status", "Success"),
+                o.get("execution_time"),
+                o.get("metadata"),
+                o.get("tokens_used"),
+            )
+            for o in outputs
+        ]
+        if not rows: return 0
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM agent_outputs WHERE user_id = ? ORDER BY timestamp DESC", (self.user_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.executemany(
+                "INSERT INTO agent_outputs (user_id, crew_name, output, status, execution_time, metadata, tokens_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            return cursor.rowcount
+
+    def get_all_agent_outputs(self, limit=None, offset=0):
+        if not self.user_id: return []
+        return self._paginate(
+            "SELECT * FROM agent_outputs WHERE user_id = ? ORDER BY timestamp DESC",
+            (self.user_id,), limit, offset
+        )
 
     def update_social_post(self, post_id: int, status: str, content: str = None):
         if not self.user_id: return
@@ -287,13 +435,12 @@ class DatabaseManager:
                 )
             conn.commit()
 
-    def get_pending_leads(self):
+    def get_pending_leads(self, limit=None, offset=0):
         if not self.user_id: return []
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM leads WHERE status = 'Pending' AND user_id = ?", (self.user_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        return self._paginate(
+            "SELECT * FROM leads WHERE status = 'Pending' AND user_id = ? ORDER BY id",
+            (self.user_id,), limit, offset
+        )
 
     def update_lead_status(self, lead_id, status, summary=None):
         if not self.user_id: return
@@ -321,27 +468,33 @@ class DatabaseManager:
             )
             conn.commit()
 
-    def get_all_leads(self):
+    def get_all_leads(self, limit=None, offset=0):
         if not self.user_id: return []
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM leads WHERE user_id = ? ORDER BY created_at DESC", (self.user_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        return self._paginate(
+            "SELECT * FROM leads WHERE user_id = ? ORDER BY created_at DESC",
+            (self.user_id,), limit, offset
+        )
 
-    def get_telephony_logs(self):
+    def get_telephony_logs(self, limit=None, offset=0):
         if not self.user_id: return []
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
+        return self._paginate("""
                 SELECT l.name, l.phone, t.id, t.provider, t.type, t.result, t.transcript, t.timestamp 
                 FROM telephony_logs t
                 JOIN leads l ON t.lead_id = l.id
                 WHERE t.user_id = ?
                 ORDER BY t.timestamp DESC
-            """, (self.user_id,))
-            return [dict(row) for row in cursor.fetchall()]
+            """, (self.user_id,), limit, offset)
+
+    def iter_telephony_logs(self, batch_size=1000):
+        """Yield this user's telephony logs joined with lead name/phone, oldest first."""
+        if not self.user_id: return iter(())
+        return self._iter_query("""
+                SELECT l.name, l.phone, t.id, t.provider, t.type, t.result, t.transcript, t.timestamp
+                FROM telephony_logs t
+                JOIN leads l ON t.lead_id = l.id
+                WHERE t.user_id = ?
+                ORDER BY t.id
+            """, (self.user_id,), batch_size)
 
     def update_transcript(self, log_id, transcript):
         if not self.user_id: return
@@ -367,8 +520,8 @@ class DatabaseManager:
     def get_all_agents(self):
         if not self.user_id: return []
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM custom_agents WHERE user_id = ? ORDER BY id DESC", (self.user_id,))
             return [dict(row) for row in cursor.fetchall()]
 
@@ -393,8 +546,8 @@ class DatabaseManager:
     def get_all_tasks(self):
         if not self.user_id: return []
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM custom_tasks WHERE user_id = ? ORDER BY timestamp DESC", (self.user_id,))
             return [dict(row) for row in cursor.fetchall()]
 
@@ -420,8 +573,8 @@ class DatabaseManager:
     def check_action_status(self, action_id: int):
         if not self.user_id: return 'Rejected', 'No user ID'
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT status, feedback FROM pending_actions WHERE id = ? AND user_id = ?", (action_id, self.user_id))
             row = cursor.fetchone()
             if row:
@@ -431,8 +584,8 @@ class DatabaseManager:
     def get_all_pending_actions(self):
         if not self.user_id: return []
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM pending_actions WHERE status = 'Pending' AND user_id = ? ORDER BY timestamp DESC", (self.user_id,))
             return [dict(row) for row in cursor.fetchall()]
 
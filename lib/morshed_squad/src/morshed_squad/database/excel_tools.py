@@ -1,50 +1,164 @@
-import pandas as pd
+import csv
 import os
+import re
+
 from morshed_squad.database.database_manager import DatabaseManager
 
+
+LEAD_COLUMNS = ['id', 'name', 'phone', 'email', 'status', 'research_summary', 'created_at', 'updated_at']
+LOG_COLUMNS = ['id', 'name', 'phone', 'provider', 'type', 'result', 'transcript', 'timestamp']
+
+_PHONE_STRIP = re.compile(r"[^\d+]")
+
+
+def _cell_to_str(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        # Spreadsheets store long numeric phone numbers as floats.
+        value = int(value)
+    return str(value).strip()
+
+
+def _normalize_phone(phone):
+    return _PHONE_STRIP.sub('', phone or '')
+
+
 class ExcelManager:
     """
     Handles importing leads from Excel/CSV and exporting outreach reports.
+
+    Both directions stream: imports read rows lazily and insert them in
+    batched transactions, exports write rows as they come off a database
+    cursor, so memory use stays flat for very large lead lists.
     """
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = 5000):
         self.db = db_manager
+        self.batch_size = batch_size
+
+    def _iter_rows(self, file_path):
+        """Yield each data row as a dict keyed by the header row."""
+        if file_path.endswith('.csv'):
+            with open(file_path, newline='', encoding='utf-8-sig') as f:
+                yield from csv.DictReader(f)
+            return
+
+        from openpyxl import load_workbook
 
-    def import_leads(self, file_path):
-        """Reads Excel/CSV and adds to DB."""
+        wb = load_workbook(file_path, read_only=True, data_only=True)
         try:
-            if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-            
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            keys = [_cell_to_str(h) for h in header]
+            for values in rows:
+                # Ragged rows are allowed, like csv.DictReader's missing cells.
+                yield dict(zip(keys, values, strict=False))
+        finally:
+            wb.close()
+
+    def import_leads(self, file_path, progress_callback=None):
+        """Streams Excel/CSV rows into the DB in batched transactions.
+
+        Rows without a name or phone are skipped, as are rows whose phone or
+        email already exists for this user (or earlier in the same file).
+        `progress_callback(rows_read, leads_imported)` is called after each batch.
+        """
+        try:
+            phones, emails = self.db.get_lead_contacts()
+            seen_phones = {_normalize_phone(p) for p in phones}
+            seen_emails = set(emails)
+
             # Expected columns: Name, Phone, Email (Email optional)
             count = 0
-            for _, row in df.iterrows():
-                name = str(row.get('Name', '')).strip()
-                phone = str(row.get('Phone', '')).strip()
-                email = str(row.get('Email', '')).strip() if 'Email' in row else None
-                
+            read = 0
+            batch = []
+            for row in self._iter_rows(file_path):
+                read += 1
+                name = _cell_to_str(row.get('Name'))
+                phone = _cell_to_str(row.get('Phone'))
+                email = _cell_to_str(row.get('Email')) or None
+
                 if name and phone:
-                    res = self.db.add_lead(name, phone, email)
-                    if res:
-                        count += 1
+                    key = _normalize_phone(phone)
+                    mail = email.lower() if email else None
+                    if key in seen_phones or (mail and mail in seen_emails):
+                        continue
+                    seen_phones.add(key)
+                    if mail:
+                        seen_emails.add(mail)
+                    batch.append((name, phone, email))
+
+                if len(batch) >= self.batch_size:
+                    count += self.db.add_leads_bulk(batch)
+                    batch = []
+                    if progress_callback:
+                        progress_callback(read, count)
+
+            if batch:
+                count += self.db.add_leads_bulk(batch)
+            if progress_callback:
+                progress_callback(read, count)
             return f"Successfully imported {count} leads."
         except Exception as e:
             return f"Import failed: {str(e)}"
 
-    def export_report(self, output_path="outreach_report.xlsx"):
-        """Generates an Excel report of all leads and logs."""
+    def _write_rows(self, sheet_rows, progress_callback):
+        written = 0
+        for row in sheet_rows:
+            yield row
+            written += 1
+            if progress_callback and written % self.batch_size == 0:
+                progress_callback(written)
+
+    def _export_csv(self, output_path, progress_callback):
+        stem, _ = os.path.splitext(output_path)
+        leads_path = f"{stem}_leads.csv"
+        logs_path = f"{stem}_telephony_logs.csv"
+        for path, columns, rows in (
+            (leads_path, LEAD_COLUMNS, self.db.iter_leads(self.batch_size)),
+            (logs_path, LOG_COLUMNS, self.db.iter_telephony_logs(self.batch_size)),
+        ):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(
+                    [r.get(c) for c in columns]
+                    for r in self._write_rows(rows, progress_callback)
+                )
+        return f"Report exported to {leads_path} and {logs_path}"
+
+    def export_report(self, output_path="outreach_report.xlsx", progress_callback=None):
+        """Generates an Excel report of all leads and logs.
+
+        Rows are streamed from the database into a write-only workbook.
+        A CSV file holds a single table, so when `output_path` ends in `.csv`
+        (or openpyxl is unavailable) it is only used as a name stem: leads go
+        to `<stem>_leads.csv`, telephony logs to `<stem>_telephony_logs.csv`,
+        and nothing is written to `output_path` itself. The returned message
+        names the files actually written.
+        `progress_callback(rows_written)` is called every `batch_size` rows.
+        """
         try:
-            leads = self.db.get_all_leads()
-            logs = self.db.get_telephony_logs()
-            
-            df_leads = pd.DataFrame(leads)
-            df_logs = pd.DataFrame(logs)
-            
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                df_leads.to_excel(writer, sheet_name='Leads', index=False)
-                df_logs.to_excel(writer, sheet_name='Telephony Logs', index=False)
-            
+            if output_path.endswith('.csv'):
+                return self._export_csv(output_path, progress_callback)
+            try:
+                from openpyxl import Workbook
+            except ImportError:
+                return self._export_csv(output_path, progress_callback)
+
+            wb = Workbook(write_only=True)
+            for title, columns, rows in (
+                ('Leads', LEAD_COLUMNS, self.db.iter_leads(self.batch_size)),
+                ('Telephony Logs', LOG_COLUMNS, self.db.iter_telephony_logs(self.batch_size)),
+            ):
+                ws = wb.create_sheet(title)
+                ws.append(columns)
+                for r in self._write_rows(rows, progress_callback):
+                    ws.append([r.get(c) for c in columns])
+            wb.save(output_path)
+
             return f"Report exported to {output_path}"
         except Exception as e:
             return f"Export failed: {str(e)}"
@@ -736,6 +736,9 @@ class TraceCollectionListener(BaseEventListener):
         self, event_type: str, event: Any, source: Any
     ) -> dict[str, Any]:
         """Build event data"""
+        if getattr(event, "state_patch", None) is not None:
+            # Diff mode: ship the state delta instead of the full snapshot.
+            return safe_serialize_to_dict(event, exclude={"state"})
         if event_type not in self.complex_events:
             return safe_serialize_to_dict(event)
         if event_type == "task_started":
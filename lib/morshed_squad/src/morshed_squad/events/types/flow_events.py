@@ -1,10 +1,69 @@
+from collections.abc import Callable, Iterator, Mapping
+import threading
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
 from morshed_squad.events.base_events import BaseEvent
 
 
+class LazyFlowState(Mapping[str, Any]):
+    """Read-only flow state payload that is serialized on first access.
+
+    Method events carry one of these when the flow's ``state_events`` mode is
+    ``"lazy"``, so handlers that never look at ``state`` never pay for copying
+    and dumping it. The value reflects the flow state at the time of the first
+    read, after which it is fixed.
+    """
+
+    def __init__(self, loader: Callable[[], dict[str, Any]]) -> None:
+        self._loader: Callable[[], dict[str, Any]] | None = loader
+        self._value: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the state has already been serialized."""
+        return self._loader is None
+
+    def resolve(self) -> dict[str, Any]:
+        """Serialize the state if needed and return it as a dict."""
+        with self._lock:
+            if self._loader is not None:
+                self._value = self._loader()
+                self._loader = None
+            return self._value if self._value is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self.resolve()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __repr__(self) -> str:
+        if not self.resolved:
+            return "LazyFlowState(<unresolved>)"
+        return f"LazyFlowState({self.resolve()!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, _handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Accept instances as-is and serialize them as their resolved dict."""
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.resolve()
+                if isinstance(value, LazyFlowState)
+                else value
+            ),
+        )
+
+
 class FlowEvent(BaseEvent):
     """Base class for all flow events"""
 
@@ -32,7 +91,10 @@ class MethodExecutionStartedEvent(FlowEvent):
 
     flow_name: str
     method_name: str
-    state: dict[str, Any] | BaseModel
+    state: LazyFlowState | dict[str, Any] | BaseModel = Field(
+        union_mode="left_to_right"
+    )
+    state_patch: list[dict[str, Any]] | None = None
     params: dict[str, Any] | None = None
     type: str = "method_execution_started"
 
@@ -43,7 +105,10 @@ class MethodExecutionFinishedEvent(FlowEvent):
     flow_name: str
     method_name: str
     result: Any = None
-    state: dict[str, Any] | BaseModel
+    state: LazyFlowState | dict[str, Any] | BaseModel = Field(
+        union_mode="left_to_right"
+    )
+    state_patch: list[dict[str, Any]] | None = None
     type: str = "method_execution_finished"
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine
 from datetime import datetime
 import json
@@ -50,8 +51,8 @@ from morshed_squad.hooks.types import (
     BeforeLLMCallHookType,
 )
 from morshed_squad.utilities.agent_utils import (
+    aenforce_rpm_limit,
     convert_tools_to_openai_schema,
-    enforce_rpm_limit,
     extract_tool_call_info,
     format_message_for_llm,
     get_llm_response,
@@ -418,15 +419,21 @@ class AgentExecutor(Flow[AgentReActState], CrewAgentExecutorMixin):
         return "agent_finished"
 
     @listen("continue_reasoning")
-    def call_llm_and_parse(self) -> Literal["parsed", "parser_error", "context_error"]:
+    async def call_llm_and_parse(
+        self,
+    ) -> Literal["parsed", "parser_error", "context_error"]:
         """Execute LLM call with hooks and parse the response.
 
+        The rate limit is awaited on the event loop; the LLM call itself runs in
+        a worker thread.
+
         Returns routing decision based on parsing result.
         """
         try:
-            enforce_rpm_limit(self.request_within_rpm_limit)
+            await aenforce_rpm_limit(self.request_within_rpm_limit)
 
-            answer = get_llm_response(
+            answer = await asyncio.to_thread(
+                get_llm_response,
                 llm=self.llm,
                 messages=list(self.state.messages),
                 callbacks=self.callbacks,
@@ -484,7 +491,7 @@ class AgentExecutor(Flow[AgentReActState], CrewAgentExecutorMixin):
             raise
 
     @listen("continue_reasoning_native")
-    def call_llm_native_tools(self) -> None:
+    async def call_llm_native_tools(self) -> None:
         """Execute LLM call with native function calling.
 
         Always calls the LLM so it can read reflection prompts and decide
@@ -500,10 +507,11 @@ class AgentExecutor(Flow[AgentReActState], CrewAgentExecutorMixin):
             # 2. Return tool calls (possibly same ones, or different ones)
             self.state.pending_tool_calls.clear()
 
-            enforce_rpm_limit(self.request_within_rpm_limit)
+            await aenforce_rpm_limit(self.request_within_rpm_limit)
 
             # Call LLM with native tools
-            answer = get_llm_response(
+            answer = await asyncio.to_thread(
+                get_llm_response,
                 llm=self.llm,
                 messages=list(self.state.messages),
                 callbacks=self.callbacks,
@@ -60,6 +60,7 @@ from morshed_squad.events.types.flow_events import (
     FlowPausedEvent,
     FlowPlotEvent,
     FlowStartedEvent,
+    LazyFlowState,
     MethodExecutionFailedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionPausedEvent,
@@ -77,6 +78,7 @@ from morshed_squad.flow.flow_wrappers import (
     StartMethod,
 )
 from morshed_squad.flow.persistence.base import FlowPersistence
+from morshed_squad.flow.state_patch import make_state_patch
 from morshed_squad.flow.types import FlowExecutionData, FlowMethodName, InputHistoryEntry, PendingListenerKey
 from morshed_squad.flow.utils import (
     _extract_all_methods,
@@ -737,6 +739,14 @@ class Flow(Generic[T], metaclass=FlowMeta):
     name: str | None = None
     tracing: bool | None = None
     stream: bool = False
+    # How method started/finished events carry state: "full" snapshots each time,
+    # "lazy" serializes only when a handler reads event.state, "diff" also attaches
+    # a JSON Patch against the previous event in event.state_patch and only
+    # re-serializes the top-level fields that changed. Lazy payloads are read
+    # under the state lock but show the state as of that first read, which can
+    # be later than the event when handlers run on other threads; use "full" or
+    # "diff" when handlers need the state at emit time.
+    state_events: Literal["full", "lazy", "diff"] = "full"
     memory: Any = None  # Memory | MemoryScope | MemorySlice | None; auto-created if not set
     input_provider: Any = None  # InputProvider | None; per-flow override for self.ask()
 
@@ -776,8 +786,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
             set()
         )  # Track completed methods for reload
         self._persistence: FlowPersistence | None = persistence
+        # Backends that @persist saved to, flushed when execution ends.
+        self._persistence_backends: list[FlowPersistence] = []
         self._is_execution_resuming: bool = False
         self._event_futures: list[Future[None]] = []
+        self._last_event_state: dict[str, Any] | None = None
+        # Copies of the top-level state values behind _last_event_state.
+        self._last_event_values: dict[str, Any] = {}
 
         # Human feedback storage
         self.human_feedback_history: list[HumanFeedbackResult] = []
@@ -1328,6 +1343,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 # Return the pending exception instead of raising
                 return e
             raise
+        finally:
+            self._flush_persistence()
 
         # Emit flow finished
         crewai_event_bus.emit(
@@ -1342,6 +1359,18 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         return final_result
 
+    def _flush_persistence(self) -> None:
+        """Wait until every state save queued by this flow has been written.
+
+        Raises:
+            Exception: If a background writer failed to persist a queued state.
+        """
+        backends = list(self._persistence_backends)
+        if self._persistence is not None and self._persistence not in backends:
+            backends.append(self._persistence)
+        for backend in backends:
+            backend.flush()
+
     def _create_initial_state(self) -> T:
         """Create and initialize flow state with UUID and default values.
 
@@ -1842,6 +1871,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
             if get_current_parent_id() is None:
                 reset_emission_counter()
                 reset_last_event_id()
+            self._last_event_state = None
+            self._last_event_values = {}
 
             if not self.suppress_flow_events:
                 future = crewai_event_bus.emit(
@@ -1986,6 +2017,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
             # Ensure all background memory saves complete before returning
             if self.memory is not None and hasattr(self.memory, "drain_writes"):
                 self.memory.drain_writes()
+            self._flush_persistence()
             if request_id_token is not None:
                 current_flow_request_id.reset(request_id_token)
             if flow_id_token is not None:
@@ -2115,6 +2147,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
 
             if not self.suppress_flow_events:
+                state, state_patch = self._method_event_state()
                 future = crewai_event_bus.emit(
                     self,
                     MethodExecutionStartedEvent(
@@ -2122,7 +2155,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
                         method_name=method_name,
                         flow_name=self.name or self.__class__.__name__,
                         params=dumped_params,
-                        state=self._copy_and_serialize_state(),
+                        state=state,
+                        state_patch=state_patch,
                     ),
                 )
                 if future:
@@ -2160,11 +2194,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             finished_event_id: str | None = None
             if not self.suppress_flow_events:
+                state, state_patch = self._method_event_state()
                 finished_event = MethodExecutionFinishedEvent(
                     type="method_execution_finished",
                     method_name=method_name,
                     flow_name=self.name or self.__class__.__name__,
-                    state=self._copy_and_serialize_state(),
+                    state=state,
+                    state_patch=state_patch,
                     result=result,
                 )
                 finished_event_id = finished_event.event_id
@@ -2216,14 +2252,87 @@ class Flow(Generic[T], metaclass=FlowMeta):
             raise e
 
     def _copy_and_serialize_state(self) -> dict[str, Any]:
-        state_copy = self._copy_state()
-        if isinstance(state_copy, BaseModel):
+        if isinstance(self._state, BaseModel):
+            # A JSON-mode dump already builds an independent structure, so the
+            # deep copy is only needed for the python-mode fallback.
             try:
-                return state_copy.model_dump(mode="json")
+                return self._state.model_dump(mode="json")
             except Exception:
-                return state_copy.model_dump()
+                return cast(BaseModel, self._copy_state()).model_dump()
+        return self._copy_state()
+
+    def _method_event_state(
+        self,
+    ) -> tuple[LazyFlowState | dict[str, Any], list[dict[str, Any]] | None]:
+        """Build the state payloads for a method started/finished event.
+
+        Returns:
+            A tuple of (state, state_patch) following ``state_events``.
+        """
+        if self.state_events == "lazy":
+            return LazyFlowState(self._locked_serialize_state), None
+        if self.state_events != "diff":
+            return self._copy_and_serialize_state(), None
+        with self._state_lock:
+            snapshot = self._serialize_changed_state()
+        state_patch = make_state_patch(self._last_event_state or {}, snapshot)
+        self._last_event_state = snapshot
+        # Handlers get their own copy so they cannot corrupt the diff baseline.
+        return LazyFlowState(lambda: copy.deepcopy(snapshot)), state_patch
+
+    def _locked_serialize_state(self) -> dict[str, Any]:
+        with self._state_lock:
+            return self._copy_and_serialize_state()
+
+    def _serialize_changed_state(self) -> dict[str, Any]:
+        """Serialize the state, reusing the last event's unchanged fields.
+
+        Top-level values equal to the copies kept from the previous diff event
+        keep their previous serialized form; only the others are copied and
+        dumped. Caller holds the state lock.
+        """
+        state = self._state
+        previous = self._last_event_state or {}
+        if isinstance(state, BaseModel):
+            model = type(state)
+            names = [*model.model_fields, *model.model_computed_fields]
+            values = {name: getattr(state, name) for name in names}
         else:
-            return state_copy
+            values = dict(state)
+
+        for name in self._last_event_values.keys() - values.keys():
+            del self._last_event_values[name]
+        changed = {
+            name
+            for name, value in values.items()
+            if not self._unchanged_since_last_event(name, value)
+        }
+        dumped: dict[str, Any] = {}
+        if changed and isinstance(state, BaseModel):
+            try:
+                dumped = state.model_dump(mode="json", include=changed)
+            except Exception:
+                dumped = copy.deepcopy(state.model_dump(include=changed))
+        elif changed:
+            dumped = {name: copy.deepcopy(values[name]) for name in changed}
+        for name in changed:
+            try:
+                self._last_event_values[name] = copy.deepcopy(values[name])
+            except Exception:  # noqa: PERF203
+                # Per value: one uncopyable value must not drop the others;
+                # it is simply re-serialized on every event.
+                self._last_event_values.pop(name, None)
+
+        source = {**previous, **dumped}
+        return {name: source[name] for name in values if name in source}
+
+    def _unchanged_since_last_event(self, name: str, value: Any) -> bool:
+        if name not in self._last_event_values:
+            return False
+        try:
+            return bool(value == self._last_event_values[name])
+        except Exception:
+            return False
 
     async def _execute_listeners(
         self,
@@ -22,6 +22,7 @@ class FlowPersistence(ABC):
     - save_pending_feedback(): Saves state with pending feedback context
     - load_pending_feedback(): Loads state and pending feedback context
     - clear_pending_feedback(): Clears pending feedback after resume
+    - flush(): Waits for saves written in the background
     """
 
     @abstractmethod
@@ -104,3 +105,11 @@ class FlowPersistence(ABC):
         Args:
             flow_uuid: Unique identifier for the flow instance
         """
+
+    def flush(self) -> None:  # noqa: B027
+        """Block until every save accepted so far has been written.
+
+        Called when a flow finishes. Backends that write in the background
+        should override this and raise any error hit while writing; the
+        default is a no-op for backends that write synchronously.
+        """
@@ -116,6 +116,9 @@ class PersistenceDecorator:
                     method_name=method_name,
                     state_data=state_data,
                 )
+                backends = getattr(flow_instance, "_persistence_backends", None)
+                if backends is not None and persistence_instance not in backends:
+                    backends.append(persistence_instance)
             except Exception as e:
                 error_msg = LOG_MESSAGES["save_error"].format(method_name, str(e))
                 if verbose:
@@ -4,15 +4,23 @@ SQLite-based implementation of flow state persistence.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
 from datetime import datetime, timezone
 import json
+import logging
 from pathlib import Path
+import queue
 import sqlite3
-from typing import TYPE_CHECKING, Any
+import threading
+from typing import TYPE_CHECKING, Any, Literal
+import weakref
+import zlib
 
 from pydantic import BaseModel
 
 from morshed_squad.flow.persistence.base import FlowPersistence
+from morshed_squad.flow.state_patch import apply_state_patch, make_state_patch
 from morshed_squad.utilities.paths import db_storage_path
 
 
@@ -20,6 +28,29 @@ if TYPE_CHECKING:
     from morshed_squad.flow.async_feedback.types import PendingFeedbackContext
 
 
+logger = logging.getLogger(__name__)
+
+_WRITE_BATCH_SIZE = 256
+_MAX_CACHED_FLOWS = 128
+
+
+def _compress(payload: Any) -> bytes:
+    return zlib.compress(json.dumps(payload).encode("utf-8"))
+
+
+def _decompress(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _stop_writer(
+    pending: queue.Queue[tuple[str, str, str, str] | None], writer: threading.Thread
+) -> None:
+    """Let the writer thread write everything still queued, then stop it."""
+    if writer.is_alive():
+        pending.put(None)
+        writer.join()
+
+
 class SQLiteFlowPersistence(FlowPersistence):
     """SQLite-based implementation of flow state persistence.
 
@@ -48,17 +79,41 @@ class SQLiteFlowPersistence(FlowPersistence):
         flow = MyFlow.from_pending("abc-123", persistence)
         result = flow.resume("looks good!")
         ```
+
+    In ``"delta"`` mode each flow keeps a compressed base snapshot followed by
+    compressed JSON Patch deltas, and a fresh base is written every
+    ``snapshot_interval`` saves. Writes are queued to a background writer
+    thread that owns a long-lived WAL connection, so ``save_state`` returns
+    without touching the disk. Reads flush the queue first, and ``compact``
+    collapses a flow's history into a single base snapshot. A flow flushes
+    its persistence when it finishes, and the queue is also drained at
+    interpreter exit. An error hit by the writer is raised by the next
+    ``save_state``, ``flush`` or ``close``.
+
+    Example:
+        ```python
+        persistence = SQLiteFlowPersistence("flows.db", mode="delta")
+        ```
     """
 
-    def __init__(self, db_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        mode: Literal["snapshot", "delta"] = "snapshot",
+        snapshot_interval: int = 20,
+    ) -> None:
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            mode: ``"snapshot"`` stores the full state on every save,
+                    ``"delta"`` stores base snapshots plus compressed deltas.
+            snapshot_interval: In delta mode, number of deltas written before
+                    a new base snapshot.
 
         Raises:
-            ValueError: If db_path is invalid
+            ValueError: If db_path, mode or snapshot_interval is invalid
         """
 
         # Get path from argument or default location
@@ -66,8 +121,22 @@ class SQLiteFlowPersistence(FlowPersistence):
 
         if not path:
             raise ValueError("Database path must be provided")
+        if mode not in ("snapshot", "delta"):
+            raise ValueError(f"mode must be 'snapshot' or 'delta', got {mode!r}")
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
 
         self.db_path = path  # Now mypy knows this is str
+        self.mode = mode
+        self.snapshot_interval = snapshot_interval
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.RLock()
+        self._queue: queue.Queue[tuple[str, str, str, str] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._stop_writer: weakref.finalize[Any, SQLiteFlowPersistence] | None = None
+        self._write_error: Exception | None = None
+        # flow_uuid -> (latest state, deltas written since the last base)
+        self._latest: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
         self.init_db()
 
     def init_db(self) -> None:
@@ -113,6 +182,257 @@ class SQLiteFlowPersistence(FlowPersistence):
             """
             )
 
+        if self.mode == "delta":
+            conn = self._connection()
+            with self._conn_lock, conn:
+                conn.execute(
+                    """
+                CREATE TABLE IF NOT EXISTS flow_state_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    flow_uuid TEXT NOT NULL,
+                    method_name TEXT NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    kind TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                )
+                """
+                )
+                conn.execute(
+                    """
+                CREATE INDEX IF NOT EXISTS idx_flow_state_log_uuid
+                ON flow_state_log(flow_uuid, kind, id)
+                """
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the long-lived WAL connection used in delta mode."""
+        with self._conn_lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.db_path, timeout=30, check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn = conn
+            return self._conn
+
+    def _ensure_writer(self) -> None:
+        with self._conn_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="flow-persistence-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+                # The running writer keeps self alive, so this fires at exit.
+                self._stop_writer = weakref.finalize(
+                    self, _stop_writer, self._queue, self._writer
+                )
+
+    def _writer_loop(self) -> None:
+        """Drain queued saves and write them in batched transactions."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    next_item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is None:
+                    stop = True
+                    break
+                batch.append(next_item)
+            try:
+                conn = self._connection()
+                with self._conn_lock, conn:
+                    for flow_uuid, method_name, timestamp, state_json in batch:
+                        self._write_log_entry(
+                            conn, flow_uuid, method_name, timestamp, state_json
+                        )
+            except Exception as e:
+                # Drop cached states so the next save re-reads what was committed.
+                with self._conn_lock:
+                    self._latest.clear()
+                    self._write_error = e
+                logger.error(f"Failed to persist flow state batch: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _remember(self, flow_uuid: str, state: dict[str, Any], deltas: int) -> None:
+        self._latest[flow_uuid] = (state, deltas)
+        self._latest.move_to_end(flow_uuid)
+        while len(self._latest) > _MAX_CACHED_FLOWS:
+            self._latest.popitem(last=False)
+
+    def _write_log_entry(
+        self,
+        conn: sqlite3.Connection,
+        flow_uuid: str,
+        method_name: str,
+        timestamp: str,
+        state_json: str,
+    ) -> None:
+        """Append a base snapshot or delta for one save. Caller holds the lock."""
+        state = json.loads(state_json)
+        cached = self._latest.get(flow_uuid)
+        previous, deltas = cached if cached else self._read_log(conn, flow_uuid)
+
+        if previous is None or deltas >= self.snapshot_interval:
+            kind, payload, deltas = "base", _compress(state), 0
+        else:
+            kind = "delta"
+            payload = _compress(make_state_patch(previous, state))
+            deltas += 1
+
+        conn.execute(
+            """
+        INSERT INTO flow_state_log (
+            flow_uuid,
+            method_name,
+            timestamp,
+            kind,
+            payload
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+            (flow_uuid, method_name, timestamp, kind, payload),
+        )
+        self._remember(flow_uuid, state, deltas)
+
+    def _read_log(
+        self, conn: sqlite3.Connection, flow_uuid: str
+    ) -> tuple[dict[str, Any] | None, int]:
+        """Rebuild the latest state from the last base snapshot and its deltas.
+
+        Returns:
+            A tuple of (state, deltas since the base). The state is None when
+            the flow has no log entries.
+        """
+        row = conn.execute(
+            """
+        SELECT id FROM flow_state_log
+        WHERE flow_uuid = ? AND kind = 'base'
+        ORDER BY id DESC
+        LIMIT 1
+        """,
+            (flow_uuid,),
+        ).fetchone()
+        if row is None:
+            return None, 0
+
+        state: Any = None
+        deltas = 0
+        for kind, payload in conn.execute(
+            """
+        SELECT kind, payload FROM flow_state_log
+        WHERE flow_uuid = ? AND id >= ?
+        ORDER BY id
+        """,
+            (flow_uuid, row[0]),
+        ):
+            if kind == "base":
+                state = _decompress(payload)
+            else:
+                state = apply_state_patch(state, _decompress(payload))
+                deltas += 1
+        return (state if isinstance(state, dict) else None), deltas
+
+    def _raise_write_error(self) -> None:
+        """Raise the error the writer thread hit since it was last reported."""
+        with self._conn_lock:
+            error, self._write_error = self._write_error, None
+        if error is not None:
+            raise RuntimeError(f"Failed to persist flow state: {error}") from error
+
+    def flush(self) -> None:
+        """Block until every queued delta-mode save has been written.
+
+        Raises:
+            RuntimeError: If the writer failed to write a queued save.
+        """
+        if self._writer is not None:
+            self._queue.join()
+        self._raise_write_error()
+
+    def compact(self, flow_uuid: str | None = None) -> int:
+        """Collapse delta-mode history into a single base snapshot per flow.
+
+        Args:
+            flow_uuid: Flow to compact. Compacts every flow when None.
+
+        Returns:
+            Number of log rows removed.
+        """
+        if self.mode != "delta":
+            return 0
+        self.flush()
+        conn = self._connection()
+        removed = 0
+        with self._conn_lock, conn:
+            if flow_uuid is None:
+                flow_uuids = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT DISTINCT flow_uuid FROM flow_state_log"
+                    )
+                ]
+            else:
+                flow_uuids = [flow_uuid]
+            for uuid in flow_uuids:
+                state, _ = self._read_log(conn, uuid)
+                latest = conn.execute(
+                    """
+                SELECT method_name, timestamp FROM flow_state_log
+                WHERE flow_uuid = ?
+                ORDER BY id DESC
+                LIMIT 1
+                """,
+                    (uuid,),
+                ).fetchone()
+                if state is None or latest is None:
+                    continue
+                removed += conn.execute(
+                    "DELETE FROM flow_state_log WHERE flow_uuid = ?", (uuid,)
+                ).rowcount
+                conn.execute(
+                    """
+                INSERT INTO flow_state_log (
+                    flow_uuid,
+                    method_name,
+                    timestamp,
+                    kind,
+                    payload
+                ) VALUES (?, ?, ?, 'base', ?)
+                """,
+                    (uuid, latest[0], latest[1], _compress(state)),
+                )
+                removed -= 1
+                self._remember(uuid, state, 0)
+        return removed
+
+    def close(self) -> None:
+        """Flush pending writes, stop the writer thread and close the connection.
+
+        Raises:
+            RuntimeError: If the writer failed to write a queued save.
+        """
+        if self._stop_writer is not None:
+            self._stop_writer()
+        self._writer = None
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._raise_write_error()
+
     def save_state(
         self,
         flow_uuid: str,
@@ -136,6 +456,20 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
+        if self.mode == "delta":
+            # Serializing here snapshots the state and surfaces errors to the caller.
+            self._raise_write_error()
+            self._ensure_writer()
+            self._queue.put(
+                (
+                    flow_uuid,
+                    method_name,
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(state_dict),
+                )
+            )
+            return
+
         with sqlite3.connect(self.db_path) as conn:
             conn.execute(
                 """
@@ -163,6 +497,19 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
+        if self.mode == "delta":
+            self.flush()
+            conn = self._connection()
+            with self._conn_lock:
+                cached = self._latest.get(flow_uuid)
+                if cached is not None:
+                    return copy.deepcopy(cached[0])
+                state, deltas = self._read_log(conn, flow_uuid)
+                if state is not None:
+                    self._remember(flow_uuid, copy.deepcopy(state), deltas)
+                    return state
+            # Fall back to full snapshots written before delta mode was enabled.
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
@@ -0,0 +1,116 @@
+"""JSON Patch (RFC 6902) helpers for serialized flow state.
+
+Only the ``add``, ``remove`` and ``replace`` operations are produced. Dicts
+are diffed key by key, lists that only grew are expressed as appends, and any
+other change replaces the value at that path.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+
+StatePatch = list[dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_state_patch(old: Any, new: Any, path: str = "") -> StatePatch:
+    """Compute the operations that turn ``old`` into ``new``.
+
+    Args:
+        old: Previous JSON-compatible state.
+        new: Current JSON-compatible state.
+        path: JSON Pointer prefix of the compared values.
+
+    Returns:
+        List of JSON Patch operations, empty when both values are equal.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: StatePatch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_state_patch(old[key], value, child))
+        return ops
+    if (
+        isinstance(old, list)
+        and isinstance(new, list)
+        and len(new) > len(old)
+        and new[: len(old)] == old
+    ):
+        return [
+            {"op": "add", "path": f"{path}/-", "value": value}
+            for value in new[len(old) :]
+        ]
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_state_patch(document: Any, patch: StatePatch) -> Any:
+    """Apply operations produced by ``make_state_patch``.
+
+    Args:
+        document: JSON-compatible state the patch was computed against.
+            It is not modified.
+        patch: Operations to apply.
+
+    Returns:
+        The patched state.
+
+    Raises:
+        ValueError: If an operation is not supported or its path is invalid.
+    """
+    result = copy.deepcopy(document)
+    for operation in patch:
+        op = operation.get("op")
+        path = operation.get("path", "")
+        value = copy.deepcopy(operation.get("value"))
+        if path == "":
+            if op in ("add", "replace"):
+                result = value
+                continue
+            raise ValueError(f"Unsupported operation on document root: {op}")
+
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = result
+        try:
+            for token in parents:
+                target = target[int(token)] if isinstance(target, list) else target[token]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid patch path: {path}") from e
+
+        if isinstance(target, list):
+            if op == "add" and last == "-":
+                target.append(value)
+            elif op == "add":
+                target.insert(int(last), value)
+            elif op == "replace":
+                target[int(last)] = value
+            elif op == "remove":
+                del target[int(last)]
+            else:
+                raise ValueError(f"Unsupported patch operation: {op}")
+        elif isinstance(target, dict):
+            if op in ("add", "replace"):
+                target[last] = value
+            elif op == "remove":
+                target.pop(last, None)
+            else:
+                raise ValueError(f"Unsupported patch operation: {op}")
+        else:
+            raise ValueError(f"Invalid patch path: {path}")
+    return result
@@ -18,6 +18,7 @@ class Knowledge(BaseModel):
         sources: list[BaseKnowledgeSource] = Field(default_factory=list)
         storage: KnowledgeStorage | None = Field(default=None)
         embedder: EmbedderConfig | None = None
+        hybrid_search: bool = False
     """
 
     sources: list[BaseKnowledgeSource] = Field(default_factory=list)
@@ -25,6 +26,10 @@ class Knowledge(BaseModel):
     storage: KnowledgeStorage | None = Field(default=None)
     embedder: EmbedderConfig | None = None
     collection_name: str | None = None
+    hybrid_search: bool = Field(
+        default=False,
+        description="Fuse BM25 keyword search with vector search when querying",
+    )
 
     def __init__(
         self,
@@ -32,14 +37,17 @@ class Knowledge(BaseModel):
         sources: list[BaseKnowledgeSource],
         embedder: EmbedderConfig | None = None,
         storage: KnowledgeStorage | None = None,
+        hybrid_search: bool = False,
         **data: object,
     ) -> None:
-        super().__init__(**data)
+        super().__init__(hybrid_search=hybrid_search, **data)
         if storage:
             self.storage = storage
         else:
             self.storage = KnowledgeStorage(
-                embedder=embedder, collection_name=collection_name
+                embedder=embedder,
+                collection_name=collection_name,
+                hybrid_search=hybrid_search,
             )
         self.sources = sources
 
@@ -48,7 +56,8 @@ class Knowledge(BaseModel):
     ) -> list[SearchResult]:
         """
         Query across all knowledge sources to find the most relevant information.
-        Returns the top_k most relevant chunks.
+        Returns the top_k most relevant chunks. With ``hybrid_search`` the
+        keyword and vector rankings are fused, and scores are fusion scores.
 
         Raises:
             ValueError: If storage is not initialized.
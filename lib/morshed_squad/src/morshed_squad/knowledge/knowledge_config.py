@@ -7,6 +7,7 @@ class KnowledgeConfig(BaseModel):
     Args:
         results_limit (int): The number of relevant documents to return.
         score_threshold (float): The minimum score for a document to be considered relevant.
+        hybrid_search (bool): Whether to fuse BM25 keyword search with vector search.
     """
 
     results_limit: int = Field(default=5, description="The number of results to return")
@@ -14,3 +15,7 @@ class KnowledgeConfig(BaseModel):
         default=0.6,
         description="The minimum score for a result to be considered relevant",
     )
+    hybrid_search: bool = Field(
+        default=False,
+        description="Fuse BM25 keyword search with vector search, for exact identifiers",
+    )
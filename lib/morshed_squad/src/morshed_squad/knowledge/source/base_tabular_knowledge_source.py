@@ -0,0 +1,143 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import Field
+
+from morshed_squad.knowledge.source.base_file_knowledge_source import (
+    BaseFileKnowledgeSource,
+)
+
+
+class RowGroup(NamedTuple):
+    """Rows that share a header, such as one CSV file or one Excel sheet.
+
+    Attributes:
+        context: Text repeated at the top of every chunk cut from the group,
+            e.g. the file name and column names.
+        rows: Lazily produced text of each row.
+        name: Label of the group within its file, such as a sheet name.
+    """
+
+    context: str
+    rows: Iterable[str]
+    name: str = ""
+
+
+def format_row(values: Iterable[Any]) -> str:
+    """Render a row of cell values as a single line."""
+    return " | ".join("" if value is None else str(value).strip() for value in values)
+
+
+class BaseTabularKnowledgeSource(BaseFileKnowledgeSource, ABC):
+    """Base class for knowledge sources made of rows, such as CSV or Excel files.
+
+    Rows are streamed from each file and packed into chunks of up to
+    ``chunk_size`` characters that never split a row (unless the row alone
+    is too long). Every chunk starts with its group's context, so it keeps
+    the column names; a context longer than half of ``chunk_size`` is cut
+    to that length. Chunks are saved in batches of ``batch_size``.
+    ``chunk_overlap`` is not used; the repeated context replaces it.
+
+    Only the start of each file is read when the source is created, enough
+    to reject a missing or malformed file early. ``content`` is rendered on
+    first access, and ``add`` never uses it, so memory use does not grow
+    with file size unless ``content`` is read.
+    """
+
+    batch_size: int = Field(
+        default=256, description="Number of chunks embedded and saved per batch."
+    )
+
+    def model_post_init(self, _: Any) -> None:
+        """Resolve and validate the paths; content is read lazily."""
+        self.safe_file_paths = self._process_file_paths()
+        self.validate_content()
+        for path in self.safe_file_paths:
+            self._check_readable(path)
+        if "content" not in self.model_fields_set:
+            # Left unset so the first read goes through __getattr__.
+            del self.__dict__["content"]
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "content":
+            self.__dict__["content"] = self.load_content()
+            return self.__dict__["content"]
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def _check_readable(self, path: Path) -> None:
+        """Parse the first row of a file so malformed files fail early."""
+        for group in self.iter_row_groups(path):
+            next(iter(group.rows), None)
+            return
+
+    @abstractmethod
+    def iter_row_groups(self, path: Path) -> Iterator[RowGroup]:
+        """Yield the row groups of a file.
+
+        Each group's rows must be consumed before advancing to the next group.
+        """
+
+    def load_content(self) -> dict[Path, str]:
+        """Render each file as a single string.
+
+        Reads whole files into memory; ``add`` streams instead of using this.
+        """
+        return {
+            path: "\n\n".join(
+                "\n".join([group.context, *group.rows])
+                for group in self.iter_row_groups(path)
+            )
+            for path in self.safe_file_paths
+        }
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the chunks of every file, in order."""
+        for path in self.safe_file_paths:
+            for group in self.iter_row_groups(path):
+                yield from self._chunk_rows(group)
+
+    def _chunk_rows(self, group: RowGroup) -> Iterator[str]:
+        """Pack whole rows into chunks prefixed with the group's context."""
+        prefix = f"{group.context}\n" if group.context else ""
+        limit = self.chunk_size // 2
+        if len(prefix) > limit:
+            prefix = f"{group.context[: limit - 1]}\n" if limit > 1 else ""
+        budget = max(self.chunk_size - len(prefix), 1)
+        rows: list[str] = []
+        size = 0
+        for row in group.rows:
+            if not row.strip():
+                continue
+            if rows and size + len(row) > budget:
+                yield prefix + "\n".join(rows)
+                rows, size = [], 0
+            if len(row) > budget:
+                for start in range(0, len(row), budget):
+                    yield prefix + row[start : start + budget]
+                continue
+            rows.append(row)
+            size += len(row) + 1
+        if rows:
+            yield prefix + "\n".join(rows)
+
+    def _iter_batches(self) -> Iterator[list[str]]:
+        chunks = self.iter_chunks()
+        while batch := list(islice(chunks, max(self.batch_size, 1))):
+            yield batch
+
+    def add(self) -> None:
+        """Stream the rows, chunk them and save the chunks batch by batch."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        for batch in self._iter_batches():
+            self.storage.save(batch)
+
+    async def aadd(self) -> None:
+        """Stream the rows, chunk them and save the chunks batch by batch asynchronously."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        for batch in self._iter_batches():
+            await self.storage.asave(batch)
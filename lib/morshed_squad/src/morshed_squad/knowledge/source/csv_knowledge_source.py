@@ -1,48 +1,29 @@
+from collections.abc import Iterator
 import csv
 from pathlib import Path
 
-from morshed_squad.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from morshed_squad.knowledge.source.base_tabular_knowledge_source import (
+    BaseTabularKnowledgeSource,
+    RowGroup,
+    format_row,
+)
 
 
-class CSVKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries CSV file content using embeddings."""
+class CSVKnowledgeSource(BaseTabularKnowledgeSource):
+    """A knowledge source that stores and queries CSV file content using embeddings.
 
-    def load_content(self) -> dict[Path, str]:
-        """Load and preprocess CSV file content."""
-        content_dict = {}
-        for file_path in self.safe_file_paths:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                content = ""
-                for row in reader:
-                    content += " ".join(row) + "\n"
-                content_dict[file_path] = content
-        return content_dict
+    The first row of each file is treated as its header and repeated at the
+    top of every chunk.
+    """
 
-    def add(self) -> None:
-        """
-        Add CSV file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    async def aadd(self) -> None:
-        """Add CSV file content asynchronously."""
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def iter_row_groups(self, path: Path) -> Iterator[RowGroup]:
+        """Yield each CSV file as one group, reading rows lazily."""
+        with open(path, "r", encoding="utf-8", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            yield RowGroup(
+                context=f"{path.name}\nColumns: {format_row(header)}",
+                rows=(format_row(row) for row in reader),
+            )
@@ -1,61 +1,82 @@
+from collections.abc import Iterator
 import json
 from pathlib import Path
 from typing import Any
 
-from morshed_squad.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from morshed_squad.knowledge.source.base_tabular_knowledge_source import (
+    BaseTabularKnowledgeSource,
+    RowGroup,
+)
 
 
-class JSONKnowledgeSource(BaseFileKnowledgeSource):
-    """A knowledge source that stores and queries JSON file content using embeddings."""
+_JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
 
-    def load_content(self) -> dict[Path, str]:
-        """Load and preprocess JSON file content."""
-        content: dict[Path, str] = {}
-        for path in self.safe_file_paths:
-            path = self.convert_to_path(path)
+
+class JSONKnowledgeSource(BaseTabularKnowledgeSource):
+    """A knowledge source that stores and queries JSON file content using embeddings.
+
+    Array items and object members become rows: a top-level array is one
+    group, and each nested array or object under a top-level key is a group
+    whose chunks are prefixed with that key. JSON Lines files (``.jsonl``,
+    ``.ndjson``) are read one record at a time; other JSON documents are
+    parsed whole but rendered and saved incrementally.
+    """
+
+    def iter_row_groups(self, path: Path) -> Iterator[RowGroup]:
+        """Yield the row groups of a JSON or JSON Lines file."""
+        if path.suffix.lower() in _JSON_LINES_SUFFIXES:
             with open(path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-            content[path] = self._json_to_text(data)
-        return content
+                yield RowGroup(
+                    context=path.name,
+                    rows=(
+                        self._json_to_text(json.loads(line)).rstrip("\n")
+                        for line in json_file
+                        if line.strip()
+                    ),
+                )
+            return
 
-    def _json_to_text(self, data: Any, level: int = 0) -> str:
-        """Recursively convert JSON data to a text representation."""
-        text = ""
-        indent = "  " * level
+        with open(path, "r", encoding="utf-8") as json_file:
+            data = json.load(json_file)
+
+        if not isinstance(data, dict):
+            yield RowGroup(context=path.name, rows=self._json_rows(data))
+            return
+
+        scalars = {
+            key: value
+            for key, value in data.items()
+            if not isinstance(value, (dict, list))
+        }
+        if scalars:
+            yield RowGroup(context=path.name, rows=self._json_rows(scalars))
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                yield RowGroup(
+                    context=f"{path.name} / {key}", rows=self._json_rows(value)
+                )
+
+    def _json_rows(self, data: Any) -> Iterator[str]:
+        """Render each member of an object or item of an array as a row."""
         if isinstance(data, dict):
             for key, value in data.items():
-                text += f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
+                yield f"{key}: {self._json_to_text(value, 1)}".rstrip("\n")
         elif isinstance(data, list):
             for item in data:
-                text += f"{indent}- {self._json_to_text(item, level + 1)}\n"
+                yield self._json_to_text(item).rstrip("\n")
         else:
-            text += f"{data!s}"
-        return text
-
-    def add(self) -> None:
-        """
-        Add JSON file content to the knowledge source, chunk it, compute embeddings,
-        and save the embeddings.
-        """
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        self._save_documents()
-
-    async def aadd(self) -> None:
-        """Add JSON file content asynchronously."""
-        content_str = (
-            str(self.content) if isinstance(self.content, dict) else self.content
-        )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
-        await self._asave_documents()
-
-    def _chunk_text(self, text: str) -> list[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+            yield str(data)
+
+    def _json_to_text(self, data: Any, level: int = 0) -> str:
+        """Recursively convert JSON data to a text representation."""
+        indent = "  " * level
+        if isinstance(data, dict):
+            return "".join(
+                f"{indent}{key}: {self._json_to_text(value, level + 1)}\n"
+                for key, value in data.items()
+            )
+        if isinstance(data, list):
+            return "".join(
+                f"{indent}- {self._json_to_text(item, level + 1)}\n" for item in data
+            )
+        return f"{data!s}"
@@ -1,9 +1,14 @@
+import asyncio
 import logging
 import traceback
 from typing import Any, cast
 import warnings
 
 from morshed_squad.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from morshed_squad.knowledge.storage.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
 from morshed_squad.rag.chromadb.config import ChromaDBConfig
 from morshed_squad.rag.chromadb.types import ChromaEmbeddingFunctionWrapper
 from morshed_squad.rag.config.utils import get_rag_client
@@ -16,10 +21,36 @@ from morshed_squad.rag.types import BaseRecord, SearchResult
 from morshed_squad.utilities.logger import Logger
 
 
+_HYBRID_CANDIDATES_PER_RESULT = 4
+"""Candidates each retriever contributes to fusion, per requested result."""
+
+
+def _merge_results(
+    result_lists: list[list[SearchResult]], limit: int
+) -> list[SearchResult]:
+    """Combine per-query results, keeping each document's best score."""
+    best: dict[str, SearchResult] = {}
+    for results in result_lists:
+        for result in results:
+            current = best.get(result["id"])
+            if current is None or result["score"] > current["score"]:
+                best[result["id"]] = result
+    return sorted(best.values(), key=lambda r: r["score"], reverse=True)[:limit]
+
+
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    With ``hybrid_search`` enabled, saved chunks are also written to a BM25
+    ``LexicalIndex`` persisted next to the vector store, and searches fuse
+    the keyword and vector rankings by reciprocal rank. This finds exact
+    identifiers such as SKUs or error codes that embeddings miss. Fused
+    results carry the fusion score, and keyword matches are returned even
+    when their vector similarity is below ``score_threshold``. Chunks saved
+    before the option was enabled are only found by the vector search until
+    they are saved again.
     """
 
     def __init__(
@@ -29,9 +60,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         | type[BaseEmbeddingsProvider[Any]]
         | None = None,
         collection_name: str | None = None,
+        hybrid_search: bool = False,
     ) -> None:
         self.collection_name = collection_name
         self._client: BaseClient | None = None
+        self._lexical_index: LexicalIndex | None = None
+        if hybrid_search:
+            self._lexical_index = LexicalIndex(
+                f"knowledge_{collection_name}" if collection_name else "knowledge"
+            )
 
         warnings.filterwarnings(
             "ignore",
@@ -69,11 +106,35 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 if self.collection_name
                 else "knowledge"
             )
-            query_text = " ".join(query) if len(query) > 1 else query[0]
+            if self._lexical_index is not None and not metadata_filter:
+                candidates = limit * _HYBRID_CANDIDATES_PER_RESULT
+                return reciprocal_rank_fusion(
+                    [
+                        *client.search_many(
+                            collection_name=collection_name,
+                            queries=query,
+                            limit=candidates,
+                            score_threshold=score_threshold,
+                        ),
+                        *(self._lexical_index.search(q, candidates) for q in query),
+                    ],
+                    limit,
+                )
+            if len(query) > 1:
+                return _merge_results(
+                    client.search_many(
+                        collection_name=collection_name,
+                        queries=query,
+                        limit=limit,
+                        metadata_filter=metadata_filter,
+                        score_threshold=score_threshold,
+                    ),
+                    limit,
+                )
 
             return client.search(
                 collection_name=collection_name,
-                query=query_text,
+                query=query[0],
                 limit=limit,
                 metadata_filter=metadata_filter,
                 score_threshold=score_threshold,
@@ -93,6 +154,8 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 else "knowledge"
             )
             client.delete_collection(collection_name=collection_name)
+            if self._lexical_index is not None:
+                self._lexical_index.clear()
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
@@ -114,8 +177,12 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
 
             client.add_documents(
-                collection_name=collection_name, documents=rag_documents
+                collection_name=collection_name,
+                documents=rag_documents,
+                skip_existing=True,
             )
+            if self._lexical_index is not None:
+                self._lexical_index.upsert(documents)
         except Exception as e:
             if "dimension mismatch" in str(e).lower():
                 Logger(verbose=True).log(
@@ -159,11 +226,36 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 if self.collection_name
                 else "knowledge"
             )
-            query_text = " ".join(query) if len(query) > 1 else query[0]
+            if self._lexical_index is not None and not metadata_filter:
+                candidates = limit * _HYBRID_CANDIDATES_PER_RESULT
+                dense, *lexical = await asyncio.gather(
+                    client.asearch_many(
+                        collection_name=collection_name,
+                        queries=query,
+                        limit=candidates,
+                        score_threshold=score_threshold,
+                    ),
+                    *(
+                        asyncio.to_thread(self._lexical_index.search, q, candidates)
+                        for q in query
+                    ),
+                )
+                return reciprocal_rank_fusion([*dense, *lexical], limit)
+            if len(query) > 1:
+                return _merge_results(
+                    await client.asearch_many(
+                        collection_name=collection_name,
+                        queries=query,
+                        limit=limit,
+                        metadata_filter=metadata_filter,
+                        score_threshold=score_threshold,
+                    ),
+                    limit,
+                )
 
             return await client.asearch(
                 collection_name=collection_name,
-                query=query_text,
+                query=query[0],
                 limit=limit,
                 metadata_filter=metadata_filter,
                 score_threshold=score_threshold,
@@ -195,8 +287,12 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
 
             await client.aadd_documents(
-                collection_name=collection_name, documents=rag_documents
+                collection_name=collection_name,
+                documents=rag_documents,
+                skip_existing=True,
             )
+            if self._lexical_index is not None:
+                await asyncio.to_thread(self._lexical_index.upsert, documents)
         except Exception as e:
             if "dimension mismatch" in str(e).lower():
                 Logger(verbose=True).log(
@@ -222,6 +318,8 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 else "knowledge"
             )
             await client.adelete_collection(collection_name=collection_name)
+            if self._lexical_index is not None:
+                await asyncio.to_thread(self._lexical_index.clear)
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
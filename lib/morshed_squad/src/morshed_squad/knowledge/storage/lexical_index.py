@@ -0,0 +1,212 @@
+"""Persistent BM25 keyword index kept alongside a knowledge collection."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+
+from morshed_squad.rag.chromadb.utils import _sanitize_collection_name
+from morshed_squad.rag.types import SearchResult
+from morshed_squad.utilities.paths import db_storage_path
+
+
+logger = logging.getLogger(__name__)
+
+RRF_K = 60
+"""Rank offset of reciprocal-rank fusion; dampens the weight of the top ranks."""
+
+_SQLITE_MAX_PARAMS = 500
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def document_id(content: str) -> str:
+    """Return the id a knowledge chunk is stored under in the lexical index."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _rowid(doc_id: str) -> int:
+    """Map a document id onto a stable signed 64-bit FTS rowid."""
+    return int.from_bytes(
+        hashlib.sha256(doc_id.encode()).digest()[:8], "big", signed=True
+    )
+
+
+def _match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query that matches any of its terms.
+
+    Each term is quoted, so identifiers such as ``SKU-4471`` or ``0x80070005``
+    are matched literally instead of being parsed as FTS5 operators.
+    """
+    terms = dict.fromkeys(token.lower() for token in _TOKEN_PATTERN.findall(query))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def reciprocal_rank_fusion(
+    result_lists: list[list[SearchResult]], limit: int, k: int = RRF_K
+) -> list[SearchResult]:
+    """Fuse ranked result lists by reciprocal rank.
+
+    Each document scores ``sum(1 / (k + rank))`` over the lists it appears
+    in, so documents ranked well by several retrievers rise to the top
+    regardless of how each retriever scales its own scores. Documents are
+    matched by content, since vector stores such as Qdrant assign their own
+    ids; the first list a document appears in provides its id and metadata.
+
+    Args:
+        result_lists: Result lists, each ordered best first.
+        limit: Maximum number of results to return.
+        k: Rank offset.
+
+    Returns:
+        The fused results, best first, with ``score`` set to the fused score.
+    """
+    fused: dict[str, SearchResult] = {}
+    scores: dict[str, float] = {}
+    for results in result_lists:
+        for rank, result in enumerate(results, start=1):
+            key = document_id(result["content"])
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            fused.setdefault(key, result)
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+    return [{**fused[key], "score": scores[key]} for key in ranked]
+
+
+class LexicalIndex:
+    """BM25 inverted index of a knowledge collection, stored in SQLite FTS5.
+
+    Documents are keyed by ``document_id`` of their content. Writes are
+    incremental upserts and deletes; nothing is rebuilt. Each thread uses
+    its own connection.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+    """
+
+    def __init__(self, collection_name: str, db_path: str | None = None) -> None:
+        """Initialize the index and create its table if needed.
+
+        Args:
+            collection_name: Name of the vector collection this index mirrors.
+            db_path: Path to the SQLite database file. Defaults to
+                ``knowledge_lexical/<collection_name>.db`` under
+                ``db_storage_path()``, next to the vector store data. The
+                name is sanitized the same way as the vector collection's.
+        """
+        if db_path is None:
+            directory = Path(db_storage_path()) / "knowledge_lexical"
+            directory.mkdir(parents=True, exist_ok=True)
+            name = _sanitize_collection_name(collection_name)
+            db_path = str(directory / f"{name}.db")
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connection().execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5(
+                doc_id UNINDEXED,
+                content,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, contents: list[str]) -> None:
+        """Add documents, replacing any already stored with the same content.
+
+        Args:
+            contents: Document texts.
+        """
+        if not contents:
+            return
+        rows = []
+        for content in contents:
+            doc_id = document_id(content)
+            rows.append((_rowid(doc_id), doc_id, content))
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO chunks (rowid, doc_id, content) VALUES (?, ?, ?)",
+                rows,
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def delete(self, ids: list[str]) -> None:
+        """Remove documents by id; unknown ids are ignored."""
+        conn = self._connection()
+        rowids = [_rowid(doc_id) for doc_id in ids]
+        for start in range(0, len(rowids), _SQLITE_MAX_PARAMS):
+            chunk = rowids[start : start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(
+                f"DELETE FROM chunks WHERE rowid IN ({placeholders})",  # noqa: S608
+                chunk,
+            )
+
+    def search(self, query: str, limit: int = 5) -> list[SearchResult]:
+        """Rank documents containing any query term by BM25.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of results to return.
+
+        Returns:
+            Matching documents, best first. ``score`` is the BM25 score,
+            higher is better.
+        """
+        expression = _match_expression(query)
+        if expression is None:
+            return []
+        try:
+            rows = (
+                self._connection()
+                .execute(
+                    """
+                    SELECT doc_id, content, bm25(chunks) AS rank FROM chunks
+                    WHERE chunks MATCH ? ORDER BY rank LIMIT ?
+                    """,
+                    (expression, limit),
+                )
+                .fetchall()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Lexical search failed: {e}")
+            return []
+        return [
+            {"id": doc_id, "content": content, "metadata": {}, "score": -rank}
+            for doc_id, content, rank in rows
+        ]
+
+    def count(self) -> int:
+        """Return the number of indexed documents."""
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM chunks").fetchone()
+        return int(count)
+
+    def clear(self) -> None:
+        """Remove every document from the index."""
+        self._connection().execute("DELETE FROM chunks")
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -64,6 +64,7 @@ from morshed_squad.llms.base_llm import BaseLLM
 from morshed_squad.tools.base_tool import BaseTool
 from morshed_squad.tools.structured_tool import CrewStructuredTool
 from morshed_squad.utilities.agent_utils import (
+    aenforce_rpm_limit,
     enforce_rpm_limit,
     format_message_for_llm,
     get_llm_response,
@@ -479,6 +480,18 @@ class LiteAgent(FlowTrackable, BaseModel):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
+        agent_info = self._prepare_kickoff()
+        try:
+            self._start_run(messages, response_format, input_files)
+            return self._execute_core(
+                agent_info=agent_info, response_format=response_format
+            )
+        except Exception as e:
+            self._handle_kickoff_error(agent_info, e)
+            raise e
+
+    def _prepare_kickoff(self) -> dict[str, Any]:
+        """Inject memory tools and return the agent info used for events."""
         # Inject memory tools once if memory is configured (mirrors Agent._prepare_kickoff)
         if self._memory is not None:
             from morshed_squad.tools.memory_tools import create_memory_tools
@@ -493,7 +506,7 @@ class LiteAgent(FlowTrackable, BaseModel):
                 self._parsed_tools = self._parsed_tools + parse_tools(memory_tools)
 
         # Create agent info for event emission
-        agent_info = {
+        return {
             "id": self.id,
             "role": self.role,
             "goal": self.goal,
@@ -502,37 +515,37 @@ class LiteAgent(FlowTrackable, BaseModel):
             "verbose": self.verbose,
         }
 
-        try:
-            # Reset state for this run
-            self._iterations = 0
-            self.tools_results = []
-
-            # Format messages for the LLM
-            self._messages = self._format_messages(
-                messages, response_format=response_format, input_files=input_files
-            )
-            self._inject_memory_context()
+    def _start_run(
+        self,
+        messages: str | list[LLMMessage],
+        response_format: type[BaseModel] | None,
+        input_files: dict[str, FileInput] | None,
+    ) -> None:
+        """Reset the run state and format the input messages."""
+        self._iterations = 0
+        self.tools_results = []
 
-            return self._execute_core(
-                agent_info=agent_info, response_format=response_format
-            )
+        # Format messages for the LLM
+        self._messages = self._format_messages(
+            messages, response_format=response_format, input_files=input_files
+        )
+        self._inject_memory_context()
 
-        except Exception as e:
-            if self.verbose:
-                self._printer.print(
-                    content="Agent failed to reach a final answer. This is likely a bug - please report it.",
-                    color="red",
-                )
-            handle_unknown_error(self._printer, e, verbose=self.verbose)
-            # Emit error event
-            crewai_event_bus.emit(
-                self,
-                event=LiteAgentExecutionErrorEvent(
-                    agent_info=agent_info,
-                    error=str(e),
-                ),
+    def _handle_kickoff_error(self, agent_info: dict[str, Any], e: Exception) -> None:
+        if self.verbose:
+            self._printer.print(
+                content="Agent failed to reach a final answer. This is likely a bug - please report it.",
+                color="red",
             )
-            raise e
+        handle_unknown_error(self._printer, e, verbose=self.verbose)
+        # Emit error event
+        crewai_event_bus.emit(
+            self,
+            event=LiteAgentExecutionErrorEvent(
+                agent_info=agent_info,
+                error=str(e),
+            ),
+        )
 
     def _get_last_user_content(self) -> str:
         """Get the last user message content from _messages for recall/input."""
@@ -623,6 +636,43 @@ class LiteAgent(FlowTrackable, BaseModel):
 
         # Execute the agent using invoke loop
         agent_finish = self._invoke_loop()
+        output = self._complete_execution(agent_info, agent_finish, response_format)
+        if output is None:
+            return self._execute_core(agent_info=agent_info)
+        return output
+
+    async def _aexecute_core(
+        self, agent_info: dict[str, Any], response_format: type[BaseModel] | None = None
+    ) -> LiteAgentOutput:
+        """Async version of _execute_core."""
+        crewai_event_bus.emit(
+            self,
+            event=LiteAgentExecutionStartedEvent(
+                agent_info=agent_info,
+                tools=self._parsed_tools,
+                messages=self._messages,
+            ),
+        )
+
+        agent_finish = await self._ainvoke_loop()
+        output = await asyncio.to_thread(
+            self._complete_execution, agent_info, agent_finish, response_format
+        )
+        if output is None:
+            return await self._aexecute_core(agent_info=agent_info)
+        return output
+
+    def _complete_execution(
+        self,
+        agent_info: dict[str, Any],
+        agent_finish: AgentFinish,
+        response_format: type[BaseModel] | None,
+    ) -> LiteAgentOutput | None:
+        """Build the output for a finished loop and apply the guardrail.
+
+        Returns:
+            The output, or None when the guardrail failed and the loop must run again.
+        """
         if self._memory is not None:
             self._save_to_memory(agent_finish.output)
         formatted_result: BaseModel | None = None
@@ -699,7 +749,7 @@ class LiteAgent(FlowTrackable, BaseModel):
                     }
                 )
 
-                return self._execute_core(agent_info=agent_info)
+                return None
 
             # Apply guardrail result if available
             if guardrail_result.result is not None:
@@ -743,9 +793,22 @@ class LiteAgent(FlowTrackable, BaseModel):
         Returns:
             LiteAgentOutput: The result of the agent execution.
         """
-        return await asyncio.to_thread(
-            self.kickoff, messages, response_format, input_files
-        )
+        if "kickoff" in self.__dict__:
+            # kickoff was wrapped for A2A delegation, which only runs synchronously.
+            return await asyncio.to_thread(
+                self.kickoff, messages, response_format, input_files
+            )
+        agent_info = self._prepare_kickoff()
+        try:
+            await asyncio.to_thread(
+                self._start_run, messages, response_format, input_files
+            )
+            return await self._aexecute_core(
+                agent_info=agent_info, response_format=response_format
+            )
+        except Exception as e:
+            self._handle_kickoff_error(agent_info, e)
+            raise e
 
     async def akickoff(
         self,
@@ -845,98 +908,131 @@ class LiteAgent(FlowTrackable, BaseModel):
         Returns:
             AgentFinish: The final result of the agent execution.
         """
-        # Execute the agent loop
         formatted_answer: AgentAction | AgentFinish | None = None
         while not isinstance(formatted_answer, AgentFinish):
-            try:
-                if has_reached_max_iterations(self._iterations, self.max_iterations):
-                    formatted_answer = handle_max_iterations_exceeded(
-                        formatted_answer,
-                        printer=self._printer,
-                        i18n=self.i18n,
-                        messages=self._messages,
-                        llm=cast(LLM, self.llm),
-                        callbacks=self._callbacks,
-                        verbose=self.verbose,
-                    )
+            enforce_rpm_limit(self.request_within_rpm_limit)
+            formatted_answer = self._invoke_step(formatted_answer)
+        return self._finish_loop(formatted_answer)
 
-                enforce_rpm_limit(self.request_within_rpm_limit)
+    async def _ainvoke_loop(self) -> AgentFinish:
+        """
+        Async version of _invoke_loop.
 
-                try:
-                    answer = get_llm_response(
-                        llm=cast(LLM, self.llm),
-                        messages=self._messages,
-                        callbacks=self._callbacks,
-                        printer=self._printer,
-                        from_agent=self,
-                        executor_context=self,
-                        verbose=self.verbose,
-                    )
+        The rate limit is awaited on the event loop; each step (LLM call and
+        tool execution) runs in a worker thread.
 
-                except Exception as e:
-                    raise e
+        Returns:
+            AgentFinish: The final result of the agent execution.
+        """
+        formatted_answer: AgentAction | AgentFinish | None = None
+        while not isinstance(formatted_answer, AgentFinish):
+            await aenforce_rpm_limit(self.request_within_rpm_limit)
+            formatted_answer = await asyncio.to_thread(
+                self._invoke_step, formatted_answer
+            )
+        return self._finish_loop(formatted_answer)
 
-                formatted_answer = process_llm_response(
-                    cast(str, answer), self.use_stop_words
-                )
+    def _invoke_step(
+        self, formatted_answer: AgentAction | AgentFinish | None
+    ) -> AgentAction | AgentFinish | None:
+        """Run one LLM call of the agent loop and handle its answer.
 
-                if isinstance(formatted_answer, AgentAction):
-                    try:
-                        tool_result = execute_tool_and_check_finality(
-                            agent_action=formatted_answer,
-                            tools=self._parsed_tools,
-                            i18n=self.i18n,
-                            agent_key=self.key,
-                            agent_role=self.role,
-                            agent=self.original_agent,
-                            crew=None,
-                        )
-                    except Exception as e:
-                        raise e
-
-                    formatted_answer = handle_agent_action_core(
-                        formatted_answer=formatted_answer,
-                        tool_result=tool_result,
-                        show_logs=self._show_logs,
-                    )
+        Args:
+            formatted_answer: The answer produced by the previous step.
 
-                self._append_message(formatted_answer.text, role="assistant")
-            except OutputParserError as e:  # noqa: PERF203
-                if self.verbose:
-                    self._printer.print(
-                        content="Failed to parse LLM output. Retrying...",
-                        color="yellow",
-                    )
-                formatted_answer = handle_output_parser_exception(
-                    e=e,
+        Returns:
+            The answer produced by this step.
+        """
+        try:
+            if has_reached_max_iterations(self._iterations, self.max_iterations):
+                formatted_answer = handle_max_iterations_exceeded(
+                    formatted_answer,
+                    printer=self._printer,
+                    i18n=self.i18n,
                     messages=self._messages,
-                    iterations=self._iterations,
-                    log_error_after=3,
+                    llm=cast(LLM, self.llm),
+                    callbacks=self._callbacks,
+                    verbose=self.verbose,
+                )
+
+            try:
+                answer = get_llm_response(
+                    llm=cast(LLM, self.llm),
+                    messages=self._messages,
+                    callbacks=self._callbacks,
                     printer=self._printer,
+                    from_agent=self,
+                    executor_context=self,
                     verbose=self.verbose,
                 )
 
             except Exception as e:
-                if e.__class__.__module__.startswith("litellm"):
-                    # Do not retry on litellm errors
-                    raise e
-                if is_context_length_exceeded(e):
-                    handle_context_length(
-                        respect_context_window=self.respect_context_window,
-                        printer=self._printer,
-                        messages=self._messages,
-                        llm=cast(LLM, self.llm),
-                        callbacks=self._callbacks,
+                raise e
+
+            formatted_answer = process_llm_response(
+                cast(str, answer), self.use_stop_words
+            )
+
+            if isinstance(formatted_answer, AgentAction):
+                try:
+                    tool_result = execute_tool_and_check_finality(
+                        agent_action=formatted_answer,
+                        tools=self._parsed_tools,
                         i18n=self.i18n,
-                        verbose=self.verbose,
+                        agent_key=self.key,
+                        agent_role=self.role,
+                        agent=self.original_agent,
+                        crew=None,
                     )
-                    continue
-                handle_unknown_error(self._printer, e, verbose=self.verbose)
+                except Exception as e:
+                    raise e
+
+                formatted_answer = handle_agent_action_core(
+                    formatted_answer=formatted_answer,
+                    tool_result=tool_result,
+                    show_logs=self._show_logs,
+                )
+
+            self._append_message(formatted_answer.text, role="assistant")
+        except OutputParserError as e:
+            if self.verbose:
+                self._printer.print(
+                    content="Failed to parse LLM output. Retrying...",
+                    color="yellow",
+                )
+            formatted_answer = handle_output_parser_exception(
+                e=e,
+                messages=self._messages,
+                iterations=self._iterations,
+                log_error_after=3,
+                printer=self._printer,
+                verbose=self.verbose,
+            )
+
+        except Exception as e:
+            if e.__class__.__module__.startswith("litellm"):
+                # Do not retry on litellm errors
                 raise e
+            if is_context_length_exceeded(e):
+                handle_context_length(
+                    respect_context_window=self.respect_context_window,
+                    printer=self._printer,
+                    messages=self._messages,
+                    llm=cast(LLM, self.llm),
+                    callbacks=self._callbacks,
+                    i18n=self.i18n,
+                    verbose=self.verbose,
+                )
+                return formatted_answer
+            handle_unknown_error(self._printer, e, verbose=self.verbose)
+            raise e
+
+        finally:
+            self._iterations += 1
 
-            finally:
-                self._iterations += 1
+        return formatted_answer
 
+    def _finish_loop(self, formatted_answer: AgentAction | AgentFinish) -> AgentFinish:
         if not isinstance(formatted_answer, AgentFinish):
             raise RuntimeError(
                 "Agent execution ended without reaching a final answer. "
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Final
 import uuid
 
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from morshed_squad.events.event_bus import crewai_event_bus
 from morshed_squad.events.types.llm_events import (
@@ -151,6 +152,18 @@ class BaseLLM(ABC):
             "cached_prompt_tokens": 0,
         }
 
+    def __copy__(self) -> Self:
+        """Shallow copy that counts its own token usage.
+
+        The copy shares configuration and clients with the original but
+        starts with zeroed token counters, so usage of a copied agent or crew
+        is attributed to the copy alone.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._token_usage = dict.fromkeys(self._token_usage, 0)
+        return clone
+
     @property
     def provider(self) -> str:
         """Get the provider of the LLM."""
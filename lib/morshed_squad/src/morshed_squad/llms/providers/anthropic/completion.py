@@ -10,6 +10,10 @@ from pydantic import BaseModel
 from morshed_squad.events.types.llm_events import LLMCallType
 from morshed_squad.llms.base_llm import BaseLLM, llm_call_context
 from morshed_squad.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+from morshed_squad.llms.providers.utils.http_pool import (
+    shared_async_http_client,
+    shared_http_client,
+)
 from morshed_squad.utilities.agent_utils import is_context_length_exceeded
 from morshed_squad.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -174,8 +178,8 @@ class AnthropicCompletion(BaseLLM):
 
         self.client = Anthropic(**self._get_client_params())
 
-        async_client_params = self._get_client_params()
-        if self.interceptor:
+        async_client_params = self._get_client_params(is_async=True)
+        if self.interceptor and "http_client" not in async_client_params:
             async_transport = AsyncHTTPTransport(interceptor=self.interceptor)
             async_http_client = httpx.AsyncClient(transport=async_transport)
             async_client_params["http_client"] = async_http_client
@@ -218,8 +222,12 @@ class AnthropicCompletion(BaseLLM):
         else:
             self.stop_sequences = []
 
-    def _get_client_params(self) -> dict[str, Any]:
-        """Get client parameters."""
+    def _get_client_params(self, is_async: bool = False) -> dict[str, Any]:
+        """Get client parameters.
+
+        Args:
+            is_async: Whether the parameters are for the async client.
+        """
 
         if self.api_key is None:
             self.api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -233,14 +241,20 @@ class AnthropicCompletion(BaseLLM):
             "max_retries": self.max_retries,
         }
 
-        if self.interceptor:
-            transport = HTTPTransport(interceptor=self.interceptor)
-            http_client = httpx.Client(transport=transport)
-            client_params["http_client"] = http_client  # type: ignore[assignment]
-
         if self.client_params:
             client_params.update(self.client_params)
 
+        if "http_client" not in client_params:
+            shared_client = (
+                shared_async_http_client if is_async else shared_http_client
+            )("anthropic", client_params, self.interceptor)
+            if shared_client is not None:
+                client_params["http_client"] = shared_client
+            elif self.interceptor and not is_async:
+                transport = HTTPTransport(interceptor=self.interceptor)
+                http_client = httpx.Client(transport=transport)
+                client_params["http_client"] = http_client  # type: ignore[assignment]
+
         return client_params
 
     def call(
@@ -19,6 +19,10 @@ from pydantic import BaseModel
 from morshed_squad.events.types.llm_events import LLMCallType
 from morshed_squad.llms.base_llm import BaseLLM, llm_call_context
 from morshed_squad.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+from morshed_squad.llms.providers.utils.http_pool import (
+    shared_async_http_client,
+    shared_http_client,
+)
 from morshed_squad.utilities.agent_utils import is_context_length_exceeded
 from morshed_squad.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -248,7 +252,10 @@ class OpenAICompletion(BaseLLM):
         )
 
         client_config = self._get_client_params()
-        if self.interceptor:
+        shared_client = shared_http_client("openai", client_config, self.interceptor)
+        if shared_client is not None:
+            client_config["http_client"] = shared_client
+        elif self.interceptor:
             transport = HTTPTransport(interceptor=self.interceptor)
             http_client = httpx.Client(transport=transport)
             client_config["http_client"] = http_client
@@ -256,7 +263,12 @@ class OpenAICompletion(BaseLLM):
         self.client = OpenAI(**client_config)
 
         async_client_config = self._get_client_params()
-        if self.interceptor:
+        shared_async_client = shared_async_http_client(
+            "openai", async_client_config, self.interceptor
+        )
+        if shared_async_client is not None:
+            async_client_config["http_client"] = shared_async_client
+        elif self.interceptor:
             async_transport = AsyncHTTPTransport(interceptor=self.interceptor)
             async_http_client = httpx.AsyncClient(transport=async_transport)
             async_client_config["http_client"] = async_http_client
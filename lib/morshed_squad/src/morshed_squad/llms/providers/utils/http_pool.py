@@ -0,0 +1,506 @@
+"""Process-wide registry of pooled HTTP clients shared by native LLM providers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, replace
+import hashlib
+import importlib.util
+import ipaddress
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+from urllib.request import getproxies
+import weakref
+
+import httpx
+
+from morshed_squad.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+
+
+if TYPE_CHECKING:
+    from morshed_squad.llms.hooks.base import BaseInterceptor
+
+
+logger = logging.getLogger(__name__)
+
+SHARED_HTTP_CLIENTS_ENV = "CREWAI_SHARED_HTTP_CLIENTS"
+
+_CREDENTIAL_PARAMS = ("api_key", "auth_token", "organization", "project")
+_CONNECT_EVENTS = frozenset(
+    {"connection.connect_tcp.complete", "connection.connect_unix_socket.complete"}
+)
+
+_default_pool: HTTPClientPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def shared_http_clients_enabled() -> bool:
+    """Whether ``CREWAI_SHARED_HTTP_CLIENTS`` turns client sharing on (off by default)."""
+    return os.getenv(SHARED_HTTP_CLIENTS_ENV, "false").lower() in ("1", "true", "yes")
+
+
+def _environment_proxies() -> dict[str, str | None]:
+    """Return httpx mount patterns for the proxy environment.
+
+    Follows what httpx does for a client built without a transport: the
+    ``http``, ``https`` and ``all`` proxies found by ``getproxies`` are
+    mounted per scheme, and each ``NO_PROXY`` entry is mounted without a
+    proxy using curl's matching rules. ``NO_PROXY=*`` disables proxies.
+    """
+    proxy_info = getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        proxy = proxy_info.get(scheme)
+        if proxy:
+            mounts[f"{scheme}://"] = proxy if "://" in proxy else f"http://{proxy}"
+
+    for host in (entry.strip() for entry in proxy_info.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+            continue
+        try:
+            version = ipaddress.ip_address(host.split("/")[0]).version
+        except ValueError:
+            version = None
+        if version == 6:
+            mounts[f"all://[{host}]"] = None
+        elif version == 4 or host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        else:
+            # "example.com" also covers its subdomains, ".example.com" only them
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+@dataclass(frozen=True)
+class HTTPPoolLimits:
+    """Connection pool settings of the shared clients.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per client.
+        max_keepalive_connections: Idle connections kept open per client.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Negotiate HTTP/2 where the server supports it. Requires the
+            ``h2`` package; falls back to HTTP/1.1 without it.
+    """
+
+    max_connections: int = 1000
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+@dataclass(frozen=True)
+class HTTPClientStats:
+    """Usage of one shared client.
+
+    Attributes:
+        provider: Provider the client serves.
+        base_url: API base URL, or None for the provider default.
+        is_async: Whether this is the async client.
+        acquisitions: Number of LLM clients handed this HTTP client.
+        requests: Requests sent.
+        connections_opened: New connections opened, including reconnects
+            after keep-alive expiry.
+    """
+
+    provider: str
+    base_url: str | None
+    is_async: bool
+    acquisitions: int
+    requests: int
+    connections_opened: int
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests served on an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that did not open a connection."""
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+class _Counters:
+    """Request and connection counts of one shared client.
+
+    Connections are counted through httpcore's ``trace`` request extension,
+    which reports every new TCP or Unix socket connection.
+    """
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def acquired(self) -> None:
+        with self._lock:
+            self.acquisitions += 1
+
+    def _count_event(self, name: str) -> None:
+        if name in _CONNECT_EVENTS:
+            with self._lock:
+                self.connections_opened += 1
+
+    def attach(self, request: httpx.Request, is_async: bool) -> None:
+        """Count a request and trace the connection it is sent on."""
+        with self._lock:
+            self.requests += 1
+        previous = request.extensions.get("trace")
+        if is_async:
+
+            async def atrace(name: str, info: dict[str, Any]) -> None:
+                self._count_event(name)
+                if previous is not None:
+                    await previous(name, info)
+
+            request.extensions["trace"] = atrace
+        else:
+
+            def trace(name: str, info: dict[str, Any]) -> None:
+                self._count_event(name)
+                if previous is not None:
+                    previous(name, info)
+
+            request.extensions["trace"] = trace
+
+
+class _CountingTransport(httpx.BaseTransport):
+    """Delegating transport that records requests and new connections."""
+
+    def __init__(self, transport: httpx.BaseTransport, counters: _Counters) -> None:
+        self._transport = transport
+        self._counters = counters
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._counters.attach(request, is_async=False)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _LoopLocalAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping a separate connection pool per event loop.
+
+    Async connections belong to the event loop that opened them, so one
+    shared pool would break as soon as two loops (``asyncio.run`` calls,
+    or threads with their own loop) used the same client. Each loop gets
+    its own pool, dropped when the loop is garbage collected.
+    """
+
+    def __init__(
+        self,
+        limits: HTTPPoolLimits,
+        interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None,
+        counters: _Counters,
+        proxy: str | None = None,
+    ) -> None:
+        self._limits = limits
+        self._interceptor = interceptor
+        self._counters = counters
+        self._proxy = proxy
+        self._transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncBaseTransport
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _for_loop(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncBaseTransport:
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                kwargs = _transport_kwargs(self._limits, self._proxy)
+                transport = (
+                    AsyncHTTPTransport(interceptor=self._interceptor, **kwargs)
+                    if self._interceptor is not None
+                    else httpx.AsyncHTTPTransport(**kwargs)
+                )
+                self._transports[loop] = transport
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counters.attach(request, is_async=True)
+        transport = self._for_loop(asyncio.get_running_loop())
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the current loop's pool; pools of other loops are dropped."""
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+            self._transports.clear()
+        if transport is not None:
+            await transport.aclose()
+
+
+def _transport_kwargs(
+    limits: HTTPPoolLimits, proxy: str | None = None
+) -> dict[str, Any]:
+    http2 = limits.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP/2 requested for shared LLM clients but the 'h2' package is "
+            "not installed; using HTTP/1.1."
+        )
+        http2 = False
+    kwargs: dict[str, Any] = {
+        "limits": httpx.Limits(
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+        ),
+        "http2": http2,
+    }
+    if proxy is not None:
+        kwargs["proxy"] = proxy
+    return kwargs
+
+
+@dataclass
+class _Entry:
+    provider: str
+    base_url: str | None
+    is_async: bool
+    client: httpx.Client | httpx.AsyncClient
+    counters: _Counters
+    interceptor: Any = None
+
+
+class HTTPClientPool:
+    """Registry handing out one keep-alive HTTP client per endpoint.
+
+    Clients are keyed by provider, base URL, credentials and interceptor,
+    so every LLM instance talking to the same endpoint with the same
+    identity, including the copies made by ``Crew.copy()``, sends its
+    requests over one connection pool instead of opening its own.
+    Credentials are hashed so they are not kept in the key.
+
+    httpx ignores proxy environment variables once a client is given a
+    transport, so the proxies from ``HTTP_PROXY``, ``HTTPS_PROXY``,
+    ``ALL_PROXY`` and ``NO_PROXY`` are mounted explicitly, as httpx would
+    for a client built without one. The proxies are part of the key, so a
+    changed environment gets a new client.
+
+    Attributes:
+        limits: Pool settings applied to clients created from now on.
+    """
+
+    def __init__(self, limits: HTTPPoolLimits | None = None) -> None:
+        self.limits = limits or HTTPPoolLimits()
+        self._entries: dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(
+        provider: str,
+        client_params: Mapping[str, Any],
+        interceptor: Any,
+        is_async: bool,
+        proxies: Mapping[str, str | None],
+    ) -> Hashable:
+        credentials = json.dumps(
+            {name: client_params.get(name) for name in _CREDENTIAL_PARAMS},
+            sort_keys=True,
+            default=repr,
+        )
+        base_url = client_params.get("base_url")
+        return (
+            provider,
+            str(base_url) if base_url else None,
+            hashlib.sha256(credentials.encode("utf-8")).hexdigest(),
+            id(interceptor) if interceptor is not None else None,
+            is_async,
+            tuple(sorted(proxies.items())),
+        )
+
+    def _acquire(
+        self,
+        provider: str,
+        client_params: Mapping[str, Any],
+        interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None,
+        is_async: bool,
+    ) -> httpx.Client | httpx.AsyncClient:
+        proxies = _environment_proxies()
+        key = self._key(provider, client_params, interceptor, is_async, proxies)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                counters = _Counters()
+                client: httpx.Client | httpx.AsyncClient
+                if is_async:
+                    client = httpx.AsyncClient(
+                        transport=_LoopLocalAsyncTransport(
+                            self.limits, interceptor, counters
+                        ),
+                        mounts={
+                            pattern: _LoopLocalAsyncTransport(
+                                self.limits, interceptor, counters, proxy
+                            )
+                            if proxy is not None
+                            else None
+                            for pattern, proxy in proxies.items()
+                        },
+                        follow_redirects=True,
+                    )
+                else:
+                    client = httpx.Client(
+                        transport=self._sync_transport(interceptor, counters),
+                        mounts={
+                            pattern: self._sync_transport(interceptor, counters, proxy)
+                            if proxy is not None
+                            else None
+                            for pattern, proxy in proxies.items()
+                        },
+                        follow_redirects=True,
+                    )
+                base_url = client_params.get("base_url")
+                entry = _Entry(
+                    provider=provider,
+                    base_url=str(base_url) if base_url else None,
+                    is_async=is_async,
+                    client=client,
+                    counters=counters,
+                    interceptor=interceptor,
+                )
+                self._entries[key] = entry
+        entry.counters.acquired()
+        return entry.client
+
+    def _sync_transport(
+        self,
+        interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None,
+        counters: _Counters,
+        proxy: str | None = None,
+    ) -> httpx.BaseTransport:
+        kwargs = _transport_kwargs(self.limits, proxy)
+        transport = (
+            HTTPTransport(interceptor=interceptor, **kwargs)
+            if interceptor is not None
+            else httpx.HTTPTransport(**kwargs)
+        )
+        return _CountingTransport(transport, counters)
+
+    def client(
+        self,
+        provider: str,
+        client_params: Mapping[str, Any],
+        interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
+    ) -> httpx.Client:
+        """Return the shared sync client for an endpoint, creating it on first use.
+
+        Args:
+            provider: Provider name, e.g. ``"openai"``.
+            client_params: SDK client parameters; ``base_url`` and the
+                credential parameters select the client.
+            interceptor: Optional interceptor wrapped around the transport.
+
+        Returns:
+            The shared ``httpx.Client``.
+        """
+        return self._acquire(provider, client_params, interceptor, False)  # type: ignore[return-value]
+
+    def async_client(
+        self,
+        provider: str,
+        client_params: Mapping[str, Any],
+        interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
+    ) -> httpx.AsyncClient:
+        """Return the shared async client for an endpoint, creating it on first use.
+
+        Args:
+            provider: Provider name, e.g. ``"openai"``.
+            client_params: SDK client parameters; ``base_url`` and the
+                credential parameters select the client.
+            interceptor: Optional interceptor wrapped around the transport.
+
+        Returns:
+            The shared ``httpx.AsyncClient``.
+        """
+        return self._acquire(provider, client_params, interceptor, True)  # type: ignore[return-value]
+
+    def configure(self, **settings: Any) -> None:
+        """Change pool settings for clients created from now on.
+
+        Args:
+            **settings: ``HTTPPoolLimits`` fields to override.
+        """
+        with self._lock:
+            self.limits = replace(self.limits, **settings)
+
+    def stats(self) -> list[HTTPClientStats]:
+        """Return request and connection reuse counts of every shared client."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return [
+            HTTPClientStats(
+                provider=entry.provider,
+                base_url=entry.base_url,
+                is_async=entry.is_async,
+                acquisitions=entry.counters.acquisitions,
+                requests=entry.counters.requests,
+                connections_opened=entry.counters.connections_opened,
+            )
+            for entry in entries
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget every client and close the sync ones.
+
+        Async clients are only dropped, since closing them needs their event
+        loop; LLM instances still holding a client keep using it.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if isinstance(entry.client, httpx.Client):
+                entry.client.close()
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPClientPool()
+        return _default_pool
+
+
+def shared_http_client(
+    provider: str,
+    client_params: Mapping[str, Any],
+    interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
+) -> httpx.Client | None:
+    """Return the pooled sync client for an LLM, or None if it should build its own.
+
+    Sharing is opt-in: None is returned unless ``CREWAI_SHARED_HTTP_CLIENTS``
+    is set to ``true``, or when ``client_params`` already supplies an
+    ``http_client``.
+    """
+    if not shared_http_clients_enabled() or "http_client" in client_params:
+        return None
+    return get_http_client_pool().client(provider, client_params, interceptor)
+
+
+def shared_async_http_client(
+    provider: str,
+    client_params: Mapping[str, Any],
+    interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
+) -> httpx.AsyncClient | None:
+    """Async counterpart of ``shared_http_client``."""
+    if not shared_http_clients_enabled() or "http_client" in client_params:
+        return None
+    return get_http_client_pool().async_client(provider, client_params, interceptor)
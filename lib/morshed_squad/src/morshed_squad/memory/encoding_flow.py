@@ -2,8 +2,8 @@
 
 Orchestrates the encoding side of memory in a single Flow with 5 steps:
 1. Batch embed (ONE embedder call for all items)
-2. Intra-batch dedup (cosine matrix, drop near-exact duplicates)
-3. Parallel find similar (concurrent storage searches)
+2. Intra-batch dedup (blockwise normalized matrix products, drop near-exact duplicates)
+3. Find similar (one batched storage search, concurrent fallback)
 4. Parallel analyze (N concurrent LLM calls -- field resolution + consolidation)
 5. Execute plans (batch re-embed updates + bulk insert)
 """
@@ -12,10 +12,10 @@ from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import math
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from morshed_squad.flow.flow import Flow, listen, start
@@ -28,6 +28,10 @@ from morshed_squad.memory.analyze import (
 from morshed_squad.memory.types import MemoryConfig, MemoryRecord, embed_texts
 
 
+# Columns of the similarity matrix computed per step of intra-batch dedup.
+_DEDUP_BLOCK_SIZE = 512
+
+
 # ---------------------------------------------------------------------------
 # State models
 # ---------------------------------------------------------------------------
@@ -55,6 +59,7 @@ class ItemState(BaseModel):
     embedding: list[float] = Field(default_factory=list)
     # Intra-batch dedup
     dropped: bool = False
+    duplicate_of: int | None = None
     # Consolidation
     similar_records: list[MemoryRecord] = Field(default_factory=list)
     top_similarity: float = 0.0
@@ -84,7 +89,7 @@ class EncodingFlow(Flow[EncodingState]):
 
     Processes N items through 5 sequential steps, maximising parallelism:
     - ONE embedder call for all items
-    - N concurrent storage searches
+    - ONE batched storage search (concurrent per-item fallback)
     - N concurrent individual LLM calls (field resolution + consolidation)
     - ONE batch re-embed for updates + ONE bulk storage write
     """
@@ -119,61 +124,118 @@ class EncodingFlow(Flow[EncodingState]):
         for item, emb in zip(items, embeddings, strict=False):
             item.embedding = emb
 
+    @staticmethod
+    def _build_embedding_matrix(embeddings: list[list[float]]) -> np.ndarray:
+        """Stack embeddings into an L2-normalized float32 matrix.
+
+        Rows whose embedding is empty, has a mismatched dimension or zero norm
+        are left as zeros so they never match anything.
+        """
+        dim = next((len(e) for e in embeddings if e), 0)
+        matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+        for row, emb in enumerate(embeddings):
+            if emb and len(emb) == dim:
+                matrix[row] = emb
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
     # ------------------------------------------------------------------
     # Step 2: Intra-batch dedup (cosine similarity matrix)
     # ------------------------------------------------------------------
 
     @listen(batch_embed)
     def intra_batch_dedup(self) -> None:
-        """Drop near-exact duplicates within the batch."""
+        """Drop near-exact duplicates within the batch.
+
+        An item is dropped when its cosine similarity to any earlier, kept item
+        with the same scope, source and privacy reaches
+        ``batch_dedup_threshold``; the write queue merges calls with different
+        options into one batch, so items saved with different options never
+        replace each other. Similarities are computed one block of
+        ``_DEDUP_BLOCK_SIZE`` columns at a time against all earlier rows, so
+        memory stays linear in the batch size, and columns are walked in order
+        to preserve first-wins semantics.
+        """
         items = list(self.state.items)
         if len(items) <= 1:
             return
 
+        matrix = self._build_embedding_matrix([item.embedding for item in items])
         threshold = self._config.batch_dedup_threshold
-        n = len(items)
-        for j in range(1, n):
-            if items[j].dropped or not items[j].embedding:
-                continue
-            for i in range(j):
-                if items[i].dropped or not items[i].embedding:
+        options: dict[tuple[str | None, str | None, bool], int] = {}
+        group = np.array(
+            [
+                options.setdefault(
+                    (item.scope, item.source, item.private), len(options)
+                )
+                for item in items
+            ]
+        )
+        kept = np.array(
+            [bool(item.embedding) and not item.dropped for item in items], dtype=bool
+        )
+
+        for block_start in range(0, len(items), _DEDUP_BLOCK_SIZE):
+            block_end = min(block_start + _DEDUP_BLOCK_SIZE, len(items))
+            # duplicates[i, j - block_start] is True when item i is a
+            # near-duplicate of item j; only rows i < j are candidates.
+            duplicates = matrix[:block_end] @ matrix[block_start:block_end].T
+            duplicates = duplicates >= threshold
+            duplicates[block_start:] = np.triu(duplicates[block_start:], k=1)
+            duplicates &= group[:block_end, None] == group[None, block_start:block_end]
+            for offset in np.flatnonzero(duplicates.any(axis=0)):
+                j = block_start + int(offset)
+                if not kept[j]:
                     continue
-                sim = self._cosine_similarity(items[i].embedding, items[j].embedding)
-                if sim >= threshold:
+                earlier = np.flatnonzero(duplicates[:j, offset] & kept[:j])
+                if earlier.size:
+                    kept[j] = False
                     items[j].dropped = True
+                    items[j].duplicate_of = int(earlier[0])
                     self.state.items_dropped_dedup += 1
-                    break
-
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if len(a) != len(b) or not a:
-            return 0.0
-        dot = sum(x * y for x, y in zip(a, b, strict=False))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
-        return dot / (norm_a * norm_b)
 
     # ------------------------------------------------------------------
-    # Step 3: Parallel find similar (concurrent storage searches)
+    # Step 3: Find similar (batched storage search)
     # ------------------------------------------------------------------
 
     @listen(intra_batch_dedup)
     def parallel_find_similar(self) -> None:
-        """Search storage for similar records, concurrently for all active items."""
+        """Search storage for similar records for all active items.
+
+        Uses the backend's batched ``search_many`` when available so the whole
+        batch is one round-trip; otherwise falls back to concurrent per-item
+        ``search`` calls.
+        """
         items = list(self.state.items)
         active = [(i, item) for i, item in enumerate(items) if not item.dropped and item.embedding]
 
         if not active:
             return
 
+        def _scope_prefix(item: ItemState) -> str | None:
+            return item.scope if item.scope and item.scope.strip("/") else None
+
+        def _assign(item: ItemState, raw: list[tuple[MemoryRecord, float]]) -> None:
+            item.similar_records = [r for r, _ in raw]
+            item.top_similarity = float(raw[0][1]) if raw else 0.0
+
+        search_many = getattr(self._storage, "search_many", None)
+        if search_many is not None and len(active) > 1:
+            batched = search_many(
+                [item.embedding for _, item in active],
+                scope_prefixes=[_scope_prefix(item) for _, item in active],
+                limit=self._config.consolidation_limit,
+                min_score=0.0,
+            )
+            for (_, item), raw in zip(active, batched, strict=False):
+                _assign(item, raw)
+            return
+
         def _search_one(item: ItemState) -> list[tuple[MemoryRecord, float]]:
-            scope_prefix = item.scope if item.scope and item.scope.strip("/") else None
             return self._storage.search(
                 item.embedding,
-                scope_prefix=scope_prefix,
+                scope_prefix=_scope_prefix(item),
                 categories=None,
                 limit=self._config.consolidation_limit,
                 min_score=0.0,
@@ -181,16 +243,12 @@ class EncodingFlow(Flow[EncodingState]):
 
         if len(active) == 1:
             _, item = active[0]
-            raw = _search_one(item)
-            item.similar_records = [r for r, _ in raw]
-            item.top_similarity = float(raw[0][1]) if raw else 0.0
+            _assign(item, _search_one(item))
         else:
             with ThreadPoolExecutor(max_workers=min(len(active), 8)) as pool:
                 futures = [(i, item, pool.submit(_search_one, item)) for i, item in active]
                 for _, item, future in futures:
-                    raw = future.result()
-                    item.similar_records = [r for r, _ in raw]
-                    item.top_similarity = float(raw[0][1]) if raw else 0.0
+                    _assign(item, future.result())
 
     # ------------------------------------------------------------------
     # Step 4: Parallel analyze (N concurrent LLM calls)
@@ -0,0 +1,166 @@
+"""In-process caches for memory recall: recall results and query embeddings."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any
+
+from morshed_squad.memory.types import MemoryMatch
+
+
+RecallKey = tuple[Any, ...]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a key."""
+    return " ".join(query.lower().split())
+
+
+def _normalize_scope(scope: str | None) -> str:
+    """Return the scope as a ``/``-rooted path without a trailing slash."""
+    if scope is None or not scope.strip("/"):
+        return "/"
+    return "/" + scope.strip("/")
+
+
+def _scopes_overlap(a: str, b: str) -> bool:
+    """Whether one normalized scope contains the other."""
+    if a == "/" or b == "/":
+        return True
+    return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+
+class RecallCache:
+    """LRU cache of recall results with scope-aware invalidation.
+
+    Entries are keyed by the normalized query plus every argument that shapes
+    the result (scope, categories, depth, limit, source, privacy). Writes to a
+    scope invalidate every entry whose scope overlaps it. A generation counter
+    lets callers skip storing results computed concurrently with a write.
+
+    Attributes:
+        max_entries: Maximum number of cached recalls; 0 disables the cache.
+        ttl: Seconds an entry stays valid, since recency scores drift over time.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[RecallKey, tuple[float, str, list[MemoryMatch]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        scope: str | None,
+        categories: list[str] | None,
+        depth: str,
+        limit: int,
+        source: str | None,
+        include_private: bool,
+    ) -> RecallKey:
+        """Build the cache key for a recall call."""
+        return (
+            normalize_query(query),
+            _normalize_scope(scope),
+            tuple(sorted(categories or [])),
+            depth,
+            limit,
+            source,
+            include_private,
+        )
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation."""
+        return self._generation
+
+    def get(self, key: RecallKey) -> list[MemoryMatch] | None:
+        """Return cached results for ``key`` if present and fresh."""
+        if self.max_entries <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, _scope, results = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(results)
+
+    def put(self, key: RecallKey, results: list[MemoryMatch], generation: int) -> None:
+        """Store results unless a write happened since ``generation`` was read."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), key[1], list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, scopes: list[str | None] | None = None) -> None:
+        """Drop entries affected by a write.
+
+        Args:
+            scopes: Scopes that were written to. ``None`` (or a ``None`` entry)
+                means the affected scope is unknown and everything is dropped.
+        """
+        with self._lock:
+            self._generation += 1
+            if scopes is None or any(s is None for s in scopes):
+                self._entries.clear()
+                return
+            written = [_normalize_scope(s) for s in scopes]
+            stale = [
+                key
+                for key, (_, cached_scope, _) in self._entries.items()
+                if any(_scopes_overlap(cached_scope, w) for w in written)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+
+class MemoizedEmbedder:
+    """Embedder wrapper that memoizes embeddings per text in an LRU.
+
+    Accepts and returns the same ``list[str] -> list[embedding]`` shape as
+    the wrapped embedder; only texts not seen before are sent to it.
+    """
+
+    def __init__(self, embedder: Any, max_entries: int = 1024) -> None:
+        self._embedder = embedder
+        self.max_entries = max_entries
+        self._memo: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: list[str]) -> list[Any]:
+        results: list[Any] = [None] * len(texts)
+        missing: list[int] = []
+        with self._lock:
+            for i, text in enumerate(texts):
+                cached = self._memo.get(text)
+                if cached is None:
+                    missing.append(i)
+                else:
+                    self._memo.move_to_end(text)
+                    results[i] = cached
+        if missing:
+            fresh = self._embedder([texts[i] for i in missing])
+            with self._lock:
+                for i, emb in zip(missing, fresh, strict=False):
+                    results[i] = emb
+                    if self.max_entries > 0:
+                        self._memo[texts[i]] = emb
+                        self._memo.move_to_end(texts[i])
+                while len(self._memo) > self.max_entries:
+                    self._memo.popitem(last=False)
+        return results
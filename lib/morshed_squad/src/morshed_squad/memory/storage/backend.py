@@ -44,6 +44,30 @@ class StorageBackend(Protocol):
         """
         ...
 
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        scope_prefixes: list[str | None] | None = None,
+        limit: int = 10,
+        min_score: float = 0.0,
+    ) -> list[list[tuple[MemoryRecord, float]]]:
+        """Search for several query embeddings in one batched request.
+
+        Backends that do not implement this are queried one embedding at a
+        time through ``search``.
+
+        Args:
+            query_embeddings: Embedding vectors, one per query.
+            scope_prefixes: Optional scope prefix per query (same length as
+                ``query_embeddings``); ``None`` entries search all scopes.
+            limit: Maximum number of results per query.
+            min_score: Minimum similarity score threshold.
+
+        Returns:
+            One list of (MemoryRecord, score) tuples per query, in input order.
+        """
+        ...
+
     def delete(
         self,
         scope_prefix: str | None = None,
@@ -19,14 +19,18 @@ from morshed_squad.memory.types import MemoryRecord, ScopeInfo
 _logger = logging.getLogger(__name__)
 
 # Default embedding vector dimensionality (matches OpenAI text-embedding-3-small).
-# Used when creating new tables and for zero-vector placeholder scans.
+# Used when creating new tables and for placeholder vectors of unembedded records.
 # Callers can override via the ``vector_dim`` constructor parameter.
 DEFAULT_VECTOR_DIM = 1536
 
-# Safety cap on the number of rows returned by a single scan query.
-# Prevents unbounded memory use when scanning large tables for scope info,
-# listing, or deletion. Internal only -- not user-configurable.
-_SCAN_ROWS_LIMIT = 50_000
+# Suffix of the table holding one aggregate row per distinct scope
+# (record count, category counts, oldest/newest record). Every write applies
+# its count and category deltas to the touched rows, so neither writes nor
+# scope and category listings scan the records table.
+_SUMMARY_TABLE_SUFFIX = "_scope_summary"
+
+# Columns of a record that contribute to its scope's summary row.
+_SUMMARY_COLUMNS = ["scope", "categories_str", "created_at"]
 
 # Retry settings for LanceDB commit conflicts (optimistic concurrency).
 # Under heavy write load (many concurrent saves), the table version can
@@ -36,6 +40,29 @@ _MAX_RETRIES = 5
 _RETRY_BASE_DELAY = 0.2  # seconds; doubles on each retry
 
 
+def _sql_str(value: str) -> str:
+    """Quote a string literal for a LanceDB filter expression."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _row_categories(row: dict[str, Any]) -> list[str]:
+    try:
+        return list(json.loads(row.get("categories_str") or "[]"))
+    except Exception:
+        return []
+
+
+def _parse_created(val: Any) -> datetime | None:
+    if not val:
+        return None
+    if isinstance(val, datetime):
+        return val
+    try:
+        return datetime.fromisoformat(str(val).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 class LanceDBStorage:
     """LanceDB-backed storage for the unified memory system."""
 
@@ -100,6 +127,18 @@ class LanceDBStorage:
             self._vector_dim = vector_dim
             self._table = self._create_table(vector_dim)
 
+        self._summary_table_name = f"{table_name}{_SUMMARY_TABLE_SUFFIX}"
+        self._summary: lancedb.table.Table | None = None
+        self._scope_indexed = False
+        if self._table is not None:
+            with self._write_lock:
+                self._ensure_scope_index()
+                try:
+                    self._summary = self._db.open_table(self._summary_table_name)
+                except Exception:
+                    # Existing table without a summary yet: build it once.
+                    self._refresh_summary(None)
+
     @property
     def write_lock(self) -> threading.RLock:
         """The shared reentrant write lock for this database path.
@@ -178,6 +217,198 @@ class LanceDBStorage:
         table.delete("id = '__schema_placeholder__'")
         return table
 
+    def _ensure_scope_index(self) -> None:
+        """Create the scalar index on ``scope`` if the table does not have one yet."""
+        if self._scope_indexed or self._table is None:
+            return
+        try:
+            indexed = any(
+                "scope" in (getattr(idx, "columns", None) or [])
+                for idx in self._table.list_indices()
+            )
+            if not indexed and self._table.count_rows() > 0:
+                self._table.create_scalar_index("scope")
+                indexed = True
+            self._scope_indexed = indexed
+        except Exception as e:
+            _logger.debug("Could not create scalar index on scope: %s", e)
+
+    def _create_summary_table(self) -> lancedb.table.Table:
+        """Create the per-scope summary table."""
+        placeholder = [
+            {
+                "scope": "__schema_placeholder__",
+                "record_count": 0,
+                "categories_str": "{}",
+                "oldest": "",
+                "newest": "",
+            }
+        ]
+        table = self._db.create_table(self._summary_table_name, placeholder)
+        table.delete("scope = '__schema_placeholder__'")
+        return table
+
+    def _summarize(self, scopes: set[str] | None) -> list[dict[str, Any]]:
+        """Aggregate exact per-scope stats with a projection-only scan.
+
+        Args:
+            scopes: Scopes to aggregate, or None for every scope.
+
+        Returns:
+            One summary row per scope that still has records.
+        """
+        where = None
+        if scopes is not None:
+            where = f"scope IN ({', '.join(_sql_str(sc) for sc in scopes)})"
+        rows = self._scan_rows(columns=_SUMMARY_COLUMNS, where=where)
+        stats: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            entry = stats.setdefault(
+                str(row.get("scope", "")),
+                {"count": 0, "categories": {}, "oldest": None, "newest": None},
+            )
+            entry["count"] += 1
+            for c in _row_categories(row):
+                entry["categories"][c] = entry["categories"].get(c, 0) + 1
+            dt = _parse_created(row.get("created_at"))
+            if dt is not None:
+                if entry["oldest"] is None or dt < entry["oldest"]:
+                    entry["oldest"] = dt
+                if entry["newest"] is None or dt > entry["newest"]:
+                    entry["newest"] = dt
+        return [
+            {
+                "scope": sc,
+                "record_count": entry["count"],
+                "categories_str": json.dumps(entry["categories"]),
+                "oldest": entry["oldest"].isoformat() if entry["oldest"] else "",
+                "newest": entry["newest"].isoformat() if entry["newest"] else "",
+            }
+            for sc, entry in stats.items()
+        ]
+
+    def _summary_table(self) -> lancedb.table.Table:
+        """Return the summary table, opening or creating it on first use."""
+        if self._summary is None:
+            try:
+                self._summary = self._db.open_table(self._summary_table_name)
+            except Exception:
+                self._summary = self._create_summary_table()
+        return self._summary
+
+    def _refresh_summary(self, scopes: set[str] | None) -> None:
+        """Recompute summary rows by scanning their scopes. Caller holds the write lock.
+
+        Args:
+            scopes: Scopes to recompute, or None to rebuild everything.
+        """
+        if scopes is not None and not scopes:
+            return
+        rows = self._summarize(scopes) if self._table is not None else []
+        summary = self._summary_table()
+        if scopes is None:
+            summary.delete("record_count >= 0")
+        else:
+            summary.delete(f"scope IN ({', '.join(_sql_str(sc) for sc in scopes)})")
+        if rows:
+            summary.add(rows)
+
+    def _update_summary(
+        self,
+        added: list[dict[str, Any]] | None = None,
+        removed: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Apply the deltas of a write to the summary. Caller holds the write lock.
+
+        Only the summary rows of the touched scopes are read and rewritten.
+        A scope is rescanned only when a removed record held its oldest or
+        newest timestamp, since those bounds cannot be derived from a delta.
+
+        Args:
+            added: ``scope``, ``categories_str`` and ``created_at`` of written records.
+            removed: The same columns of deleted records.
+        """
+        deltas: dict[str, dict[str, Any]] = {}
+
+        def _delta(row: dict[str, Any]) -> dict[str, Any]:
+            return deltas.setdefault(
+                str(row.get("scope", "")),
+                {"count": 0, "categories": {}, "added": [], "removed": []},
+            )
+
+        for row in added or []:
+            delta = _delta(row)
+            delta["count"] += 1
+            for c in _row_categories(row):
+                delta["categories"][c] = delta["categories"].get(c, 0) + 1
+            dt = _parse_created(row.get("created_at"))
+            if dt is not None:
+                delta["added"].append(dt)
+        for row in removed or []:
+            delta = _delta(row)
+            delta["count"] -= 1
+            for c in _row_categories(row):
+                delta["categories"][c] = delta["categories"].get(c, 0) - 1
+            dt = _parse_created(row.get("created_at"))
+            if dt is not None:
+                delta["removed"].append(dt)
+        if not deltas:
+            return
+
+        summary = self._summary_table()
+        scopes_expr = f"scope IN ({', '.join(_sql_str(sc) for sc in deltas)})"
+        current = {
+            str(r["scope"]): r
+            for r in summary.search().where(scopes_expr).limit(None).to_list()
+        }
+        rows: list[dict[str, Any]] = []
+        rescan: set[str] = set()
+        for sc, delta in deltas.items():
+            row = current.get(sc)
+            count = (int(row["record_count"]) if row else 0) + delta["count"]
+            if count <= 0:
+                continue
+            oldest = _parse_created(row.get("oldest")) if row else None
+            newest = _parse_created(row.get("newest")) if row else None
+            if any(
+                (oldest is not None and dt <= oldest)
+                or (newest is not None and dt >= newest)
+                for dt in delta["removed"]
+            ):
+                rescan.add(sc)
+                continue
+            categories: dict[str, int] = (
+                json.loads(row.get("categories_str") or "{}") if row else {}
+            )
+            for c, n in delta["categories"].items():
+                categories[c] = categories.get(c, 0) + n
+                if categories[c] <= 0:
+                    del categories[c]
+            bounds = [dt for dt in (oldest, newest) if dt is not None] + delta["added"]
+            rows.append(
+                {
+                    "scope": sc,
+                    "record_count": count,
+                    "categories_str": json.dumps(categories),
+                    "oldest": min(bounds).isoformat() if bounds else "",
+                    "newest": max(bounds).isoformat() if bounds else "",
+                }
+            )
+        if rescan:
+            rows.extend(self._summarize(rescan))
+        summary.delete(scopes_expr)
+        if rows:
+            summary.add(rows)
+
+    def _summary_rows(self, scope_prefix: str | None = None) -> list[dict[str, Any]]:
+        """Read summary rows for scopes starting with ``scope_prefix``."""
+        if self._table is None or self._summary is None:
+            return []
+        q = self._summary.search()
+        if scope_prefix:
+            q = q.where(f"scope LIKE {_sql_str(scope_prefix.rstrip('/') + '%')}")
+        return q.limit(None).to_list()
+
     def _ensure_table(self, vector_dim: int | None = None) -> lancedb.table.Table:
         """Return the table, creating it lazily if needed.
 
@@ -246,17 +477,21 @@ class LanceDBStorage:
                 if r["vector"] is None or len(r["vector"]) != self._vector_dim:
                     r["vector"] = [0.0] * self._vector_dim
             self._retry_write("add", rows)
+            self._ensure_scope_index()
+            self._update_summary(added=rows)
 
     def update(self, record: MemoryRecord) -> None:
         """Update a record by ID. Preserves created_at, updates last_accessed."""
         with self._write_lock:
             self._ensure_table()
             safe_id = str(record.id).replace("'", "''")
+            previous = self._scan_rows(columns=_SUMMARY_COLUMNS, where=f"id = '{safe_id}'")
             self._retry_write("delete", f"id = '{safe_id}'")
             row = self._record_to_row(record)
             if row["vector"] is None or len(row["vector"]) != self._vector_dim:
                 row["vector"] = [0.0] * self._vector_dim
             self._retry_write("add", [row])
+            self._update_summary(added=[row], removed=previous)
 
     def touch_records(self, record_ids: list[str]) -> None:
         """Update last_accessed to now for the given record IDs.
@@ -268,25 +503,19 @@ class LanceDBStorage:
             return
         with self._write_lock:
             now = datetime.utcnow().isoformat()
-            for rid in record_ids:
-                safe_id = str(rid).replace("'", "''")
-                rows = (
-                    self._table.search([0.0] * self._vector_dim)
-                    .where(f"id = '{safe_id}'")
-                    .limit(1)
-                    .to_list()
-                )
-                if rows:
-                    rows[0]["last_accessed"] = now
-                    self._retry_write("delete", f"id = '{safe_id}'")
-                    self._retry_write("add", [rows[0]])
+            ids_expr = ", ".join(_sql_str(rid) for rid in record_ids)
+            rows = self._scan_rows(where=f"id IN ({ids_expr})")
+            if rows:
+                for row in rows:
+                    row["last_accessed"] = now
+                self._retry_write("delete", f"id IN ({ids_expr})")
+                self._retry_write("add", rows)
 
     def get_record(self, record_id: str) -> MemoryRecord | None:
         """Return a single record by ID, or None if not found."""
         if self._table is None:
             return None
-        safe_id = str(record_id).replace("'", "''")
-        rows = self._table.search([0.0] * self._vector_dim).where(f"id = '{safe_id}'").limit(1).to_list()
+        rows = self._scan_rows(where=f"id = {_sql_str(record_id)}")
         if not rows:
             return None
         return self._row_to_record(rows[0])
@@ -304,9 +533,7 @@ class LanceDBStorage:
             return []
         query = self._table.search(query_embedding)
         if scope_prefix is not None and scope_prefix.strip("/"):
-            prefix = scope_prefix.rstrip("/")
-            like_val = prefix + "%"
-            query = query.where(f"scope LIKE '{like_val}'")
+            query = query.where(f"scope LIKE {_sql_str(scope_prefix.rstrip('/') + '%')}")
         results = query.limit(limit * 3 if (categories or metadata_filter) else limit).to_list()
         out: list[tuple[MemoryRecord, float]] = []
         for row in results:
@@ -323,6 +550,71 @@ class LanceDBStorage:
                 break
         return out[:limit]
 
+    def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        scope_prefixes: list[str | None] | None = None,
+        limit: int = 10,
+        min_score: float = 0.0,
+    ) -> list[list[tuple[MemoryRecord, float]]]:
+        """Search several embeddings with one multi-vector query per scope.
+
+        Queries sharing a scope prefix are sent to LanceDB together; rows are
+        routed back to their query through the ``query_index`` column. If the
+        installed LanceDB does not support multi-vector search, each query
+        falls back to ``search``.
+
+        Args:
+            query_embeddings: Embedding vectors, one per query.
+            scope_prefixes: Optional scope prefix per query.
+            limit: Maximum number of results per query.
+            min_score: Minimum similarity score threshold.
+
+        Returns:
+            One list of (MemoryRecord, score) tuples per query, in input order.
+        """
+        results: list[list[tuple[MemoryRecord, float]]] = [[] for _ in query_embeddings]
+        if self._table is None or not query_embeddings:
+            return results
+        prefixes = scope_prefixes or [None] * len(query_embeddings)
+
+        groups: dict[str | None, list[int]] = {}
+        for idx, prefix in enumerate(prefixes):
+            key = prefix.rstrip("/") if prefix is not None and prefix.strip("/") else None
+            groups.setdefault(key, []).append(idx)
+
+        for prefix, indices in groups.items():
+            if len(indices) == 1:
+                idx = indices[0]
+                results[idx] = self.search(
+                    query_embeddings[idx], scope_prefix=prefix, limit=limit, min_score=min_score
+                )
+                continue
+            try:
+                query = self._table.search([query_embeddings[i] for i in indices])
+                if prefix is not None:
+                    query = query.where(f"scope LIKE {_sql_str(prefix + '%')}")
+                rows = query.limit(limit).to_list()
+                if rows and "query_index" not in rows[0]:
+                    raise ValueError("multi-vector search not supported")
+            except Exception as e:
+                _logger.debug("Batched LanceDB search unavailable, searching per query: %s", e)
+                for idx in indices:
+                    results[idx] = self.search(
+                        query_embeddings[idx], scope_prefix=prefix, limit=limit, min_score=min_score
+                    )
+                continue
+            for row in rows:
+                idx = indices[int(row["query_index"])]
+                distance = row.get("_distance", 0.0)
+                score = 1.0 / (1.0 + float(distance)) if distance is not None else 1.0
+                if score >= min_score:
+                    results[idx].append((self._row_to_record(row), score))
+            for idx in indices:
+                results[idx].sort(key=lambda pair: pair[1], reverse=True)
+                del results[idx][limit:]
+        return results
+
     def delete(
         self,
         scope_prefix: str | None = None,
@@ -337,51 +629,86 @@ class LanceDBStorage:
             if record_ids and not (categories or metadata_filter):
                 before = self._table.count_rows()
                 ids_expr = ", ".join(f"'{rid}'" for rid in record_ids)
+                removed = self._scan_rows(
+                    columns=_SUMMARY_COLUMNS, where=f"id IN ({ids_expr})"
+                )
                 self._retry_write("delete", f"id IN ({ids_expr})")
+                self._update_summary(removed=removed)
                 return before - self._table.count_rows()
             if categories or metadata_filter:
-                rows = self._scan_rows(scope_prefix)
+                rows = self._scan_rows(
+                    scope_prefix,
+                    columns=["id", "scope", "categories_str", "metadata_str", "created_at"],
+                )
                 to_delete: list[str] = []
+                removed = []
                 for row in rows:
-                    record = self._row_to_record(row)
-                    if categories and not any(c in record.categories for c in categories):
+                    row_categories = json.loads(row["categories_str"]) if row.get("categories_str") else []
+                    row_metadata = json.loads(row["metadata_str"]) if row.get("metadata_str") else {}
+                    if categories and not any(c in row_categories for c in categories):
                         continue
-                    if metadata_filter and not all(record.metadata.get(k) == v for k, v in metadata_filter.items()):
+                    if metadata_filter and not all(row_metadata.get(k) == v for k, v in metadata_filter.items()):
                         continue
-                    if older_than and record.created_at >= older_than:
+                    created = _parse_created(row.get("created_at"))
+                    if older_than and created is not None and created >= older_than:
                         continue
-                    to_delete.append(record.id)
+                    to_delete.append(str(row["id"]))
+                    removed.append(row)
                 if not to_delete:
                     return 0
                 before = self._table.count_rows()
                 ids_expr = ", ".join(f"'{rid}'" for rid in to_delete)
                 self._retry_write("delete", f"id IN ({ids_expr})")
+                self._update_summary(removed=removed)
                 return before - self._table.count_rows()
-            conditions = []
+            scope_expr = None
             if scope_prefix is not None and scope_prefix.strip("/"):
                 prefix = scope_prefix.rstrip("/")
                 if not prefix.startswith("/"):
                     prefix = "/" + prefix
-                conditions.append(f"scope LIKE '{prefix}%' OR scope = '/'")
-            if older_than is not None:
-                conditions.append(f"created_at < '{older_than.isoformat()}'")
-            if not conditions:
-                before = self._table.count_rows()
-                self._retry_write("delete", "id != ''")
+                scope_expr = f"scope LIKE '{prefix}%' OR scope = '/'"
+            before = self._table.count_rows()
+            if older_than is None:
+                # Whole scopes go away, so their summary rows can be dropped
+                # with the same filter instead of being recomputed.
+                self._retry_write("delete", scope_expr or "id != ''")
+                self._summary_table().delete(scope_expr or "record_count >= 0")
                 return before - self._table.count_rows()
+            conditions = [f"created_at < '{older_than.isoformat()}'"]
+            if scope_expr is not None:
+                conditions.insert(0, f"({scope_expr})")
             where_expr = " AND ".join(conditions)
-            before = self._table.count_rows()
+            removed = self._scan_rows(columns=_SUMMARY_COLUMNS, where=where_expr)
             self._retry_write("delete", where_expr)
+            self._update_summary(removed=removed)
             return before - self._table.count_rows()
 
-    def _scan_rows(self, scope_prefix: str | None = None, limit: int = _SCAN_ROWS_LIMIT) -> list[dict[str, Any]]:
-        """Scan rows optionally filtered by scope prefix."""
+    def _scan_rows(
+        self,
+        scope_prefix: str | None = None,
+        columns: list[str] | None = None,
+        where: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scan every matching row without a vector query or row cap.
+
+        Args:
+            scope_prefix: Optional scope prefix to filter by.
+            columns: Columns to project; all columns when None.
+            where: Extra filter expression ANDed with the scope filter.
+        """
         if self._table is None:
             return []
-        q = self._table.search([0.0] * self._vector_dim)
+        conditions = []
         if scope_prefix is not None and scope_prefix.strip("/"):
-            q = q.where(f"scope LIKE '{scope_prefix.rstrip('/')}%'")
-        return q.limit(limit).to_list()
+            conditions.append(f"scope LIKE {_sql_str(scope_prefix.rstrip('/') + '%')}")
+        if where:
+            conditions.append(f"({where})")
+        q = self._table.search()
+        if conditions:
+            q = q.where(" AND ".join(conditions))
+        if columns:
+            q = q.select(columns)
+        return q.limit(None).to_list()
 
     def list_records(
         self, scope_prefix: str | None = None, limit: int = 200, offset: int = 0
@@ -396,17 +723,25 @@ class LanceDBStorage:
         Returns:
             List of MemoryRecord, ordered by created_at descending.
         """
-        rows = self._scan_rows(scope_prefix, limit=limit + offset)
+        # Order on a projection of (id, created_at), then load only the page.
+        keys = self._scan_rows(scope_prefix, columns=["id", "created_at"])
+        keys.sort(key=lambda r: str(r.get("created_at") or ""), reverse=True)
+        page_ids = [str(r["id"]) for r in keys[offset : offset + limit]]
+        if not page_ids:
+            return []
+        rows = self._scan_rows(
+            where=f"id IN ({', '.join(_sql_str(rid) for rid in page_ids)})"
+        )
         records = [self._row_to_record(r) for r in rows]
         records.sort(key=lambda r: r.created_at, reverse=True)
-        return records[offset : offset + limit]
+        return records
 
     def get_scope_info(self, scope: str) -> ScopeInfo:
         scope = scope.rstrip("/") or "/"
         prefix = scope if scope != "/" else ""
         if prefix and not prefix.startswith("/"):
             prefix = "/" + prefix
-        rows = self._scan_rows(prefix or None)
+        rows = self._summary_rows(prefix or None)
         if not rows:
             return ScopeInfo(
                 path=scope or "/",
@@ -416,6 +751,7 @@ class LanceDBStorage:
                 newest_record=None,
                 child_scopes=[],
             )
+        record_count = 0
         categories_set: set[str] = set()
         oldest: datetime | None = None
         newest: datetime | None = None
@@ -428,22 +764,17 @@ class LanceDBStorage:
                 first_component = rest.split("/", 1)[0]
                 if first_component:
                     children.add(child_prefix + first_component)
-            try:
-                cat_str = row.get("categories_str") or "[]"
-                categories_set.update(json.loads(cat_str))
-            except Exception:  # noqa: S110
-                pass
-            created = row.get("created_at")
-            if created:
-                dt = datetime.fromisoformat(str(created).replace("Z", "+00:00")) if isinstance(created, str) else created
-                if isinstance(dt, datetime):
-                    if oldest is None or dt < oldest:
-                        oldest = dt
-                    if newest is None or dt > newest:
-                        newest = dt
+            record_count += int(row.get("record_count") or 0)
+            categories_set.update(json.loads(row.get("categories_str") or "{}"))
+            row_oldest = _parse_created(row.get("oldest"))
+            row_newest = _parse_created(row.get("newest"))
+            if row_oldest is not None and (oldest is None or row_oldest < oldest):
+                oldest = row_oldest
+            if row_newest is not None and (newest is None or row_newest > newest):
+                newest = row_newest
         return ScopeInfo(
             path=scope or "/",
-            record_count=len(rows),
+            record_count=record_count,
             categories=sorted(categories_set),
             oldest_record=oldest,
             newest_record=newest,
@@ -453,7 +784,7 @@ class LanceDBStorage:
     def list_scopes(self, parent: str = "/") -> list[str]:
         parent = parent.rstrip("/") or ""
         prefix = (parent + "/") if parent else "/"
-        rows = self._scan_rows(prefix if prefix != "/" else None)
+        rows = self._summary_rows(prefix if prefix != "/" else None)
         children: set[str] = set()
         for row in rows:
             sc = str(row.get("scope", ""))
@@ -465,16 +796,10 @@ class LanceDBStorage:
         return sorted(children)
 
     def list_categories(self, scope_prefix: str | None = None) -> dict[str, int]:
-        rows = self._scan_rows(scope_prefix)
         counts: dict[str, int] = {}
-        for row in rows:
-            cat_str = row.get("categories_str") or "[]"
-            try:
-                parsed = json.loads(cat_str)
-            except Exception:  # noqa: S112
-                continue
-            for c in parsed:
-                counts[c] = counts.get(c, 0) + 1
+        for row in self._summary_rows(scope_prefix):
+            for c, n in json.loads(row.get("categories_str") or "{}").items():
+                counts[c] = counts.get(c, 0) + int(n)
         return counts
 
     def count(self, scope_prefix: str | None = None) -> int:
@@ -489,14 +814,22 @@ class LanceDBStorage:
         if scope_prefix is None or scope_prefix.strip("/") == "":
             if self._table is not None:
                 self._db.drop_table(self._table_name)
+            if self._summary is not None:
+                self._db.drop_table(self._summary_table_name)
             self._table = None
+            self._summary = None
+            self._scope_indexed = False
             # Dimension is preserved; table will be recreated on next save.
             return
         if self._table is None:
             return
         prefix = scope_prefix.rstrip("/")
         if prefix:
-            self._table.delete(f"scope >= '{prefix}' AND scope < '{prefix}/\uFFFF'")
+            upper = prefix + "/\uFFFF"
+            where_expr = f"scope >= {_sql_str(prefix)} AND scope < {_sql_str(upper)}"
+            with self._write_lock:
+                self._retry_write("delete", where_expr)
+                self._summary_table().delete(where_expr)
 
     async def asave(self, records: list[MemoryRecord]) -> None:
         self.save(records)
@@ -273,6 +273,70 @@ class MemoryConfig(BaseModel):
         ),
     )
 
+    # -- Recall caching --
+
+    recall_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description=(
+            "Maximum number of recall results kept in memory. Repeated recalls "
+            "with the same normalized query, scope, categories and depth are "
+            "served from the cache without embedding or LLM calls. Writes to an "
+            "overlapping scope invalidate entries. Set to 0 to disable."
+        ),
+    )
+    recall_cache_ttl: float = Field(
+        default=300.0,
+        ge=0.0,
+        description=(
+            "Seconds a cached recall result stays valid. Bounds how stale the "
+            "recency component of the composite score can get."
+        ),
+    )
+    query_embedding_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Maximum number of recall query embeddings memoized in an LRU so "
+            "repeated queries and sub-queries are not re-embedded."
+        ),
+    )
+
+    # -- Background writes --
+
+    write_batch_size: int = Field(
+        default=64,
+        ge=1,
+        description=(
+            "Target number of items per background encoding batch. Pending "
+            "remember calls are coalesced into one EncodingFlow run up to this size."
+        ),
+    )
+    write_batch_wait: float = Field(
+        default=0.05,
+        ge=0.0,
+        description=(
+            "Seconds the background writer waits for more saves before encoding "
+            "a batch that is not full."
+        ),
+    )
+    write_queue_size: int = Field(
+        default=1024,
+        ge=1,
+        description=(
+            "Items allowed to wait for encoding. Further saves block until the "
+            "queue drains, so fast producers cannot build an unbounded backlog."
+        ),
+    )
+    max_in_flight_writes: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Encoding batches run concurrently. 1 serializes storage mutations; "
+            "higher values can race when batches consolidate the same record."
+        ),
+    )
+
 
 def embed_text(embedder: Any, text: str) -> list[float]:
     """Embed a single text string and return a list of floats.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from datetime import datetime
 import threading
 import time
@@ -19,6 +19,7 @@ from morshed_squad.events.types.memory_events import (
 )
 from morshed_squad.llms.base_llm import BaseLLM
 from morshed_squad.memory.analyze import extract_memories_from_content
+from morshed_squad.memory.recall_cache import MemoizedEmbedder, RecallCache
 from morshed_squad.memory.recall_flow import RecallFlow
 from morshed_squad.memory.storage.backend import StorageBackend
 from morshed_squad.memory.storage.lancedb_storage import LanceDBStorage
@@ -30,6 +31,11 @@ from morshed_squad.memory.types import (
     compute_composite_score,
     embed_text,
 )
+from morshed_squad.memory.write_queue import (
+    MemoryWriteQueue,
+    WriteQueueMetrics,
+    WriteRequest,
+)
 
 
 def _default_embedder() -> Any:
@@ -88,6 +94,25 @@ class Memory:
         # Queries shorter than this skip LLM analysis (saving ~1-3s).
         # Longer queries (full task descriptions) benefit from LLM distillation.
         query_analysis_threshold: int = 200,
+        # -- Recall caching --
+        # Identical recalls (normalized query, scope, categories, depth) are
+        # served from an LRU until a write touches an overlapping scope or the
+        # TTL expires. Set recall_cache_size=0 to disable.
+        recall_cache_size: int = 256,
+        recall_cache_ttl: float = 300.0,
+        # LRU of query embeddings so repeated (sub-)queries are not re-embedded.
+        query_embedding_cache_size: int = 1024,
+        # -- Background writes --
+        # Saves are queued and encoded in micro-batches: a batch is sent once it
+        # holds write_batch_size items or write_batch_wait seconds have passed.
+        # write_queue_size items may wait before remember calls block, and
+        # max_in_flight_writes batches are encoded at once. Keep it at 1 unless
+        # writes go to disjoint scopes: concurrent batches can race on
+        # consolidating the same existing record.
+        write_batch_size: int = 64,
+        write_batch_wait: float = 0.05,
+        write_queue_size: int = 1024,
+        max_in_flight_writes: int = 1,
     ) -> None:
         """Initialize Memory.
 
@@ -107,6 +132,13 @@ class Memory:
             complex_query_threshold: For complex queries, explore deeper below this confidence.
             exploration_budget: Number of LLM-driven exploration rounds during deep recall.
             query_analysis_threshold: Queries shorter than this skip LLM analysis during deep recall.
+            recall_cache_size: Max cached recall results (0 disables the recall cache).
+            recall_cache_ttl: Seconds a cached recall result stays valid.
+            query_embedding_cache_size: Max memoized query embeddings.
+            write_batch_size: Target number of items per background encoding batch.
+            write_batch_wait: Seconds to wait for more saves before encoding a partial batch.
+            write_queue_size: Items allowed to wait for encoding before saves block.
+            max_in_flight_writes: Encoding batches run concurrently.
         """
         self._config = MemoryConfig(
             recency_weight=recency_weight,
@@ -121,6 +153,13 @@ class Memory:
             complex_query_threshold=complex_query_threshold,
             exploration_budget=exploration_budget,
             query_analysis_threshold=query_analysis_threshold,
+            recall_cache_size=recall_cache_size,
+            recall_cache_ttl=recall_cache_ttl,
+            query_embedding_cache_size=query_embedding_cache_size,
+            write_batch_size=write_batch_size,
+            write_batch_wait=write_batch_wait,
+            write_queue_size=write_queue_size,
+            max_in_flight_writes=max_in_flight_writes,
         )
 
         # Store raw config for lazy initialization. LLM and embedder are only
@@ -141,16 +180,26 @@ class Memory:
         else:
             self._storage = storage
 
-        # Background save queue. max_workers=1 serializes saves to avoid
-        # concurrent storage mutations (two saves finding the same similar
-        # record and both trying to update/delete it). Within each save,
-        # the parallel LLM calls still run on their own thread pool.
-        self._save_pool = ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="memory-save"
+        # Background save queue. Saves from all callers are coalesced into
+        # batches; by default one batch is encoded at a time, which serializes
+        # storage mutations (two saves finding the same similar record and
+        # both trying to update/delete it). Within each batch, the parallel
+        # LLM calls still run on their own thread pool.
+        self._write_queue = MemoryWriteQueue(
+            self._write_batch,
+            batch_size=write_batch_size,
+            batch_wait=write_batch_wait,
+            max_queue_size=write_queue_size,
+            max_in_flight=max_in_flight_writes,
         )
         self._pending_saves: list[Future[Any]] = []
         self._pending_lock = threading.Lock()
 
+        self._recall_cache = RecallCache(
+            max_entries=recall_cache_size, ttl=recall_cache_ttl
+        )
+        self._query_embedder_instance: MemoizedEmbedder | None = None
+
     _MEMORY_DOCS_URL = "https://docs.crewai.com/concepts/memory"
 
     @property
@@ -196,28 +245,45 @@ class Memory:
                 ) from e
         return self._embedder_instance
 
+    @property
+    def _query_embedder(self) -> MemoizedEmbedder:
+        """Embedder used for recall queries, memoizing embeddings in an LRU."""
+        if self._query_embedder_instance is None:
+            self._query_embedder_instance = MemoizedEmbedder(
+                self._embedder, max_entries=self._config.query_embedding_cache_size
+            )
+        return self._query_embedder_instance
+
     # ------------------------------------------------------------------
     # Background write queue
     # ------------------------------------------------------------------
 
-    def _submit_save(self, fn: Any, *args: Any, **kwargs: Any) -> Future[Any]:
-        """Submit a save operation to the background thread pool.
+    def _submit_save(
+        self,
+        items: list[dict[str, Any]],
+        agent_role: str | None = None,
+        background: bool = True,
+    ) -> Future[list[MemoryRecord | None]]:
+        """Queue items on the background write queue.
 
         The future is tracked so that ``drain_writes()`` can wait for it.
-        If the pool has been shut down (e.g. after ``close()``), the save
+        If the queue has been closed (e.g. after ``close()``), the save
         runs synchronously as a fallback so late saves still succeed.
         """
         try:
-            future: Future[Any] = self._save_pool.submit(fn, *args, **kwargs)
+            future = self._write_queue.submit(
+                items, agent_role=agent_role, background=background
+            )
         except RuntimeError:
-            # Pool shut down -- run synchronously as fallback
-            future = Future()
+            # Queue closed -- run synchronously as fallback
+            request = WriteRequest(
+                items=items, agent_role=agent_role, background=background
+            )
             try:
-                result = fn(*args, **kwargs)
-                future.set_result(result)
+                request.future.set_result(self._write_batch([request]))
             except Exception as exc:
-                future.set_exception(exc)
-            return future
+                request.future.set_exception(exc)
+            return request.future
         with self._pending_lock:
             self._pending_saves.append(future)
         future.add_done_callback(self._on_save_done)
@@ -260,13 +326,17 @@ class Memory:
         for future in pending:
             future.result()  # blocks until done; re-raises exceptions
 
+    def write_metrics(self) -> WriteQueueMetrics:
+        """Return queue depth, batch size and encode latency of background saves."""
+        return self._write_queue.metrics()
+
     def close(self) -> None:
-        """Drain pending saves and shut down the background thread pool."""
+        """Drain pending saves and shut down the background write queue."""
         self.drain_writes()
-        self._save_pool.shutdown(wait=True)
+        self._write_queue.close()
 
-    def _encode_batch(
-        self,
+    @staticmethod
+    def _build_items(
         contents: list[str],
         scope: str | None = None,
         categories: list[str] | None = None,
@@ -274,21 +344,9 @@ class Memory:
         importance: float | None = None,
         source: str | None = None,
         private: bool = False,
-    ) -> list[MemoryRecord]:
-        """Run the batch EncodingFlow for one or more items. No event emission.
-
-        This is the core encoding logic shared by ``remember()`` and
-        ``remember_many()``. Events are managed by the calling method.
-        """
-        from morshed_squad.memory.encoding_flow import EncodingFlow
-
-        flow = EncodingFlow(
-            storage=self._storage,
-            llm=self._llm,
-            embedder=self._embedder,
-            config=self._config,
-        )
-        items_input = [
+    ) -> list[dict[str, Any]]:
+        """Build ``EncodingFlow`` item inputs sharing the same options."""
+        return [
             {
                 "content": c,
                 "scope": scope,
@@ -300,12 +358,97 @@ class Memory:
             }
             for c in contents
         ]
-        flow.kickoff(inputs={"items": items_input})
-        return [
-            item.result_record
-            for item in flow.state.items
-            if not item.dropped and item.result_record is not None
-        ]
+
+    def _encode_items(self, items: list[dict[str, Any]]) -> list[MemoryRecord | None]:
+        """Run the batch EncodingFlow over items. No event emission.
+
+        This is the core encoding logic shared by ``remember()`` and
+        ``remember_many()``; items may come from several calls with different
+        options. Events are managed by the caller.
+
+        Returns:
+            One record per item. Items dropped as duplicates of an earlier item
+            in the batch get that item's record.
+        """
+        from morshed_squad.memory.encoding_flow import EncodingFlow
+
+        flow = EncodingFlow(
+            storage=self._storage,
+            llm=self._llm,
+            embedder=self._embedder,
+            config=self._config,
+        )
+        flow.kickoff(inputs={"items": items})
+        self._recall_cache.invalidate(list({item["scope"] for item in items}))
+        states = flow.state.items
+        records: list[MemoryRecord | None] = []
+        for item in states:
+            if item.duplicate_of is not None:
+                records.append(states[item.duplicate_of].result_record)
+            else:
+                records.append(None if item.dropped else item.result_record)
+        return records
+
+    def _write_batch(self, batch: list[WriteRequest]) -> list[MemoryRecord | None]:
+        """Encode a batch from the write queue, emitting events for background saves.
+
+        Each ``remember_many`` call gets its own started and completed event,
+        emitted here (in the writer thread) so they pair correctly on the event
+        bus scope stack. ``remember`` emits its own events in the caller.
+
+        All ``emit`` calls are wrapped in try/except to handle the case where
+        the event bus shuts down before the background save finishes (e.g.
+        during process exit).
+        """
+        for request in batch:
+            if not request.background:
+                continue
+            try:
+                crewai_event_bus.emit(
+                    self,
+                    MemorySaveStartedEvent(
+                        value=f"{len(request.items)} memories (background)",
+                        metadata=request.items[0]["metadata"],
+                        source_type="unified_memory",
+                    ),
+                )
+            except RuntimeError:
+                pass  # event bus shut down during process exit
+
+        items = [item for request in batch for item in request.items]
+        try:
+            start = time.perf_counter()
+            records = self._encode_items(items)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except RuntimeError:
+            # The encoding pipeline uses asyncio.run() -> to_thread() internally.
+            # If the process is shutting down, the default executor is closed and
+            # to_thread raises "cannot schedule new futures after shutdown".
+            # Silently abandon background saves -- the process is exiting anyway.
+            if not all(request.background for request in batch):
+                raise
+            return [None] * len(items)
+
+        offset = 0
+        for request in batch:
+            saved = records[offset : offset + len(request.items)]
+            offset += len(request.items)
+            if not request.background:
+                continue
+            try:
+                crewai_event_bus.emit(
+                    self,
+                    MemorySaveCompletedEvent(
+                        value=f"{sum(r is not None for r in saved)} memories saved",
+                        metadata=request.items[0]["metadata"] or {},
+                        agent_role=request.agent_role,
+                        save_time_ms=elapsed_ms,
+                        source_type="unified_memory",
+                    ),
+                )
+            except RuntimeError:
+                pass  # event bus shut down during process exit
+        return records
 
     def remember(
         self,
@@ -320,9 +463,9 @@ class Memory:
     ) -> MemoryRecord:
         """Store a single item in memory (synchronous).
 
-        Routes through the same serialized save pool as ``remember_many``
-        to prevent races, but blocks until the save completes so the caller
-        gets the ``MemoryRecord`` back immediately.
+        Routes through the same write queue as ``remember_many``, so it is
+        batched with concurrent saves and cannot race them, but blocks until
+        the save completes so the caller gets the ``MemoryRecord`` back.
 
         Args:
             content: Text to remember.
@@ -352,14 +495,16 @@ class Memory:
             )
             start = time.perf_counter()
 
-            # Submit through the save pool for proper serialization,
+            # Submit through the write queue for proper serialization,
             # then immediately wait for the result.
             future = self._submit_save(
-                self._encode_batch,
-                [content], scope, categories, metadata, importance, source, private,
+                self._build_items(
+                    [content], scope, categories, metadata, importance, source, private
+                ),
+                agent_role=agent_role,
+                background=False,
             )
-            records = future.result()
-            record = records[0] if records else None
+            record = future.result()[0]
 
             elapsed_ms = (time.perf_counter() - start) * 1000
             crewai_event_bus.emit(
@@ -398,11 +543,13 @@ class Memory:
     ) -> list[MemoryRecord]:
         """Store multiple items in memory (non-blocking).
 
-        The encoding pipeline runs in a background thread. This method
-        returns immediately so the caller (e.g. agent) is not blocked.
-        A ``MemorySaveStartedEvent`` is emitted immediately; the
-        ``MemorySaveCompletedEvent`` is emitted when the background
-        save finishes.
+        The items are queued for the background writer, which coalesces
+        them with other pending saves into one encoding batch. This method
+        returns immediately so the caller (e.g. agent) is not blocked,
+        unless the write queue is full.
+        The ``MemorySaveStartedEvent`` and ``MemorySaveCompletedEvent`` are
+        both emitted by the background writer thread, when it picks up the
+        batch and when the save finishes.
 
         Any subsequent ``recall()`` call will automatically wait for
         pending saves to complete before searching (read barrier).
@@ -424,72 +571,13 @@ class Memory:
             return []
 
         self._submit_save(
-            self._background_encode_batch,
-            contents, scope, categories, metadata,
-            importance, source, private, agent_role,
+            self._build_items(
+                contents, scope, categories, metadata, importance, source, private
+            ),
+            agent_role=agent_role,
         )
         return []
 
-    def _background_encode_batch(
-        self,
-        contents: list[str],
-        scope: str | None,
-        categories: list[str] | None,
-        metadata: dict[str, Any] | None,
-        importance: float | None,
-        source: str | None,
-        private: bool,
-        agent_role: str | None,
-    ) -> list[MemoryRecord]:
-        """Run the encoding pipeline in a background thread with event emission.
-
-        Both started and completed events are emitted here (in the background
-        thread) so they pair correctly on the event bus scope stack.
-
-        All ``emit`` calls are wrapped in try/except to handle the case where
-        the event bus shuts down before the background save finishes (e.g.
-        during process exit).
-        """
-        try:
-            crewai_event_bus.emit(
-                self,
-                MemorySaveStartedEvent(
-                    value=f"{len(contents)} memories (background)",
-                    metadata=metadata,
-                    source_type="unified_memory",
-                ),
-            )
-        except RuntimeError:
-            pass  # event bus shut down during process exit
-
-        try:
-            start = time.perf_counter()
-            records = self._encode_batch(
-                contents, scope, categories, metadata, importance, source, private
-            )
-            elapsed_ms = (time.perf_counter() - start) * 1000
-        except RuntimeError:
-            # The encoding pipeline uses asyncio.run() -> to_thread() internally.
-            # If the process is shutting down, the default executor is closed and
-            # to_thread raises "cannot schedule new futures after shutdown".
-            # Silently abandon the save -- the process is exiting anyway.
-            return []
-
-        try:
-            crewai_event_bus.emit(
-                self,
-                MemorySaveCompletedEvent(
-                    value=f"{len(records)} memories saved",
-                    metadata=metadata or {},
-                    agent_role=agent_role,
-                    save_time_ms=elapsed_ms,
-                    source_type="unified_memory",
-                ),
-            )
-        except RuntimeError:
-            pass  # event bus shut down during process exit
-        return records
-
     def extract_memories(self, content: str) -> list[str]:
         """Extract discrete memories from a raw content blob using the LLM.
 
@@ -538,6 +626,11 @@ class Memory:
         # so that the search sees all persisted records.
         self.drain_writes()
 
+        cache_key = RecallCache.make_key(
+            query, scope, categories, depth, limit, source, include_private
+        )
+        cache_generation = self._recall_cache.generation
+
         _source = "unified_memory"
         try:
             crewai_event_bus.emit(
@@ -551,8 +644,24 @@ class Memory:
             )
             start = time.perf_counter()
 
+            cached = self._recall_cache.get(cache_key)
+            if cached is not None:
+                self._touch_recalled(cached)
+                crewai_event_bus.emit(
+                    self,
+                    MemoryQueryCompletedEvent(
+                        query=query,
+                        results=cached,
+                        limit=limit,
+                        score_threshold=None,
+                        query_time_ms=(time.perf_counter() - start) * 1000,
+                        source_type=_source,
+                    ),
+                )
+                return cached
+
             if depth == "shallow":
-                embedding = embed_text(self._embedder, query)
+                embedding = embed_text(self._query_embedder, query)
                 if not embedding:
                     results: list[MemoryMatch] = []
                 else:
@@ -586,7 +695,7 @@ class Memory:
                 flow = RecallFlow(
                     storage=self._storage,
                     llm=self._llm,
-                    embedder=self._embedder,
+                    embedder=self._query_embedder,
                     config=self._config,
                 )
                 flow.kickoff(
@@ -601,14 +710,8 @@ class Memory:
                 )
                 results = flow.state.final_results
 
-            # Update last_accessed for recalled records
-            if results:
-                try:
-                    touch = getattr(self._storage, "touch_records", None)
-                    if touch is not None:
-                        touch([m.record.id for m in results])
-                except Exception:  # noqa: S110
-                    pass  # Non-critical: don't fail recall because of touch
+            self._touch_recalled(results)
+            self._recall_cache.put(cache_key, results, cache_generation)
 
             elapsed_ms = (time.perf_counter() - start) * 1000
             crewai_event_bus.emit(
@@ -636,6 +739,17 @@ class Memory:
             )
             raise
 
+    def _touch_recalled(self, results: list[MemoryMatch]) -> None:
+        """Update last_accessed for recalled records, cache hits included."""
+        if not results:
+            return
+        try:
+            touch = getattr(self._storage, "touch_records", None)
+            if touch is not None:
+                touch([m.record.id for m in results])
+        except Exception:  # noqa: S110
+            pass  # Non-critical: don't fail recall because of touch
+
     def forget(
         self,
         scope: str | None = None,
@@ -649,13 +763,16 @@ class Memory:
         Returns:
             Number of records deleted.
         """
-        return self._storage.delete(
+        deleted = self._storage.delete(
             scope_prefix=scope,
             categories=categories,
             record_ids=record_ids,
             older_than=older_than,
             metadata_filter=metadata_filter,
         )
+        # Deletes by record ID may touch any scope.
+        self._recall_cache.invalidate(None if record_ids else [scope])
+        return deleted
 
     def update(
         self,
@@ -701,6 +818,7 @@ class Memory:
             updates["importance"] = importance
         updated = existing.model_copy(update=updates)
         self._storage.update(updated)
+        self._recall_cache.invalidate([existing.scope, updated.scope])
         return updated
 
     def scope(self, path: str) -> Any:
@@ -767,6 +885,7 @@ class Memory:
     def reset(self, scope: str | None = None) -> None:
         """Reset (delete all) memories in scope. None = all."""
         self._storage.reset(scope_prefix=scope)
+        self._recall_cache.invalidate([scope])
 
     async def aextract_memories(self, content: str) -> list[str]:
         """Async variant of extract_memories."""
@@ -0,0 +1,275 @@
+"""Background write pipeline that coalesces memory saves into large batches."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+
+from morshed_squad.memory.types import MemoryRecord
+
+
+@dataclass
+class WriteRequest:
+    """Items submitted together by one ``remember`` / ``remember_many`` call.
+
+    Attributes:
+        items: ``EncodingFlow`` item inputs.
+        agent_role: Agent role reported in save events.
+        background: Whether the caller returned without waiting, so save
+            events are emitted by the writer rather than the caller.
+        future: Resolves to one record (or None) per item.
+    """
+
+    items: list[dict[str, Any]]
+    agent_role: str | None = None
+    background: bool = True
+    future: Future[list[MemoryRecord | None]] = field(default_factory=Future)
+
+
+EncodeFn = Callable[[list[WriteRequest]], list[MemoryRecord | None]]
+"""Encodes the items of a batch of requests, returning one record (or None) per item."""
+
+
+@dataclass(frozen=True)
+class WriteQueueMetrics:
+    """Snapshot of a ``MemoryWriteQueue``.
+
+    Attributes:
+        queue_length: Items waiting to be batched.
+        queued_requests: Calls whose items are waiting to be batched.
+        in_flight: Batches currently being encoded.
+        batches: Batches encoded so far, including failed ones.
+        failed_batches: Batches whose encoding raised.
+        items_written: Items in successfully encoded batches.
+        last_batch_size: Items in the most recent batch.
+        max_batch_size: Items in the largest batch so far.
+        mean_batch_size: Average items per batch.
+        last_encode_ms: Encode latency of the most recent batch.
+        max_encode_ms: Slowest batch encode latency so far.
+        mean_encode_ms: Average batch encode latency.
+    """
+
+    queue_length: int = 0
+    queued_requests: int = 0
+    in_flight: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    items_written: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    mean_batch_size: float = 0.0
+    last_encode_ms: float = 0.0
+    max_encode_ms: float = 0.0
+    mean_encode_ms: float = 0.0
+
+
+class MemoryWriteQueue:
+    """Bounded queue of memory writes, encoded in micro-batches.
+
+    A dispatcher thread gathers queued requests into one batch until it holds
+    ``batch_size`` items or ``batch_wait`` seconds have passed since its first
+    request, then hands it to a pool of ``max_in_flight`` workers. Many small
+    ``remember`` calls therefore become a few large ``EncodingFlow`` runs.
+    ``submit`` blocks while ``max_queue_size`` items are waiting, and the
+    dispatcher blocks while ``max_in_flight`` batches are encoding, so a
+    producer that outpaces encoding is slowed down instead of growing an
+    unbounded backlog.
+
+    Attributes:
+        batch_size: Target number of items per batch. A single larger
+            request is still encoded as one batch.
+        batch_wait: Seconds to wait for more requests before encoding a
+            batch that is not full.
+        max_queue_size: Items allowed to wait before ``submit`` blocks.
+        max_in_flight: Batches encoded concurrently.
+    """
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        batch_size: int = 64,
+        batch_wait: float = 0.05,
+        max_queue_size: int = 1024,
+        max_in_flight: int = 1,
+    ) -> None:
+        self.batch_size = max(batch_size, 1)
+        self.batch_wait = batch_wait
+        self.max_queue_size = max(max_queue_size, 1)
+        self.max_in_flight = max(max_in_flight, 1)
+        self._encode = encode
+        self._queue: deque[WriteRequest] = deque()
+        self._queued_items = 0
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="memory-save"
+        )
+        self._dispatcher: threading.Thread | None = None
+        self._batches = 0
+        self._failed_batches = 0
+        self._items_written = 0
+        self._batched_items = 0
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self._total_encode_ms = 0.0
+        self._last_encode_ms = 0.0
+        self._max_encode_ms = 0.0
+
+    def submit(
+        self,
+        items: list[dict[str, Any]],
+        agent_role: str | None = None,
+        background: bool = True,
+    ) -> Future[list[MemoryRecord | None]]:
+        """Queue items for encoding, blocking while the queue is full.
+
+        Args:
+            items: ``EncodingFlow`` item inputs.
+            agent_role: Agent role reported in save events.
+            background: Whether the caller does not wait for the result.
+
+        Returns:
+            A future resolving to one record (or None when the item was
+            dropped) per item, in order. Duplicates of an earlier item in
+            the same batch resolve to that item's record.
+
+        Raises:
+            RuntimeError: If the queue has been closed.
+        """
+        request = WriteRequest(
+            items=items, agent_role=agent_role, background=background
+        )
+        with self._condition:
+            while (
+                not self._closed
+                and self._queued_items
+                and self._queued_items + len(items) > self.max_queue_size
+            ):
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("memory write queue is closed")
+            self._queue.append(request)
+            self._queued_items += len(items)
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name="memory-save-dispatch", daemon=True
+                )
+                self._dispatcher.start()
+            self._condition.notify_all()
+        return request.future
+
+    def _next_batch(self) -> list[WriteRequest] | None:
+        """Wait for a batch to fill or time out; None once closed and empty."""
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if not self._queue:
+                return None
+            deadline = time.monotonic() + self.batch_wait
+            while self._queued_items < self.batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = [self._queue.popleft()]
+            size = len(batch[0].items)
+            while self._queue and size + len(self._queue[0].items) <= self.batch_size:
+                request = self._queue.popleft()
+                size += len(request.items)
+                batch.append(request)
+            self._queued_items -= size
+            self._in_flight += 1
+            self._condition.notify_all()
+            return batch
+
+    def _dispatch(self) -> None:
+        while True:
+            self._slots.acquire()
+            batch = self._next_batch()
+            if batch is None:
+                self._slots.release()
+                return
+            try:
+                self._pool.submit(self._run, batch)
+            except RuntimeError:
+                # Pool shut down underneath us; encode on this thread instead.
+                self._run(batch)
+
+    def _run(self, batch: list[WriteRequest]) -> None:
+        size = sum(len(request.items) for request in batch)
+        start = time.perf_counter()
+        failed = False
+        try:
+            records = self._encode(batch)
+        except BaseException as e:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            failed = True
+            for request in batch:
+                request.future.set_exception(e)
+        else:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            offset = 0
+            for request in batch:
+                request.future.set_result(records[offset : offset + len(request.items)])
+                offset += len(request.items)
+        finally:
+            self._slots.release()
+            self._finish(size, elapsed_ms, failed)
+
+    def _finish(self, size: int, elapsed_ms: float, failed: bool) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._batches += 1
+            self._batched_items += size
+            self._last_batch_size = size
+            self._max_batch_size = max(self._max_batch_size, size)
+            self._total_encode_ms += elapsed_ms
+            self._last_encode_ms = elapsed_ms
+            self._max_encode_ms = max(self._max_encode_ms, elapsed_ms)
+            if failed:
+                self._failed_batches += 1
+            else:
+                self._items_written += size
+            self._condition.notify_all()
+
+    def metrics(self) -> WriteQueueMetrics:
+        """Return a snapshot of queue depth, batch sizes and encode latency."""
+        with self._condition:
+            batches = self._batches
+            return WriteQueueMetrics(
+                queue_length=self._queued_items,
+                queued_requests=len(self._queue),
+                in_flight=self._in_flight,
+                batches=batches,
+                failed_batches=self._failed_batches,
+                items_written=self._items_written,
+                last_batch_size=self._last_batch_size,
+                max_batch_size=self._max_batch_size,
+                mean_batch_size=self._batched_items / batches if batches else 0.0,
+                last_encode_ms=self._last_encode_ms,
+                max_encode_ms=self._max_encode_ms,
+                mean_encode_ms=self._total_encode_ms / batches if batches else 0.0,
+            )
+
+    def flush(self) -> None:
+        """Block until every queued and in-flight batch has been encoded."""
+        with self._condition:
+            while self._queue or self._in_flight:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Encode what is queued, then stop the dispatcher and workers."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            dispatcher = self._dispatcher
+        if dispatcher is not None:
+            dispatcher.join()
+        self._pool.shutdown(wait=True)
@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 
+from chromadb import errors as chromadb_errors
 from chromadb.api.types import (
     EmbeddingFunction as ChromaEmbeddingFunction,
     QueryResult,
@@ -10,13 +11,16 @@ from chromadb.api.types import (
 from typing_extensions import Unpack
 
 from morshed_squad.rag.chromadb.types import (
+    AddDocumentsStats,
     ChromaDBClientType,
     ChromaDBCollectionCreateParams,
+    ChromaDBCollectionSearchManyParams,
     ChromaDBCollectionSearchParams,
 )
 from morshed_squad.rag.chromadb.utils import (
     _create_batch_slice,
     _extract_search_params,
+    _filter_unchanged_batch,
     _is_async_client,
     _is_sync_client,
     _prepare_documents_for_chromadb,
@@ -26,12 +30,23 @@ from morshed_squad.rag.chromadb.utils import (
 from morshed_squad.rag.core.base_client import (
     BaseClient,
     BaseCollectionAddParams,
+    BaseCollectionDeleteParams,
     BaseCollectionParams,
 )
 from morshed_squad.rag.types import SearchResult
 from morshed_squad.utilities.logger_utils import suppress_logging
 
 
+# Raised when a cached collection handle points at a collection that was
+# dropped or recreated elsewhere. Older chromadb releases raise
+# InvalidCollectionException instead of NotFoundError.
+_STALE_COLLECTION_ERRORS: tuple[type[Exception], ...] = tuple(
+    getattr(chromadb_errors, name)
+    for name in ("NotFoundError", "InvalidCollectionException")
+    if hasattr(chromadb_errors, name)
+)
+
+
 class ChromaDBClient(BaseClient):
     """ChromaDB implementation of the BaseClient protocol.
 
@@ -43,6 +58,10 @@ class ChromaDBClient(BaseClient):
         embedding_function: Function to generate embeddings for documents.
         default_limit: Default number of results to return in searches.
         default_score_threshold: Default minimum score for search results.
+        last_add_stats: Embedded and skipped counts from the last add call.
+
+    Collection handles are cached per client, keyed by sanitized name, and
+    dropped by ``delete_collection`` and ``reset``.
     """
 
     def __init__(
@@ -67,6 +86,64 @@ class ChromaDBClient(BaseClient):
         self.default_limit = default_limit
         self.default_score_threshold = default_score_threshold
         self.default_batch_size = default_batch_size
+        self.last_add_stats = AddDocumentsStats(embedded=0, skipped=0)
+        self._collections: dict[str, Any] = {}
+
+    def _cached_collection(self, collection_name: str) -> Any:
+        """Return the handle for a collection, creating it on first use."""
+        name = _sanitize_collection_name(collection_name)
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self.client.get_or_create_collection(  # type: ignore[union-attr]
+                name=name,
+                embedding_function=self.embedding_function,
+            )
+            self._collections[name] = collection
+        return collection
+
+    async def _acached_collection(self, collection_name: str) -> Any:
+        """Return the handle for a collection, creating it on first use."""
+        name = _sanitize_collection_name(collection_name)
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = await self.client.get_or_create_collection(  # type: ignore[misc]
+                name=name,
+                embedding_function=self.embedding_function,
+            )
+            self._collections[name] = collection
+        return collection
+
+    def _query(
+        self, collection_name: str, **query_kwargs: Any
+    ) -> tuple[Any, QueryResult]:
+        """Query a cached collection, refetching the handle once if it went stale."""
+        collection = self._cached_collection(collection_name)
+        with suppress_logging(
+            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
+        ):
+            try:
+                return collection, collection.query(**query_kwargs)
+            except _STALE_COLLECTION_ERRORS:
+                # The collection was dropped or recreated elsewhere.
+                self._collections.pop(_sanitize_collection_name(collection_name), None)
+                collection = self._cached_collection(collection_name)
+                return collection, collection.query(**query_kwargs)
+
+    async def _aquery(
+        self, collection_name: str, **query_kwargs: Any
+    ) -> tuple[Any, QueryResult]:
+        """Query a cached collection, refetching the handle once if it went stale."""
+        collection = await self._acached_collection(collection_name)
+        with suppress_logging(
+            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
+        ):
+            try:
+                return collection, await collection.query(**query_kwargs)
+            except _STALE_COLLECTION_ERRORS:
+                # The collection was dropped or recreated elsewhere.
+                self._collections.pop(_sanitize_collection_name(collection_name), None)
+                collection = await self._acached_collection(collection_name)
+                return collection, await collection.query(**query_kwargs)
 
     def create_collection(
         self, **kwargs: Unpack[ChromaDBCollectionCreateParams]
@@ -218,8 +295,9 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
-        return self.client.get_or_create_collection(
-            name=_sanitize_collection_name(kwargs["collection_name"]),
+        name = _sanitize_collection_name(kwargs["collection_name"])
+        collection = self.client.get_or_create_collection(
+            name=name,
             configuration=kwargs.get("configuration"),  # type: ignore[arg-type]
             metadata=metadata,
             embedding_function=kwargs.get(
@@ -227,6 +305,9 @@ class ChromaDBClient(BaseClient):
             ),
             data_loader=kwargs.get("data_loader"),
         )
+        if "embedding_function" not in kwargs and "data_loader" not in kwargs:
+            self._collections[name] = collection
+        return collection
 
     async def aget_or_create_collection(
         self, **kwargs: Unpack[ChromaDBCollectionCreateParams]
@@ -271,8 +352,9 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
-        return await self.client.get_or_create_collection(
-            name=_sanitize_collection_name(kwargs["collection_name"]),
+        name = _sanitize_collection_name(kwargs["collection_name"])
+        collection = await self.client.get_or_create_collection(
+            name=name,
             configuration=kwargs.get("configuration") or None,  # type: ignore[arg-type]
             metadata=metadata,
             embedding_function=kwargs.get(
@@ -280,12 +362,17 @@ class ChromaDBClient(BaseClient):
             ),
             data_loader=kwargs.get("data_loader"),
         )
+        if "embedding_function" not in kwargs and "data_loader" not in kwargs:
+            self._collections[name] = collection
+        return collection
 
     def add_documents(self, **kwargs: Unpack[BaseCollectionAddParams]) -> None:
         """Add documents with their embeddings to a collection.
 
         Performs an upsert operation - documents with existing IDs are updated.
         Generates embeddings automatically using the configured embedding function.
+        With ``skip_existing``, each batch is first looked up by ID and only new
+        or changed documents are embedded; counts land in ``last_add_stats``.
 
         Keyword Args:
             collection_name: The name of the collection to add documents to.
@@ -294,6 +381,7 @@ class ChromaDBClient(BaseClient):
                 - doc_id: Optional unique identifier (auto-generated if missing)
                 - metadata: Optional metadata dictionary
             batch_size: Optional batch size for processing documents (default: 100)
+            skip_existing: Skip documents already stored unchanged (default: False)
 
         Raises:
             TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
@@ -309,33 +397,57 @@ class ChromaDBClient(BaseClient):
         collection_name = kwargs["collection_name"]
         documents = kwargs["documents"]
         batch_size = kwargs.get("batch_size", self.default_batch_size)
+        skip_existing = kwargs.get("skip_existing", False)
 
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        collection = self.client.get_or_create_collection(
-            name=_sanitize_collection_name(collection_name),
-            embedding_function=self.embedding_function,
-        )
-
         prepared = _prepare_documents_for_chromadb(documents)
 
-        for i in range(0, len(prepared.ids), batch_size):
-            batch_ids, batch_texts, batch_metadatas = _create_batch_slice(
-                prepared=prepared, start_index=i, batch_size=batch_size
-            )
-
-            collection.upsert(
-                ids=batch_ids,
-                documents=batch_texts,
-                metadatas=batch_metadatas,  # type: ignore[arg-type]
-            )
+        def upsert_all(collection: Any) -> int:
+            embedded = 0
+            for i in range(0, len(prepared.ids), batch_size):
+                batch_ids, batch_texts, batch_metadatas = _create_batch_slice(
+                    prepared=prepared, start_index=i, batch_size=batch_size
+                )
+
+                if skip_existing:
+                    existing = collection.get(
+                        ids=batch_ids, include=["documents", "metadatas"]
+                    )
+                    batch_ids, batch_texts, batch_metadatas = _filter_unchanged_batch(
+                        batch_ids, batch_texts, batch_metadatas, existing
+                    )
+                    if not batch_ids:
+                        continue
+
+                collection.upsert(
+                    ids=batch_ids,
+                    documents=batch_texts,
+                    metadatas=batch_metadatas,  # type: ignore[arg-type]
+                )
+                embedded += len(batch_ids)
+            return embedded
+
+        try:
+            embedded = upsert_all(self._cached_collection(collection_name))
+        except _STALE_COLLECTION_ERRORS:
+            # The collection was dropped or recreated elsewhere; upserts are
+            # idempotent, so retry once with a fresh handle.
+            self._collections.pop(_sanitize_collection_name(collection_name), None)
+            embedded = upsert_all(self._cached_collection(collection_name))
+
+        self.last_add_stats = AddDocumentsStats(
+            embedded=embedded, skipped=len(prepared.ids) - embedded
+        )
 
     async def aadd_documents(self, **kwargs: Unpack[BaseCollectionAddParams]) -> None:
         """Add documents with their embeddings to a collection asynchronously.
 
         Performs an upsert operation - documents with existing IDs are updated.
         Generates embeddings automatically using the configured embedding function.
+        With ``skip_existing``, each batch is first looked up by ID and only new
+        or changed documents are embedded; counts land in ``last_add_stats``.
 
         Keyword Args:
             collection_name: The name of the collection to add documents to.
@@ -344,6 +456,7 @@ class ChromaDBClient(BaseClient):
                 - doc_id: Optional unique identifier (auto-generated if missing)
                 - metadata: Optional metadata dictionary
             batch_size: Optional batch size for processing documents (default: 100)
+            skip_existing: Skip documents already stored unchanged (default: False)
 
         Raises:
             TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
@@ -359,26 +472,49 @@ class ChromaDBClient(BaseClient):
         collection_name = kwargs["collection_name"]
         documents = kwargs["documents"]
         batch_size = kwargs.get("batch_size", self.default_batch_size)
+        skip_existing = kwargs.get("skip_existing", False)
 
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        collection = await self.client.get_or_create_collection(
-            name=_sanitize_collection_name(collection_name),
-            embedding_function=self.embedding_function,
-        )
         prepared = _prepare_documents_for_chromadb(documents)
 
-        for i in range(0, len(prepared.ids), batch_size):
-            batch_ids, batch_texts, batch_metadatas = _create_batch_slice(
-                prepared=prepared, start_index=i, batch_size=batch_size
-            )
-
-            await collection.upsert(
-                ids=batch_ids,
-                documents=batch_texts,
-                metadatas=batch_metadatas,  # type: ignore[arg-type]
-            )
+        async def upsert_all(collection: Any) -> int:
+            embedded = 0
+            for i in range(0, len(prepared.ids), batch_size):
+                batch_ids, batch_texts, batch_metadatas = _create_batch_slice(
+                    prepared=prepared, start_index=i, batch_size=batch_size
+                )
+
+                if skip_existing:
+                    existing = await collection.get(
+                        ids=batch_ids, include=["documents", "metadatas"]
+                    )
+                    batch_ids, batch_texts, batch_metadatas = _filter_unchanged_batch(
+                        batch_ids, batch_texts, batch_metadatas, existing
+                    )
+                    if not batch_ids:
+                        continue
+
+                await collection.upsert(
+                    ids=batch_ids,
+                    documents=batch_texts,
+                    metadatas=batch_metadatas,  # type: ignore[arg-type]
+                )
+                embedded += len(batch_ids)
+            return embedded
+
+        try:
+            embedded = await upsert_all(await self._acached_collection(collection_name))
+        except _STALE_COLLECTION_ERRORS:
+            # The collection was dropped or recreated elsewhere; upserts are
+            # idempotent, so retry once with a fresh handle.
+            self._collections.pop(_sanitize_collection_name(collection_name), None)
+            embedded = await upsert_all(await self._acached_collection(collection_name))
+
+        self.last_add_stats = AddDocumentsStats(
+            embedded=embedded, skipped=len(prepared.ids) - embedded
+        )
 
     def search(
         self, **kwargs: Unpack[ChromaDBCollectionSearchParams]
@@ -419,23 +555,16 @@ class ChromaDBClient(BaseClient):
 
         params = _extract_search_params(kwargs)
 
-        collection = self.client.get_or_create_collection(
-            name=_sanitize_collection_name(params.collection_name),
-            embedding_function=self.embedding_function,
-        )
-
         where = params.where if params.where is not None else params.metadata_filter
 
-        with suppress_logging(
-            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
-        ):
-            results: QueryResult = collection.query(
-                query_texts=[params.query],
-                n_results=params.limit,
-                where=where,
-                where_document=params.where_document,
-                include=params.include,
-            )
+        collection, results = self._query(
+            params.collection_name,
+            query_texts=[params.query],
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
 
         return _process_query_results(
             collection=collection,
@@ -482,23 +611,16 @@ class ChromaDBClient(BaseClient):
 
         params = _extract_search_params(kwargs)
 
-        collection = await self.client.get_or_create_collection(
-            name=_sanitize_collection_name(params.collection_name),
-            embedding_function=self.embedding_function,
-        )
-
         where = params.where if params.where is not None else params.metadata_filter
 
-        with suppress_logging(
-            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
-        ):
-            results: QueryResult = await collection.query(
-                query_texts=[params.query],
-                n_results=params.limit,
-                where=where,
-                where_document=params.where_document,
-                include=params.include,
-            )
+        collection, results = await self._aquery(
+            params.collection_name,
+            query_texts=[params.query],
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
 
         return _process_query_results(
             collection=collection,
@@ -506,6 +628,207 @@ class ChromaDBClient(BaseClient):
             params=params,
         )
 
+    def search_many(
+        self, **kwargs: Unpack[ChromaDBCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with a single ChromaDB query call.
+
+        All query texts are embedded in one batch and sent in one request.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+            where: Optional ChromaDB where clause for metadata filtering.
+            where_document: Optional ChromaDB where clause for document content filtering.
+            include: Optional list of fields to include in results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+
+        Example:
+            >>> client = ChromaDBClient()
+            >>> results = client.search_many(
+            ...     collection_name="documents",
+            ...     queries=["refund policy", "how do I get my money back"],
+            ... )
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method search_many() requires a ClientAPI. "
+                "Use asearch_many() for AsyncClientAPI."
+            )
+
+        queries = kwargs["queries"]
+        if not queries:
+            return []
+        params = _extract_search_params(
+            {
+                **kwargs,  # type: ignore[typeddict-item]
+                "query": "",
+                "limit": kwargs.get("limit", self.default_limit),
+                "score_threshold": kwargs.get(
+                    "score_threshold", self.default_score_threshold
+                ),
+            }
+        )
+        where = params.where if params.where is not None else params.metadata_filter
+
+        collection, results = self._query(
+            params.collection_name,
+            query_texts=list(queries),
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
+
+        return [
+            _process_query_results(
+                collection=collection,
+                results=results,
+                params=params,
+                query_index=index,
+            )
+            for index in range(len(queries))
+        ]
+
+    async def asearch_many(
+        self, **kwargs: Unpack[ChromaDBCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for several queries with a single ChromaDB query call asynchronously.
+
+        All query texts are embedded in one batch and sent in one request.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+            where: Optional ChromaDB where clause for metadata filtering.
+            where_document: Optional ChromaDB where clause for document content filtering.
+            include: Optional list of fields to include in results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method asearch_many() requires an AsyncClientAPI. "
+                "Use search_many() for ClientAPI."
+            )
+
+        queries = kwargs["queries"]
+        if not queries:
+            return []
+        params = _extract_search_params(
+            {
+                **kwargs,  # type: ignore[typeddict-item]
+                "query": "",
+                "limit": kwargs.get("limit", self.default_limit),
+                "score_threshold": kwargs.get(
+                    "score_threshold", self.default_score_threshold
+                ),
+            }
+        )
+        where = params.where if params.where is not None else params.metadata_filter
+
+        collection, results = await self._aquery(
+            params.collection_name,
+            query_texts=list(queries),
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
+
+        return [
+            _process_query_results(
+                collection=collection,
+                results=results,
+                params=params,
+                query_index=index,
+            )
+            for index in range(len(queries))
+        ]
+
+    def delete_documents(self, **kwargs: Unpack[BaseCollectionDeleteParams]) -> None:
+        """Delete documents from a collection by ID.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete documents from.
+            ids: IDs of the documents to delete. Unknown IDs are ignored.
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to ChromaDB server.
+
+        Example:
+            >>> client = ChromaDBClient()
+            >>> client.delete_documents(collection_name="my_docs", ids=["doc1"])
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method delete_documents() requires a ClientAPI. "
+                "Use adelete_documents() for AsyncClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        if not ids:
+            return
+
+        collection = self._collections.get(
+            _sanitize_collection_name(kwargs["collection_name"])
+        ) or self.client.get_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        collection.delete(ids=ids)
+
+    async def adelete_documents(
+        self, **kwargs: Unpack[BaseCollectionDeleteParams]
+    ) -> None:
+        """Delete documents from a collection by ID asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete documents from.
+            ids: IDs of the documents to delete. Unknown IDs are ignored.
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method adelete_documents() requires an AsyncClientAPI. "
+                "Use delete_documents() for ClientAPI."
+            )
+
+        ids = kwargs["ids"]
+        if not ids:
+            return
+
+        collection = self._collections.get(
+            _sanitize_collection_name(kwargs["collection_name"])
+        ) or await self.client.get_collection(
+            name=_sanitize_collection_name(kwargs["collection_name"]),
+            embedding_function=self.embedding_function,
+        )
+        await collection.delete(ids=ids)
+
     def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data.
 
@@ -530,8 +853,9 @@ class ChromaDBClient(BaseClient):
                 "Use adelete_collection() for AsyncClientAPI."
             )
 
-        collection_name = kwargs["collection_name"]
-        self.client.delete_collection(name=_sanitize_collection_name(collection_name))
+        name = _sanitize_collection_name(kwargs["collection_name"])
+        self._collections.pop(name, None)
+        self.client.delete_collection(name=name)
 
     async def adelete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data asynchronously.
@@ -560,10 +884,9 @@ class ChromaDBClient(BaseClient):
                 "Use delete_collection() for ClientAPI."
             )
 
-        collection_name = kwargs["collection_name"]
-        await self.client.delete_collection(
-            name=_sanitize_collection_name(collection_name)
-        )
+        name = _sanitize_collection_name(kwargs["collection_name"])
+        self._collections.pop(name, None)
+        await self.client.delete_collection(name=name)
 
     def reset(self) -> None:
         """Reset the vector database by deleting all collections and data.
@@ -586,6 +909,7 @@ class ChromaDBClient(BaseClient):
                 "Use areset() for AsyncClientAPI."
             )
 
+        self._collections.clear()
         self.client.reset()
 
     async def areset(self) -> None:
@@ -612,4 +936,5 @@ class ChromaDBClient(BaseClient):
                 "Use reset() for ClientAPI."
             )
 
+        self._collections.clear()
         await self.client.reset()
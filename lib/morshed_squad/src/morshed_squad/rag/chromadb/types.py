@@ -17,7 +17,11 @@ from chromadb.api.types import (
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
-from morshed_squad.rag.core.base_client import BaseCollectionParams, BaseCollectionSearchParams
+from morshed_squad.rag.core.base_client import (
+    BaseCollectionParams,
+    BaseCollectionSearchManyParams,
+    BaseCollectionSearchParams,
+)
 
 
 ChromaDBClientType = ClientAPI | AsyncClientAPI
@@ -52,6 +56,18 @@ class PreparedDocuments(NamedTuple):
     metadatas: list[Mapping[str, str | int | float | bool]]
 
 
+class AddDocumentsStats(NamedTuple):
+    """Outcome of the last add_documents call.
+
+    Attributes:
+        embedded: Number of documents sent to the embedding function and written
+        skipped: Number of documents already stored with identical content and metadata
+    """
+
+    embedded: int
+    skipped: int
+
+
 class ExtractedSearchParams(NamedTuple):
     """Extracted search parameters for ChromaDB queries.
 
@@ -100,3 +116,11 @@ class ChromaDBCollectionSearchParams(BaseCollectionSearchParams, total=False):
     where: Where
     where_document: WhereDocument
     include: Include
+
+
+class ChromaDBCollectionSearchManyParams(BaseCollectionSearchManyParams, total=False):
+    """ChromaDB-specific keyword arguments for searching several queries at once."""
+
+    where: Where
+    where_document: WhereDocument
+    include: Include
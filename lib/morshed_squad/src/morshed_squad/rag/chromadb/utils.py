@@ -9,6 +9,7 @@ from chromadb.api import AsyncClientAPI, ClientAPI
 from chromadb.api.models.AsyncCollection import AsyncCollection
 from chromadb.api.models.Collection import Collection
 from chromadb.api.types import (
+    GetResult,
     Include,
     QueryResult,
 )
@@ -135,6 +136,50 @@ def _create_batch_slice(
     return batch_ids, batch_texts, batch_metadatas
 
 
+def _filter_unchanged_batch(
+    batch_ids: list[str],
+    batch_texts: list[str],
+    batch_metadatas: list[Mapping[str, str | int | float | bool]] | None,
+    existing: GetResult,
+) -> tuple[list[str], list[str], list[Mapping[str, str | int | float | bool]] | None]:
+    """Drop documents that are already stored with the same content and metadata.
+
+    Args:
+        batch_ids: IDs in the batch.
+        batch_texts: Texts in the batch.
+        batch_metadatas: Metadata in the batch, or None if the batch has none.
+        existing: Result of ``collection.get`` for ``batch_ids`` including
+            documents and metadatas.
+
+    Returns:
+        Tuple of (batch_ids, batch_texts, batch_metadatas) holding only new or
+        changed documents.
+    """
+    existing_ids = existing["ids"]
+    existing_texts = existing.get("documents") or [None] * len(existing_ids)
+    existing_metadatas = existing.get("metadatas") or [None] * len(existing_ids)
+    stored = {
+        doc_id: (text, dict(metadata or {}))
+        for doc_id, text, metadata in zip(
+            existing_ids, existing_texts, existing_metadatas, strict=False
+        )
+    }
+
+    keep = [
+        i
+        for i, doc_id in enumerate(batch_ids)
+        if stored.get(doc_id)
+        != (batch_texts[i], dict(batch_metadatas[i]) if batch_metadatas else {})
+    ]
+    if len(keep) == len(batch_ids):
+        return batch_ids, batch_texts, batch_metadatas
+    return (
+        [batch_ids[i] for i in keep],
+        [batch_texts[i] for i in keep],
+        [batch_metadatas[i] for i in keep] if batch_metadatas else None,
+    )
+
+
 def _extract_search_params(
     kwargs: ChromaDBCollectionSearchParams,
 ) -> ExtractedSearchParams:
@@ -194,6 +239,7 @@ def _convert_chromadb_results_to_search_results(
     include: Include,
     distance_metric: Literal["l2", "cosine", "ip"],
     score_threshold: float | None = None,
+    query_index: int = 0,
 ) -> list[SearchResult]:
     """Convert ChromaDB query results to SearchResult format.
 
@@ -202,6 +248,7 @@ def _convert_chromadb_results_to_search_results(
         include: List of fields that were included in the query.
         distance_metric: The distance metric used by the collection.
         score_threshold: Optional minimum similarity score (0-1) for results.
+        query_index: Which of the query texts to convert results for.
 
     Returns:
         List of SearchResult dicts containing id, content, metadata, and score.
@@ -210,21 +257,21 @@ def _convert_chromadb_results_to_search_results(
 
     include_strings = list(include) if include else []
 
-    ids = results["ids"][0] if results.get("ids") else []
+    ids = results["ids"][query_index] if results.get("ids") else []
 
     documents_list = results.get("documents")
     documents = (
-        documents_list[0] if documents_list and "documents" in include_strings else []
+        documents_list[query_index] if documents_list and "documents" in include_strings else []
     )
 
     metadatas_list = results.get("metadatas")
     metadatas = (
-        metadatas_list[0] if metadatas_list and "metadatas" in include_strings else []
+        metadatas_list[query_index] if metadatas_list and "metadatas" in include_strings else []
     )
 
     distances_list = results.get("distances")
     distances = (
-        distances_list[0] if distances_list and "distances" in include_strings else []
+        distances_list[query_index] if distances_list and "distances" in include_strings else []
     )
 
     for i, doc_id in enumerate(ids):
@@ -256,6 +303,7 @@ def _process_query_results(
     collection: Collection | AsyncCollection,
     results: QueryResult,
     params: ExtractedSearchParams,
+    query_index: int = 0,
 ) -> list[SearchResult]:
     """Process ChromaDB query results and convert to SearchResult format.
 
@@ -263,6 +311,7 @@ def _process_query_results(
         collection: The ChromaDB collection (sync or async) that was queried.
         results: Raw query results from ChromaDB.
         params: The search parameters used for the query.
+        query_index: Which of the query texts to convert results for.
 
     Returns:
         List of SearchResult dicts containing id, content, metadata, and score.
@@ -278,6 +327,7 @@ def _process_query_results(
         include=params.include,
         distance_metric=distance_metric,
         score_threshold=params.score_threshold,
+        query_index=query_index,
     )
 
 
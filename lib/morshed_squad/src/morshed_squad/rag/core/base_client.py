@@ -38,10 +38,13 @@ class BaseCollectionAddParams(BaseCollectionParams, total=False):
         collection_name: The name of the collection to add documents to.
         documents: List of BaseRecord dictionaries containing document data.
         batch_size: Optional batch size for processing documents to avoid token limits.
+        skip_existing: Optional flag to skip embedding documents whose ID is
+            already stored with identical content and metadata.
     """
 
     documents: Required[list[BaseRecord]]
     batch_size: int
+    skip_existing: bool
 
 
 class BaseCollectionSearchParams(BaseCollectionParams, total=False):
@@ -63,6 +66,33 @@ class BaseCollectionSearchParams(BaseCollectionParams, total=False):
     score_threshold: float
 
 
+class BaseCollectionSearchManyParams(BaseCollectionParams, total=False):
+    """Parameters for running several queries against a collection at once.
+
+    Attributes:
+        queries: The text queries to search for (required).
+        limit: Maximum number of results to return per query.
+        metadata_filter: Filter results by metadata fields.
+        score_threshold: Minimum similarity score for results (0-1).
+    """
+
+    queries: Required[list[str]]
+    limit: int
+    metadata_filter: dict[str, Any] | None
+    score_threshold: float
+
+
+class BaseCollectionDeleteParams(BaseCollectionParams):
+    """Parameters for deleting documents from a collection.
+
+    Attributes:
+        collection_name: The name of the collection to delete documents from.
+        ids: IDs of the documents to delete.
+    """
+
+    ids: Required[list[str]]
+
+
 @runtime_checkable
 class BaseClient(Protocol):
     """Protocol for vector store client implementations.
@@ -362,6 +392,90 @@ class BaseClient(Protocol):
         """
         ...
 
+    def search_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once.
+
+        Implementations that can embed and query in a single batch override
+        this; the default runs one search per query.
+
+        Keyword Args:
+            collection_name: The name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Filter results by metadata fields.
+            score_threshold: Minimum similarity score for results.
+
+        Returns:
+            One list of results per query, in query order.
+        """
+        queries = kwargs["queries"]
+        search_kwargs = {k: v for k, v in kwargs.items() if k != "queries"}
+        return [
+            self.search(**search_kwargs, query=query)  # type: ignore[misc]
+            for query in queries
+        ]
+
+    async def asearch_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for several queries at once asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Filter results by metadata fields.
+            score_threshold: Minimum similarity score for results.
+
+        Returns:
+            One list of results per query, in query order.
+        """
+        queries = kwargs["queries"]
+        search_kwargs = {k: v for k, v in kwargs.items() if k != "queries"}
+        return [
+            await self.asearch(**search_kwargs, query=query)  # type: ignore[misc]
+            for query in queries
+        ]
+
+    @abstractmethod
+    def delete_documents(self, **kwargs: Unpack[BaseCollectionDeleteParams]) -> None:
+        """Delete documents from a collection by ID.
+
+        IDs that are not present in the collection are ignored.
+
+        Keyword Args:
+            collection_name: The name of the collection to delete documents from.
+            ids: IDs of the documents to delete.
+
+        Raises:
+            ValueError: If the collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+
+        Example:
+            >>> from morshed_squad.rag.chromadb.client import ChromaDBClient
+            >>> client = ChromaDBClient()
+            >>> client.delete_documents(collection_name="my_docs", ids=["doc1"])
+        """
+        ...
+
+    @abstractmethod
+    async def adelete_documents(
+        self, **kwargs: Unpack[BaseCollectionDeleteParams]
+    ) -> None:
+        """Delete documents from a collection by ID asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to delete documents from.
+            ids: IDs of the documents to delete.
+
+        Raises:
+            ValueError: If the collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+        """
+        ...
+
     @abstractmethod
     def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data.
@@ -0,0 +1,366 @@
+"""Persistent, content-addressed cache for text embeddings."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from morshed_squad.utilities.paths import db_storage_path
+
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_ENV = "CREWAI_EMBEDDING_CACHE"
+
+_SQLITE_MAX_PARAMS = 500
+_PRUNE_EVERY_N_WRITES = 1024
+
+_default_cache: EmbeddingCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest used to address a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_namespace(provider: str, model: str | None, dimension: int | None) -> str:
+    """Build the namespace that separates embeddings of different models.
+
+    Args:
+        provider: Embedding provider name, e.g. ``"openai"``.
+        model: Model name, if the provider takes one.
+        dimension: Requested output dimension, if configurable.
+
+    Returns:
+        A ``provider:model:dimension`` string.
+    """
+    return f"{provider}:{model or ''}:{dimension or ''}"
+
+
+def embedding_cache_enabled() -> bool:
+    """Whether ``CREWAI_EMBEDDING_CACHE`` turns the cache on by default."""
+    return os.getenv(EMBEDDING_CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class EmbeddingCache:
+    """Two-tier embedding store: an in-memory LRU over a SQLite table.
+
+    Vectors are stored as raw float32 blobs keyed by namespace and text hash.
+    Lookups and writes are batched, and the table is trimmed back to
+    ``max_entries`` by least recent access.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+        max_entries: Upper bound on rows kept on disk.
+        memory_entries: Upper bound on vectors kept in memory.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        max_entries: int = 200_000,
+        memory_entries: int = 4096,
+    ) -> None:
+        """Initialize the cache and create the table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file. Defaults to
+                ``embedding_cache.db`` under ``db_storage_path()``.
+            max_entries: Upper bound on rows kept on disk.
+            memory_entries: Upper bound on vectors kept in memory.
+        """
+        self.db_path = db_path or str(Path(db_storage_path()) / "embedding_cache.db")
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self._initialize_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _initialize_db(self) -> None:
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                namespace TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_embeddings_accessed
+            ON embeddings(accessed_at)
+            """
+        )
+
+    def _remember(self, key: tuple[str, str], vector: np.ndarray) -> None:
+        """Insert into the in-memory tier. Caller holds the lock.
+
+        ``vector`` must not be shared with callers; it is made read-only so
+        the cached copy cannot change after it is stored.
+        """
+        if self.memory_entries <= 0:
+            return
+        vector.flags.writeable = False
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, namespace: str, hashes: list[str]) -> list[np.ndarray | None]:
+        """Look up several vectors at once.
+
+        Args:
+            namespace: Cache namespace from ``cache_namespace``.
+            hashes: Text hashes to look up.
+
+        Returns:
+            One entry per hash: a copy of the cached vector, or None on a
+            miss. Callers may modify the returned arrays freely.
+        """
+        results: list[np.ndarray | None] = [None] * len(hashes)
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, digest in enumerate(hashes):
+                vector = self._memory.get((namespace, digest))
+                if vector is None:
+                    missing.setdefault(digest, []).append(i)
+                else:
+                    self._memory.move_to_end((namespace, digest))
+                    results[i] = vector.copy()
+        if not missing:
+            return results
+
+        digests = list(missing)
+        try:
+            conn = self._connection()
+            found: list[str] = []
+            for start in range(0, len(digests), _SQLITE_MAX_PARAMS):
+                chunk = digests[start : start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "  # noqa: S608
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    (namespace, *chunk),
+                ).fetchall()
+                with self._lock:
+                    for digest, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember((namespace, digest), vector)
+                        for i in missing[digest]:
+                            results[i] = vector.copy()
+                        found.append(digest)
+            if found:
+                now = time.time()
+                for start in range(0, len(found), _SQLITE_MAX_PARAMS):
+                    chunk = found[start : start + _SQLITE_MAX_PARAMS]
+                    placeholders = ",".join("?" * len(chunk))
+                    conn.execute(
+                        f"UPDATE embeddings SET accessed_at = ? "  # noqa: S608
+                        f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                        (now, namespace, *chunk),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+        return results
+
+    def put_many(
+        self, namespace: str, hashes: list[str], vectors: list[np.ndarray]
+    ) -> None:
+        """Store several vectors at once.
+
+        Args:
+            namespace: Cache namespace from ``cache_namespace``.
+            hashes: Text hashes, aligned with ``vectors``.
+            vectors: Embeddings to store; copied as float32, so later changes
+                to these arrays do not reach the cache.
+        """
+        if not hashes:
+            return
+        now = time.time()
+        rows = []
+        with self._lock:
+            for digest, vector in zip(hashes, vectors, strict=False):
+                array = np.array(vector, dtype=np.float32, order="C")
+                self._remember((namespace, digest), array)
+                rows.append((namespace, digest, array.tobytes(), now))
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings
+                (namespace, text_hash, vector, accessed_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+            return
+        previous = self._writes
+        self._writes += len(rows)
+        if previous // _PRUNE_EVERY_N_WRITES != self._writes // _PRUNE_EVERY_N_WRITES:
+            self.prune()
+
+    def prune(self) -> int:
+        """Trim the table down to ``max_entries`` rows by least recent access.
+
+        Returns:
+            Number of rows removed.
+        """
+        try:
+            conn = self._connection()
+            (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            overflow = count - self.max_entries
+            if overflow <= 0:
+                return 0
+            return int(
+                conn.execute(
+                    """
+                    DELETE FROM embeddings WHERE (namespace, text_hash) IN (
+                        SELECT namespace, text_hash FROM embeddings
+                        ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,),
+                ).rowcount
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache prune failed: {e}")
+            return 0
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Remove every cached vector, or only those in ``namespace``."""
+        with self._lock:
+            if namespace is None:
+                self._memory.clear()
+            else:
+                for key in [k for k in self._memory if k[0] == namespace]:
+                    del self._memory[key]
+        conn = self._connection()
+        if namespace is None:
+            conn.execute("DELETE FROM embeddings")
+        else:
+            conn.execute("DELETE FROM embeddings WHERE namespace = ?", (namespace,))
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache()
+        return _default_cache
+
+
+class CachedEmbeddingFunction:
+    """Embedding function wrapper that only embeds texts it has not seen.
+
+    Text inputs are looked up in an ``EmbeddingCache`` as one batch and only
+    the misses are passed to the wrapped function. Non-text inputs (such as
+    images) bypass the cache. Any other attribute is forwarded to the wrapped
+    function, so it can be handed to vector stores in its place.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        namespace: str,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        self._embedder = embedder
+        self._namespace = namespace
+        self._cache = cache or get_embedding_cache()
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying embedding function."""
+        return self._embedder
+
+    def _embed(self, fn: Any, texts: list[Any], namespace: str) -> list[Any]:
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return list(fn(texts))
+        hashes = [text_hash(text) for text in texts]
+        results: list[Any] = self._cache.get_many(namespace, hashes)
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing:
+            # Embed each distinct missing text once.
+            positions: dict[str, list[int]] = {}
+            for i in missing:
+                positions.setdefault(hashes[i], []).append(i)
+            unique = list(positions)
+            first = [positions[digest][0] for digest in unique]
+            fresh = [
+                np.asarray(vector, dtype=np.float32)
+                for vector in fn([texts[i] for i in first])
+            ]
+            self._cache.put_many(namespace, unique, fresh)
+            for digest, vector in zip(unique, fresh, strict=False):
+                for i in positions[digest]:
+                    results[i] = vector
+        return results
+
+    def __call__(self, input: Any) -> Any:
+        return self._embed(self._embedder, input, self._namespace)
+
+    def embed_query(self, input: Any) -> Any:
+        embed_query = getattr(self._embedder, "embed_query", None)
+        if embed_query is None:
+            return self(input)
+        return self._embed(embed_query, input, f"{self._namespace}:query")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._embedder, name)
+
+
+def with_embedding_cache(
+    embedder: Any,
+    provider: str,
+    model: str | None = None,
+    dimension: int | None = None,
+    cache: EmbeddingCache | None = None,
+) -> CachedEmbeddingFunction:
+    """Wrap an embedding function with the persistent embedding cache.
+
+    Args:
+        embedder: Embedding function taking a list of texts.
+        provider: Provider name used in the cache namespace.
+        model: Model name used in the cache namespace.
+        dimension: Output dimension used in the cache namespace.
+        cache: Cache to use instead of the process-wide one.
+
+    Returns:
+        The wrapped embedding function.
+    """
+    if isinstance(embedder, CachedEmbeddingFunction):
+        return embedder
+    return CachedEmbeddingFunction(
+        embedder, cache_namespace(provider, model, dimension), cache
+    )
@@ -6,6 +6,16 @@ from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from morshed_squad.rag.core.base_embeddings_callable import EmbeddingFunction
 from morshed_squad.rag.core.base_embeddings_provider import BaseEmbeddingsProvider
+from morshed_squad.rag.embeddings.cache import (
+    embedding_cache_enabled,
+    with_embedding_cache,
+)
+from morshed_squad.rag.embeddings.shared import (
+    LOCAL_PROVIDERS,
+    embedder_key,
+    get_embedder_pool,
+    shared_embedders_enabled,
+)
 from morshed_squad.utilities.import_utils import import_and_validate_definition
 
 
@@ -110,6 +120,48 @@ PROVIDER_PATHS = {
 }
 
 
+def _maybe_cache(
+    embedder: Any,
+    provider_name: str,
+    provider: BaseEmbeddingsProvider[Any],
+    cache: bool | None,
+) -> Any:
+    """Wrap the embedder with the persistent embedding cache when enabled.
+
+    The namespace is read from the validated provider rather than the raw
+    config, so aliases, environment variables and field defaults that pick
+    the model or dimension are all reflected in it.
+
+    Args:
+        embedder: The built embedding function.
+        provider_name: Provider name used to namespace cached vectors.
+        provider: The provider the embedder was built from, read for the
+            model and dimension.
+        cache: Explicit on/off switch; None follows ``CREWAI_EMBEDDING_CACHE``.
+
+    Returns:
+        The embedder, wrapped if caching is enabled.
+    """
+    if cache is None:
+        cache = embedding_cache_enabled()
+    if not cache:
+        return embedder
+    config = provider.model_dump(exclude={"embedding_callable"})
+    model = next(
+        (
+            str(config[key])
+            for key in ("model_name", "model", "model_id", "deployment_id")
+            if config.get(key)
+        ),
+        None,
+    )
+    if model is None and (callable_ := getattr(provider, "embedding_callable", None)):
+        # Custom providers are told apart by the embedding class they build.
+        model = f"{callable_.__module__}.{callable_.__qualname__}"
+    dimension = config.get("dimensions") or config.get("dimension")
+    return with_embedding_cache(embedder, provider_name, model, dimension)
+
+
 def build_embedder_from_provider(provider: BaseEmbeddingsProvider[T]) -> T:
     """Build an embedding function instance from a provider.
 
@@ -124,6 +176,46 @@ def build_embedder_from_provider(provider: BaseEmbeddingsProvider[T]) -> T:
     )
 
 
+def _maybe_share(
+    provider: BaseEmbeddingsProvider[Any], provider_name: str, shared: bool | None
+) -> Any:
+    """Build the embedder, or reuse the process-wide instance of a local model.
+
+    Args:
+        provider: The embedding provider configuration.
+        provider_name: Provider name, e.g. ``"sentence-transformer"``.
+        shared: Explicit on/off switch; None follows ``CREWAI_SHARED_EMBEDDERS``.
+
+    Returns:
+        A shared handle for local providers when sharing is enabled,
+        otherwise a new embedding function.
+    """
+    if shared is None:
+        shared = shared_embedders_enabled()
+    if not shared or provider_name not in LOCAL_PROVIDERS:
+        return build_embedder_from_provider(provider)
+    callable_ = provider.embedding_callable
+    key = embedder_key(
+        provider_name,
+        {
+            **provider.model_dump(exclude={"embedding_callable"}),
+            "embedding_callable": f"{callable_.__module__}.{callable_.__qualname__}",
+        },
+    )
+    return get_embedder_pool().acquire(
+        key, lambda: build_embedder_from_provider(provider)
+    )
+
+
+def _provider_name(provider: BaseEmbeddingsProvider[Any]) -> str:
+    """Return the registered name of a provider instance, or its class name."""
+    path = f"{type(provider).__module__}.{type(provider).__qualname__}"
+    return next(
+        (name for name, target in PROVIDER_PATHS.items() if target == path),
+        type(provider).__name__,
+    )
+
+
 @overload
 def build_embedder_from_dict(spec: AzureProviderSpec) -> OpenAIEmbeddingFunction: ...
 
@@ -220,7 +312,12 @@ def build_embedder_from_dict(spec):  # type: ignore[no-untyped-def]
     """Build an embedding function instance from a dictionary specification.
 
     Args:
-        spec: A dictionary with 'provider' and 'config' keys.
+        spec: A dictionary with 'provider' and 'config' keys, and an optional
+              'cache' flag to persist embeddings on disk (defaults to the
+              CREWAI_EMBEDDING_CACHE environment variable) and an optional
+              'shared' flag to reuse one process-wide instance of local
+              models (defaults to the CREWAI_SHARED_EMBEDDERS environment
+              variable, which is on unless set to a false value).
               Example: {
                   "provider": "openai",
                   "config": {
@@ -256,7 +353,12 @@ def build_embedder_from_dict(spec):  # type: ignore[no-untyped-def]
         raise ValueError("Custom provider requires 'embedding_callable' in config")
 
     provider = provider_class(**provider_config)
-    return build_embedder_from_provider(provider)
+    return _maybe_cache(
+        _maybe_share(provider, provider_name, spec.get("shared")),
+        provider_name,
+        provider,
+        spec.get("cache"),
+    )
 
 
 @overload
@@ -363,7 +465,12 @@ def build_embedder(spec):  # type: ignore[no-untyped-def]
         embedder = build_embedder(provider)
     """
     if isinstance(spec, BaseEmbeddingsProvider):
-        return build_embedder_from_provider(spec)
+        return _maybe_cache(
+            _maybe_share(spec, _provider_name(spec), None),
+            type(spec).__name__,
+            spec,
+            None,
+        )
     return build_embedder_from_dict(spec)
 
 
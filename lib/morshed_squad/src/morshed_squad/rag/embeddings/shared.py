@@ -0,0 +1,253 @@
+"""Process-wide pool of shared, micro-batched local embedding models."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
+
+SHARED_EMBEDDERS_ENV = "CREWAI_SHARED_EMBEDDERS"
+
+LOCAL_PROVIDERS = frozenset(
+    {
+        "huggingface",
+        "instructor",
+        "onnx",
+        "openclip",
+        "sentence-transformer",
+        "text2vec",
+    }
+)
+"""Providers that load model weights, or hold a client, worth sharing."""
+
+_default_pool: EmbedderPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def shared_embedders_enabled() -> bool:
+    """Whether ``CREWAI_SHARED_EMBEDDERS`` leaves model sharing on (the default)."""
+    return os.getenv(SHARED_EMBEDDERS_ENV, "true").lower() not in ("0", "false", "no")
+
+
+def embedder_key(provider: str, config: dict[str, Any]) -> tuple[str, str]:
+    """Build the pool key of an embedder from its provider and configuration.
+
+    Every configuration value is part of the key, so two callers only share
+    a model when they would have loaded an identical one. The configuration
+    is hashed so credentials such as API keys are not kept in the key.
+
+    Args:
+        provider: Embedding provider name, e.g. ``"sentence-transformer"``.
+        config: Provider configuration, such as model name and device.
+
+    Returns:
+        A hashable ``(provider, config digest)`` key.
+    """
+    serialized = json.dumps(config, sort_keys=True, default=repr)
+    return provider, hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class _Request:
+    """A caller's texts waiting to be embedded in a shared batch."""
+
+    __slots__ = ("done", "error", "result", "texts")
+
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.result: list[Any] | None = None
+        self.error: BaseException | None = None
+        self.done = False
+
+
+class SharedEmbeddingFunction:
+    """Thread-safe handle on an embedding model shared by many callers.
+
+    Text batches from concurrent callers are queued and coalesced into one
+    call of the wrapped function, of up to ``max_batch_size`` texts. There
+    is no background thread: the first waiting caller runs the batches
+    while the others wait, and hands over to the next waiting caller once
+    its own texts are embedded. Calls with non-text input (such as images)
+    and ``embed_query`` run on their own, one at a time. Any other attribute
+    is forwarded to the wrapped function, so it can be handed to vector
+    stores in its place.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+    ) -> None:
+        """Initialize the handle.
+
+        Args:
+            embedder: Embedding function taking a list of texts.
+            max_batch_size: Most texts embedded in one call. A single
+                larger request is still embedded in one call.
+            max_wait: Seconds a caller waits for others to join a batch
+                that is not yet full.
+        """
+        self._embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._model_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._pending: list[_Request] = []
+        self._pending_texts = 0
+        self._running = False
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying embedding function."""
+        return self._embedder
+
+    def _next_batch(self) -> list[_Request]:
+        """Take queued requests up to ``max_batch_size`` texts. Caller holds the condition."""
+        batch = [self._pending.pop(0)]
+        size = len(batch[0].texts)
+        while self._pending and size + len(self._pending[0].texts) <= self.max_batch_size:
+            request = self._pending.pop(0)
+            size += len(request.texts)
+            batch.append(request)
+        self._pending_texts -= size
+        return batch
+
+    def _run(self, batch: list[_Request]) -> None:
+        texts = [text for request in batch for text in request.texts]
+        try:
+            with self._model_lock:
+                vectors = list(self._embedder(texts))
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+            return
+        start = 0
+        for request in batch:
+            request.result = vectors[start : start + len(request.texts)]
+            start += len(request.texts)
+
+    def __call__(self, input: Any) -> Any:
+        if not isinstance(input, list) or not all(isinstance(t, str) for t in input):
+            with self._model_lock:
+                return self._embedder(input)
+        if not input:
+            return []
+
+        request = _Request(input)
+        with self._condition:
+            self._pending.append(request)
+            self._pending_texts += len(input)
+            self._condition.notify_all()
+            while not request.done:
+                if self._running:
+                    self._condition.wait()
+                    continue
+                # Nobody is embedding: run batches until ours is done.
+                self._running = True
+                deadline = time.monotonic() + self.max_wait
+                while self._pending_texts < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                try:
+                    while not request.done:
+                        batch = self._next_batch()
+                        self._condition.release()
+                        try:
+                            self._run(batch)
+                        finally:
+                            self._condition.acquire()
+                        for finished in batch:
+                            finished.done = True
+                        self._condition.notify_all()
+                finally:
+                    self._running = False
+                    self._condition.notify_all()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def embed_query(self, input: Any) -> Any:
+        embed_query = getattr(self._embedder, "embed_query", None)
+        if embed_query is None:
+            return self(input)
+        with self._model_lock:
+            return embed_query(input)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._embedder, name)
+
+
+class EmbedderPool:
+    """Registry that loads each embedding model once per process.
+
+    Handles are keyed by ``embedder_key``. Loading is serialized per key,
+    so concurrent callers asking for the same model wait for one load
+    while other models load in parallel.
+    """
+
+    def __init__(self) -> None:
+        self._handles: dict[Hashable, SharedEmbeddingFunction] = {}
+        self._loading: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, key: Hashable, factory: Callable[[], Any]
+    ) -> SharedEmbeddingFunction:
+        """Return the shared handle for ``key``, building it on first use.
+
+        Args:
+            key: Identity of the model, usually from ``embedder_key``.
+            factory: Builds the embedding function if it is not loaded yet.
+
+        Returns:
+            The shared handle.
+        """
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                return handle
+            loading = self._loading.setdefault(key, threading.Lock())
+        with loading:
+            with self._lock:
+                handle = self._handles.get(key)
+            if handle is None:
+                handle = SharedEmbeddingFunction(factory())
+                with self._lock:
+                    self._handles[key] = handle
+                    self._loading.pop(key, None)
+        return handle
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._handles
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._handles)
+
+    def release(self, key: Hashable) -> None:
+        """Drop the pool's reference to a model so it can be garbage collected."""
+        with self._lock:
+            self._handles.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every pooled model."""
+        with self._lock:
+            self._handles.clear()
+
+
+def get_embedder_pool() -> EmbedderPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = EmbedderPool()
+        return _default_pool
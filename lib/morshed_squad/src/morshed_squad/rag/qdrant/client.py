@@ -2,11 +2,13 @@
 
 from typing import Any, cast
 
+from qdrant_client.models import PointIdsList  # type: ignore[import-not-found]
 from typing_extensions import Unpack
 
 from morshed_squad.rag.core.base_client import (
     BaseClient,
     BaseCollectionAddParams,
+    BaseCollectionDeleteParams,
     BaseCollectionParams,
     BaseCollectionSearchParams,
 )
@@ -429,6 +431,72 @@ class QdrantClient(BaseClient):
         response = await self.client.query_points(**search_kwargs)
         return _process_search_results(response)
 
+    def delete_documents(self, **kwargs: Unpack[BaseCollectionDeleteParams]) -> None:
+        """Delete documents from a collection by ID.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete documents from.
+            ids: IDs of the points to delete. Unknown IDs are ignored.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_sync_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="delete_documents",
+                expected_client="QdrantClient",
+                alt_method="adelete_documents",
+                alt_client="AsyncQdrantClient",
+            )
+
+        collection_name = kwargs["collection_name"]
+        ids = kwargs["ids"]
+        if not ids:
+            return
+
+        if not self.client.collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        self.client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=ids),
+        )
+
+    async def adelete_documents(
+        self, **kwargs: Unpack[BaseCollectionDeleteParams]
+    ) -> None:
+        """Delete documents from a collection by ID asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete documents from.
+            ids: IDs of the points to delete. Unknown IDs are ignored.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_async_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="adelete_documents",
+                expected_client="AsyncQdrantClient",
+                alt_method="delete_documents",
+                alt_client="QdrantClient",
+            )
+
+        collection_name = kwargs["collection_name"]
+        ids = kwargs["ids"]
+        if not ids:
+            return
+
+        if not await self.client.collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        await self.client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=ids),
+        )
+
     def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data.
 
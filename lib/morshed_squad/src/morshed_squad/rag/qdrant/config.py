@@ -35,7 +35,14 @@ def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
     """
     from fastembed import TextEmbedding
 
-    model = TextEmbedding(model_name=DEFAULT_EMBEDDING_MODEL)
+    from morshed_squad.rag.embeddings.shared import get_embedder_pool
+
+    def load() -> Any:
+        model = TextEmbedding(model_name=DEFAULT_EMBEDDING_MODEL)
+        return lambda texts: [vector.tolist() for vector in model.embed(texts)]
+
+    # One model per process, shared by every Qdrant client that uses the default.
+    shared = get_embedder_pool().acquire(("fastembed", DEFAULT_EMBEDDING_MODEL), load)
 
     def embed_fn(text: str) -> list[float]:
         """Embed a single text string.
@@ -46,8 +53,8 @@ def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
         Returns:
             Embedding vector as list of floats.
         """
-        embeddings = list(model.embed([text]))
-        return embeddings[0].tolist() if embeddings else []
+        embeddings = shared([text])
+        return embeddings[0] if embeddings else []
 
     return cast(QdrantEmbeddingFunctionWrapper, embed_fn)
 
@@ -23,7 +23,10 @@ from pydantic import (
 )
 from typing_extensions import TypeIs
 
-from morshed_squad.tools.structured_tool import CrewStructuredTool
+from morshed_squad.tools.structured_tool import (
+    CrewStructuredTool,
+    _usage_count_lock,
+)
 from morshed_squad.utilities.printer import Printer
 from morshed_squad.utilities.pydantic_schema_utils import generate_model_description
 from morshed_squad.utilities.string_utils import sanitize_tool_name
@@ -161,7 +164,7 @@ class BaseTool(BaseModel, ABC):
         if asyncio.iscoroutine(result):
             result = asyncio.run(result)
 
-        self.current_usage_count += 1
+        self._increment_usage_count()
 
         return result
 
@@ -180,7 +183,7 @@ class BaseTool(BaseModel, ABC):
             The result of the tool execution.
         """
         result = await self._arun(*args, **kwargs)
-        self.current_usage_count += 1
+        self._increment_usage_count()
         return result
 
     async def _arun(
@@ -198,6 +201,11 @@ class BaseTool(BaseModel, ABC):
         """Reset the current usage count to zero."""
         self.current_usage_count = 0
 
+    def _increment_usage_count(self) -> None:
+        """Increment the usage count; parallel tool calls may run concurrently."""
+        with _usage_count_lock:
+            self.current_usage_count += 1
+
     @abstractmethod
     def _run(
         self,
@@ -336,7 +344,7 @@ class Tool(BaseTool, Generic[P, R]):
         if asyncio.iscoroutine(result):
             result = asyncio.run(result)
 
-        self.current_usage_count += 1
+        self._increment_usage_count()
         return result  # type: ignore[return-value]
 
     def _run(self, *args: P.args, **kwargs: P.kwargs) -> R:
@@ -362,7 +370,7 @@ class Tool(BaseTool, Generic[P, R]):
             The result of the tool execution.
         """
         result = await self._arun(*args, **kwargs)
-        self.current_usage_count += 1
+        self._increment_usage_count()
         return result
 
     async def _arun(self, *args: P.args, **kwargs: P.kwargs) -> R:
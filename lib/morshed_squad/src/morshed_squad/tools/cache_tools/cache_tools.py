@@ -25,4 +25,4 @@ class CacheTools(BaseModel):
         split = key.split("tool:")
         tool = split[1].split("|input:")[0].strip()
         tool_input = split[1].split("|input:")[1].strip()
-        return self.cache_handler.read(tool, tool_input)
+        return self.cache_handler.read(sanitize_tool_name(tool), tool_input)
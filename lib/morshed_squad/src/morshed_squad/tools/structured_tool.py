@@ -5,6 +5,7 @@ from collections.abc import Callable
 import inspect
 import json
 import textwrap
+import threading
 from typing import TYPE_CHECKING, Any, get_type_hints
 
 from pydantic import BaseModel, Field, create_model
@@ -17,6 +18,10 @@ if TYPE_CHECKING:
     from morshed_squad.tools.base_tool import BaseTool
 
 
+# Guards usage counters, which parallel tool calls update from worker threads.
+_usage_count_lock = threading.Lock()
+
+
 class ToolUsageLimitExceededError(Exception):
     """Exception raised when a tool has reached its maximum usage limit."""
 
@@ -286,9 +291,10 @@ class CrewStructuredTool:
 
     def _increment_usage_count(self) -> None:
         """Increment the usage count."""
-        self.current_usage_count += 1
-        if self._original_tool is not None:
-            self._original_tool.current_usage_count = self.current_usage_count
+        with _usage_count_lock:
+            self.current_usage_count += 1
+            if self._original_tool is not None:
+                self._original_tool.current_usage_count = self.current_usage_count
 
     @property
     def args(self) -> dict:
@@ -0,0 +1,113 @@
+"""Precomputed name index used to resolve the tool an agent asked for."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+import threading
+from typing import Any
+
+from morshed_squad.utilities.string_utils import sanitize_tool_name
+
+
+FUZZY_MATCH_THRESHOLD = 0.85
+_MAX_CACHED_INDEXES = 64
+_MAX_CACHED_LOOKUPS = 256
+
+
+class ToolIndex:
+    """Resolves requested tool names against a fixed set of tools.
+
+    Sanitized tool names are computed once when the index is built. Lookups
+    first hit an exact-match dict; only misses fall back to fuzzy matching,
+    which is restricted to names whose length can still reach the similarity
+    threshold and whose results are memoized per requested name.
+
+    Resolution matches the previous behaviour of sorting every tool by
+    ``SequenceMatcher`` ratio: the highest-ratio tool wins (earliest on ties)
+    provided the ratio exceeds ``FUZZY_MATCH_THRESHOLD``.
+    """
+
+    def __init__(self, tools: Sequence[Any]) -> None:
+        self.tools = list(tools)
+        self._names = [sanitize_tool_name(tool.name) for tool in self.tools]
+        self._exact: dict[str, Any] = {}
+        self._by_length: dict[int, list[int]] = {}
+        for position, name in enumerate(self._names):
+            self._exact.setdefault(name, self.tools[position])
+            self._by_length.setdefault(len(name), []).append(position)
+        self._lookups: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tool_name: str) -> Any | None:
+        """Return the tool matching ``tool_name`` or ``None`` if nothing is close enough."""
+        sanitized = sanitize_tool_name(tool_name)
+        tool = self._exact.get(sanitized)
+        if tool is not None:
+            return tool
+
+        with self._lock:
+            if sanitized in self._lookups:
+                self._lookups.move_to_end(sanitized)
+                return self._lookups[sanitized]
+
+        tool = self._fuzzy_match(sanitized)
+        with self._lock:
+            self._lookups[sanitized] = tool
+            while len(self._lookups) > _MAX_CACHED_LOOKUPS:
+                self._lookups.popitem(last=False)
+        return tool
+
+    def _candidate_positions(self, sanitized: str) -> list[int]:
+        """Positions of tools whose name length can still exceed the threshold.
+
+        ``ratio = 2 * matches / (len(a) + len(b))`` and ``matches`` is at most
+        the shorter length, which bounds the usable lengths on both sides.
+        """
+        size = len(sanitized)
+        positions: list[int] = []
+        for length, bucket in self._by_length.items():
+            total = length + size
+            if total and 2 * min(length, size) / total > FUZZY_MATCH_THRESHOLD:
+                positions.extend(bucket)
+        positions.sort()
+        return positions
+
+    def _fuzzy_match(self, sanitized: str) -> Any | None:
+        matcher = SequenceMatcher(None, b=sanitized)
+        best_position: int | None = None
+        best_ratio = FUZZY_MATCH_THRESHOLD
+        for position in self._candidate_positions(sanitized):
+            matcher.set_seq1(self._names[position])
+            if matcher.quick_ratio() <= best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_position, best_ratio = position, ratio
+        return None if best_position is None else self.tools[best_position]
+
+
+_indexes: OrderedDict[tuple[tuple[int, str], ...], ToolIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_tool_index(tools: Sequence[Any]) -> ToolIndex:
+    """Return the shared index for ``tools``, building it on first use.
+
+    ``ToolUsage`` is created per tool call, so indexes are cached by the
+    identity and name of each tool. The cached index holds references to
+    its tools, which keeps their ids from being reused while it is cached.
+    """
+    key = tuple((id(tool), tool.name) for tool in tools)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = ToolIndex(tools)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > _MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return index
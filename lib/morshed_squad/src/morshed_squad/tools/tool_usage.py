@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import ast
 import datetime
-from difflib import SequenceMatcher
 import json
 from json import JSONDecodeError
 from textwrap import dedent
@@ -23,6 +22,7 @@ from morshed_squad.events.types.tool_usage_events import (
 from morshed_squad.telemetry.telemetry import Telemetry
 from morshed_squad.tools.structured_tool import CrewStructuredTool
 from morshed_squad.tools.tool_calling import InstructorToolCalling, ToolCalling
+from morshed_squad.tools.tool_index import get_tool_index
 from morshed_squad.utilities.agent_utils import (
     get_tool_names,
     render_text_description_and_args,
@@ -735,21 +735,9 @@ class ToolUsage:
         return None
 
     def _select_tool(self, tool_name: str) -> Any:
-        sanitized_input = sanitize_tool_name(tool_name)
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, sanitize_tool_name(tool.name), sanitized_input
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            sanitized_tool = sanitize_tool_name(tool.name)
-            if (
-                sanitized_tool == sanitized_input
-                or SequenceMatcher(None, sanitized_tool, sanitized_input).ratio() > 0.85
-            ):
-                return tool
+        tool = get_tool_index(self.tools).get(tool_name)
+        if tool is not None:
+            return tool
         if self.task:
             self.task.increment_tools_errors()
         tool_selection_data: dict[str, Any] = {
@@ -30,6 +30,7 @@ from morshed_squad.utilities.exceptions.context_window_exceeding_exception impor
 from morshed_squad.utilities.i18n import I18N
 from morshed_squad.utilities.printer import ColoredText, Printer
 from morshed_squad.utilities.pydantic_schema_utils import generate_model_description
+from morshed_squad.utilities.rpm_controller import RPMController
 from morshed_squad.utilities.string_utils import sanitize_tool_name
 from morshed_squad.utilities.token_counter_callback import TokenCalcHandler
 from morshed_squad.utilities.types import LLMMessage
@@ -323,6 +324,56 @@ def enforce_rpm_limit(
         request_within_rpm_limit()
 
 
+async def aenforce_rpm_limit(
+    request_within_rpm_limit: Callable[[], bool] | None = None,
+) -> None:
+    """Enforce the requests per minute (RPM) limit without blocking the event loop.
+
+    When the limit function is bound to an ``RPMController`` its asyncio-native
+    ``acquire`` is awaited; any other callable is invoked as-is.
+
+    Args:
+        request_within_rpm_limit: Function to enforce RPM limit.
+    """
+    if not request_within_rpm_limit:
+        return
+    controller = _rate_limiter_of(request_within_rpm_limit)
+    if controller is not None:
+        await controller.acquire()
+    else:
+        request_within_rpm_limit()
+
+
+def _rate_limiter_of(
+    request_within_rpm_limit: Callable[[], bool] | None,
+) -> RPMController | None:
+    """Return the RPMController a limit function is bound to, if any."""
+    controller = getattr(request_within_rpm_limit, "__self__", None)
+    return controller if isinstance(controller, RPMController) else None
+
+
+def _total_tokens(llm: LLM | BaseLLM) -> int:
+    return getattr(llm, "_token_usage", {}).get("total_tokens", 0)
+
+
+def _charge_token_usage(
+    executor_context: Any, llm: LLM | BaseLLM, tokens_before: int
+) -> None:
+    """Charge the tokens the last LLM call used to the executor's TPM budget.
+
+    Args:
+        executor_context: Executor whose ``request_within_rpm_limit`` is bound
+            to the rate limiter.
+        llm: The LLM that was called.
+        tokens_before: The LLM's total token count before the call.
+    """
+    controller = _rate_limiter_of(
+        getattr(executor_context, "request_within_rpm_limit", None)
+    )
+    if controller is not None:
+        controller.record_tokens(_total_tokens(llm) - tokens_before)
+
+
 def get_llm_response(
     llm: LLM | BaseLLM,
     messages: list[LLMMessage],
@@ -365,6 +416,7 @@ def get_llm_response(
             raise ValueError("LLM call blocked by before_llm_call hook")
         messages = executor_context.messages
 
+    tokens_before = _total_tokens(llm)
     try:
         answer = llm.call(
             messages,
@@ -377,6 +429,7 @@ def get_llm_response(
         )
     except Exception as e:
         raise e
+    _charge_token_usage(executor_context, llm, tokens_before)
     if not answer:
         if verbose:
             printer.print(
@@ -430,6 +483,7 @@ async def aget_llm_response(
             raise ValueError("LLM call blocked by before_llm_call hook")
         messages = executor_context.messages
 
+    tokens_before = _total_tokens(llm)
     try:
         answer = await llm.acall(
             messages,
@@ -442,6 +496,7 @@ async def aget_llm_response(
         )
     except Exception as e:
         raise e
+    _charge_token_usage(executor_context, llm, tokens_before)
     if not answer:
         if verbose:
             printer.print(
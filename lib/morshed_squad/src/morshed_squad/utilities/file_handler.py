@@ -1,10 +1,23 @@
+import atexit
+from collections import deque
+from collections.abc import Iterator
 from datetime import datetime
+import gzip
 import json
+import logging
 import os
+from pathlib import Path
 import pickle
-from typing import Any, TypedDict
+import re
+import shutil
+import threading
+import time
+from typing import Any
 
-from typing_extensions import Unpack
+from typing_extensions import TypedDict, Unpack
+
+
+logger = logging.getLogger(__name__)
 
 
 class LogEntry(TypedDict, total=False):
@@ -26,19 +39,302 @@ class LogEntry(TypedDict, total=False):
     metadata: dict[str, Any]
 
 
+class LogRotation(TypedDict, total=False):
+    """Rotation settings for JSONL logs."""
+
+    max_bytes: int
+    interval: float
+    compress: bool
+    backup_count: int
+
+
+def _segment_pattern(path: Path) -> re.Pattern[str]:
+    stem = path.name[: -len(".jsonl")]
+    return re.compile(rf"^{re.escape(stem)}\.(\d+)\.jsonl(\.gz)?$")
+
+
+def _rotated_segments(path: Path) -> list[tuple[int, Path]]:
+    """Return the rotated segments of a JSONL log, oldest first."""
+    if not path.parent.is_dir():
+        return []
+    pattern = _segment_pattern(path)
+    segments = []
+    for candidate in path.parent.iterdir():
+        match = pattern.match(candidate.name)
+        if match:
+            segments.append((int(match.group(1)), candidate))
+    return sorted(segments)
+
+
+class JsonlLogWriter:
+    """Buffered background writer appending lines to a JSONL log.
+
+    ``write`` only queues a line; a writer thread appends queued lines in
+    batches every ``flush_interval`` seconds, or as soon as ``buffer_size``
+    lines are waiting, keeping the file open between batches. ``write``
+    blocks while ``max_pending`` lines are waiting, so a stalled disk slows
+    logging down instead of growing memory without bound.
+
+    The active file is rotated to ``<name>.<n>.jsonl`` once it exceeds
+    ``max_bytes`` or is older than ``interval`` seconds, optionally gzipped,
+    and only the newest ``backup_count`` rotated segments are kept.
+
+    Attributes:
+        path: Path of the active log file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int | None = None,
+        interval: float | None = None,
+        compress: bool = False,
+        backup_count: int | None = None,
+        flush_interval: float = 1.0,
+        buffer_size: int = 256,
+        max_pending: int = 10_000,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            path: Path of the active log file.
+            max_bytes: Rotate once the active file reaches this size.
+            interval: Rotate once the active file is this many seconds old.
+            compress: Gzip rotated segments.
+            backup_count: Rotated segments to keep; all are kept if None.
+            flush_interval: Most seconds a line waits before it is written.
+            buffer_size: Waiting lines that trigger an immediate write.
+            max_pending: Waiting lines at which ``write`` blocks.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.compress = compress
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.buffer_size = max(buffer_size, 1)
+        self.max_pending = max(max_pending, self.buffer_size)
+        self._pending: deque[str] = deque()
+        self._writing = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._file: Any = None
+        self._opened_at = 0.0
+
+    def write(self, line: str) -> None:
+        """Queue one serialized entry, without its trailing newline.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        with self._condition:
+            while not self._closed and len(self._pending) >= self.max_pending:
+                self._condition.wait()
+            if self._closed:
+                raise ValueError(f"JSONL log {self.path} is closed")
+            self._pending.append(line)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="jsonl-log-writer", daemon=True
+                )
+                self._thread.start()
+            if len(self._pending) >= self.buffer_size:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self.flush_interval
+                while (
+                    not self._closed
+                    and not self._flush_requested
+                    and len(self._pending) < self.buffer_size
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                lines = list(self._pending)
+                self._pending.clear()
+                self._flush_requested = False
+                self._writing = len(lines)
+                closed = self._closed
+                self._condition.notify_all()
+            try:
+                if lines:
+                    self._append(lines)
+            except Exception as e:
+                logger.warning(f"Failed to write JSONL log {self.path}: {e}")
+            finally:
+                with self._condition:
+                    self._writing = 0
+                    self._condition.notify_all()
+            if closed and not lines:
+                self._close_file()
+                return
+
+    def _append(self, lines: list[str]) -> None:
+        if (
+            self.interval is not None
+            and self._file is not None
+            and time.time() - self._opened_at >= self.interval
+        ):
+            self._rotate()
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._opened_at = time.time()
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        if self.max_bytes is not None and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._close_file()
+        if not self.path.exists():
+            return
+        segments = _rotated_segments(self.path)
+        number = segments[-1][0] + 1 if segments else 1
+        stem = self.path.name[: -len(".jsonl")]
+        target = self.path.with_name(f"{stem}.{number:05d}.jsonl")
+        os.replace(self.path, target)
+        if self.compress:
+            with open(target, "rb") as source, gzip.open(f"{target}.gz", "wb") as out:
+                shutil.copyfileobj(source, out)
+            target.unlink()
+        if self.backup_count is not None:
+            segments = _rotated_segments(self.path)
+            for _, old in segments[: max(len(segments) - self.backup_count, 0)]:
+                old.unlink(missing_ok=True)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def flush(self) -> None:
+        """Block until every queued line has been written."""
+        with self._condition:
+            if self._thread is None:
+                return
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._pending or self._writing:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Write what is queued, then stop the writer thread and close the file.
+
+        A closed writer is dropped from the shared registry, so handlers
+        created afterwards for the same file get a fresh writer.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with _writers_lock:
+            for key, writer in list(_writers.items()):
+                if writer is self:
+                    del _writers[key]
+
+
+_writers: dict[str, JsonlLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _close_writers() -> None:
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(_close_writers)
+
+
+def get_jsonl_writer(path: str, **rotation: Unpack[LogRotation]) -> JsonlLogWriter:
+    """Return the process-wide writer of a JSONL log, creating it on first use.
+
+    Handlers logging to the same file, such as those of crew copies run in
+    a batch, share one writer so lines never interleave and only one thread
+    rotates the file. Rotation settings of the first caller apply.
+
+    Args:
+        path: Path of the log file.
+        **rotation: Rotation settings for a new writer.
+
+    Returns:
+        The shared writer.
+    """
+    key = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = JsonlLogWriter(key, **rotation)
+            _writers[key] = writer
+        return writer
+
+
+def read_jsonl_log(path: str, include_rotated: bool = True) -> Iterator[dict[str, Any]]:
+    """Stream the entries of a JSONL log, oldest first.
+
+    Lines that are not valid JSON, such as a line cut short by a crash, are
+    skipped.
+
+    Args:
+        path: Path of the active log file.
+        include_rotated: Whether to read rotated segments, gzipped or not,
+            before the active file.
+
+    Yields:
+        One dictionary per log entry.
+    """
+    active = Path(path)
+    files = (
+        [segment for _, segment in _rotated_segments(active)] if include_rotated else []
+    )
+    if active.exists():
+        files.append(active)
+    for file in files:
+        opener = gzip.open if file.suffix == ".gz" else open
+        with opener(file, "rt", encoding="utf-8") as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
 class FileHandler:
-    """Handler for file operations supporting both JSON and text-based logging.
+    """Handler for file operations supporting JSON, JSONL and text-based logging.
+
+    A ``.jsonl`` path appends one JSON object per line through a shared
+    background ``JsonlLogWriter``, so logging costs the same however long
+    the log grows; read it back with ``read_jsonl_log``. A ``.json`` path
+    rewrites the whole file as a JSON array on every entry.
 
     Attributes:
         _path: The path to the log file.
     """
 
-    def __init__(self, file_path: bool | str) -> None:
+    def __init__(
+        self, file_path: bool | str, rotation: LogRotation | None = None
+    ) -> None:
         """Initialize the FileHandler with the specified file path.
         Args:
             file_path: Path to the log file or boolean flag.
+            rotation: Rotation settings, used by ``.jsonl`` logs only.
         """
         self._initialize_path(file_path)
+        self._writer: JsonlLogWriter | None = None
+        if self._path.endswith(".jsonl"):
+            self._writer = get_jsonl_writer(self._path, **(rotation or {}))
 
     def _initialize_path(self, file_path: bool | str) -> None:
         """Initialize the file path based on the input type.
@@ -53,14 +349,14 @@ class FileHandler:
             self._path = os.path.join(os.curdir, "logs.txt")
 
         elif isinstance(file_path, str):  # File path is a string
-            if file_path.endswith((".json", ".txt")):
+            if file_path.endswith((".json", ".jsonl", ".txt")):
                 self._path = (
-                    file_path  # No modification if the file ends with .json or .txt
+                    file_path  # No modification if the file ends with .json, .jsonl or .txt
                 )
             else:
                 self._path = (
                     file_path + ".txt"
-                )  # Append .txt if the file doesn't end with .json or .txt
+                )  # Append .txt if the file doesn't end with .json, .jsonl or .txt
 
         else:
             raise ValueError(
@@ -93,7 +389,13 @@ class FileHandler:
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = {"timestamp": now, **kwargs}
 
-            if self._path.endswith(".json"):
+            if self._writer is not None:
+                # Append one line; the writer thread does the file I/O
+                self._writer.write(
+                    json.dumps(log_entry, ensure_ascii=False, default=str)
+                )
+
+            elif self._path.endswith(".json"):
                 # Append log in JSON format
                 try:
                     # Try reading existing content to avoid overwriting
@@ -121,6 +423,11 @@ class FileHandler:
         except Exception as e:
             raise ValueError(f"Failed to log message: {e!s}") from e
 
+    def flush(self) -> None:
+        """Block until buffered JSONL entries are on disk; a no-op for other formats."""
+        if self._writer is not None:
+            self._writer.flush()
+
 
 class PickleHandler:
     """Handler for saving and loading data using pickle.
@@ -1,7 +1,12 @@
 """Controls request rate limiting for API calls."""
 
+from __future__ import annotations
+
+import asyncio
+from collections import deque
 import threading
 import time
+from typing import ClassVar
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from typing_extensions import Self
@@ -9,81 +14,184 @@ from typing_extensions import Self
 from morshed_squad.utilities.logger import Logger
 
 
+_WINDOW_SECONDS = 60.0
+
+
 class RPMController(BaseModel):
-    """Manages requests per minute limiting."""
+    """Manages requests per minute and tokens per minute limiting.
+
+    Uses a sliding one-minute window: every admitted request records its
+    timestamp, and once the budget is exhausted callers wait exactly until the
+    oldest request leaves the window instead of sleeping a whole minute. The
+    lock is never held while waiting, so other agents sharing the controller
+    are not stalled.
+
+    Agents charge the tokens each LLM response used through ``record_tokens``;
+    new requests wait while the tokens in the window have used up ``max_tpm``.
+
+    A single controller can be shared by several crews in one process through
+    ``RPMController.shared(name, ...)``.
+    """
 
     max_rpm: int | None = Field(
         default=None,
         description="Maximum requests per minute. If None, no limit is applied.",
     )
+    max_tpm: int | None = Field(
+        default=None,
+        description="Maximum tokens per minute. If None, no token budget is applied.",
+    )
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: "threading.Timer | None" = PrivateAttr(default=None)
-    _lock: "threading.Lock | None" = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _requests: deque[float] = PrivateAttr(default_factory=deque)
+    _tokens: deque[tuple[float, int]] = PrivateAttr(default_factory=deque)
+    _tokens_in_window: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    _shared: ClassVar[dict[str, RPMController]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @model_validator(mode="after")
     def reset_counter(self) -> Self:
-        """Resets the RPM counter and starts the timer if max_rpm is set.
+        """Clears the sliding windows.
 
         Returns:
             The instance of the RPMController.
         """
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+        with self._lock:
+            self._requests.clear()
+            self._tokens.clear()
+            self._tokens_in_window = 0
         return self
 
-    def check_or_wait(self) -> bool:
-        """Checks if a new request can be made based on the RPM limit.
+    @classmethod
+    def shared(
+        cls,
+        name: str,
+        max_rpm: int | None = None,
+        max_tpm: int | None = None,
+    ) -> Self:
+        """Return the process-wide controller registered under ``name``.
+
+        The first call creates the controller with the given limits; later calls
+        return the same instance so every crew using ``name`` draws from one budget.
+
+        Args:
+            name: Registry key, e.g. the provider or API key alias.
+            max_rpm: Requests per minute used when the controller is created.
+            max_tpm: Tokens per minute used when the controller is created.
 
         Returns:
-            True if a new request can be made, False otherwise.
+            The shared RPMController instance.
         """
-        if self.max_rpm is None:
+        with cls._shared_lock:
+            controller = cls._shared.get(name)
+            if controller is None:
+                controller = cls(max_rpm=max_rpm, max_tpm=max_tpm)
+                cls._shared[name] = controller
+            return controller
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop window entries older than one minute. Caller holds the lock."""
+        cutoff = now - _WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._tokens_in_window -= self._tokens.popleft()[1]
+
+    def _try_acquire(self, estimated_tokens: int) -> float:
+        """Reserve a slot if the budgets allow it.
+
+        Args:
+            estimated_tokens: Tokens the upcoming request is expected to use.
+
+        Returns:
+            0.0 when the slot was reserved, otherwise the seconds to wait before
+            trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            wait = 0.0
+            if self.max_rpm is not None and len(self._requests) >= self.max_rpm:
+                wait = self._requests[0] + _WINDOW_SECONDS - now
+            if (
+                self.max_tpm is not None
+                and self._tokens
+                and self._tokens_in_window + max(estimated_tokens, 1) > self.max_tpm
+            ):
+                wait = max(wait, self._tokens[0][0] + _WINDOW_SECONDS - now)
+            if wait > 0:
+                return wait
+            self._requests.append(now)
+            if estimated_tokens:
+                self._tokens.append((now, estimated_tokens))
+                self._tokens_in_window += estimated_tokens
+            return 0.0
+
+    def _is_unlimited(self) -> bool:
+        return self.max_rpm is None and self.max_tpm is None
+
+    def check_or_wait(self, estimated_tokens: int = 0) -> bool:
+        """Blocks until a new request fits in the RPM/TPM budgets.
+
+        Args:
+            estimated_tokens: Tokens the upcoming request is expected to use.
+
+        Returns:
+            True once the request may proceed.
+        """
+        if self._is_unlimited():
             return True
 
-        def _check_and_increment() -> bool:
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            if self.max_rpm is not None:
+        logged = False
+        while (wait := self._try_acquire(estimated_tokens)) > 0:
+            if not logged:
                 self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
+                    "info", f"Rate limit reached, waiting {wait:.1f}s for capacity."
                 )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
+                logged = True
+            time.sleep(wait)
+        return True
+
+    async def acquire(self, estimated_tokens: int = 0) -> bool:
+        """Asynchronously waits until a new request fits in the budgets.
+
+        Args:
+            estimated_tokens: Tokens the upcoming request is expected to use.
+
+        Returns:
+            True once the request may proceed.
+        """
+        if self._is_unlimited():
             return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        logged = False
+        while (wait := self._try_acquire(estimated_tokens)) > 0:
+            if not logged:
+                self.logger.log(
+                    "info", f"Rate limit reached, waiting {wait:.1f}s for capacity."
+                )
+                logged = True
+            await asyncio.sleep(wait)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charges tokens actually consumed against the TPM budget.
+
+        Args:
+            tokens: Number of prompt plus completion tokens used.
+        """
+        if self.max_tpm is None or tokens <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._tokens.append((now, tokens))
+            self._tokens_in_window += tokens
 
     def stop_rpm_counter(self) -> None:
-        """Stops the RPM counter and cancels any active timers."""
-        self._shutdown_flag = True
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self) -> None:
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self) -> None:
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.daemon = True
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
+        """Kept for compatibility; the sliding window needs no background timer.
+
+        The window is deliberately left intact so that a controller shared with
+        other crews keeps enforcing the budget after this crew finishes.
+        """
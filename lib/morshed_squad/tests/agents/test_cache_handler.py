@@ -0,0 +1,122 @@
+"""Tests for the tool result cache and how crews wire it into agents."""
+
+from morshed_squad.agent import Agent
+from morshed_squad.agents.cache import cache_handler as cache_module
+from morshed_squad.agents.cache.cache_handler import CacheHandler
+from morshed_squad.crew import Crew
+from morshed_squad.llms.base_llm import BaseLLM
+from morshed_squad.task import Task
+import pytest
+
+
+class StaticLLM(BaseLLM):
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        return "Final Answer: done"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+def _agent(**kwargs) -> Agent:
+    return Agent(
+        role="worker",
+        goal="answer",
+        backstory="answers",
+        llm=StaticLLM(model="static"),
+        **kwargs,
+    )
+
+
+def _crew(agent: Agent, **kwargs) -> Crew:
+    return Crew(
+        agents=[agent],
+        tasks=[Task(description="say hi", expected_output="done", agent=agent)],
+        **kwargs,
+    )
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CacheHandler(max_entries=2)
+    cache.add("search", '{"q": "a"}', "A")
+    cache.add("search", '{"q": "b"}', "B")
+    assert cache.read("search", '{"q": "a"}') == "A"
+
+    cache.add("search", '{"q": "c"}', "C")
+
+    assert cache.read("search", '{"q": "b"}') is None
+    assert cache.read("search", '{"q": "a"}') == "A"
+    assert cache.read("search", '{"q": "c"}') == "C"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_argument_order_does_not_change_the_key():
+    cache = CacheHandler()
+    cache.add("search", '{"q": "a", "n": 1}', "A")
+
+    assert cache.read("search", '{"n": 1, "q": "a"}') == "A"
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = CacheHandler(default_ttl=10, tool_ttls={"weather": 1})
+    cache.add("search", "x", "kept")
+    cache.add("weather", "x", "stale")
+    cache.add("search", "y", "short", ttl=2)
+
+    clock[0] += 5
+    assert cache.read("search", "x") == "kept"
+    assert cache.read("weather", "x") is None
+    assert cache.read("search", "y") is None
+
+    clock[0] += 6
+    assert cache.read("search", "x") is None
+
+
+def test_sqlite_tier_survives_a_new_handler(tmp_path, clock):
+    path = str(tmp_path / "tool_cache.db")
+    first = CacheHandler(persist_path=path)
+    first.add("search", '{"q": "a"}', {"hits": [1, 2]})
+    first.add("weather", "x", "sunny", ttl=1)
+
+    second = CacheHandler(persist_path=path)
+    assert second.read("search", '{"q": "a"}') == {"hits": [1, 2]}
+
+    clock[0] += 2
+    assert CacheHandler(persist_path=path).read("weather", "x") is None
+
+    second.clear("search")
+    assert CacheHandler(persist_path=path).read("search", '{"q": "a"}') is None
+
+
+def test_crew_uses_configured_cache_handler(tmp_path):
+    path = str(tmp_path / "tool_cache.db")
+    agent = _agent()
+    crew = _crew(
+        agent, cache_handler={"max_entries": 5, "default_ttl": 30, "persist_path": path}
+    )
+
+    assert agent.cache_handler is crew._cache_handler
+    assert crew._cache_handler.max_entries == 5
+    assert crew._cache_handler.persist_path == path
+    assert crew.copy()._cache_handler is crew.cache_handler
+
+
+def test_crew_keeps_an_agents_own_cache_handler():
+    own = CacheHandler(max_entries=3)
+    mine, other = _agent(cache_handler=own), _agent()
+    crew = Crew(
+        agents=[mine, other],
+        tasks=[Task(description="say hi", expected_output="done", agent=mine)],
+    )
+
+    assert mine.cache_handler is own
+    assert mine.tools_handler.cache is own
+    assert other.cache_handler is crew._cache_handler
+    assert mine.copy().cache_handler is own
@@ -0,0 +1,235 @@
+"""Tests for running an LLM turn's native tool calls in parallel."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from morshed_squad.agents.crew_agent_executor import CrewAgentExecutor
+from morshed_squad.agents.tools_handler import ToolsHandler
+from morshed_squad.tools import BaseTool, tool
+from morshed_squad.utilities.agent_utils import convert_tools_to_openai_schema
+import pytest
+
+
+class _OverlapCache:
+    """Cache stub that records how many writes ever ran at the same time."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], object] = {}
+        self.active = 0
+        self.max_active = 0
+
+    def read(self, tool: str, input: str) -> None:
+        return None
+
+    def add(self, tool: str, input: str, output: object) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        self.entries[(tool, input)] = output
+        self.active -= 1
+
+
+def _executor(tools: list[BaseTool], cache=None, **agent_options) -> CrewAgentExecutor:
+    options = {"max_parallel_tool_calls": 8, "tool_call_timeout": None}
+    options.update(agent_options)
+    agent = SimpleNamespace(
+        id="agent",
+        role="tester",
+        key="tester",
+        verbose=False,
+        parallel_tool_calls=True,
+        **options,
+    )
+    return CrewAgentExecutor(
+        llm=None,
+        task=None,
+        crew=None,
+        agent=agent,
+        prompt={"prompt": ""},
+        max_iter=1,
+        tools=[t.to_structured_tool() for t in tools],
+        tools_names="",
+        stop_words=[],
+        tools_description="",
+        tools_handler=ToolsHandler(cache=cache),
+        original_tools=tools,
+    )
+
+
+def _run(executor: CrewAgentExecutor, calls: list[tuple[str, dict]]):
+    _, available_functions = convert_tools_to_openai_schema(executor.original_tools)
+    tool_calls = [
+        {"id": f"call_{i}", "function": {"name": name, "arguments": json.dumps(args)}}
+        for i, (name, args) in enumerate(calls)
+    ]
+    return executor._handle_native_tool_calls(tool_calls, available_functions)
+
+
+def _tool_messages(executor: CrewAgentExecutor) -> list[tuple[str, str]]:
+    return [
+        (message["tool_call_id"], message["content"])
+        for message in executor.messages
+        if message["role"] == "tool"
+    ]
+
+
+def test_results_keep_the_llm_order_when_later_calls_finish_first():
+    second_done = threading.Event()
+
+    @tool("slow")
+    def slow() -> str:
+        """Finish only after the fast call."""
+        assert second_done.wait(5)
+        return "slow result"
+
+    @tool("fast")
+    def fast() -> str:
+        """Finish immediately."""
+        second_done.set()
+        return "fast result"
+
+    executor = _executor([slow, fast])
+
+    assert _run(executor, [("slow", {}), ("fast", {})]) is None
+    assert _tool_messages(executor) == [
+        ("call_0", "slow result"),
+        ("call_1", "fast result"),
+    ]
+
+
+def test_first_result_as_answer_call_in_llm_order_wins():
+    release = threading.Event()
+
+    @tool("first_answer", result_as_answer=True)
+    def first_answer() -> str:
+        """Finish last."""
+        assert release.wait(5)
+        return "first"
+
+    @tool("second_answer", result_as_answer=True)
+    def second_answer() -> str:
+        """Finish first."""
+        release.set()
+        return "second"
+
+    executor = _executor([first_answer, second_answer])
+
+    finish = _run(executor, [("first_answer", {}), ("second_answer", {})])
+
+    assert finish.output == "first"
+    assert [content for _, content in _tool_messages(executor)] == ["first", "second"]
+
+
+def test_timed_out_call_is_reported_while_others_complete():
+    release = threading.Event()
+
+    @tool("hang")
+    def hang() -> str:
+        """Block until released."""
+        release.wait(5)
+        return "late"
+
+    @tool("quick")
+    def quick() -> str:
+        """Finish immediately."""
+        return "done"
+
+    executor = _executor([hang, quick], tool_call_timeout=0.2)
+    try:
+        started = time.monotonic()
+        _run(executor, [("hang", {}), ("quick", {})])
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert elapsed < 2
+    assert _tool_messages(executor) == [
+        ("call_0", "Tool 'hang' timed out after 0.2 seconds."),
+        ("call_1", "done"),
+    ]
+
+
+@pytest.mark.parametrize("calls", [8, 40])
+def test_cache_writes_and_usage_counts_are_serialized(calls):
+    gate = threading.Barrier(min(calls, 8))
+
+    @tool("lookup")
+    def lookup(key: int) -> str:
+        """Return the key once every worker is running."""
+        gate.wait(5)
+        return f"value {key}"
+
+    cache = _OverlapCache()
+    executor = _executor([lookup], cache=cache)
+
+    _run(executor, [("lookup", {"key": i}) for i in range(calls)])
+
+    assert cache.max_active == 1
+    assert len(cache.entries) == calls
+    assert lookup.current_usage_count == calls
+
+
+def test_late_result_of_a_timed_out_call_is_not_cached():
+    release = threading.Event()
+
+    @tool("hang")
+    def hang() -> str:
+        """Block until released."""
+        release.wait(5)
+        return "late"
+
+    cache = _OverlapCache()
+    executor = _executor([hang], cache=cache, tool_call_timeout=0.1)
+    try:
+        _run(executor, [("hang", {})])
+    finally:
+        release.set()
+    for thread in threading.enumerate():
+        if thread.name.startswith("tool-call"):
+            thread.join(5)
+
+    assert _tool_messages(executor) == [
+        ("call_0", "Tool 'hang' timed out after 0.1 seconds.")
+    ]
+    assert cache.entries == {}
+
+
+def test_late_result_of_a_timed_out_async_fallback_call_is_not_cached():
+    release = threading.Event()
+
+    @tool("hang")
+    def hang() -> str:
+        """Block until released."""
+        release.wait(5)
+        return "late"
+
+    @tool("quick")
+    def quick() -> str:
+        """Finish immediately."""
+        return "done"
+
+    cache = _OverlapCache()
+    executor = _executor([hang, quick], cache=cache, tool_call_timeout=0.1)
+    _, available_functions = convert_tools_to_openai_schema([hang, quick])
+    tool_calls = [
+        {"id": "call_0", "function": {"name": "hang", "arguments": "{}"}},
+        {"id": "call_1", "function": {"name": "quick", "arguments": "{}"}},
+    ]
+
+    async def _handle() -> None:
+        try:
+            await executor._ahandle_native_tool_calls(tool_calls, available_functions)
+        finally:
+            release.set()
+
+    # asyncio.run waits for the worker thread, so its late result has landed
+    asyncio.run(_handle())
+
+    assert _tool_messages(executor)[0] == (
+        "call_0",
+        "Tool 'hang' timed out after 0.1 seconds.",
+    )
+    assert list(cache.entries) == [("quick", "")]
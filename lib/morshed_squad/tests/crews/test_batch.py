@@ -0,0 +1,203 @@
+"""Tests for token usage accounting and the thread and process backends of batch kickoffs."""
+
+import copy
+from pathlib import Path
+import re
+import threading
+import time
+
+from morshed_squad.agent import Agent
+from morshed_squad.crew import Crew
+from morshed_squad.crews.batch import BatchWorkerError, ProcessBatchRunner
+from morshed_squad.llms.base_llm import BaseLLM
+from morshed_squad.project import CrewBase, agent, crew, task
+from morshed_squad.task import Task
+import pytest
+
+
+class FixedUsageLLM(BaseLLM):
+    """Answers immediately and charges 10 prompt + 5 completion tokens per call."""
+
+    def call(
+        self, messages, tools=None, callbacks=None, available_functions=None, **kwargs
+    ):
+        time.sleep(0.05)
+        self._track_token_usage_internal({"prompt_tokens": 10, "completion_tokens": 5})
+        return "Final Answer: done"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+class FailOnBoomLLM(FixedUsageLLM):
+    """Like FixedUsageLLM, but raises when the prompt mentions "boom"."""
+
+    def call(
+        self, messages, tools=None, callbacks=None, available_functions=None, **kwargs
+    ):
+        if "boom" in str(messages):
+            raise ValueError("boom input")
+        return super().call(messages, tools, callbacks, available_functions, **kwargs)
+
+
+def _crew(llm_class: type[BaseLLM] = FixedUsageLLM) -> Crew:
+    worker = Agent(
+        role="worker",
+        goal="answer",
+        backstory="answers",
+        llm=llm_class(model="fixed-usage"),
+        max_retry_limit=0,
+    )
+    return Crew(
+        agents=[worker],
+        tasks=[Task(description="say {x}", expected_output="done", agent=worker)],
+    )
+
+
+class EchoLLM(FixedUsageLLM):
+    """Echoes the requested item, answering later items sooner."""
+
+    def call(
+        self, messages, tools=None, callbacks=None, available_functions=None, **kwargs
+    ):
+        item = int(re.search(r"say item (\d+)", str(messages)).group(1))
+        time.sleep(0.05 * (5 - item))
+        return f"Final Answer: echo item {item}"
+
+
+def _failing_crew() -> Crew:
+    return _crew(FailOnBoomLLM)
+
+
+def _echo_crew() -> Crew:
+    return _crew(EchoLLM)
+
+
+@CrewBase
+class BatchProject:
+    """A ``@CrewBase`` project used as a process-pool crew factory."""
+
+    @agent
+    def worker(self) -> Agent:
+        return Agent(
+            role="worker",
+            goal="answer",
+            backstory="answers",
+            llm=FixedUsageLLM(model="fixed-usage"),
+        )
+
+    @task
+    def answer(self) -> Task:
+        return Task(description="say {x}", expected_output="done", agent=self.worker())
+
+    @crew
+    def crew(self) -> Crew:
+        return Crew(agents=self.agents, tasks=self.tasks)
+
+
+@pytest.fixture
+def spawned_workers(monkeypatch):
+    """Let spawned workers import this module and keep them off the network."""
+    monkeypatch.syspath_prepend(str(Path(__file__).parents[2]))
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
+
+
+def test_llm_copies_count_their_own_usage():
+    llm = FixedUsageLLM(model="fixed-usage")
+    llm.call("hi")
+    clone = copy.copy(llm)
+    clone.call("hi")
+
+    assert llm.get_token_usage_summary().total_tokens == 15
+    assert clone.get_token_usage_summary().total_tokens == 15
+    assert clone.model == llm.model
+
+
+@pytest.mark.parametrize("reuse_crews", [False, True])
+def test_batch_usage_is_not_over_counted(reuse_crews):
+    crew = _crew()
+    inputs = [{"x": i} for i in range(8)]
+
+    results = list(
+        crew.kickoff_batch(inputs, max_concurrency=4, reuse_crews=reuse_crews)
+    )
+
+    assert all(result.succeeded for result in results)
+    assert [r.usage_metrics.total_tokens for r in results] == [15] * len(inputs)
+    assert crew.usage_metrics.total_tokens == 15 * len(inputs)
+    assert crew.usage_metrics.successful_requests == len(inputs)
+
+
+def test_kickoff_for_each_runs_each_input_on_a_fresh_copy(monkeypatch):
+    crew = _crew()
+    seen: list[int] = []
+    lock = threading.Lock()
+    original_copy = Crew.copy
+
+    def _tracking_copy(self):
+        clone = original_copy(self)
+        with lock:
+            seen.append(id(clone))
+        return clone
+
+    monkeypatch.setattr(Crew, "copy", _tracking_copy)
+    crew.kickoff_for_each([{"x": i} for i in range(6)], max_concurrency=2)
+
+    assert len(set(seen)) == 6
+    assert crew.usage_metrics.total_tokens == 15 * 6
+
+
+def test_process_runner_returns_outputs_and_usage(spawned_workers):
+    runner = ProcessBatchRunner(_crew, max_workers=2)
+    inputs = [{"x": i} for i in range(4)]
+
+    results = sorted(runner.run(inputs), key=lambda result: result.index)
+
+    assert [result.inputs for result in results] == inputs
+    assert all(result.succeeded for result in results)
+    assert [result.output.raw for result in results] == ["done"] * 4
+    assert [r.usage_metrics.total_tokens for r in results] == [15] * 4
+    assert runner.usage_metrics.total_tokens == 15 * 4
+    assert runner.usage_metrics.successful_requests == 4
+
+
+def test_process_runner_isolates_a_failing_input(spawned_workers):
+    # One worker, so the inputs after the failure run on the same crew
+    runner = ProcessBatchRunner(_failing_crew, max_workers=1)
+    inputs = [{"x": "ok 0"}, {"x": "boom"}, {"x": "ok 2"}]
+
+    results = sorted(runner.run(inputs), key=lambda result: result.index)
+
+    assert [result.succeeded for result in results] == [True, False, True]
+    error = results[1].error
+    assert isinstance(error, BatchWorkerError)
+    assert error.error_type == "builtins.ValueError"
+    assert str(error) == "builtins.ValueError: boom input"
+    assert "ValueError: boom input" in error.worker_traceback
+    assert results[1].output is None
+    assert [results[0].output.raw, results[2].output.raw] == ["done", "done"]
+
+
+def test_crew_base_class_is_a_process_factory(spawned_workers):
+    template = _crew()
+
+    results = list(
+        template.kickoff_batch(
+            [{"x": i} for i in range(3)], max_concurrency=2, crew_factory=BatchProject
+        )
+    )
+
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert all(result.succeeded for result in results)
+    assert template.usage_metrics.total_tokens == 15 * 3
+
+
+def test_kickoff_for_each_with_factory_keeps_input_order(spawned_workers):
+    inputs = [{"x": f"item {i}"} for i in range(5)]
+
+    outputs = _crew().kickoff_for_each(
+        inputs, max_concurrency=3, crew_factory=_echo_crew
+    )
+
+    assert [output.raw for output in outputs] == [f"echo item {i}" for i in range(5)]
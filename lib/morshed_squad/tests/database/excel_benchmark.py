@@ -0,0 +1,87 @@
+"""Throughput benchmark for ExcelManager lead import and report export.
+
+Writes a synthetic lead list as CSV and XLSX, imports each into a fresh
+SQLite database and exports the result back out, reporting rows per second
+and peak Python memory for every step::
+
+    python lib/morshed_squad/tests/database/excel_benchmark.py --rows 100000
+
+Not collected by pytest.
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+from morshed_squad.database.database_manager import DatabaseManager
+from morshed_squad.database.excel_tools import ExcelManager
+from openpyxl import Workbook
+
+
+def write_leads(directory: str, rows: int) -> dict[str, str]:
+    """Write ``rows`` leads to a CSV and an XLSX file and return both paths."""
+    header = ["Name", "Phone", "Email"]
+    leads = (
+        (
+            f"Lead {i}",
+            f"+1 555 {i // 10000:04d} {i % 10000:04d}",
+            f"lead{i}@example.com",
+        )
+        for i in range(rows)
+    )
+    csv_path = os.path.join(directory, "leads.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(leads)
+
+    xlsx_path = os.path.join(directory, "leads.xlsx")
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Leads")
+    ws.append(header)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if row != header:
+                ws.append(row)
+    wb.save(xlsx_path)
+    return {"csv": csv_path, "xlsx": xlsx_path}
+
+
+def timed(label: str, rows: int, fn, *args) -> None:
+    """Run ``fn(*args)`` and print rows/sec and peak traced memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    message = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<14} {rows / elapsed:>10,.0f} rows/s  "
+        f"peak {peak / 2**20:6.1f} MiB  ({message})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = write_leads(directory, args.rows)
+        print(f"{args.rows} leads, batch size {args.batch_size}")
+        for kind, path in sources.items():
+            db = DatabaseManager(os.path.join(directory, f"{kind}.db"), user_id=1)
+            excel = ExcelManager(db, batch_size=args.batch_size)
+            print(f"\n{kind}:")
+            timed("import", args.rows, excel.import_leads, path)
+            output = os.path.join(directory, f"report_{kind}.{kind}")
+            timed("export", args.rows, excel.export_report, output)
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
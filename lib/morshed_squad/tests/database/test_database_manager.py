@@ -0,0 +1,83 @@
+"""Tests for DatabaseManager connection pooling and schema setup."""
+
+import os
+import sqlite3
+import threading
+
+from morshed_squad.database.database_manager import DatabaseManager
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "morshed.db"), user_id=1)
+    yield manager
+    manager.close()
+
+
+def _in_thread(fn):
+    result = {}
+
+    def _run():
+        try:
+            result["value"] = fn()
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def test_memory_database_has_schema_on_every_thread():
+    DatabaseManager(":memory:", user_id=1).add_lead("main", "1")
+
+    def _use_from_thread():
+        manager = DatabaseManager(":memory:", user_id=1)
+        manager.add_lead("worker", "2")
+        names = [lead["name"] for lead in manager.get_all_leads()]
+        manager.close()
+        return names
+
+    assert _in_thread(_use_from_thread) == ["worker"]
+
+
+def test_deleted_database_file_is_recreated(db):
+    db.add_lead("before", "1")
+    os.remove(db.db_path)
+
+    manager = DatabaseManager(db.db_path, user_id=1)
+
+    assert os.path.exists(db.db_path)
+    assert manager.add_lead("after", "2") is not None
+    assert [lead["name"] for lead in manager.get_all_leads()] == ["after"]
+
+
+def test_pooled_connection_keeps_tuple_rows(db):
+    db.add_lead("ada", "1")
+    assert db.get_all_leads(limit=1)[0]["name"] == "ada"
+    assert db.verify_user("admin", "admin123")["username"] == "admin"
+
+    with db._get_connection() as conn:
+        row = conn.execute("SELECT name FROM leads").fetchone()
+    assert row == ("ada",)
+    assert db.get_api_key() is None
+
+
+def test_bulk_insert_rejected_by_a_constraint_stores_nothing(db):
+    with db._get_connection() as conn:
+        conn.execute("CREATE UNIQUE INDEX idx_test_phone ON leads(phone)")
+
+    assert db.add_leads_bulk([("a", "1"), ("b", "2"), ("c", "1")]) == 0
+    assert db.count_leads() == 0
+    assert db.add_leads_bulk([("a", "1"), ("b", "2")]) == 2
+
+
+def test_connection_reused_within_a_thread(db):
+    other = DatabaseManager(db.db_path, user_id=2)
+
+    assert other._get_connection() is db._get_connection()
+    assert isinstance(other._get_connection(), sqlite3.Connection)
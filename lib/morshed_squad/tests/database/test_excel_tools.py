@@ -0,0 +1,63 @@
+"""Tests for streaming lead import and report export in ExcelManager."""
+
+import csv
+
+from morshed_squad.database.database_manager import DatabaseManager
+from morshed_squad.database.excel_tools import LEAD_COLUMNS, ExcelManager
+from openpyxl import Workbook, load_workbook
+import pytest
+
+
+@pytest.fixture
+def excel(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "morshed.db"), user_id=1)
+    yield ExcelManager(manager, batch_size=2)
+    manager.close()
+
+
+def test_ragged_xlsx_rows_are_imported(excel, tmp_path):
+    path = str(tmp_path / "leads.xlsx")
+    wb = Workbook()
+    wb.active.append(["Name", "Phone", "Email"])
+    wb.active.append(["Ada", 4155550100.0])
+    wb.active.append(["Grace", "+1 415 555 0101", "grace@example.com", "extra"])
+    wb.save(path)
+
+    assert excel.import_leads(path) == "Successfully imported 2 leads."
+    leads = {lead["name"]: lead for lead in excel.db.get_all_leads()}
+    assert leads["Ada"]["phone"] == "4155550100"
+    assert leads["Grace"]["email"] == "grace@example.com"
+
+
+def test_csv_output_path_is_used_as_a_stem(excel, tmp_path):
+    excel.db.add_lead("Ada", "1")
+    output = tmp_path / "report.csv"
+
+    message = excel.export_report(str(output))
+
+    leads_path = tmp_path / "report_leads.csv"
+    logs_path = tmp_path / "report_telephony_logs.csv"
+    assert message == f"Report exported to {leads_path} and {logs_path}"
+    assert not output.exists()
+    with open(leads_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == LEAD_COLUMNS
+    assert rows[1][1:3] == ["Ada", "1"]
+    assert logs_path.exists()
+
+
+def test_xlsx_export_streams_every_row(excel, tmp_path):
+    excel.db.add_leads_bulk([(f"lead {i}", str(i)) for i in range(5)])
+    output = str(tmp_path / "report.xlsx")
+    progress = []
+
+    assert excel.export_report(output, progress.append) == (
+        f"Report exported to {output}"
+    )
+
+    wb = load_workbook(output, read_only=True)
+    rows = list(wb["Leads"].iter_rows(values_only=True))
+    wb.close()
+    assert list(rows[0]) == LEAD_COLUMNS
+    assert len(rows) == 6
+    assert progress == [2, 4]
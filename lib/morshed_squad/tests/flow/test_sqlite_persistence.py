@@ -0,0 +1,107 @@
+"""Tests for delta-mode SQLite flow persistence durability."""
+
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import time
+
+from morshed_squad.flow.flow import Flow, start
+from morshed_squad.flow.persistence import persist
+from morshed_squad.flow.persistence.sqlite import SQLiteFlowPersistence
+import pytest
+
+
+def _log_rows(db_path: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM flow_state_log").fetchone()[0]
+
+
+def _slow_writes(persistence: SQLiteFlowPersistence, monkeypatch) -> None:
+    write = persistence._write_log_entry
+
+    def _slow_write(*args, **kwargs):
+        time.sleep(0.2)
+        write(*args, **kwargs)
+
+    monkeypatch.setattr(persistence, "_write_log_entry", _slow_write)
+
+
+def test_flow_flushes_delta_saves_when_it_finishes(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+    _slow_writes(persistence, monkeypatch)
+
+    @persist(persistence)
+    class CounterFlow(Flow[dict]):
+        _skip_auto_memory = True
+
+        @start()
+        def step(self):
+            self.state["count"] = 1
+
+    flow = CounterFlow()
+    flow.kickoff()
+
+    # Read through a separate connection: nothing may still sit in the queue.
+    assert _log_rows(db_path) == 1
+    assert persistence._queue.unfinished_tasks == 0
+    persistence.close()
+
+
+def test_queued_saves_are_written_at_interpreter_exit(tmp_path):
+    db_path = str(tmp_path / "flows.db")
+    script = textwrap.dedent(
+        f"""
+        import time
+
+        from morshed_squad.flow.persistence.sqlite import SQLiteFlowPersistence
+
+        write = SQLiteFlowPersistence._write_log_entry
+
+        def slow_write(self, *args):
+            time.sleep(0.01)
+            write(self, *args)
+
+        SQLiteFlowPersistence._write_log_entry = slow_write
+        persistence = SQLiteFlowPersistence({db_path!r}, mode="delta")
+        for i in range(50):
+            persistence.save_state("flow-1", "step", {{"id": "flow-1", "i": i}})
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=120)
+
+    assert _log_rows(db_path) == 50
+    assert SQLiteFlowPersistence(db_path, mode="delta").load_state("flow-1") == {
+        "id": "flow-1",
+        "i": 49,
+    }
+
+
+def test_writer_errors_are_raised_to_the_caller(tmp_path):
+    db_path = str(tmp_path / "flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+    persistence.save_state("flow-1", "step", {"id": "flow-1"})
+    persistence.flush()
+
+    with persistence._conn_lock:
+        persistence._connection().execute("DROP TABLE flow_state_log")
+    persistence.save_state("flow-1", "step", {"id": "flow-1", "n": 2})
+
+    with pytest.raises(RuntimeError, match="Failed to persist flow state"):
+        persistence.flush()
+    # The error is reported once.
+    persistence.flush()
+    persistence.close()
+
+
+def test_close_raises_pending_writer_error(tmp_path):
+    db_path = str(tmp_path / "flows.db")
+    persistence = SQLiteFlowPersistence(db_path, mode="delta")
+    with persistence._conn_lock:
+        persistence._connection().execute("DROP TABLE flow_state_log")
+    persistence.save_state("flow-1", "step", {"id": "flow-1"})
+
+    with pytest.raises(RuntimeError, match="Failed to persist flow state"):
+        persistence.close()
+    assert persistence._conn is None
@@ -0,0 +1,120 @@
+"""Tests for the lazy and diff state payloads of flow method events."""
+
+import threading
+
+from morshed_squad.events.event_bus import crewai_event_bus
+from morshed_squad.events.types.flow_events import MethodExecutionFinishedEvent
+from morshed_squad.flow.flow import Flow, listen, start
+from morshed_squad.flow.state_patch import apply_state_patch
+from pydantic import BaseModel, Field, field_serializer
+
+
+DUMPED_DOCUMENTS: list[int] = []
+
+
+class PipelineState(BaseModel):
+    id: str = "pipeline"
+    step: int = 0
+    notes: list[str] = Field(default_factory=list)
+    documents: list[str] = Field(default_factory=lambda: ["doc"] * 100)
+
+    @field_serializer("documents")
+    def _count_dumps(self, documents: list[str]) -> list[str]:
+        DUMPED_DOCUMENTS.append(len(documents))
+        return documents
+
+
+class PipelineFlow(Flow[PipelineState]):
+    _skip_auto_memory = True
+    state_events = "diff"
+
+    @start()
+    def first(self):
+        self.state.step = 1
+
+    @listen(first)
+    def second(self):
+        self.state.notes.append("checked")
+        self.state.step = 2
+
+
+def _finished_events(flow: Flow) -> list[MethodExecutionFinishedEvent]:
+    events: list[MethodExecutionFinishedEvent] = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def _collect(source, event):
+            events.append(event)
+
+        flow.kickoff()
+        crewai_event_bus.flush()
+    return sorted(events, key=lambda event: event.emission_sequence or 0)
+
+
+def test_diff_patches_rebuild_each_snapshot():
+    events = _finished_events(PipelineFlow())
+
+    assert [event.method_name for event in events] == ["first", "second"]
+    assert dict(events[1].state)["notes"] == ["checked"]
+    assert events[1].state_patch == [
+        {"op": "replace", "path": "/step", "value": 2},
+        {"op": "add", "path": "/notes/-", "value": "checked"},
+    ]
+    assert apply_state_patch(dict(events[0].state), events[1].state_patch) == dict(
+        events[1].state
+    )
+
+
+def test_diff_mode_only_serializes_changed_fields():
+    flow = PipelineFlow()
+    DUMPED_DOCUMENTS.clear()
+
+    flow._method_event_state()
+    flow.state.step = 5
+    state, patch = flow._method_event_state()
+
+    assert DUMPED_DOCUMENTS == [100]
+    assert patch == [{"op": "replace", "path": "/step", "value": 5}]
+    assert state["documents"] == ["doc"] * 100
+
+    flow.state.documents.append("new")
+    state, patch = flow._method_event_state()
+
+    assert DUMPED_DOCUMENTS == [100, 101]
+    assert patch == [{"op": "add", "path": "/documents/-", "value": "new"}]
+
+
+def test_diff_mode_tracks_dict_state_keys():
+    class DictFlow(Flow[dict]):
+        _skip_auto_memory = True
+        state_events = "diff"
+
+    flow = DictFlow()
+    flow.state["temp"] = [1]
+    flow._method_event_state()
+    del flow.state["temp"]
+    state, patch = flow._method_event_state()
+    assert patch == [{"op": "remove", "path": "/temp"}]
+
+    flow.state["temp"] = [1]
+    state, patch = flow._method_event_state()
+    assert patch == [{"op": "add", "path": "/temp", "value": [1]}]
+    assert state["temp"] == [1]
+
+
+def test_lazy_state_is_read_under_the_state_lock():
+    flow = PipelineFlow()
+    flow.state_events = "lazy"
+    state, patch = flow._method_event_state()
+    assert patch is None
+    read: dict = {}
+
+    with flow._state_lock:
+        reader = threading.Thread(target=lambda: read.update(state))
+        reader.start()
+        reader.join(timeout=0.2)
+        assert reader.is_alive()
+        flow._state.step = 7
+    reader.join(timeout=5)
+
+    assert read["step"] == 7
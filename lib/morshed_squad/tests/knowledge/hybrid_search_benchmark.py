@@ -0,0 +1,122 @@
+"""Recall and latency benchmark for hybrid knowledge search.
+
+Builds a synthetic product catalogue, saves it to a ``KnowledgeStorage``
+with and without ``hybrid_search``, and reports recall@k and query latency
+for two query sets: exact identifiers (SKUs, phone numbers, error codes)
+and natural-language descriptions::
+
+    python lib/morshed_squad/tests/knowledge/hybrid_search_benchmark.py --docs 5000
+
+Uses a local sentence-transformer model by default so no API key is needed.
+Not collected by pytest.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+import uuid
+
+
+os.environ.setdefault("CREWAI_STORAGE_DIR", f"hybrid-benchmark-{uuid.uuid4().hex[:8]}")
+
+from morshed_squad.knowledge.storage.knowledge_storage import (
+    KnowledgeStorage,
+)
+
+
+COLOURS = ["red", "blue", "green", "black", "white", "silver", "orange"]
+PRODUCTS = [
+    ("cordless drill", "drills holes in wood and metal with a rechargeable battery"),
+    ("espresso machine", "brews strong coffee under pressure for lattes"),
+    ("hiking backpack", "carries gear on long mountain trails"),
+    ("noise cancelling headphones", "blocks background sound on flights"),
+    ("standing desk", "raises the work surface so you can stand while typing"),
+    ("air purifier", "filters dust and pollen out of indoor air"),
+    ("electric kettle", "boils water quickly for tea"),
+    ("robot vacuum", "cleans floors automatically while you are out"),
+]
+
+
+def build_corpus(
+    n_docs: int, seed: int
+) -> tuple[list[str], list[tuple[str, str]], list[tuple[str, str]]]:
+    """Return documents plus (query, expected document) pairs for both query sets."""
+    rng = random.Random(seed)
+    docs: list[str] = []
+    exact: list[tuple[str, str]] = []
+    semantic: list[tuple[str, str]] = []
+    for i in range(n_docs):
+        name, purpose = rng.choice(PRODUCTS)
+        colour = rng.choice(COLOURS)
+        sku = f"SKU-{rng.randint(10000, 99999)}-{i:05d}"
+        phone = f"+1 555 {rng.randint(1000, 9999)} {i:04d}"
+        error = f"0x{rng.getrandbits(32):08X}"
+        doc = (
+            f"{colour.title()} {name} ({sku}). It {purpose}. "
+            f"Support line {phone}. Firmware fault code {error} means the "
+            f"unit needs a reset."
+        )
+        docs.append(doc)
+        exact.append((rng.choice([sku, phone, f"what does error {error} mean"]), doc))
+        semantic.append((f"a {colour} device that {purpose}", doc))
+    return docs, exact, semantic
+
+
+def evaluate(
+    storage: KnowledgeStorage, queries: list[tuple[str, str]], k: int
+) -> tuple[float, float, float]:
+    """Return recall@k, median and p95 latency in milliseconds."""
+    hits = 0
+    latencies: list[float] = []
+    for query, expected in queries:
+        start = time.perf_counter()
+        results = storage.search([query], limit=k, score_threshold=0.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += any(result["content"] == expected for result in results)
+    latencies.sort()
+    return (
+        hits / len(queries),
+        statistics.median(latencies),
+        latencies[int(len(latencies) * 0.95) - 1],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--provider", default="sentence-transformer")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    docs, exact, semantic = build_corpus(args.docs, args.seed)
+    rng = random.Random(args.seed)
+    query_sets = {
+        "exact identifiers": rng.sample(exact, min(args.queries, len(exact))),
+        "natural language": rng.sample(semantic, min(args.queries, len(semantic))),
+    }
+    embedder = {"provider": args.provider, "config": {}}
+
+    print(f"{args.docs} documents, recall@{args.k}, latency in ms (median / p95)")
+    for label, hybrid in (("vector", False), ("hybrid", True)):
+        storage = KnowledgeStorage(
+            embedder=embedder,  # type: ignore[arg-type]
+            collection_name=f"bench_{label}",
+            hybrid_search=hybrid,
+        )
+        storage.reset()
+        start = time.perf_counter()
+        for i in range(0, len(docs), 256):
+            storage.save(docs[i : i + 256])
+        print(f"\n{label}: indexed in {time.perf_counter() - start:.1f}s")
+        for name, queries in query_sets.items():
+            recall, p50, p95 = evaluate(storage, queries, args.k)
+            print(f"  {name:<18} recall={recall:.3f}  {p50:6.1f} / {p95:6.1f}")
+        storage.reset()
+
+
+if __name__ == "__main__":
+    main()
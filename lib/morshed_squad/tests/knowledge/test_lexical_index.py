@@ -0,0 +1,128 @@
+"""Tests for the BM25 lexical index and hybrid knowledge search."""
+
+from pathlib import Path
+
+from morshed_squad.knowledge.storage import lexical_index
+from morshed_squad.knowledge.storage.knowledge_storage import KnowledgeStorage
+from morshed_squad.knowledge.storage.lexical_index import (
+    LexicalIndex,
+    document_id,
+    reciprocal_rank_fusion,
+)
+import pytest
+
+
+@pytest.fixture
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(lexical_index, "db_storage_path", lambda: str(tmp_path))
+    return tmp_path / "knowledge_lexical"
+
+
+def test_collection_name_with_path_separators_is_sanitized(storage_dir):
+    index = LexicalIndex("knowledge_Sales/Ops Lead")
+    index.upsert(["Reset SKU-4471 from the admin console"])
+
+    assert [p.name for p in storage_dir.iterdir() if p.suffix == ".db"] == [
+        "knowledge_Sales_Ops_Lead.db"
+    ]
+    assert index.search("SKU-4471", limit=1)[0]["content"].startswith("Reset")
+
+
+def test_collection_name_cannot_escape_the_index_directory(storage_dir):
+    index = LexicalIndex("../outside")
+
+    assert Path(index.db_path).resolve().parent == storage_dir.resolve()
+    assert not (storage_dir.parent / "outside.db").exists()
+
+
+def _result(content: str, score: float = 0.0, **metadata) -> dict:
+    return {
+        "id": f"id-{content}",
+        "content": content,
+        "metadata": metadata,
+        "score": score,
+    }
+
+
+def test_reciprocal_rank_fusion_orders_by_summed_reciprocal_ranks():
+    dense = [_result("a", 0.9, source="dense"), _result("b", 0.8), _result("c", 0.7)]
+    lexical = [_result("c", 12.0, source="lexical"), _result("a", 3.0)]
+
+    fused = reciprocal_rank_fusion([dense, lexical], limit=3, k=60)
+
+    assert [r["content"] for r in fused] == ["a", "c", "b"]
+    assert [r["score"] for r in fused] == pytest.approx(
+        [1 / 61 + 1 / 62, 1 / 63 + 1 / 61, 1 / 62]
+    )
+    assert fused[0]["metadata"] == {"source": "dense"}
+    assert fused[1]["metadata"] == {}
+    assert reciprocal_rank_fusion([dense, lexical], limit=1) == fused[:1]
+
+
+class FakeVectorClient:
+    """Vector client whose search ignores exact identifiers, like embeddings do."""
+
+    def __init__(self) -> None:
+        self.documents: list[str] = []
+
+    def get_or_create_collection(self, collection_name):
+        pass
+
+    def add_documents(self, collection_name, documents, skip_existing=False):
+        self.documents.extend(doc["content"] for doc in documents)
+
+    def delete_collection(self, collection_name):
+        self.documents.clear()
+
+    def search_many(self, collection_name, queries, limit, score_threshold, **kwargs):
+        # Semantic neighbours only: everything except the SKU chunk
+        return [
+            [_result(doc, 0.7) for doc in self.documents if "SKU" not in doc][:limit]
+            for _ in queries
+        ]
+
+
+@pytest.fixture
+def hybrid_storage(storage_dir):
+    storage = KnowledgeStorage(collection_name="catalog", hybrid_search=True)
+    storage._client = FakeVectorClient()
+    return storage
+
+
+def test_hybrid_search_recovers_an_exact_identifier(hybrid_storage):
+    hybrid_storage.save(
+        [
+            "Resetting a router restores the factory settings",
+            "Part SKU-4471 is the replacement power supply",
+            "Routers ship with a power supply and a cable",
+        ]
+    )
+
+    query = ["power supply for SKU-4471"]
+    dense = hybrid_storage._client.search_many("catalog", query, 3, 0.6)[0]
+    results = hybrid_storage.search(query, limit=3)
+
+    sku = "Part SKU-4471 is the replacement power supply"
+    assert sku not in [r["content"] for r in dense]
+    assert sku in [r["content"] for r in results]
+    # Ranked by both retrievers, the chunk sharing terms with the query leads
+    assert results[0]["content"] == "Routers ship with a power supply and a cable"
+
+
+def test_lexical_index_follows_save_delete_and_reset(hybrid_storage):
+    index = hybrid_storage._lexical_index
+    chunks = ["Order 1001 shipped", "Order 1002 is pending"]
+
+    hybrid_storage.save(chunks)
+    hybrid_storage.save(chunks)
+    assert index.count() == 2
+    assert [r["id"] for r in index.search("1002")] == [document_id(chunks[1])]
+
+    index.delete([document_id(chunks[1]), "unknown"])
+    assert index.count() == 1
+    assert index.search("1002") == []
+
+    hybrid_storage.reset()
+    assert index.count() == 0
+    assert hybrid_storage._client.documents == []
+    assert hybrid_storage.search(["Order 1001"]) == []
@@ -0,0 +1,77 @@
+"""Tests for CSV, JSON and Excel knowledge sources built on row chunking."""
+
+from zipfile import BadZipFile
+
+from morshed_squad.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from morshed_squad.knowledge.source.excel_knowledge_source import (
+    ExcelKnowledgeSource,
+)
+from morshed_squad.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+from openpyxl import Workbook
+import pytest
+
+
+@pytest.fixture
+def leads_csv(tmp_path):
+    path = tmp_path / "leads.csv"
+    path.write_text("name,phone\nAda,1\nGrace,2\n", encoding="utf-8")
+    return path
+
+
+def test_content_is_rendered_on_first_access(leads_csv, monkeypatch):
+    source = CSVKnowledgeSource(file_paths=[leads_csv])
+    assert "content" not in source.__dict__
+
+    assert source.content == {
+        leads_csv: "leads.csv\nColumns: name | phone\nAda | 1\nGrace | 2"
+    }
+    monkeypatch.setattr(
+        CSVKnowledgeSource, "load_content", lambda self: pytest.fail("reloaded")
+    )
+    assert source.content[leads_csv].endswith("Grace | 2")
+
+
+def test_excel_content_is_keyed_by_sheet(tmp_path):
+    path = tmp_path / "leads.xlsx"
+    wb = Workbook()
+    wb.active.title = "Leads"
+    wb.active.append(["name", "phone"])
+    wb.active.append(["Ada", 1.0])
+    wb.save(path)
+
+    source = ExcelKnowledgeSource(file_paths=[path])
+
+    assert source.content == {
+        path: {"Leads": "leads.xlsx / Leads\nColumns: name | phone\nAda | 1"}
+    }
+
+
+def test_malformed_files_fail_at_construction(tmp_path):
+    broken_json = tmp_path / "broken.json"
+    broken_json.write_text('{"leads": [', encoding="utf-8")
+    broken_xlsx = tmp_path / "broken.xlsx"
+    broken_xlsx.write_bytes(b"not a workbook")
+
+    with pytest.raises(ValueError, match="line 1 column 12"):
+        JSONKnowledgeSource(file_paths=[broken_json])
+    with pytest.raises(BadZipFile):
+        ExcelKnowledgeSource(file_paths=[broken_xlsx])
+
+
+@pytest.mark.parametrize("chunk_size", [20, 40, 64, 200])
+def test_chunks_never_exceed_chunk_size(tmp_path, chunk_size):
+    path = tmp_path / "wide.csv"
+    header = ",".join(f"column_{i}" for i in range(12))
+    rows = [",".join(f"r{r}c{i}" for i in range(12)) for r in range(30)]
+    path.write_text("\n".join([header, *rows]), encoding="utf-8")
+    source = CSVKnowledgeSource(file_paths=[path], chunk_size=chunk_size)
+
+    chunks = list(source.iter_chunks())
+
+    context = f"wide.csv\nColumns: {header.replace(',', ' | ')}"
+    prefix = f"{context[: chunk_size // 2 - 1]}\n"
+    assert chunks
+    assert max(len(chunk) for chunk in chunks) <= chunk_size
+    assert all(chunk.startswith(prefix) for chunk in chunks)
+    text = "".join(chunk[len(prefix) :] for chunk in chunks).replace("\n", "")
+    assert text == "".join(row.replace(",", " | ") for row in rows)
@@ -0,0 +1,145 @@
+"""Tests for the shared LLM HTTP client pool."""
+
+import asyncio
+
+import httpx
+from morshed_squad.llms.providers.utils.http_pool import (
+    SHARED_HTTP_CLIENTS_ENV,
+    HTTPClientPool,
+    _environment_proxies,
+    shared_http_client,
+)
+import pytest
+
+
+_PROXY_VARS = (
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "ALL_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "all_proxy",
+    "no_proxy",
+)
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    """Replace the pool's transports with mocks recording the proxy each request used."""
+    for name in _PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+    seen: list[tuple[str | None, str]] = []
+
+    def transport(**kwargs):
+        proxy = kwargs.get("proxy")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((proxy, str(request.url)))
+            return httpx.Response(200, text="ok")
+
+        return httpx.MockTransport(handler)
+
+    monkeypatch.setattr(httpx, "HTTPTransport", transport)
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", transport)
+    return seen
+
+
+def test_sharing_is_opt_in(monkeypatch):
+    monkeypatch.delenv(SHARED_HTTP_CLIENTS_ENV, raising=False)
+    assert shared_http_client("openai", {"api_key": "k"}) is None
+
+    monkeypatch.setenv(SHARED_HTTP_CLIENTS_ENV, "true")
+    assert shared_http_client("openai", {"api_key": "k"}) is not None
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, {}),
+        ({"HTTP_PROXY": "proxy:3128"}, {"http://": "http://proxy:3128"}),
+        (
+            {"HTTPS_PROXY": "https://proxy", "ALL_PROXY": "socks5://socks:1080"},
+            {"https://": "https://proxy", "all://": "socks5://socks:1080"},
+        ),
+        (
+            {
+                "HTTP_PROXY": "http://proxy",
+                "NO_PROXY": "example.com, .internal,localhost,10.0.0.1,::1,https://api.test",
+            },
+            {
+                "http://": "http://proxy",
+                "all://*example.com": None,
+                "all://*.internal": None,
+                "all://localhost": None,
+                "all://10.0.0.1": None,
+                "all://[::1]": None,
+                "https://api.test": None,
+            },
+        ),
+        ({"HTTP_PROXY": "http://proxy", "NO_PROXY": "example.com,*"}, {}),
+    ],
+)
+def test_environment_proxies_follow_the_httpx_mount_rules(monkeypatch, env, expected):
+    for name in _PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert _environment_proxies() == expected
+
+
+def test_sync_client_uses_environment_proxy(monkeypatch, routes):
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    pool = HTTPClientPool()
+
+    client = pool.client("openai", {"base_url": "http://llm.invalid/v1"})
+    response = client.get("http://llm.invalid/v1/models")
+
+    assert response.text == "ok"
+    assert routes == [("http://proxy.invalid:3128", "http://llm.invalid/v1/models")]
+    assert pool.stats()[0].requests == 1
+    pool.clear()
+
+
+def test_async_client_uses_environment_proxy(monkeypatch, routes):
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    pool = HTTPClientPool()
+    client = pool.async_client("openai", {"base_url": "http://llm.invalid/v1"})
+
+    async def _get() -> str:
+        return (await client.get("http://llm.invalid/v1/models")).text
+
+    assert asyncio.run(_get()) == "ok"
+    assert routes == [("http://proxy.invalid:3128", "http://llm.invalid/v1/models")]
+    assert pool.stats()[0].requests == 1
+
+
+def test_no_proxy_hosts_bypass_the_proxy(monkeypatch, routes):
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    monkeypatch.setenv("NO_PROXY", "llm.internal")
+    pool = HTTPClientPool()
+
+    client = pool.client("openai", {"base_url": "http://llm.internal/v1"})
+    client.get("http://llm.internal/v1/models")
+    client.get("http://api.llm.internal/v1/models")
+    client.get("http://other.invalid/v1/models")
+
+    assert routes == [
+        (None, "http://llm.internal/v1/models"),
+        (None, "http://api.llm.internal/v1/models"),
+        ("http://proxy.invalid:3128", "http://other.invalid/v1/models"),
+    ]
+    pool.clear()
+
+
+def test_changed_proxy_environment_gets_a_new_client(monkeypatch, routes):
+    pool = HTTPClientPool()
+    direct = pool.client("openai", {"api_key": "k"})
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.invalid:3128")
+    proxied = pool.client("openai", {"api_key": "k"})
+
+    assert proxied is not direct
+    assert pool.client("openai", {"api_key": "k"}) is proxied
+    pool.clear()
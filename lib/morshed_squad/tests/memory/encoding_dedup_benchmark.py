@@ -0,0 +1,74 @@
+"""Throughput benchmark for intra-batch dedup in the memory encoding flow.
+
+Builds batches of synthetic embeddings in which a share of the items are
+near-copies of earlier ones, runs ``EncodingFlow.intra_batch_dedup`` on each
+and reports items per second for every batch size::
+
+    python lib/morshed_squad/tests/memory/encoding_dedup_benchmark.py --sizes 10 100 1000 5000
+
+No embedder, LLM or storage is involved. Not collected by pytest.
+"""
+
+import argparse
+import random
+import time
+
+from morshed_squad.memory.encoding_flow import EncodingFlow, ItemState
+
+
+def build_batch(
+    size: int, dim: int, duplicate_rate: float, rng: random.Random
+) -> list[ItemState]:
+    """Return ``size`` items, about ``duplicate_rate`` of them near-copies."""
+    embeddings: list[list[float]] = []
+    for _ in range(size):
+        if embeddings and rng.random() < duplicate_rate:
+            source = rng.choice(embeddings)
+            embeddings.append([x + rng.uniform(-1e-4, 1e-4) for x in source])
+        else:
+            embeddings.append([rng.gauss(0, 1) for _ in range(dim)])
+    return [
+        ItemState(content=f"memory {i}", embedding=emb, scope=rng.choice(["/a", "/b"]))
+        for i, emb in enumerate(embeddings)
+    ]
+
+
+def run(items: list[ItemState], repeat: int) -> tuple[float, int]:
+    """Return the best items/sec over ``repeat`` runs and the dropped count."""
+    best = 0.0
+    dropped = 0
+    for _ in range(repeat):
+        flow = EncodingFlow(storage=None, llm=None, embedder=None)
+        flow.state.items = [item.model_copy() for item in items]
+        start = time.perf_counter()
+        flow.intra_batch_dedup()
+        elapsed = time.perf_counter() - start
+        best = max(best, len(items) / elapsed)
+        dropped = flow.state.items_dropped_dedup
+    return best, dropped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 500, 1000, 2000, 5000]
+    )
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--duplicate-rate", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"dim={args.dim}, duplicate rate={args.duplicate_rate:.0%}, best of {args.repeat}"
+    )
+    print(f"{'batch':>6}  {'items/sec':>12}  {'dropped':>7}")
+    for size in args.sizes:
+        items = build_batch(size, args.dim, args.duplicate_rate, rng)
+        rate, dropped = run(items, args.repeat)
+        print(f"{size:>6}  {rate:>12,.0f}  {dropped:>7}")
+
+
+if __name__ == "__main__":
+    main()
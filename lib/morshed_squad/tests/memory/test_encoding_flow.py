@@ -0,0 +1,88 @@
+"""Tests for intra-batch dedup in the memory encoding flow."""
+
+import math
+
+from morshed_squad.memory import encoding_flow
+from morshed_squad.memory.encoding_flow import EncodingFlow, ItemState
+import numpy as np
+import pytest
+
+
+def _flow(items: list[ItemState]) -> EncodingFlow:
+    flow = EncodingFlow(storage=None, llm=None, embedder=None)
+    flow.state.items = items
+    return flow
+
+
+def _pairwise_dedup(items: list[ItemState], threshold: float) -> list[int | None]:
+    """Reference first-wins dedup, one cosine similarity at a time."""
+
+    def _cosine(a: list[float], b: list[float]) -> float:
+        dot = sum(x * y for x, y in zip(a, b, strict=True))
+        return dot / (math.hypot(*a) * math.hypot(*b))
+
+    duplicate_of: list[int | None] = [None] * len(items)
+    for j, item in enumerate(items):
+        for i in range(j):
+            other = items[i]
+            if duplicate_of[i] is not None:
+                continue
+            if (other.scope, other.source, other.private) != (
+                item.scope,
+                item.source,
+                item.private,
+            ):
+                continue
+            if _cosine(other.embedding, item.embedding) >= threshold:
+                duplicate_of[j] = i
+                break
+    return duplicate_of
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 512])
+def test_blockwise_dedup_matches_pairwise_reference(monkeypatch, block_size):
+    monkeypatch.setattr(encoding_flow, "_DEDUP_BLOCK_SIZE", block_size)
+    rng = np.random.default_rng(3)
+    bases = rng.uniform(-1, 1, size=(6, 8))
+    items = [
+        ItemState(
+            content=f"item {n}",
+            embedding=(bases[rng.integers(6)] + rng.uniform(-1e-4, 1e-4, 8)).tolist(),
+            scope=str(rng.choice(["/a", "/b"])),
+            private=bool(rng.random() < 0.2),
+        )
+        for n in range(40)
+    ]
+    expected = _pairwise_dedup(items, threshold=0.98)
+    flow = _flow(items)
+
+    flow.intra_batch_dedup()
+
+    assert [item.duplicate_of for item in flow.state.items] == expected
+    assert [item.dropped for item in flow.state.items] == [
+        i is not None for i in expected
+    ]
+    assert flow.state.items_dropped_dedup == sum(i is not None for i in expected)
+
+
+def test_items_without_embeddings_are_never_duplicates(monkeypatch):
+    monkeypatch.setattr(encoding_flow, "_DEDUP_BLOCK_SIZE", 2)
+    flow = _flow(
+        [
+            ItemState(content="empty", embedding=[]),
+            ItemState(content="first", embedding=[1.0, 0.0]),
+            ItemState(content="zero", embedding=[0.0, 0.0]),
+            ItemState(content="again", embedding=[2.0, 0.0]),
+            ItemState(content="empty too", embedding=[]),
+        ]
+    )
+
+    flow.intra_batch_dedup()
+
+    assert [item.duplicate_of for item in flow.state.items] == [
+        None,
+        None,
+        None,
+        1,
+        None,
+    ]
@@ -0,0 +1,84 @@
+"""Tests that batched LanceDB searches match per-query searches."""
+
+import math
+
+from morshed_squad.memory.storage.lancedb_storage import LanceDBStorage
+from morshed_squad.memory.types import MemoryRecord
+import pytest
+
+
+_SCOPES = ["/a", "/a/deep", "/b", "/o'brien", "/o'brien/notes"]
+
+
+def _vector(i: int) -> list[float]:
+    return [math.sin(i), math.cos(i), math.sin(2 * i), (i % 5) / 5]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = LanceDBStorage(path=str(tmp_path / "memory"), vector_dim=4)
+    storage.save(
+        [
+            MemoryRecord(
+                id=f"r{i}",
+                content=f"memory {i}",
+                scope=_SCOPES[i % len(_SCOPES)],
+                embedding=_vector(i),
+            )
+            for i in range(40)
+        ]
+    )
+    return storage
+
+
+_PREFIXES = [None, "/a", "/a/", "/b", "/o'brien", "/o'brien", "/", "/missing"]
+_QUERIES = [_vector(100 + i) for i in range(len(_PREFIXES))]
+
+
+def _ids(results) -> list[list[tuple[str, float]]]:
+    return [
+        [(record.id, round(score, 6)) for record, score in matches]
+        for matches in results
+    ]
+
+
+def _expected(storage: LanceDBStorage) -> list[list[tuple[str, float]]]:
+    return _ids(
+        storage.search(query, scope_prefix=prefix, limit=3)
+        for query, prefix in zip(_QUERIES, _PREFIXES, strict=True)
+    )
+
+
+def test_search_many_matches_per_query_search(storage):
+    batched = storage.search_many(_QUERIES, scope_prefixes=_PREFIXES, limit=3)
+
+    assert _ids(batched) == _expected(storage)
+    assert all(
+        record.scope.startswith("/o'brien")
+        for matches in batched[4:6]
+        for record, _ in matches
+    )
+
+
+def test_search_many_falls_back_to_per_query_search(storage, monkeypatch):
+    search = storage._table.search
+    batched_calls: list[int] = []
+
+    def _single_vector_search(query, *args, **kwargs):
+        if isinstance(query[0], list):
+            batched_calls.append(len(query))
+            raise ValueError("multi-vector search not supported")
+        return search(query, *args, **kwargs)
+
+    monkeypatch.setattr(storage._table, "search", _single_vector_search)
+
+    batched = storage.search_many(_QUERIES, scope_prefixes=_PREFIXES, limit=3)
+
+    assert batched_calls
+    assert _ids(batched) == _expected(storage)
+
+
+def test_scope_prefix_with_a_quote_is_a_literal(storage):
+    results = storage.search(_vector(1), scope_prefix="/o'brien' OR '1'='1", limit=5)
+
+    assert results == []
@@ -0,0 +1,125 @@
+"""Tests for the incrementally maintained LanceDB scope summary."""
+
+from datetime import datetime, timedelta
+import json
+
+from morshed_squad.memory.storage.lancedb_storage import LanceDBStorage
+from morshed_squad.memory.types import MemoryRecord
+import pytest
+
+
+_BASE = datetime(2024, 1, 1)
+
+
+def _record(i: int, scope: str, categories: list[str]) -> MemoryRecord:
+    return MemoryRecord(
+        id=f"r{i}",
+        content=f"memory {i}",
+        scope=scope,
+        categories=categories,
+        created_at=_BASE + timedelta(days=i),
+        embedding=[float(i % 7), 1.0, 0.5, 0.25],
+    )
+
+
+def _summary(storage: LanceDBStorage) -> dict[str, tuple]:
+    return {
+        row["scope"]: (
+            row["record_count"],
+            json.loads(row["categories_str"]),
+            row["oldest"],
+            row["newest"],
+        )
+        for row in storage._summary_rows()
+    }
+
+
+def _rebuilt(storage: LanceDBStorage) -> dict[str, tuple]:
+    return {
+        row["scope"]: (
+            row["record_count"],
+            json.loads(row["categories_str"]),
+            row["oldest"],
+            row["newest"],
+        )
+        for row in storage._summarize(None)
+    }
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = LanceDBStorage(path=str(tmp_path / "db"), vector_dim=4)
+    storage.save(
+        [
+            _record(i, scope, cats)
+            for i, (scope, cats) in enumerate(
+                [
+                    ("/a", ["x"]),
+                    ("/a", ["x", "y"]),
+                    ("/a/b", ["y"]),
+                    ("/a/b", []),
+                    ("/c", ["z"]),
+                    ("/c", ["x"]),
+                    ("/", ["y"]),
+                    ("/a", ["z"]),
+                ]
+            )
+        ]
+    )
+    return storage
+
+
+def test_saves_update_summary_without_scanning(storage, monkeypatch):
+    def _no_scan(scopes):
+        raise AssertionError(f"scanned {scopes}")
+
+    monkeypatch.setattr(storage, "_summarize", _no_scan)
+    storage.save([_record(20, "/a", ["y"]), _record(21, "/d", ["w"])])
+    monkeypatch.undo()
+
+    assert _summary(storage) == _rebuilt(storage)
+    assert storage.get_scope_info("/a").record_count == 6
+    assert storage.list_categories("/a") == {"x": 2, "y": 3, "z": 1}
+
+
+def test_deleting_a_middle_record_does_not_rescan(storage, monkeypatch):
+    def _no_scan(scopes):
+        raise AssertionError(f"scanned {scopes}")
+
+    monkeypatch.setattr(storage, "_summarize", _no_scan)
+    storage.delete(record_ids=["r1"])
+    monkeypatch.undo()
+
+    assert _summary(storage) == _rebuilt(storage)
+
+
+def test_summary_matches_rebuild_after_mixed_writes(storage):
+    updated = _record(3, "/c", ["q"])
+    storage.update(updated)
+    assert _summary(storage) == _rebuilt(storage)
+
+    storage.delete(record_ids=["r0", "r7"])
+    assert _summary(storage) == _rebuilt(storage)
+
+    storage.delete(categories=["z"])
+    assert _summary(storage) == _rebuilt(storage)
+
+    storage.delete(scope_prefix="/a", older_than=_BASE + timedelta(days=2))
+    assert _summary(storage) == _rebuilt(storage)
+
+    storage.delete(scope_prefix="/c")
+    assert _summary(storage) == _rebuilt(storage)
+    assert storage.list_scopes("/") == ["/a"]
+
+
+def test_reset_of_a_scope_drops_only_its_summary_rows(storage, monkeypatch):
+    def _no_scan(scopes):
+        raise AssertionError(f"scanned {scopes}")
+
+    monkeypatch.setattr(storage, "_summarize", _no_scan)
+    storage.reset("/a")
+    monkeypatch.undo()
+
+    assert storage.count("/a") == 0
+    assert set(_summary(storage)) == {"/", "/c"}
+    assert _summary(storage) == _rebuilt(storage)
@@ -0,0 +1,215 @@
+"""Tests for the recall result cache and the memoized query embedder."""
+
+import hashlib
+from unittest.mock import MagicMock
+
+from morshed_squad.memory import recall_cache
+from morshed_squad.memory.recall_cache import MemoizedEmbedder, RecallCache
+from morshed_squad.memory.storage.lancedb_storage import LanceDBStorage
+from morshed_squad.memory.unified_memory import Memory
+import pytest
+
+
+class CountingEmbedder:
+    """Deterministic embedder recording every text it is asked to embed."""
+
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.texts.extend(texts)
+        return [
+            [b / 255 for b in hashlib.sha256(text.encode()).digest()[:8]]
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def memory(tmp_path):
+    embedder = CountingEmbedder()
+    memory = Memory(
+        llm=MagicMock(),
+        storage=LanceDBStorage(path=str(tmp_path / "memory")),
+        embedder=embedder,
+        consolidation_threshold=1.0,
+    )
+    memory.remember("alpha fact", scope="/a", categories=[], importance=0.5)
+    memory.remember("beta fact", scope="/b", categories=[], importance=0.5)
+    yield memory, embedder
+    memory.close()
+
+
+@pytest.fixture
+def searches(memory, monkeypatch):
+    """Count the storage searches behind recall calls."""
+    memory, _ = memory
+    scopes: list[str | None] = []
+    search = memory._storage.search
+
+    def _search(*args, **kwargs):
+        scopes.append(kwargs.get("scope_prefix"))
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(memory._storage, "search", _search)
+    return scopes
+
+
+def _key(query: str = "q", scope: str | None = "/a") -> tuple:
+    return RecallCache.make_key(query, scope, None, "shallow", 5, None, False)
+
+
+def test_repeated_recall_skips_the_embedder_and_llm(memory, searches):
+    memory, embedder = memory
+    embedder.texts.clear()
+
+    first = memory.recall("what about alpha?", scope="/a", depth="shallow")
+    llm_calls = len(memory._llm.mock_calls)
+    second = memory.recall("What about   ALPHA?", scope="/a", depth="shallow")
+
+    assert [m.record.content for m in second] == [m.record.content for m in first]
+    assert embedder.texts == ["what about alpha?"]
+    assert searches == ["/a"]
+    assert len(memory._llm.mock_calls) == llm_calls
+
+
+def test_cache_hits_still_touch_the_recalled_records(memory, monkeypatch):
+    memory, _ = memory
+    touched: list[list[str]] = []
+    monkeypatch.setattr(memory._storage, "touch_records", touched.append)
+
+    first = memory.recall("alpha", scope="/a", depth="shallow")
+    memory.recall("alpha", scope="/a", depth="shallow")
+
+    ids = [m.record.id for m in first]
+    assert ids
+    assert touched == [ids, ids]
+
+
+@pytest.mark.parametrize(
+    ("write", "searched_again"),
+    [
+        (
+            lambda m: m.remember("gamma", scope="/a/x", categories=[], importance=0.5),
+            ["/a"],
+        ),
+        (lambda m: m.forget(scope="/b"), ["/b"]),
+        (lambda m: m.reset(scope="/a"), ["/a"]),
+        (lambda m: m.reset(), ["/a", "/b"]),
+    ],
+)
+def test_writes_invalidate_only_overlapping_scopes(
+    memory, searches, write, searched_again
+):
+    memory, _ = memory
+    memory.recall("fact", scope="/a", depth="shallow")
+    memory.recall("fact", scope="/b", depth="shallow")
+    searches.clear()
+
+    write(memory)
+    searches.clear()
+    memory.recall("fact", scope="/a", depth="shallow")
+    memory.recall("fact", scope="/b", depth="shallow")
+
+    assert searches == searched_again
+
+
+def test_update_invalidates_the_old_and_new_scope(memory, searches):
+    memory, _ = memory
+    [alpha] = memory.recall("alpha", scope="/a", depth="shallow", limit=1)
+    memory.recall("alpha", scope="/b", depth="shallow", limit=1)
+    memory.recall("alpha", scope="/c", depth="shallow", limit=1)
+    searches.clear()
+
+    memory.update(alpha.record.id, scope="/b")
+    for scope in ("/a", "/b", "/c"):
+        memory.recall("alpha", scope=scope, depth="shallow", limit=1)
+
+    assert searches == ["/a", "/b"]
+
+
+def test_recall_racing_a_write_is_not_cached(memory, monkeypatch):
+    memory, _ = memory
+    search = memory._storage.search
+    calls: list[str] = []
+
+    def _search(*args, **kwargs):
+        if not calls:
+            # A write elsewhere lands while the first recall is searching
+            memory._recall_cache.invalidate(["/elsewhere"])
+        calls.append(kwargs.get("scope_prefix"))
+        return search(*args, **kwargs)
+
+    monkeypatch.setattr(memory._storage, "search", _search)
+    memory.recall("alpha", scope="/a", depth="shallow")
+    key = RecallCache.make_key("alpha", "/a", None, "shallow", 10, None, False)
+    assert memory._recall_cache.get(key) is None
+
+    memory.recall("alpha", scope="/a", depth="shallow")
+    assert memory._recall_cache.get(key) is not None
+
+
+def test_scope_invalidation_follows_the_scope_tree():
+    cache = RecallCache()
+    for scope in ("/a", "/a/b", "/ab", "/c", None):
+        cache.put(_key(scope=scope), [], cache.generation)
+
+    cache.invalidate(["a/b/"])
+
+    assert cache.get(_key(scope="/a")) is None
+    assert cache.get(_key(scope="/a/b")) is None
+    assert cache.get(_key(scope=None)) is None
+    assert cache.get(_key(scope="/ab")) == []
+    assert cache.get(_key(scope="/c")) == []
+
+    cache.invalidate([None])
+    assert cache.get(_key(scope="/c")) is None
+
+
+def test_results_computed_during_a_write_are_not_stored():
+    cache = RecallCache()
+    generation = cache.generation
+
+    cache.invalidate(["/elsewhere"])
+    cache.put(_key(), [], generation)
+
+    assert cache.get(_key()) is None
+    cache.put(_key(), [], cache.generation)
+    assert cache.get(_key()) == []
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(recall_cache.time, "monotonic", lambda: now[0])
+    cache = RecallCache(ttl=10.0)
+    cache.put(_key(), [], cache.generation)
+
+    now[0] += 10.0
+    assert cache.get(_key()) == []
+    now[0] += 0.1
+    assert cache.get(_key()) is None
+
+
+def test_lru_bound_and_disabled_cache():
+    cache = RecallCache(max_entries=2)
+    for query in ("one", "two", "three"):
+        cache.put(_key(query), [], cache.generation)
+    assert cache.get(_key("one")) is None
+    assert cache.get(_key("three")) == []
+
+    disabled = RecallCache(max_entries=0)
+    disabled.put(_key(), [], disabled.generation)
+    assert disabled.get(_key()) is None
+
+
+def test_memoized_embedder_only_embeds_new_texts():
+    inner = CountingEmbedder()
+    embedder = MemoizedEmbedder(inner, max_entries=2)
+
+    first = embedder(["a", "b"])
+    assert embedder(["b", "a", "c"]) == [first[1], first[0], inner(["c"])[0]]
+    assert inner.texts == ["a", "b", "c", "c"]
+
+    # "b" was least recently used when "c" was added
+    embedder(["a", "c"])
+    embedder(["b"])
+    assert inner.texts == ["a", "b", "c", "c", "b"]
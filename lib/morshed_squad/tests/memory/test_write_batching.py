@@ -0,0 +1,96 @@
+"""Tests for batching memory saves from different calls into one encoding run."""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
+from unittest.mock import MagicMock
+
+from morshed_squad.memory.storage.lancedb_storage import LanceDBStorage
+from morshed_squad.memory.unified_memory import Memory
+import pytest
+
+
+def _embedder(texts: list[str]) -> list[list[float]]:
+    """Embed identical text to identical vectors, distinct text to distinct ones."""
+    vectors = []
+    for text in texts:
+        digest = hashlib.sha256(text.encode()).digest()
+        vectors.append([b / 255 for b in digest[:8]])
+    return vectors
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = Memory(
+        llm=MagicMock(),
+        storage=LanceDBStorage(path=str(tmp_path / "memory")),
+        embedder=_embedder,
+        consolidation_threshold=1.0,
+        write_batch_wait=0.5,
+    )
+    yield memory
+    memory.close()
+
+
+def _remember_together(memory: Memory, calls: list[dict]) -> list:
+    """Call remember() concurrently so the write queue merges the calls."""
+    barrier = threading.Barrier(len(calls))
+
+    def _call(kwargs: dict):
+        barrier.wait()
+        return memory.remember(categories=[], importance=0.5, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        return list(pool.map(_call, calls))
+
+
+def test_same_content_in_different_scopes_is_kept(memory):
+    records = _remember_together(
+        memory,
+        [
+            {"content": "the deploy key rotates weekly", "scope": "/team-a"},
+            {"content": "the deploy key rotates weekly", "scope": "/team-b"},
+        ],
+    )
+
+    assert memory.write_metrics().max_batch_size == 2
+    assert [r.scope for r in records] == ["/team-a", "/team-b"]
+    assert records[0].id != records[1].id
+    assert memory.info("/").record_count == 2
+
+
+def test_same_content_with_different_privacy_is_kept(memory):
+    records = _remember_together(
+        memory,
+        [
+            {"content": "prefers dark mode", "scope": "/prefs", "source": "alice"},
+            {
+                "content": "prefers dark mode",
+                "scope": "/prefs",
+                "source": "alice",
+                "private": True,
+            },
+            {"content": "prefers dark mode", "scope": "/prefs", "source": "bob"},
+        ],
+    )
+
+    assert memory.write_metrics().max_batch_size == 3
+    assert all(r is not None for r in records)
+    assert len({r.id for r in records}) == 3
+    assert [r.private for r in records] == [False, True, False]
+    assert [r.source for r in records] == ["alice", "alice", "bob"]
+
+
+def test_duplicate_with_same_options_returns_surviving_record(memory):
+    records = _remember_together(
+        memory,
+        [
+            {"content": "standup is at 9am", "scope": "/team"},
+            {"content": "standup is at 9am", "scope": "/team"},
+        ],
+    )
+
+    assert memory.write_metrics().max_batch_size == 2
+    assert records[0] is not None
+    assert records[0].id == records[1].id
+    assert memory.info("/").record_count == 1
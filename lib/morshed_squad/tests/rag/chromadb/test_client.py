@@ -0,0 +1,173 @@
+"""Tests for ChromaDBClient's cached collection handles and skip-existing adds."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import chromadb
+from chromadb.utils.embedding_functions import EmbeddingFunction
+from morshed_squad.rag.chromadb import client as client_module
+from morshed_squad.rag.chromadb.client import ChromaDBClient
+import pytest
+
+
+class FixedEmbedding(EmbeddingFunction):
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def __call__(self, input):
+        self.embedded.extend(input)
+        return [[1.0, float(len(text)), 0.5] for text in input]
+
+    @staticmethod
+    def name() -> str:
+        return "fixed"
+
+    def get_config(self) -> dict:
+        return {}
+
+    @staticmethod
+    def build_from_config(config):
+        return FixedEmbedding()
+
+
+@pytest.fixture
+def client(tmp_path):
+    return ChromaDBClient(
+        client=chromadb.PersistentClient(str(tmp_path)),
+        embedding_function=FixedEmbedding(),
+        default_score_threshold=0.0,
+    )
+
+
+def _docs(*texts):
+    return [{"doc_id": text, "content": text} for text in texts]
+
+
+def test_dropped_collection_is_refetched(client):
+    client.add_documents(collection_name="docs", documents=_docs("alpha"))
+    client.client.delete_collection("docs")
+
+    client.add_documents(collection_name="docs", documents=_docs("beta"))
+    assert client.client.get_collection("docs").count() == 1
+
+    client.client.delete_collection("docs")
+    client.client.create_collection("docs", embedding_function=FixedEmbedding())
+    assert client.search(collection_name="docs", query="beta") == []
+
+
+def test_other_errors_are_not_retried(client, monkeypatch):
+    client.add_documents(collection_name="docs", documents=_docs("alpha"))
+    broken = MagicMock()
+    broken.upsert.side_effect = ValueError("bad metadata")
+    broken.query.side_effect = ValueError("bad filter")
+    client._collections["docs"] = broken
+    refetch = MagicMock()
+    monkeypatch.setattr(client.client, "get_or_create_collection", refetch)
+
+    with pytest.raises(ValueError, match="bad metadata"):
+        client.add_documents(collection_name="docs", documents=_docs("beta", "gamma"))
+    with pytest.raises(ValueError, match="bad filter"):
+        client.search(collection_name="docs", query="alpha")
+
+    assert broken.upsert.call_count == 1
+    assert broken.query.call_count == 1
+    refetch.assert_not_called()
+
+
+class _AsyncCollection:
+    """Async facade over a local collection, standing in for AsyncHttpClient's."""
+
+    def __init__(self, collection) -> None:
+        self._collection = collection
+
+    async def get(self, **kwargs):
+        return self._collection.get(**kwargs)
+
+    async def upsert(self, **kwargs):
+        return self._collection.upsert(**kwargs)
+
+
+class _AsyncClient:
+    def __init__(self, client) -> None:
+        self._client = client
+
+    async def get_or_create_collection(self, **kwargs):
+        return _AsyncCollection(self._client.get_or_create_collection(**kwargs))
+
+
+@pytest.fixture(params=["sync", "async"])
+def add(request, tmp_path, monkeypatch):
+    """Return an embedder and an add function running the sync or async path."""
+    embedder = FixedEmbedding()
+    local = chromadb.PersistentClient(str(tmp_path))
+    if request.param == "sync":
+        client = ChromaDBClient(client=local, embedding_function=embedder)
+
+        def _add(documents, **kwargs):
+            client.add_documents(collection_name="docs", documents=documents, **kwargs)
+            return client.last_add_stats
+
+    else:
+        monkeypatch.setattr(client_module, "_is_async_client", lambda _: True)
+        client = ChromaDBClient(client=_AsyncClient(local), embedding_function=embedder)
+
+        def _add(documents, **kwargs):
+            asyncio.run(
+                client.aadd_documents(
+                    collection_name="docs", documents=documents, **kwargs
+                )
+            )
+            return client.last_add_stats
+
+    return embedder, _add
+
+
+def test_unchanged_documents_are_not_re_embedded(add):
+    embedder, add_documents = add
+    docs = _docs("alpha", "beta", "gamma")
+
+    stats = add_documents(docs, skip_existing=True, batch_size=2)
+    assert (stats.embedded, stats.skipped) == (3, 0)
+    embedder.embedded.clear()
+
+    stats = add_documents(docs, skip_existing=True, batch_size=2)
+    assert (stats.embedded, stats.skipped) == (0, 3)
+    assert embedder.embedded == []
+
+
+def test_only_new_or_changed_chunks_are_embedded(add):
+    embedder, add_documents = add
+
+    def _doc(doc_id, content, page=1):
+        return {"doc_id": doc_id, "content": content, "metadata": {"page": page}}
+
+    add_documents(
+        [_doc("a", "alpha"), _doc("b", "beta"), _doc("c", "gamma")],
+        skip_existing=True,
+    )
+    embedder.embedded.clear()
+
+    stats = add_documents(
+        [
+            _doc("a", "alpha"),
+            _doc("b", "beta, revised"),
+            _doc("c", "gamma", page=2),
+            _doc("d", "delta"),
+        ],
+        skip_existing=True,
+    )
+
+    assert (stats.embedded, stats.skipped) == (3, 1)
+    assert embedder.embedded == ["beta, revised", "gamma", "delta"]
+
+
+def test_without_skip_existing_everything_is_embedded(add):
+    embedder, add_documents = add
+    docs = _docs("alpha", "beta")
+    add_documents(docs)
+    embedder.embedded.clear()
+
+    stats = add_documents(docs)
+
+    assert (stats.embedded, stats.skipped) == (2, 0)
+    assert embedder.embedded == ["alpha", "beta"]
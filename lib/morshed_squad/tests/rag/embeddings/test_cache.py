@@ -0,0 +1,58 @@
+"""Tests for the persistent embedding cache and how the factory namespaces it."""
+
+from morshed_squad.rag.embeddings import cache as cache_module
+from morshed_squad.rag.embeddings.cache import CachedEmbeddingFunction, EmbeddingCache
+from morshed_squad.rag.embeddings.factory import build_embedder
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = EmbeddingCache(db_path=str(tmp_path / "embedding_cache.db"))
+    monkeypatch.setattr(cache_module, "_default_cache", cache)
+    return cache
+
+
+def _openai(**config) -> CachedEmbeddingFunction:
+    embedder = build_embedder(
+        {
+            "provider": "openai",
+            "config": {"api_key": "sk-test", **config},
+            "cache": True,
+        }
+    )
+    assert isinstance(embedder, CachedEmbeddingFunction)
+    return embedder
+
+
+def test_namespace_uses_the_validated_provider_config(cache, monkeypatch):
+    assert _openai()._namespace == "openai:text-embedding-ada-002:"
+    assert _openai(model="text-embedding-3-small", dimensions=256)._namespace == (
+        "openai:text-embedding-3-small:256"
+    )
+
+    monkeypatch.setenv("OPENAI_MODEL_NAME", "text-embedding-3-large")
+    assert _openai()._namespace == "openai:text-embedding-3-large:"
+
+
+def test_cached_vectors_cannot_be_changed_by_callers(cache):
+    vector = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    cache.put_many("ns", ["a"], [vector])
+    vector[0] = 99.0
+
+    first = cache.get_many("ns", ["a"])[0]
+    first[:] = 0.0
+
+    np.testing.assert_array_equal(cache.get_many("ns", ["a"])[0], [1.0, 2.0, 3.0])
+
+
+def test_vectors_read_from_disk_are_returned_as_copies(cache):
+    cache.put_many("ns", ["a"], [np.array([1.0, 2.0], dtype=np.float32)])
+    cache._memory.clear()
+
+    first, second = cache.get_many("ns", ["a", "a"])
+    first[0] = 5.0
+
+    assert second[0] == 1.0
+    assert cache.get_many("ns", ["a"])[0][0] == 1.0
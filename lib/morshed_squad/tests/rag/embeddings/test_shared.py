@@ -0,0 +1,189 @@
+"""Tests for the process-wide embedder pool and its micro-batching handles."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from chromadb.utils.embedding_functions.sentence_transformer_embedding_function import (
+    SentenceTransformerEmbeddingFunction,
+)
+from morshed_squad.rag.embeddings import shared as shared_module
+from morshed_squad.rag.embeddings.factory import build_embedder
+from morshed_squad.rag.embeddings.providers.sentence_transformer.sentence_transformer_provider import (
+    SentenceTransformerProvider,
+)
+from morshed_squad.rag.embeddings.shared import EmbedderPool, SharedEmbeddingFunction
+import pytest
+
+
+_loads: list[tuple[str, str]] = []
+
+
+class FakeSentenceTransformer(SentenceTransformerEmbeddingFunction):
+    """Stand-in for a local model that records every load."""
+
+    def __init__(self, model_name: str, device: str, **kwargs) -> None:
+        self.model_name = model_name
+        self.device = device
+        _loads.append((model_name, device))
+
+    def __call__(self, input):
+        return [[float(len(text))] for text in input]
+
+
+class RecordingModel:
+    """Embedding function recording the batches of each forward pass."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[str]:
+        self.batches.append(list(texts))
+        if any("boom" in text for text in texts):
+            raise RuntimeError("forward pass failed")
+        return [f"vec:{text}" for text in texts]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = EmbedderPool()
+    monkeypatch.setattr(shared_module, "_default_pool", pool)
+    monkeypatch.delenv(shared_module.SHARED_EMBEDDERS_ENV, raising=False)
+    monkeypatch.delenv("CREWAI_EMBEDDING_CACHE", raising=False)
+    _loads.clear()
+    return pool
+
+
+def _build(model_name: str = "all-MiniLM-L6-v2", device: str = "cpu"):
+    return build_embedder(
+        SentenceTransformerProvider(
+            embedding_callable=FakeSentenceTransformer,
+            model_name=model_name,
+            device=device,
+        )
+    )
+
+
+def test_one_instance_is_shared_per_provider_model_and_device(pool):
+    first = _build()
+    second = _build()
+    other_device = _build(device="cuda")
+    other_model = _build(model_name="all-mpnet-base-v2")
+
+    assert isinstance(first, SharedEmbeddingFunction)
+    assert first is second
+    assert first.wrapped is second.wrapped
+    assert other_device is not first
+    assert other_model is not first
+    assert _loads == [
+        ("all-MiniLM-L6-v2", "cpu"),
+        ("all-MiniLM-L6-v2", "cuda"),
+        ("all-mpnet-base-v2", "cpu"),
+    ]
+    assert len(pool) == 3
+
+
+def test_sharing_can_be_turned_off(pool, monkeypatch):
+    monkeypatch.setenv(shared_module.SHARED_EMBEDDERS_ENV, "false")
+
+    first = _build()
+
+    assert isinstance(first, FakeSentenceTransformer)
+    assert _build() is not first
+    assert len(pool) == 0
+
+
+def test_concurrent_acquires_load_the_model_once():
+    pool = EmbedderPool()
+    loads: list[int] = []
+    gate = threading.Barrier(8)
+
+    def _factory() -> RecordingModel:
+        loads.append(1)
+        return RecordingModel()
+
+    def _acquire(_: int) -> SharedEmbeddingFunction:
+        gate.wait(5)
+        return pool.acquire(("sentence-transformer", "key"), _factory)
+
+    with ThreadPoolExecutor(max_workers=8) as workers:
+        handles = list(workers.map(_acquire, range(8)))
+
+    assert loads == [1]
+    assert all(handle is handles[0] for handle in handles)
+
+
+def _embed_concurrently(
+    handle: SharedEmbeddingFunction, inputs: list[list[str]]
+) -> list[object]:
+    """Call the handle from one thread per input, returning results or errors."""
+
+    def _call(texts: list[str]) -> object:
+        try:
+            return handle(texts)
+        except RuntimeError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as workers:
+        return list(workers.map(_call, inputs))
+
+
+def test_concurrent_callers_share_one_forward_pass():
+    model = RecordingModel()
+    inputs = [[f"text {i}", f"more {i}"] for i in range(6)]
+    # The first caller waits until every caller's texts fill the batch
+    handle = SharedEmbeddingFunction(model, max_batch_size=12, max_wait=5.0)
+
+    results = _embed_concurrently(handle, inputs)
+
+    assert len(model.batches) == 1
+    assert sorted(model.batches[0]) == sorted(t for texts in inputs for t in texts)
+    assert results == [[f"vec:{text}" for text in texts] for texts in inputs]
+
+
+def test_batches_are_capped_and_every_caller_gets_its_own_slice():
+    model = RecordingModel()
+    inputs = [[f"text {i}"] * (i % 3 + 1) + [f"end {i}"] for i in range(8)]
+    handle = SharedEmbeddingFunction(model, max_batch_size=5, max_wait=0.01)
+
+    results = _embed_concurrently(handle, inputs)
+
+    assert results == [[f"vec:{text}" for text in texts] for texts in inputs]
+    assert all(len(batch) <= 5 for batch in model.batches)
+    assert sum(len(batch) for batch in model.batches) == sum(map(len, inputs))
+
+
+def test_a_failing_batch_raises_in_every_caller_it_holds():
+    model = RecordingModel()
+    inputs = [["fine"], ["boom"], ["also fine"]]
+    handle = SharedEmbeddingFunction(model, max_batch_size=3, max_wait=5.0)
+
+    results = _embed_concurrently(handle, inputs)
+
+    assert len(model.batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    handle.max_wait = 0
+    assert handle(["after"]) == ["vec:after"]
+
+
+def test_a_failing_batch_does_not_fail_the_other_batches():
+    model = RecordingModel()
+    inputs = [["a", "b"], ["boom", "c"], ["d", "e"]]
+    handle = SharedEmbeddingFunction(model, max_batch_size=2, max_wait=5.0)
+
+    results = _embed_concurrently(handle, inputs)
+
+    assert len(model.batches) == 3
+    assert results[0] == ["vec:a", "vec:b"]
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == ["vec:d", "vec:e"]
+
+
+def test_empty_input_and_queries_bypass_the_batch_queue():
+    model = RecordingModel()
+    model.embed_query = lambda texts: [f"query:{text}" for text in texts]
+    handle = SharedEmbeddingFunction(model)
+
+    assert handle([]) == []
+    assert handle.embed_query(["q"]) == ["query:q"]
+    assert handle.batches is model.batches
+    assert model.batches == []
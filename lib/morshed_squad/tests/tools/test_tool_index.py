@@ -0,0 +1,102 @@
+"""Tests that ToolIndex resolves the same tool as the original fuzzy loop."""
+
+from difflib import SequenceMatcher
+import random
+from types import SimpleNamespace
+
+from morshed_squad.tools.tool_index import ToolIndex, get_tool_index
+from morshed_squad.utilities.string_utils import sanitize_tool_name
+import pytest
+
+
+def _tools(*names: str) -> list[SimpleNamespace]:
+    return [SimpleNamespace(name=name) for name in names]
+
+
+def _sorted_fuzzy_loop(tools: list[SimpleNamespace], tool_name: str):
+    """The selection loop ToolUsage._select_tool used before ToolIndex."""
+    sanitized_input = sanitize_tool_name(tool_name)
+    order_tools = sorted(
+        tools,
+        key=lambda tool: SequenceMatcher(
+            None, sanitize_tool_name(tool.name), sanitized_input
+        ).ratio(),
+        reverse=True,
+    )
+    for tool in order_tools:
+        sanitized_tool = sanitize_tool_name(tool.name)
+        if (
+            sanitized_tool == sanitized_input
+            or SequenceMatcher(None, sanitized_tool, sanitized_input).ratio() > 0.85
+        ):
+            return tool
+    return None
+
+
+@pytest.mark.parametrize(
+    "requested",
+    [
+        "Search the internet",
+        "search_the_internett",
+        "Search the internal",
+        "read file",
+        "read_fil",
+        "read_fila",
+        "scrape website",
+        "unknown tool",
+        "",
+    ],
+)
+def test_matches_the_fuzzy_loop_including_ties(requested):
+    tools = _tools(
+        "Search the internet",
+        "search_the_internet",
+        "Search the internal",
+        "read_filb",
+        "read_filc",
+        "Read File",
+        "Scrape Website",
+        "Scrape website",
+    )
+
+    assert ToolIndex(tools).get(requested) is _sorted_fuzzy_loop(tools, requested)
+
+
+def test_ties_go_to_the_earliest_tool():
+    tools = _tools("read_filb", "read_filc")
+
+    assert ToolIndex(tools).get("read_fila") is tools[0]
+    assert ToolIndex(tools[::-1]).get("read_fila") is tools[1]
+
+
+def test_matches_the_fuzzy_loop_on_mutated_names():
+    rng = random.Random(11)  # noqa: S311
+    alphabet = "abcdefghijklmnopqrstuvwxyz_ "
+    names = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 24)))
+        for _ in range(30)
+    ]
+    tools = _tools(*names, *names[:5])
+    index = ToolIndex(tools)
+
+    for _ in range(500):
+        chars = list(rng.choice(names))
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(chars))
+            action = rng.choice(["drop", "swap", "add"])
+            if action == "drop" and len(chars) > 1:
+                del chars[position]
+            elif action == "swap":
+                chars[position] = rng.choice(alphabet)
+            else:
+                chars.insert(position, rng.choice(alphabet))
+        requested = "".join(chars)
+
+        assert index.get(requested) is _sorted_fuzzy_loop(tools, requested)
+
+
+def test_index_is_shared_per_tool_set():
+    tools = _tools("a_tool", "b_tool")
+
+    assert get_tool_index(tools) is get_tool_index(list(tools))
+    assert get_tool_index(tools) is not get_tool_index(_tools("a_tool", "b_tool"))
@@ -0,0 +1,37 @@
+"""Tests for JSONL logging through the shared background writer."""
+
+from morshed_squad.utilities import file_handler
+from morshed_squad.utilities.file_handler import FileHandler, read_jsonl_log
+import pytest
+
+
+def test_handlers_of_one_file_share_a_writer(tmp_path):
+    path = str(tmp_path / "crew.jsonl")
+    first, second = FileHandler(path), FileHandler(path)
+
+    first.log(message="one")
+    second.log(message="two")
+    second.flush()
+
+    assert first._writer is second._writer
+    assert [entry["message"] for entry in read_jsonl_log(path)] == ["one", "two"]
+    first._writer.close()
+
+
+def test_closed_writer_is_replaced_for_new_handlers(tmp_path):
+    path = str(tmp_path / "crew.jsonl")
+    handler = FileHandler(path)
+    handler.log(message="before")
+    handler._writer.close()
+
+    assert handler._writer not in file_handler._writers.values()
+    with pytest.raises(ValueError, match="is closed"):
+        handler.log(message="lost")
+
+    fresh = FileHandler(path)
+    fresh.log(message="after")
+    fresh.flush()
+
+    assert fresh._writer is not handler._writer
+    assert [entry["message"] for entry in read_jsonl_log(path)] == ["before", "after"]
+    fresh._writer.close()
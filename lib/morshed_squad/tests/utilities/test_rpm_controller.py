@@ -0,0 +1,141 @@
+"""Tests for RPM/TPM rate limiting of agents and crews."""
+
+import asyncio
+import time
+
+from morshed_squad.agent import Agent
+from morshed_squad.crew import Crew
+from morshed_squad.lite_agent import LiteAgent
+from morshed_squad.llms.base_llm import BaseLLM
+from morshed_squad.task import Task
+from morshed_squad.utilities.rpm_controller import RPMController
+import pytest
+
+
+class FixedUsageLLM(BaseLLM):
+    """Answers immediately and charges 10 prompt + 5 completion tokens per call."""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        self._track_token_usage_internal({"prompt_tokens": 10, "completion_tokens": 5})
+        return "Final Answer: done"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+def _agent(**kwargs) -> Agent:
+    return Agent(
+        role="worker",
+        goal="answer",
+        backstory="answers",
+        llm=FixedUsageLLM(model="fixed-usage"),
+        **kwargs,
+    )
+
+
+def _crew(agent: Agent, **kwargs) -> Crew:
+    return Crew(
+        agents=[agent],
+        tasks=[Task(description="say hi", expected_output="done", agent=agent)],
+        **kwargs,
+    )
+
+
+def test_crew_builds_controller_with_token_budget():
+    agent = _agent()
+    crew = _crew(agent, max_tpm=1000)
+
+    assert crew._rpm_controller.max_tpm == 1000
+    assert agent._rpm_controller is crew._rpm_controller
+
+
+def test_crews_can_share_a_controller():
+    shared = RPMController.shared("test-crews-can-share", max_rpm=10, max_tpm=500)
+    first, second = _agent(), _agent()
+    _crew(first, rpm_controller=shared)
+    crew = _crew(second, rpm_controller=shared)
+
+    assert first._rpm_controller is shared
+    assert second._rpm_controller is shared
+    assert crew.copy().rpm_controller is shared
+
+
+def test_agent_accepts_token_budget_and_controller():
+    assert _agent(max_tpm=100)._rpm_controller.max_tpm == 100
+    controller = RPMController(max_rpm=5)
+    assert _agent(rpm_controller=controller)._rpm_controller is controller
+
+
+def test_crew_charges_token_usage_after_each_response():
+    controller = RPMController(max_tpm=1000)
+    _crew(_agent(), rpm_controller=controller).kickoff()
+
+    assert controller._tokens_in_window == 15
+    assert len(controller._requests) == 1
+
+
+def test_exhausted_token_budget_makes_requests_wait():
+    controller = RPMController(max_tpm=15)
+    assert controller._try_acquire(0) == 0.0
+    controller.record_tokens(15)
+
+    wait = controller._try_acquire(0)
+    assert 59 < wait <= 60
+
+
+def test_lite_agent_kickoff_async_awaits_the_rate_limit(monkeypatch):
+    controller = RPMController(max_rpm=10)
+
+    def _blocking_wait(*args, **kwargs):
+        raise AssertionError("blocking check_or_wait used on the async path")
+
+    monkeypatch.setattr(RPMController, "check_or_wait", _blocking_wait)
+    with pytest.warns(DeprecationWarning):
+        agent = LiteAgent(
+            role="worker",
+            goal="answer",
+            backstory="answers",
+            llm=FixedUsageLLM(model="fixed-usage"),
+            request_within_rpm_limit=controller.check_or_wait,
+        )
+
+    output = asyncio.run(agent.kickoff_async("hi"))
+
+    assert output.raw == "done"
+    assert len(controller._requests) == 1
+    assert controller._tokens_in_window == 0  # no max_tpm, nothing charged
+
+
+def test_acquire_does_not_block_the_event_loop():
+    controller = RPMController(max_rpm=1)
+    controller.check_or_wait()
+    controller._requests[0] = time.monotonic() - 59.8
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        task = asyncio.create_task(_ticker())
+        await controller.acquire()
+        task.cancel()
+
+    asyncio.run(_main())
+    assert ticks > 5
+
+
+def test_agent_kickoff_awaits_the_rate_limit_and_charges_tokens(monkeypatch):
+    def _blocking_wait(*args, **kwargs):
+        raise AssertionError("blocking check_or_wait used on the async path")
+
+    monkeypatch.setattr(RPMController, "check_or_wait", _blocking_wait)
+    controller = RPMController(max_rpm=10, max_tpm=1000)
+
+    output = _agent(rpm_controller=controller).kickoff("hi")
+
+    assert output.raw == "done"
+    assert len(controller._requests) == 1
+    assert controller._tokens_in_window == 15
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import hashlib
+import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 import uuid
 
@@ -24,6 +26,47 @@ from morshed_squad_tools.tools.rag.types import AddDocumentParams, ContentItem
 if TYPE_CHECKING:
     from morshed_squad.rag.qdrant.config import QdrantConfig
 
+    from morshed_squad_tools.rag.loaders.directory_loader import DirectoryManifest
+
+
+# Documents buffered before each write while ingesting a directory.
+_DIRECTORY_BATCH_SIZE = 256
+
+# Binary and non-text file extensions skipped when ingesting a directory.
+_BINARY_EXTENSIONS = frozenset(
+    {
+        ".pyc",
+        ".pyo",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".svg",
+        ".webp",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".rar",
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".bin",
+        ".dat",
+        ".db",
+        ".sqlite",
+        ".class",
+        ".jar",
+        ".war",
+        ".ear",
+    }
+)
+
 
 def _is_qdrant_config(config: Any) -> TypeIs[QdrantConfig]:
     """Check if config is a QdrantConfig using safe duck typing.
@@ -55,6 +98,9 @@ class MorshedSquadRagAdapter(Adapter):
     limit: int = 5
     config: RagConfigType | None = None
     _client: BaseClient | None = PrivateAttr(default=None)
+    _manifests: dict[tuple[str, str | None], DirectoryManifest] = PrivateAttr(
+        default_factory=dict
+    )
 
     def model_post_init(self, __context: Any) -> None:
         """Initialize the Morshed Squad RAG client after model initialization."""
@@ -127,6 +173,9 @@ class MorshedSquadRagAdapter(Adapter):
                 - github_url: GitHub repository URL
                 - youtube_url: YouTube video URL
                 - directory_path: Path to directory
+                - manifest_path: JSON file persisting which files of a
+                  directory were ingested, so unchanged files are skipped
+                  across processes
 
         Examples:
             rag_tool.add("path/to/document.pdf", data_type=DataType.PDF_FILE)
@@ -136,10 +185,8 @@ class MorshedSquadRagAdapter(Adapter):
 
             rag_tool.add("path/to/document.pdf")  # auto-detects PDF
         """
-        import os
-
         from morshed_squad_tools.rag.base_loader import LoaderResult
-        from morshed_squad_tools.rag.data_types import DataType, DataTypes
+        from morshed_squad_tools.rag.data_types import DataTypes
         from morshed_squad_tools.rag.source_content import SourceContent
 
         documents: list[BaseRecord] = []
@@ -212,94 +259,12 @@ class MorshedSquadRagAdapter(Adapter):
                 if not os.path.isdir(source_ref):
                     raise ValueError(f"Directory does not exist: {source_ref}")
 
-                # Define binary and non-text file extensions to skip
-                binary_extensions = {
-                    ".pyc",
-                    ".pyo",
-                    ".png",
-                    ".jpg",
-                    ".jpeg",
-                    ".gif",
-                    ".bmp",
-                    ".ico",
-                    ".svg",
-                    ".webp",
-                    ".pdf",
-                    ".zip",
-                    ".tar",
-                    ".gz",
-                    ".bz2",
-                    ".7z",
-                    ".rar",
-                    ".exe",
-                    ".dll",
-                    ".so",
-                    ".dylib",
-                    ".bin",
-                    ".dat",
-                    ".db",
-                    ".sqlite",
-                    ".class",
-                    ".jar",
-                    ".war",
-                    ".ear",
-                }
-
-                for root, dirs, files in os.walk(source_ref):
-                    dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-                    for filename in files:
-                        if filename.startswith("."):
-                            continue
-
-                        # Skip binary files based on extension
-                        file_ext = os.path.splitext(filename)[1].lower()
-                        if file_ext in binary_extensions:
-                            continue
-
-                        # Skip __pycache__ directories
-                        if "__pycache__" in root:
-                            continue
-
-                        file_path: str = os.path.join(root, filename)
-                        try:
-                            file_data_type: DataType = DataTypes.from_content(file_path)
-                            file_loader = file_data_type.get_loader()
-                            file_chunker = file_data_type.get_chunker()
-
-                            file_source = SourceContent(file_path)
-                            file_result: LoaderResult = file_loader.load(file_source)
-
-                            file_chunks = file_chunker.chunk(file_result.content)
-
-                            for chunk_idx, file_chunk in enumerate(file_chunks):
-                                file_metadata: dict[str, Any] = base_metadata.copy()
-                                file_metadata.update(file_result.metadata)
-                                file_metadata["data_type"] = str(file_data_type)
-                                file_metadata["file_path"] = file_path
-                                file_metadata["chunk_index"] = chunk_idx
-                                file_metadata["total_chunks"] = len(file_chunks)
-
-                                if isinstance(arg, dict):
-                                    file_metadata.update(arg.get("metadata", {}))
-
-                                chunk_hash = hashlib.sha256(
-                                    f"{file_result.doc_id}_{chunk_idx}_{file_chunk}".encode()
-                                ).hexdigest()
-                                chunk_id = str(uuid.UUID(chunk_hash[:32]))
-
-                                documents.append(
-                                    {
-                                        "doc_id": chunk_id,
-                                        "content": file_chunk,
-                                        "metadata": sanitize_metadata_for_chromadb(
-                                            file_metadata
-                                        ),
-                                    }
-                                )
-                        except Exception:  # noqa: S112
-                            # Silently skip files that can't be processed
-                            continue
+                item_metadata: dict[str, Any] = base_metadata.copy()
+                if isinstance(arg, dict):
+                    item_metadata.update(arg.get("metadata", {}))
+                self._add_directory(
+                    source_ref, item_metadata, kwargs.get("manifest_path")
+                )
             else:
                 metadata: dict[str, Any] = base_metadata.copy()
                 source_content = SourceContent(source_ref)
@@ -353,3 +318,146 @@ class MorshedSquadRagAdapter(Adapter):
             self._client.add_documents(
                 collection_name=self.collection_name, documents=documents
             )
+
+    def _directory_manifest(
+        self, directory: str, manifest_path: str | Path | None
+    ) -> DirectoryManifest:
+        """Return the manifest kept for ``directory``, loading it on first use."""
+        from morshed_squad_tools.rag.loaders.directory_loader import DirectoryManifest
+
+        key = (
+            os.path.abspath(directory),
+            os.path.abspath(manifest_path) if manifest_path is not None else None,
+        )
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            manifest = (
+                DirectoryManifest.load(manifest_path, directory=directory)
+                if manifest_path is not None
+                else DirectoryManifest(directory=directory)
+            )
+            self._manifests[key] = manifest
+        return manifest
+
+    def _add_directory(
+        self,
+        directory: str,
+        metadata: dict[str, Any],
+        manifest_path: str | Path | None = None,
+    ) -> None:
+        """Ingest the text files of ``directory`` that changed since the last call.
+
+        Files are compared against the directory's manifest: chunks of deleted
+        files are removed from the collection, and only added or changed files
+        are loaded (in parallel), chunked and embedded. Documents are written
+        in batches as files finish loading; the old chunks of a changed file
+        are removed only once its new chunks are written, so a file that
+        fails to load keeps its previous chunks and is retried next time.
+        """
+        from morshed_squad_tools.rag.data_types import DataTypes
+        from morshed_squad_tools.rag.loaders.directory_loader import DirectoryLoader
+        from morshed_squad_tools.rag.source_content import SourceContent
+
+        if self._client is None:
+            raise ValueError("Client is not initialized")
+
+        files: list[str] = []
+        for root, dirs, filenames in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+
+            # Skip __pycache__ directories
+            if "__pycache__" in root:
+                continue
+
+            for filename in filenames:
+                if filename.startswith("."):
+                    continue
+
+                # Skip binary files based on extension
+                if os.path.splitext(filename)[1].lower() in _BINARY_EXTENSIONS:
+                    continue
+
+                files.append(os.path.join(root, filename))
+
+        manifest = self._directory_manifest(directory, manifest_path)
+        diff = manifest.diff(files)
+
+        stale_ids: list[str] = []
+        for file_path in diff.deleted:
+            removed = manifest.remove(file_path)
+            if removed is not None:
+                stale_ids.extend(removed.doc_ids)
+        if stale_ids:
+            self._client.delete_documents(
+                collection_name=self.collection_name, ids=stale_ids
+            )
+
+        documents: list[BaseRecord] = []
+        ingested: list[tuple[str, list[str]]] = []
+
+        def flush() -> None:
+            if documents:
+                self._client.add_documents(  # type: ignore[union-attr]
+                    collection_name=self.collection_name,
+                    documents=list(documents),
+                    skip_existing=True,
+                )
+            replaced_ids: list[str] = []
+            for file_path, doc_ids in ingested:
+                previous = manifest.entries.get(file_path)
+                if previous is not None:
+                    kept = set(doc_ids)
+                    replaced_ids.extend(
+                        doc_id for doc_id in previous.doc_ids if doc_id not in kept
+                    )
+                manifest.update(file_path, diff.states[file_path], doc_ids)
+            if replaced_ids:
+                self._client.delete_documents(  # type: ignore[union-attr]
+                    collection_name=self.collection_name, ids=replaced_ids
+                )
+            documents.clear()
+            ingested.clear()
+
+        loader = DirectoryLoader()
+        for file_result in loader.load_stream(
+            SourceContent(directory), files=diff.added + diff.changed
+        ):
+            file_path = file_result.metadata["file_path"]
+            try:
+                file_chunks = (
+                    DataTypes.from_content(file_path)
+                    .get_chunker()
+                    .chunk(file_result.content)
+                )
+            except Exception:  # noqa: S112
+                # Silently skip files that can't be processed
+                continue
+
+            doc_ids: list[str] = []
+            for chunk_idx, file_chunk in enumerate(file_chunks):
+                file_metadata: dict[str, Any] = metadata.copy()
+                file_metadata.update(file_result.metadata)
+                file_metadata["chunk_index"] = chunk_idx
+                file_metadata["total_chunks"] = len(file_chunks)
+
+                chunk_hash = hashlib.sha256(
+                    f"{file_result.doc_id}_{chunk_idx}_{file_chunk}".encode()
+                ).hexdigest()
+                chunk_id = str(uuid.UUID(chunk_hash[:32]))
+                doc_ids.append(chunk_id)
+
+                documents.append(
+                    {
+                        "doc_id": chunk_id,
+                        "content": file_chunk,
+                        "metadata": sanitize_metadata_for_chromadb(file_metadata),
+                    }
+                )
+            ingested.append((file_path, doc_ids))
+
+            if len(documents) >= _DIRECTORY_BATCH_SIZE:
+                flush()
+        flush()
+
+        manifest.refresh(diff)
+        manifest.save()
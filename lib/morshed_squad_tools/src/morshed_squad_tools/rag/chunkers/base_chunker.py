@@ -1,8 +1,56 @@
-import re
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+from typing import Any
+
+
+# A piece of text plus the separator that preceded it when separators are not
+# kept inline, and its measured length.
+_Piece = tuple[str, str, int]
+
+
+@lru_cache(maxsize=8)
+def _tiktoken_encoding(encoding_name: str) -> Any:
+    import tiktoken
+
+    return tiktoken.get_encoding(encoding_name)
+
+
+def tiktoken_length_function(encoding_name: str = "cl100k_base") -> Callable[[str], int]:
+    """Return a length function that counts tokens with a tiktoken encoding.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding, e.g. ``"cl100k_base"``.
+
+    Returns:
+        A callable mapping text to its token count.
+    """
+    encoding = _tiktoken_encoding(encoding_name)
+
+    def length(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return length
 
 
 class RecursiveCharacterTextSplitter:
-    """A text splitter that recursively splits text based on a hierarchy of separators."""
+    """A text splitter that recursively splits text based on a hierarchy of separators.
+
+    Text is cut into pieces at the first separator it contains; pieces that
+    are still too long are cut at the next separator, down to fixed-size
+    character slices. Pieces are then merged greedily into chunks of at most
+    ``chunk_size``, carrying up to ``chunk_overlap`` of trailing pieces into
+    the next chunk.
+
+    Input is consumed as a stream of blocks and processed in bounded windows
+    that end on a separator, so each character is visited a constant number
+    of times and memory does not grow with the input. Sizes are measured with
+    ``length_function`` (characters by default, or tokens via
+    ``from_tiktoken_encoder``); the size of a chunk is the sum of its pieces.
+    """
 
     def __init__(
         self,
@@ -10,14 +58,16 @@ class RecursiveCharacterTextSplitter:
         chunk_overlap: int = 200,
         separators: list[str] | None = None,
         keep_separator: bool = True,
+        length_function: Callable[[str], int] | None = None,
     ) -> None:
         """Initialize the RecursiveCharacterTextSplitter.
 
         Args:
             chunk_size: Maximum size of each chunk
-            chunk_overlap: Number of characters to overlap between chunks
+            chunk_overlap: Size of the overlap between chunks
             separators: List of separators to use for splitting (in order of preference)
             keep_separator: Whether to keep the separator in the split text
+            length_function: Measures text size; defaults to ``len``
         """
         if chunk_overlap >= chunk_size:
             raise ValueError(
@@ -27,6 +77,7 @@ class RecursiveCharacterTextSplitter:
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
         self._keep_separator = keep_separator
+        self._length = length_function or len
 
         self._separators = separators or [
             "\n\n",
@@ -34,6 +85,21 @@ class RecursiveCharacterTextSplitter:
             " ",
             "",
         ]
+        # Characters buffered before a window is split; with token sizing a
+        # token spans several characters, so this still covers many chunks.
+        self._window = max(16 * chunk_size, 1 << 16)
+
+    @classmethod
+    def from_tiktoken_encoder(
+        cls, encoding_name: str = "cl100k_base", **kwargs: Any
+    ) -> RecursiveCharacterTextSplitter:
+        """Create a splitter whose ``chunk_size`` and ``chunk_overlap`` count tokens.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding.
+            **kwargs: Other ``__init__`` arguments.
+        """
+        return cls(length_function=tiktoken_length_function(encoding_name), **kwargs)
 
     def split_text(self, text: str) -> list[str]:
         """Split the input text into chunks.
@@ -44,113 +110,160 @@ class RecursiveCharacterTextSplitter:
         Returns:
             A list of text chunks.
         """
-        return self._split_text(text, self._separators)
-
-    def _split_text(self, text: str, separators: list[str]) -> list[str]:
-        separator = separators[-1]
-        new_separators = []
-
-        for i, sep in enumerate(separators):
-            if sep == "":
-                separator = sep
-                break
-            if re.search(re.escape(sep), text):
-                separator = sep
-                new_separators = separators[i + 1 :]
-                break
-
-        splits = self._split_text_with_separator(text, separator)
+        return list(self.split_stream((text,)))
 
-        good_splits = []
+    def split_stream(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Split a stream of text blocks, yielding chunks as they fill up.
 
-        for split in splits:
-            if len(split) < self._chunk_size:
-                good_splits.append(split)
-            else:
-                if new_separators:
-                    other_info = self._split_text(split, new_separators)
-                    good_splits.extend(other_info)
-                else:
-                    good_splits.extend(self._split_by_characters(split))
-
-        return self._merge_splits(good_splits, separator)
+        Blocks are treated as one continuous text, so chunks may span block
+        boundaries.
 
-    def _split_text_with_separator(self, text: str, separator: str) -> list[str]:
-        if separator == "":
-            return list(text)
-
-        if self._keep_separator and separator in text:
-            parts = text.split(separator)
-            splits = []
+        Args:
+            blocks: Consecutive pieces of the text, e.g. pages of a document.
 
-            for i, part in enumerate(parts):
-                if i == 0:
-                    splits.append(part)
-                elif i == len(parts) - 1:
-                    if part:
-                        splits.append(separator + part)
-                else:
-                    if part:
-                        splits.append(separator + part)
-                    else:
-                        if splits:
-                            splits[-1] += separator
-
-            return [s for s in splits if s]
-        return text.split(separator)
-
-    def _split_by_characters(self, text: str) -> list[str]:
-        chunks = []
-        for i in range(0, len(text), self._chunk_size):
-            chunks.append(text[i : i + self._chunk_size])  # noqa: PERF401
-        return chunks
-
-    def _merge_splits(self, splits: list[str], separator: str) -> list[str]:
-        """Merge splits into chunks with proper overlap."""
-        docs: list[str] = []
-        current_doc: list[str] = []
+        Yields:
+            Text chunks.
+        """
+        current: deque[_Piece] = deque()
         total = 0
+        for segment in self._segments(blocks):
+            for piece in self._pieces(segment, "", 0):
+                size = piece[2]
+                if total + size > self._chunk_size and current:
+                    chunk = self._join(current)
+                    if chunk.strip():
+                        yield chunk
+                    # Keep trailing pieces as overlap, as long as the next
+                    # piece still fits beside them.
+                    while current and (
+                        total > self._chunk_overlap
+                        or total + size > self._chunk_size
+                    ):
+                        total -= current.popleft()[2]
+                current.append(piece)
+                total += size
+        if current:
+            chunk = self._join(current)
+            if chunk.strip():
+                yield chunk
+
+    def _segments(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Regroup blocks into windows that end right before a separator."""
+        pending: list[str] = []
+        pending_len = 0
+        for block in blocks:
+            if not block:
+                continue
+            pending.append(block)
+            pending_len += len(block)
+            if pending_len < 2 * self._window:
+                continue
+            text = "".join(pending)
+            cut = self._find_cut(text)
+            yield text[:cut]
+            rest = text[cut:]
+            pending = [rest] if rest else []
+            pending_len = len(rest)
+        if pending:
+            yield "".join(pending)
+
+    def _find_cut(self, text: str) -> int:
+        """Last position past half a window where the best separator starts."""
+        start = self._window // 2
+        for separator in self._separators:
+            if separator == "":
+                break
+            position = text.rfind(separator, start)
+            if position > 0:
+                return position
+        return len(text)
 
-        for split in splits:
-            split_len = len(split)
+    def _pieces(self, text: str, joiner: str, level: int) -> Iterator[_Piece]:
+        """Yield pieces of ``text`` no larger than ``chunk_size``.
 
-            if total + split_len > self._chunk_size and current_doc:
-                if separator == "":
-                    doc = "".join(current_doc)
-                else:
-                    if self._keep_separator and separator == " ":
-                        doc = "".join(current_doc)
-                    else:
-                        doc = separator.join(current_doc)
-
-                if doc:
-                    docs.append(doc)
-
-                # Handle overlap by keeping some of the previous content
-                while total > self._chunk_overlap and len(current_doc) > 1:
-                    removed = current_doc.pop(0)
-                    total -= len(removed)
-                    if separator != "":
-                        total -= len(separator)
-
-            current_doc.append(split)
-            total += split_len
-            if separator != "" and len(current_doc) > 1:
-                total += len(separator)
-
-        if current_doc:
+        Args:
+            text: Text to split.
+            joiner: Separator dropped in front of ``text`` (only used when
+                separators are not kept); inherited by its first piece.
+            level: Index of the first separator to try.
+        """
+        for index in range(level, len(self._separators)):
+            separator = self._separators[index]
             if separator == "":
-                doc = "".join(current_doc)
-            else:
-                if self._keep_separator and separator == " ":
-                    doc = "".join(current_doc)
+                break
+            if separator not in text:
+                continue
+            for part_joiner, part in self._split_on(text, separator, joiner):
+                size = self._measure(part_joiner, part)
+                if size <= self._chunk_size:
+                    yield part_joiner, part, size
                 else:
-                    doc = separator.join(current_doc)
-
-            if doc:
-                docs.append(doc)
-
-        return docs
+                    yield from self._pieces(part, part_joiner, index + 1)
+            return
+        yield from self._split_by_characters(text, joiner)
+
+    def _split_on(
+        self, text: str, separator: str, joiner: str
+    ) -> Iterator[tuple[str, str]]:
+        """Split ``text`` at ``separator``, yielding ``(joiner, part)`` pairs.
+
+        With ``keep_separator`` the separator starts the following part and
+        runs of separators stay together; otherwise it becomes the joiner of
+        the following part.
+        """
+        parts = text.split(separator)
+        if not self._keep_separator:
+            first = True
+            for part in parts:
+                if part:
+                    yield (joiner if first else separator), part
+                first = False
+            return
+
+        pending = parts[0]
+        for part in islice(parts, 1, None):
+            if part:
+                if pending:
+                    yield joiner, pending
+                    joiner = ""
+                pending = separator + part
+            else:
+                pending += separator
+        if pending:
+            yield joiner, pending
+
+    def _split_by_characters(self, text: str, joiner: str) -> Iterator[_Piece]:
+        start = 0
+        while start < len(text):
+            step = self._chunk_size
+            part = text[start : start + step]
+            size = self._measure(joiner, part)
+            # A token can be shorter than a character, so shrink until it fits.
+            while size > self._chunk_size and step > 1:
+                step //= 2
+                part = text[start : start + step]
+                size = self._measure(joiner, part)
+            yield joiner, part, size
+            start += len(part)
+            joiner = ""
+
+    def _measure(self, joiner: str, text: str) -> int:
+        size = self._length(text)
+        if joiner:
+            size += self._length(joiner)
+        return size
+
+    @staticmethod
+    def _join(pieces: deque[_Piece]) -> str:
+        """Join pieces into a chunk, dropping the leading piece's joiner."""
+        first = True
+        parts: list[str] = []
+        for joiner, text, _ in pieces:
+            if not first:
+                parts.append(joiner)
+            parts.append(text)
+            first = False
+        return "".join(parts)
 
 
 class BaseChunker:
@@ -160,20 +273,25 @@ class BaseChunker:
         chunk_overlap: int = 200,
         separators: list[str] | None = None,
         keep_separator: bool = True,
+        length_function: Callable[[str], int] | None = None,
     ) -> None:
         """Initialize the Chunker.
 
         Args:
             chunk_size: Maximum size of each chunk
-            chunk_overlap: Number of characters to overlap between chunks
+            chunk_overlap: Size of the overlap between chunks
             separators: List of separators to use for splitting
             keep_separator: Whether to keep separators in the chunks
+            length_function: Measures text size, e.g.
+                ``tiktoken_length_function()`` to size chunks in tokens;
+                defaults to ``len``
         """
         self._splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             separators=separators,
             keep_separator=keep_separator,
+            length_function=length_function,
         )
 
     def chunk(self, text: str) -> list[str]:
@@ -189,3 +307,14 @@ class BaseChunker:
             return []
 
         return self._splitter.split_text(text)
+
+    def chunk_stream(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Chunk a stream of text blocks without holding the whole text.
+
+        Args:
+            blocks: Consecutive pieces of the text.
+
+        Yields:
+            Text chunks.
+        """
+        yield from self._splitter.split_stream(blocks)
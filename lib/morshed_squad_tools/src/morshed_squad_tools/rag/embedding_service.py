@@ -31,6 +31,11 @@ class EmbeddingConfig(BaseModel):
     extra_config: dict[str, Any] = Field(
         default_factory=dict, description="Additional provider-specific configuration"
     )
+    cache: bool | None = Field(
+        default=None,
+        description="Cache embeddings on disk so repeated texts are not re-embedded; "
+        "None follows the CREWAI_EMBEDDING_CACHE environment variable",
+    )
 
 
 class EmbeddingService:
@@ -136,7 +141,9 @@ class EmbeddingService:
 
     def _build_provider_config(self) -> dict[str, Any]:
         """Build configuration dictionary for Morshed Squad's embedding factory."""
-        base_config = {"provider": self.config.provider, "config": {}}
+        base_config: dict[str, Any] = {"provider": self.config.provider, "config": {}}
+        if self.config.cache is not None:
+            base_config["cache"] = self.config.cache
 
         # Provider-specific configuration mapping
         if self.config.provider == "openai":
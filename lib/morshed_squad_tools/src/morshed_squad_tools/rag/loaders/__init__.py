@@ -1,5 +1,8 @@
 from morshed_squad_tools.rag.loaders.csv_loader import CSVLoader
-from morshed_squad_tools.rag.loaders.directory_loader import DirectoryLoader
+from morshed_squad_tools.rag.loaders.directory_loader import (
+    DirectoryLoader,
+    DirectoryManifest,
+)
 from morshed_squad_tools.rag.loaders.docx_loader import DOCXLoader
 from morshed_squad_tools.rag.loaders.json_loader import JSONLoader
 from morshed_squad_tools.rag.loaders.mdx_loader import MDXLoader
@@ -15,6 +18,7 @@ __all__ = [
     "CSVLoader",
     "DOCXLoader",
     "DirectoryLoader",
+    "DirectoryManifest",
     "JSONLoader",
     "MDXLoader",
     "PDFLoader",
@@ -1,22 +1,310 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import hashlib
+import json
 import os
 from pathlib import Path
+from typing import Any, NamedTuple
 
 from morshed_squad_tools.rag.base_loader import BaseLoader, LoaderResult
 from morshed_squad_tools.rag.source_content import SourceContent
 
 
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def default_max_workers() -> int:
+    """Default size of the file loading pool; loading is mostly I/O bound."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat(file_path: str) -> os.stat_result | None:
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+def _read_manifest_file(path: str | Path) -> dict[str, Any]:
+    """Read a manifest file; a missing or unreadable file yields an empty one."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            raw = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return raw if isinstance(raw, dict) else {}
+
+
+class FileState(NamedTuple):
+    """What the manifest remembers about one ingested file."""
+
+    mtime: float
+    size: int
+    sha256: str
+    doc_ids: tuple[str, ...] = ()
+
+
+class ManifestDiff(NamedTuple):
+    """Files of a directory grouped by how they differ from the manifest.
+
+    ``states`` holds the current ``FileState`` (without ``doc_ids``) of every
+    added, changed and unchanged file.
+    """
+
+    added: list[str]
+    changed: list[str]
+    deleted: list[str]
+    unchanged: list[str]
+    states: dict[str, FileState]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+
+class DirectoryManifest:
+    """Record of the files ingested from a directory.
+
+    Each file is tracked by ``(path, mtime, size, sha256)`` together with the
+    IDs of the documents it produced. ``diff`` only hashes files whose mtime
+    or size moved, so rescanning an unchanged tree costs one ``stat`` per file.
+
+    One JSON file can hold the manifests of several directories: each is kept
+    in its own section, keyed by the directory's absolute path, and ``save``
+    leaves the other sections untouched.
+
+    Attributes:
+        path: Optional JSON file the manifest is loaded from and saved to.
+        directory: Absolute path of the directory whose section of ``path``
+            this manifest reads and writes; the working directory by default.
+        entries: Tracked files keyed by path.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        entries: dict[str, FileState] | None = None,
+        directory: str | Path = ".",
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.directory = os.path.abspath(directory)
+        self.entries: dict[str, FileState] = dict(entries or {})
+
+    @classmethod
+    def load(cls, path: str | Path, directory: str | Path = ".") -> DirectoryManifest:
+        """Read the section of ``directory`` from ``path``.
+
+        A missing or unreadable file, or one without a section for the
+        directory, yields an empty manifest.
+        """
+        directory = os.path.abspath(directory)
+        section = _read_manifest_file(path).get("directories", {}).get(directory)
+        try:
+            entries = {
+                file_path: FileState(
+                    mtime=float(state["mtime"]),
+                    size=int(state["size"]),
+                    sha256=str(state["sha256"]),
+                    doc_ids=tuple(state.get("doc_ids", ())),
+                )
+                for file_path, state in section["files"].items()
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            entries = {}
+        return cls(path=path, entries=entries, directory=directory)
+
+    def save(self) -> None:
+        """Write this directory's section to ``path`` atomically. No-op without a path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        raw = _read_manifest_file(self.path)
+        directories = raw.get("directories")
+        if not isinstance(directories, dict):
+            directories = {}
+        directories[self.directory] = {
+            "files": {
+                file_path: {
+                    "mtime": state.mtime,
+                    "size": state.size,
+                    "sha256": state.sha256,
+                    "doc_ids": list(state.doc_ids),
+                }
+                for file_path, state in self.entries.items()
+            }
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"directories": directories}, file)
+        os.replace(tmp_path, self.path)
+
+    def diff(
+        self, files: Iterable[str], max_workers: int | None = None
+    ) -> ManifestDiff:
+        """Compare the current files of a directory against the manifest.
+
+        Args:
+            files: Paths currently present in the directory.
+            max_workers: Size of the pool used to hash candidate files.
+
+        Returns:
+            The added, changed, deleted and unchanged paths. Files that can no
+            longer be read are reported as deleted.
+        """
+        stats: dict[str, os.stat_result] = {}
+        for file_path in files:
+            stat = _stat(file_path)
+            if stat is not None:
+                stats[file_path] = stat
+
+        states: dict[str, FileState] = {}
+        to_hash: list[str] = []
+        for file_path, stat in stats.items():
+            known = self.entries.get(file_path)
+            if (
+                known is not None
+                and known.mtime == stat.st_mtime
+                and known.size == stat.st_size
+            ):
+                states[file_path] = FileState(known.mtime, known.size, known.sha256)
+            else:
+                to_hash.append(file_path)
+
+        if to_hash:
+            with ThreadPoolExecutor(
+                max_workers=max_workers or default_max_workers()
+            ) as executor:
+                futures = {
+                    file_path: executor.submit(hash_file, file_path)
+                    for file_path in to_hash
+                }
+            for file_path, future in futures.items():
+                try:
+                    digest = future.result()
+                except OSError:
+                    continue
+                stat = stats[file_path]
+                states[file_path] = FileState(stat.st_mtime, stat.st_size, digest)
+
+        added: list[str] = []
+        changed: list[str] = []
+        unchanged: list[str] = []
+        for file_path in sorted(states):
+            known = self.entries.get(file_path)
+            if known is None:
+                added.append(file_path)
+            elif known.sha256 != states[file_path].sha256:
+                changed.append(file_path)
+            else:
+                unchanged.append(file_path)
+        deleted = sorted(set(self.entries) - set(states))
+        return ManifestDiff(added, changed, deleted, unchanged, states)
+
+    def update(
+        self, file_path: str, state: FileState, doc_ids: Iterable[str] = ()
+    ) -> None:
+        """Record ``file_path`` as ingested with ``state`` and its document IDs."""
+        self.entries[file_path] = state._replace(doc_ids=tuple(doc_ids))
+
+    def remove(self, file_path: str) -> FileState | None:
+        """Stop tracking ``file_path`` and return what was recorded for it."""
+        return self.entries.pop(file_path, None)
+
+    def refresh(self, diff: ManifestDiff) -> None:
+        """Carry new mtimes of unchanged files over, so they are not hashed again."""
+        for file_path in diff.unchanged:
+            known = self.entries[file_path]
+            self.entries[file_path] = diff.states[file_path]._replace(
+                doc_ids=known.doc_ids
+            )
+
+
 class DirectoryLoader(BaseLoader):
+    """Loads every matching file of a directory.
+
+    Files are loaded on a thread pool. ``load`` combines them into a single
+    result as before; ``load_stream`` yields one ``LoaderResult`` per file as
+    soon as it is ready, keeping at most ``2 * max_workers`` files in flight.
+
+    Options may be passed to the constructor config or per call:
+        - recursive: bool (default True) - Whether to search recursively
+        - include_extensions: list - Only include files with these extensions
+        - exclude_extensions: list - Exclude files with these extensions
+        - max_files: int - Maximum number of files to process
+        - max_workers: int - Size of the loading pool (1 loads serially)
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(config)
+        self.last_errors: list[str] = []
+
     def load(self, source_content: SourceContent, **kwargs) -> LoaderResult:  # type: ignore[override]
         """Load and process all files from a directory recursively.
 
         Args:
             source_content: Directory path or URL to a directory listing
-            **kwargs: Additional options:
-                - recursive: bool (default True) - Whether to search recursively
-                - include_extensions: list - Only include files with these extensions
-                - exclude_extensions: list - Exclude files with these extensions
-                - max_files: int - Maximum number of files to process
+            **kwargs: Options listed on the class.
+        """
+        source_ref = self._validate_directory(source_content)
+        return self._process_directory(source_ref, {**self.config, **kwargs})
+
+    def load_stream(
+        self,
+        source_content: SourceContent,
+        files: Iterable[str] | None = None,
+        **kwargs,
+    ) -> Iterator[LoaderResult]:
+        """Yield a ``LoaderResult`` per file, in completion order.
+
+        Each result keeps the ``source`` and ``doc_id`` of the file's own
+        loader. Files that fail to load are skipped; their errors are listed
+        in ``last_errors`` once the stream is exhausted.
+
+        Args:
+            source_content: Directory to load.
+            files: Paths to load instead of scanning the directory, e.g. the
+                added and changed files of a ``ManifestDiff``.
+            **kwargs: Options listed on the class.
         """
+        source_ref = self._validate_directory(source_content)
+        options = {**self.config, **kwargs}
+        if files is None:
+            files = self.find_files(source_ref, **options)
+        self.last_errors = []
+        for _, file_path, result, error in self._iter_file_results(
+            list(files), options.get("max_workers")
+        ):
+            if error is not None:
+                self.last_errors.append(f"Error processing {file_path}: {error!s}")
+            elif result is not None:
+                yield result
+
+    def find_files(self, dir_path: str, **kwargs) -> list[str]:
+        """List the files of ``dir_path`` that the given options select."""
+        files = self._find_files(
+            dir_path,
+            kwargs.get("recursive", True),
+            kwargs.get("include_extensions", None),
+            kwargs.get("exclude_extensions", None),
+        )
+        max_files: int | None = kwargs.get("max_files", None)
+        if max_files is not None and len(files) > max_files:
+            files = files[:max_files]
+        return files
+
+    @staticmethod
+    def _validate_directory(source_content: SourceContent) -> str:
         source_ref = source_content.source_ref
 
         if source_content.is_url():
@@ -30,41 +318,75 @@ class DirectoryLoader(BaseLoader):
         if not os.path.isdir(source_ref):
             raise ValueError(f"Path is not a directory: {source_ref}")
 
-        return self._process_directory(source_ref, kwargs)
+        return source_ref
+
+    def _iter_file_results(
+        self, files: list[str], max_workers: int | None = None
+    ) -> Iterator[tuple[int, str, LoaderResult | None, Exception | None]]:
+        """Load ``files`` on a bounded pool, yielding as each one finishes.
+
+        Yields:
+            ``(index, path, result, error)`` where exactly one of ``result``
+            and ``error`` is set.
+        """
+        workers = max_workers or default_max_workers()
+        if workers <= 1 or len(files) <= 1:
+            for index, file_path in enumerate(files):
+                try:
+                    yield index, file_path, self._process_single_file(file_path), None
+                except Exception as e:  # noqa: PERF203
+                    yield index, file_path, None, e
+            return
+
+        pending: dict[Future[LoaderResult], tuple[int, str]] = {}
+        queue = iter(enumerate(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next() -> None:
+                item = next(queue, None)
+                if item is not None:
+                    future = executor.submit(self._process_single_file, item[1])
+                    pending[future] = item
+
+            for _ in range(2 * workers):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, file_path = pending.pop(future)
+                    submit_next()
+                    error = future.exception()
+                    if error is None:
+                        yield index, file_path, future.result(), None
+                    else:
+                        yield index, file_path, None, error  # type: ignore[misc]
 
     def _process_directory(self, dir_path: str, kwargs: dict) -> LoaderResult:
-        recursive: bool = kwargs.get("recursive", True)
-        include_extensions: list[str] | None = kwargs.get("include_extensions", None)
-        exclude_extensions: list[str] | None = kwargs.get("exclude_extensions", None)
-        max_files: int | None = kwargs.get("max_files", None)
+        files = self.find_files(dir_path, **kwargs)
 
-        files = self._find_files(
-            dir_path, recursive, include_extensions, exclude_extensions
+        outcomes = sorted(
+            self._iter_file_results(files, kwargs.get("max_workers")),
+            key=lambda outcome: outcome[0],
         )
 
-        if max_files is not None and len(files) > max_files:
-            files = files[:max_files]
-
         all_contents = []
         processed_files = []
         errors = []
 
-        for file_path in files:
-            try:
-                result = self._process_single_file(file_path)
-                if result:
-                    all_contents.append(f"=== File: {file_path} ===\n{result.content}")
-                    processed_files.append(
-                        {
-                            "path": file_path,
-                            "metadata": result.metadata,
-                            "source": result.source,
-                        }
-                    )
-            except Exception as e:  # noqa: PERF203
-                error_msg = f"Error processing {file_path}: {e!s}"
+        for _, file_path, result, error in outcomes:
+            if error is not None:
+                error_msg = f"Error processing {file_path}: {error!s}"
                 errors.append(error_msg)
                 all_contents.append(f"=== File: {file_path} (ERROR) ===\n{error_msg}")
+            elif result:
+                all_contents.append(f"=== File: {file_path} ===\n{result.content}")
+                processed_files.append(
+                    {
+                        "path": file_path,
+                        "metadata": result.metadata,
+                        "source": result.source,
+                    }
+                )
 
         combined_content = "\n\n".join(all_contents)
 
@@ -25,6 +25,14 @@ class DirectorySearchTool(RagTool):
         "A tool that can be used to semantic search a query from a directory's content."
     )
     args_schema: type[BaseModel] = DirectorySearchToolSchema
+    manifest_path: str | None = Field(
+        default=None,
+        description=(
+            "Optional JSON file recording the files already ingested. Without "
+            "it the record is kept in memory, so only repeated adds in this "
+            "process skip unchanged files."
+        ),
+    )
 
     def __init__(self, directory: str | None = None, **kwargs):
         super().__init__(**kwargs)
@@ -35,7 +43,15 @@ class DirectorySearchTool(RagTool):
             self._generate_description()
 
     def add(self, directory: str) -> None:
-        super().add(directory, data_type=DataType.DIRECTORY)
+        """Ingest ``directory``; files unchanged since the last add are skipped."""
+        if self.manifest_path is not None:
+            super().add(
+                directory,
+                data_type=DataType.DIRECTORY,
+                manifest_path=self.manifest_path,
+            )
+        else:
+            super().add(directory, data_type=DataType.DIRECTORY)
 
     def _run(  # type: ignore[override]
         self,
@@ -44,6 +44,7 @@ class AddDocumentParams(TypedDict, total=False):
     github_url: str
     youtube_url: str
     directory_path: str | Path
+    manifest_path: str | Path
 
 
 class VectorDbConfig(TypedDict):
@@ -0,0 +1,101 @@
+import json
+import os
+from unittest.mock import patch
+
+from morshed_squad_tools.adapters.crewai_rag_adapter import MorshedSquadRagAdapter
+from morshed_squad_tools.rag.loaders.directory_loader import DirectoryLoader
+import pytest
+
+
+class FakeClient:
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+
+    def get_or_create_collection(self, **kwargs):
+        pass
+
+    def add_documents(self, collection_name, documents, skip_existing=False):
+        for document in documents:
+            self.documents[document["doc_id"]] = document
+
+    def delete_documents(self, collection_name, ids):
+        for doc_id in ids:
+            self.documents.pop(doc_id, None)
+
+    def sources(self) -> set[str]:
+        return {d["metadata"]["file_path"] for d in self.documents.values()}
+
+
+@pytest.fixture
+def client():
+    fake = FakeClient()
+    with patch(
+        "morshed_squad_tools.adapters.crewai_rag_adapter.get_rag_client",
+        return_value=fake,
+    ):
+        yield fake
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+
+def test_directories_sharing_a_manifest_keep_their_chunks(tmp_path, client):
+    manifest_path = tmp_path / "manifest.json"
+    a = _write(tmp_path / "a" / "notes.txt", "notes from directory a")
+    b = _write(tmp_path / "b" / "notes.txt", "notes from directory b")
+
+    adapter = MorshedSquadRagAdapter()
+    adapter.add(directory_path=str(tmp_path / "a"), manifest_path=manifest_path)
+    adapter.add(directory_path=str(tmp_path / "b"), manifest_path=manifest_path)
+
+    assert client.sources() == {a, b}
+    sections = json.loads(manifest_path.read_text())["directories"]
+    assert set(sections) == {str(tmp_path / "a"), str(tmp_path / "b")}
+
+    # A fresh adapter reading the same manifest finds nothing to re-ingest.
+    with patch.object(client, "add_documents") as add_documents:
+        MorshedSquadRagAdapter().add(
+            directory_path=str(tmp_path / "a"), manifest_path=manifest_path
+        )
+    add_documents.assert_not_called()
+    assert client.sources() == {a, b}
+
+
+def test_changed_file_keeps_old_chunks_until_reingested(tmp_path, client):
+    manifest_path = tmp_path / "manifest.json"
+    path = _write(tmp_path / "docs" / "notes.txt", "first version")
+    adapter = MorshedSquadRagAdapter()
+    adapter.add(directory_path=str(tmp_path / "docs"), manifest_path=manifest_path)
+    old_ids = set(client.documents)
+
+    _write(tmp_path / "docs" / "notes.txt", "second, longer version")
+    os.utime(path, (1, 1))
+
+    def _fail(file_path):
+        raise OSError("disk went away")
+
+    with patch.object(DirectoryLoader, "_process_single_file", side_effect=_fail):
+        adapter.add(directory_path=str(tmp_path / "docs"), manifest_path=manifest_path)
+    assert set(client.documents) == old_ids
+
+    adapter.add(directory_path=str(tmp_path / "docs"), manifest_path=manifest_path)
+    assert client.documents
+    assert not set(client.documents) & old_ids
+    assert [d["content"] for d in client.documents.values()] == [
+        "second, longer version"
+    ]
+
+
+def test_deleted_file_chunks_are_removed(tmp_path, client):
+    keep = _write(tmp_path / "docs" / "keep.txt", "keep me")
+    gone = _write(tmp_path / "docs" / "gone.txt", "delete me")
+    adapter = MorshedSquadRagAdapter()
+    adapter.add(directory_path=str(tmp_path / "docs"))
+    assert client.sources() == {keep, gone}
+
+    os.remove(gone)
+    adapter.add(directory_path=str(tmp_path / "docs"))
+    assert client.sources() == {keep}
@@ -0,0 +1,100 @@
+from itertools import pairwise
+
+from morshed_squad_tools.rag.chunkers.base_chunker import (
+    BaseChunker,
+    RecursiveCharacterTextSplitter,
+)
+import pytest
+
+
+def _document(paragraphs: int = 40) -> str:
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    return "\n\n".join(
+        "\n".join(
+            " ".join(words[(p + line + w) % len(words)] for w in range(5 + line))
+            for line in range(4)
+        )
+        for p in range(paragraphs)
+    )
+
+
+def _words(count: int) -> str:
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    return "".join(
+        f"{words[i % len(words)]}{chr(10) if i % 11 == 10 else ' '}"
+        for i in range(count)
+    ).rstrip()
+
+
+def _overlap(previous: str, current: str) -> str:
+    """Longest suffix of ``previous`` that ``current`` starts with."""
+    for size in range(min(len(previous), len(current)), 0, -1):
+        if current.startswith(previous[-size:]):
+            return previous[-size:]
+    return ""
+
+
+def test_overlap_must_be_smaller_than_chunk_size():
+    with pytest.raises(ValueError, match="cannot be >= chunk size"):
+        RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=100)
+
+
+@pytest.mark.parametrize(
+    ("chunk_size", "chunk_overlap"), [(60, 0), (80, 20), (200, 50)]
+)
+@pytest.mark.parametrize("text", [_document(), _words(400)])
+def test_chunks_respect_size_and_overlap(text, chunk_size, chunk_overlap):
+    chunks = BaseChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap).chunk(text)
+
+    assert max(len(chunk) for chunk in chunks) <= chunk_size
+    rebuilt = chunks[0]
+    for previous, current in pairwise(chunks):
+        overlap = _overlap(previous, current) if chunk_overlap else ""
+        assert len(overlap) <= chunk_overlap
+        rebuilt += current[len(overlap) :]
+    assert rebuilt == text
+
+
+def test_overlap_carries_whole_trailing_pieces():
+    chunks = BaseChunker(chunk_size=40, chunk_overlap=12).chunk(_words(30))
+
+    # " zeta eta" (9) fits in the overlap; " epsilon zeta eta" (17) would not.
+    assert chunks[:3] == [
+        "alpha beta gamma delta epsilon zeta eta",
+        " zeta eta theta alpha beta gamma\ndelta",
+        " gamma\ndelta epsilon zeta eta theta",
+    ]
+
+
+def test_oversized_words_are_cut_into_character_slices():
+    chunks = BaseChunker(chunk_size=10, chunk_overlap=0).chunk("x" * 25 + " tail")
+
+    assert chunks == ["xxxxxxxxxx", "xxxxxxxxxx", "xxxxx tail"]
+
+
+def test_length_function_sizes_chunks_in_its_own_units():
+    def word_count(text: str) -> int:
+        return len(text.split())
+
+    text = _document(10)
+    chunks = BaseChunker(
+        chunk_size=12, chunk_overlap=3, length_function=word_count
+    ).chunk(text)
+
+    assert max(word_count(chunk) for chunk in chunks) <= 12
+    assert max(len(chunk) for chunk in chunks) > 12
+    for previous, current in pairwise(chunks):
+        assert word_count(_overlap(previous, current)) <= 3
+
+
+def test_stream_matches_whole_text_across_windows():
+    text = _document(4000)
+    chunker = BaseChunker(chunk_size=500, chunk_overlap=100)
+    blocks = [text[i : i + 7919] for i in range(0, len(text), 7919)]
+
+    assert list(chunker.chunk_stream(blocks)) == chunker.chunk(text)
+
+
+def test_blank_text_has_no_chunks():
+    assert BaseChunker().chunk(" \n\n ") == []
+    assert list(BaseChunker().chunk_stream(["", "  ", "\n"])) == []
@@ -0,0 +1,168 @@
+"""Throughput benchmark for RecursiveCharacterTextSplitter.
+
+Compares the streaming splitter against the previous recursive implementation
+(kept below as ``LegacySplitter``) on a synthetic corpus::
+
+    python lib/morshed_squad_tools/tests/rag/chunker_benchmark.py --size-mb 50
+
+Not collected by pytest.
+"""
+
+import argparse
+import random
+import re
+import time
+import tracemalloc
+
+from morshed_squad_tools.rag.chunkers.base_chunker import (
+    RecursiveCharacterTextSplitter,
+)
+
+
+class LegacySplitter:
+    """The splitter as it was before streaming, for comparison only."""
+
+    def __init__(self, chunk_size: int, chunk_overlap: int) -> None:
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._keep_separator = True
+        self._separators = ["\n\n", "\n", " ", ""]
+
+    def split_text(self, text: str) -> list[str]:
+        return self._split_text(text, self._separators)
+
+    def _split_text(self, text: str, separators: list[str]) -> list[str]:
+        separator = separators[-1]
+        new_separators = []
+        for i, sep in enumerate(separators):
+            if sep == "":
+                separator = sep
+                break
+            if re.search(re.escape(sep), text):
+                separator = sep
+                new_separators = separators[i + 1 :]
+                break
+        good_splits = []
+        for split in self._split_text_with_separator(text, separator):
+            if len(split) < self._chunk_size:
+                good_splits.append(split)
+            elif new_separators:
+                good_splits.extend(self._split_text(split, new_separators))
+            else:
+                good_splits.extend(
+                    split[i : i + self._chunk_size]
+                    for i in range(0, len(split), self._chunk_size)
+                )
+        return self._merge_splits(good_splits, separator)
+
+    def _split_text_with_separator(self, text: str, separator: str) -> list[str]:
+        if separator == "":
+            return list(text)
+        if self._keep_separator and separator in text:
+            parts = text.split(separator)
+            splits: list[str] = []
+            for i, part in enumerate(parts):
+                if i == 0:
+                    splits.append(part)
+                elif part:
+                    splits.append(separator + part)
+                elif i != len(parts) - 1 and splits:
+                    splits[-1] += separator
+            return [s for s in splits if s]
+        return text.split(separator)
+
+    def _join(self, current_doc: list[str], separator: str) -> str:
+        if separator == "" or (self._keep_separator and separator == " "):
+            return "".join(current_doc)
+        return separator.join(current_doc)
+
+    def _merge_splits(self, splits: list[str], separator: str) -> list[str]:
+        docs: list[str] = []
+        current_doc: list[str] = []
+        total = 0
+        for split in splits:
+            if total + len(split) > self._chunk_size and current_doc:
+                doc = self._join(current_doc, separator)
+                if doc:
+                    docs.append(doc)
+                while total > self._chunk_overlap and len(current_doc) > 1:
+                    removed = current_doc.pop(0)
+                    total -= len(removed)
+                    if separator != "":
+                        total -= len(separator)
+            current_doc.append(split)
+            total += len(split)
+            if separator != "" and len(current_doc) > 1:
+                total += len(separator)
+        if current_doc:
+            doc = self._join(current_doc, separator)
+            if doc:
+                docs.append(doc)
+        return docs
+
+
+def make_corpus(size_bytes: int, seed: int = 0) -> list[str]:
+    """Build paragraphs of pseudo-words, with the odd very long line."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 10)))
+        for _ in range(5000)
+    ]
+    blocks: list[str] = []
+    written = 0
+    while written < size_bytes:
+        if rng.random() < 0.02:
+            block = "".join(rng.choices(vocabulary, k=2000)) + "\n\n"
+        else:
+            lines = [
+                " ".join(rng.choices(vocabulary, k=rng.randint(5, 20)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            block = "\n".join(lines) + "\n\n"
+        blocks.append(block)
+        written += len(block)
+    return blocks
+
+
+def measure(label: str, size_mb: float, run) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    chunks = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<10} {elapsed:8.2f}s {size_mb / elapsed:8.2f} MB/s "
+        f"{chunks:>9} chunks  peak {peak / 2**20:8.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50.0)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    blocks = make_corpus(int(args.size_mb * 2**20))
+    text = "".join(blocks)
+    size_mb = len(text) / 2**20
+    print(f"corpus: {size_mb:.1f} MB in {len(blocks)} blocks")
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap
+    )
+    if not args.skip_legacy:
+        legacy = LegacySplitter(args.chunk_size, args.chunk_overlap)
+        measure("legacy", size_mb, lambda: len(legacy.split_text(text)))
+    measure("split", size_mb, lambda: len(splitter.split_text(text)))
+    measure(
+        "stream",
+        size_mb,
+        lambda: sum(1 for _ in splitter.split_stream(iter(blocks))),
+    )
+
+
+if __name__ == "__main__":
+    main()